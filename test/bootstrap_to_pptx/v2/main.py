@@ -1,7 +1,5 @@
-import argparse, os
+import argparse, logging, os
 from pathlib import Path
-from parsers.bootstrap_html_parser import parse_html_to_model
-from renderer.render_engine import render_slide
 
 HERE = Path(__file__).parent
 
@@ -15,7 +13,9 @@ def main():
     p.add_argument("--overrides", default=str(HERE / "config" / "layout_overrides.json"))
     p.add_argument("--slide-num", type=int, default=1)
     p.add_argument("--slide-count", type=int, default=1)
+    p.add_argument("--log-level", default="WARNING", choices=["DEBUG", "INFO", "WARNING", "ERROR"])
     args = p.parse_args()
+    logging.basicConfig(level=args.log_level, format="%(levelname)s: %(message)s")
 
     html_path = Path(args.html)
     if not html_path.exists():
@@ -25,6 +25,9 @@ def main():
         else:
             raise FileNotFoundError(html_path)
 
+    # imported here so --help / bad arguments don't pay for python-pptx + bs4
+    from parsers.bootstrap_html_parser import parse_html_to_model
+    from renderer.render_engine import render_slide
     model = parse_html_to_model(str(html_path), args.mapping, args.icons)
     prs = render_slide(model, template_path=args.template,
                        slide_num=args.slide_num, slide_count=args.slide_count,
@@ -1,11 +1,16 @@
 import logging
-from pptx.enum.shapes import MSO_SHAPE
+from typing import NamedTuple, Optional
+from pptx.enum.dml import MSO_THEME_COLOR
+from pptx.enum.shapes import MSO_SHAPE, MSO_SHAPE_TYPE
+from pptx.enum.text import MSO_ANCHOR, MSO_AUTO_SIZE, PP_ALIGN
+from pptx.oxml.ns import qn
 from pptx.util import Inches, Pt
 from pptx.dml.color import RGBColor
+from utils.clean_up import SAFE_KEEP_NAMES
 from utils.colors import hex_to_rgb_color
 
-# Configure logging
-logging.basicConfig(level=logging.DEBUG, format="%(levelname)s: %(message)s")
+# Module logger; handlers and level are configured by the entry point (main.py).
+logger = logging.getLogger(__name__)
 
 PRIMARY   = RGBColor(13,110,253)
 GRAY_900  = RGBColor(13,45,82)
@@ -16,8 +21,87 @@ BORDER    = RGBColor(222,226,230)
 WHITE     = RGBColor(255,255,255)
 DARK      = RGBColor(33,37,41)
 
+# ---- compact mode: one text frame per container -----------------------------------
+# styles["shapes"]["compact"]: the text of a card, header, KPI tile or footer bar goes
+# into one frame (see compact_frame) instead of a textbox per part, so a slide has
+# fewer <p:sp>. The slide looks the same as without compact.
+
+def is_compact(styles) -> bool:
+    return bool((styles or {}).get("shapes", {}).get("compact"))
+
+class Para(NamedTuple):
+    text: str
+    size_pt: float
+    color: Optional[RGBColor] = None   # None = theme text color, as in a plain textbox
+    bold: bool = False
+    space_after_pt: float = 0
+
+def bullet_paras(items, size=14, numbered=False):
+    """add_bullets' paragraphs, for fill_text_frame."""
+    return [Para((f"{i+1}. " if numbered else "• ") + (t or ""), size, GRAY_700, space_after_pt=4)
+            for i, t in enumerate(items or [])]
+
+# add_textbox's default insets (l, t, r, b), inches
+TEXTBOX_INSET = (0.1, 0.05, 0.1, 0.05)
+
+def fill_text_frame(shape, paras, padding=TEXTBOX_INSET, shrink=True):
+    """
+    Write paras into shape's own text frame. padding (l, t, r, b in inches) becomes the
+    frame's margins: the offset of the textbox it replaces plus that textbox's inset,
+    so the text lands where it did. shrink: shrink text on overflow. Returns the
+    text frame.
+    """
+    autoshape = shape.shape_type != MSO_SHAPE_TYPE.TEXT_BOX   # a textbox is left-aligned, dark already
+    tf = shape.text_frame
+    tf.clear()
+    tf.word_wrap = True
+    if shrink:
+        tf.auto_size = MSO_AUTO_SIZE.TEXT_TO_FIT_SHAPE
+    if autoshape:
+        tf.vertical_anchor = MSO_ANCHOR.TOP   # autoshape text is centered by default
+    if tuple(padding) != TEXTBOX_INSET:
+        tf.margin_left, tf.margin_top, tf.margin_right, tf.margin_bottom = (Inches(v) for v in padding)
+    for i, para in enumerate(paras):
+        p = tf.add_paragraph() if i else tf.paragraphs[0]
+        if autoshape:
+            p.alignment = PP_ALIGN.LEFT
+        p.text = para.text or ""
+        p.font.size = Pt(para.size_pt)
+        p.font.bold = para.bold or None
+        if para.color is not None:
+            p.font.color.rgb = para.color
+        elif autoshape:
+            p.font.color.theme_color = MSO_THEME_COLOR.TEXT_1   # autoshape text is light by default
+        if para.space_after_pt:
+            p.space_after = Pt(para.space_after_pt)
+    return tf
+
+def compact_frame(slide, shape, paras, padding=TEXTBOX_INSET, shrink=True):
+    """
+    fill_text_frame into shape if cleanup_slide keeps it (its name is in SAFE_KEEP_NAMES),
+    else into one textbox laid over it. cleanup_slide deletes an empty container; text in
+    its frame would keep it, and the slide would no longer look as it does without compact.
+    The textbox is inset by padding less its own default insets.
+    """
+    if (shape.name or "").upper() not in SAFE_KEEP_NAMES:
+        shape = slide.shapes.add_textbox(*_inset_box(shape, padding))
+        padding = TEXTBOX_INSET
+    return fill_text_frame(shape, paras, padding, shrink)
+
+def _inset_box(shape, padding):
+    """(left, top, width, height) of a textbox whose default insets put its text padding inside shape."""
+    l, t, r, b = (Inches(p - d) for p, d in zip(padding, TEXTBOX_INSET))
+    return shape.left + l, shape.top + t, shape.width - l - r, shape.height - t - b
+
+def _right_tab(paragraph, pos):
+    """Right-aligned tab stop at pos (EMU from the frame's left margin)."""
+    pPr = paragraph._p.get_or_add_pPr()
+    tabs = pPr.makeelement(qn("a:tabLst"), {})
+    tabs.append(pPr.makeelement(qn("a:tab"), {"pos": str(int(pos)), "algn": "r"}))
+    pPr.insert_element_before(tabs, "a:defRPr", "a:extLst")
+
 def add_title(slide, left, top, width, height, text):
-    logging.debug(f"Adding title at ({left},{top}), size=({width}x{height}), text='{text}'")
+    logger.debug("Adding title at (%s,%s), size=(%sx%s), text='%s'", left, top, width, height, text)
     box = slide.shapes.add_textbox(Inches(left), Inches(top), Inches(width), Inches(height))
     p = box.text_frame.paragraphs[0]
     p.text = text or ""
@@ -27,7 +111,7 @@ def add_title(slide, left, top, width, height, text):
     return box
 
 def add_subtitle(slide, left, top, width, height, text):
-    logging.debug(f"Adding subtitle at ({left},{top}), size=({width}x{height}), text='{text}'")
+    logger.debug("Adding subtitle at (%s,%s), size=(%sx%s), text='%s'", left, top, width, height, text)
     box = slide.shapes.add_textbox(Inches(left), Inches(top), Inches(width), Inches(height))
     p = box.text_frame.paragraphs[0]
     p.text = text or ""
@@ -36,7 +120,7 @@ def add_subtitle(slide, left, top, width, height, text):
     return box
 
 def add_decor_diagonal(slide, left, top, width, height, angle=-10, rgba=(13,110,253, 0.85)):
-    logging.debug(f"Adding diagonal decor rect at ({left},{top}), size=({width}x{height}), angle={angle}, rgba={rgba}")
+    logger.debug("Adding diagonal decor rect at (%s,%s), size=(%sx%s), angle=%s, rgba=%s", left, top, width, height, angle, rgba)
     shape = slide.shapes.add_shape(MSO_SHAPE.RECTANGLE, Inches(left), Inches(top), Inches(width), Inches(height))
     shape.rotation = angle
     shape.fill.solid()
@@ -47,7 +131,7 @@ def add_decor_diagonal(slide, left, top, width, height, angle=-10, rgba=(13,110,
     return shape
 
 def add_decor_circle(slide, left, top, diameter, rgba=(13,110,253, 0.85)):
-    logging.debug(f"Adding decor circle at ({left},{top}), diameter={diameter}, rgba={rgba}")
+    logger.debug("Adding decor circle at (%s,%s), diameter=%s, rgba=%s", left, top, diameter, rgba)
     shape = slide.shapes.add_shape(MSO_SHAPE.OVAL, Inches(left), Inches(top), Inches(diameter), Inches(diameter))
     r,g,b,alpha = rgba
     shape.fill.solid()
@@ -57,7 +141,7 @@ def add_decor_circle(slide, left, top, diameter, rgba=(13,110,253, 0.85)):
     return shape
 
 def add_card(slide, left, top, width, height, radius=True, shadow=True):
-    logging.debug(f"Adding card at ({left},{top}), size=({width}x{height}), radius={radius}, shadow={shadow}")
+    logger.debug("Adding card at (%s,%s), size=(%sx%s), radius=%s, shadow=%s", left, top, width, height, radius, shadow)
     shape = slide.shapes.add_shape(MSO_SHAPE.ROUNDED_RECTANGLE if radius else MSO_SHAPE.RECTANGLE,
                                    Inches(left), Inches(top), Inches(width), Inches(height))
     shape.fill.solid()
@@ -67,13 +151,13 @@ def add_card(slide, left, top, width, height, radius=True, shadow=True):
     if radius and hasattr(shape, "adjustments"):
         try:
             shape.adjustments[0] = 0.15
-            logging.debug("Applied softer corner radius to card.")
+            logger.debug("Applied softer corner radius to card.")
         except Exception as e:
-            logging.warning(f"Could not set radius adjustment: {e}")
+            logger.warning("Could not set radius adjustment: %s", e)
     return shape
 
-def add_card_header(slide, card_shape, text, height_in=0.5, bg=PRIMARY, fg=WHITE):
-    logging.debug(f"Adding card header text='{text}', height={height_in}, bg={bg}, fg={fg}")
+def add_card_header(slide, card_shape, text, height_in=0.5, bg=PRIMARY, fg=WHITE, compact=False):
+    logger.debug("Adding card header text='%s', height=%s, bg=%s, fg=%s", text, height_in, bg, fg)
     left = card_shape.left
     top = card_shape.top
     width = card_shape.width
@@ -81,6 +165,9 @@ def add_card_header(slide, card_shape, text, height_in=0.5, bg=PRIMARY, fg=WHITE
     header.fill.solid()
     header.fill.fore_color.rgb = bg
     header.line.fill.background()
+    if compact:
+        compact_frame(slide, header, [Para(text, 14, fg, bold=True)], padding=(0.3, 0.13, 0.3, 0.13), shrink=False)
+        return header
 
     tb = slide.shapes.add_textbox(left+Inches(0.2), top+Inches(0.08), width-Inches(0.4), Inches(height_in-0.16))
     p = tb.text_frame.paragraphs[0]
@@ -105,7 +192,7 @@ def add_card_header(slide, card_shape, text, height_in=0.5, bg=PRIMARY, fg=WHITE
 
 def add_text_padded(slide, outer_left, outer_top, outer_width, outer_height, text,
                     padding=(0.3,0.3,0.3,0.3), size=14, color=GRAY_700):
-    logging.debug(f"Adding padded text with padding={padding}")
+    logger.debug("Adding padded text with padding=%s", padding)
     pl, pt, pr, pb = padding
     return add_text(slide, outer_left+pl, outer_top+pt, outer_width-(pl+pr), outer_height-(pt+pb),
                     text, size=size, color=color)
@@ -134,12 +221,16 @@ def add_text_padded(slide, outer_left, outer_top, outer_width, outer_height, tex
 #     return tb
 
 def add_kpi_tile(slide, left, top, width, height, headline, caption, bg_hex="#0d6efd",
-                 headline_pt=28, caption_pt=12):
-    logging.debug(f"Adding KPI tile at ({left},{top}), size=({width}x{height}), headline='{headline}', caption='{caption}', bg={bg_hex}")
+                 headline_pt=28, caption_pt=12, compact=False):
+    logger.debug("Adding KPI tile at (%s,%s), size=(%sx%s), headline='%s', caption='%s', bg=%s", left, top, width, height, headline, caption, bg_hex)
     tile = slide.shapes.add_shape(MSO_SHAPE.ROUNDED_RECTANGLE, Inches(left), Inches(top), Inches(width), Inches(height))
     tile.fill.solid()
     tile.fill.fore_color.rgb = hex_to_rgb_color(bg_hex)
     tile.line.fill.background()
+    if compact:
+        compact_frame(slide, tile, [Para(headline, headline_pt, WHITE, bold=True), Para(caption, caption_pt, WHITE)],
+                      padding=(0.22, 0.17, 0.22, 0.17), shrink=False)
+        return tile
 
     tb = slide.shapes.add_textbox(tile.left+Inches(0.12), tile.top+Inches(0.12),
                                   tile.width-Inches(0.24), tile.height-Inches(0.24))
@@ -160,13 +251,25 @@ def add_kpi_tile(slide, left, top, width, height, headline, caption, bg_hex="#0d
     return tile
 
 def add_footer_bar(slide, left, top, width, height, left_text, right_text,
-                   left_pt=10, right_pt=10):
-    logging.debug(f"Adding footer bar at ({left},{top}), size=({width}x{height}), left_text='{left_text}', right_text='{right_text}'")
+                   left_pt=10, right_pt=10, compact=False):
+    logger.debug("Adding footer bar at (%s,%s), size=(%sx%s), left_text='%s', right_text='%s'", left, top, width, height, left_text, right_text)
     bar = slide.shapes.add_shape(MSO_SHAPE.RECTANGLE, Inches(left), Inches(top), Inches(width), Inches(height))
     bar.name = "FOOTER_BAR"
     bar.fill.solid()
     bar.fill.fore_color.rgb = VERY_LIGHT
     bar.line.color.rgb = BORDER
+    if compact:
+        # one paragraph "left<TAB>right" against a right tab stop at the inner right edge
+        inset = 0.38  # textbox offset 0.28 + its 0.1 inset
+        p = compact_frame(slide, bar, [], padding=(inset, 0.09, inset, 0.09), shrink=False).paragraphs[0]
+        p.alignment = PP_ALIGN.LEFT
+        _right_tab(p, Inches(width - 2 * inset))
+        for text, size, color in ((left_text or "", left_pt, GRAY_700), ("\t" + (right_text or ""), right_pt, GRAY_600)):
+            run = p.add_run()
+            run.text = text
+            run.font.size = Pt(size)
+            run.font.color.rgb = color
+        return bar
 
     tb_left = slide.shapes.add_textbox(bar.left+Inches(0.28), bar.top+Inches(0.04),
                                        Inches(width/2.0), Inches(height-0.08))
@@ -185,7 +288,6 @@ def add_footer_bar(slide, left, top, width, height, left_text, right_text,
     r.alignment = 2  # right
     return bar
 
-from pptx.enum.text import MSO_AUTO_SIZE, MSO_ANCHOR
 
 def add_text(sh, left, top, width, height, text, size=14, color=GRAY_700):
     tb = sh.shapes.add_textbox(Inches(left), Inches(top), Inches(width), Inches(height))
@@ -372,201 +372,217 @@ def convert_shape_rotation(shape, degrees: float):
 # -----------------------------
 # Mapping registry (for DB)
 # Each entry matches a table row with a callable that performs the conversion.
+# Only the DB export reads it, so it is built on first access of MAPPING_REGISTRY
+# (module __getattr__) instead of at import.
 # -----------------------------
 
-MAPPING_REGISTRY: List[MappingRule] = [
-    # Slide
-    MappingRule("Slide BG Color", "slide_bg_color", "Slide", "Background Fill Color",
-                "slide.background.fill.fore_color.rgb", "RGB tuple",
-                "#N/A", lambda slide, rgb: convert_slide_bg_color(slide, rgb)),
-
-    MappingRule("Slide BG Type", "slide_bg_type", "Slide", "Background Fill Type",
-                "slide.background.fill.solid()", "solid, gradient, patterned",
-                "#N/A", lambda slide, kind: convert_slide_bg_type(slide, kind)),
-
-    # Shape geometry
-    MappingRule("Shape Left", "shape_left", "Shape", "Left Position",
-                "shape.left", "Length", "offset-1..offset-11",
-                lambda shape, grid, offset_n: convert_shape_left_from_offset(shape, grid, offset_n)),
-
-    MappingRule("Shape Top", "shape_top", "Shape", "Top Position",
-                "shape.top", "Length", "mt-0..mt-5",
-                lambda shape, mt_n: convert_shape_top_from_mt(shape, mt_n)),
-
-    MappingRule("Shape Width", "shape_width", "Shape", "Width",
-                "shape.width", "Length", "col-1..col-12",
-                lambda shape, grid, col_n: convert_shape_width_from_col(shape, grid, col_n)),
-
-    MappingRule("Shape Height", "shape_height", "Shape", "Height",
-                "shape.height", "Length", "h-25",
-                lambda shape, band_h_in, frac: convert_shape_height_from_hfrac(shape, band_h_in, frac)),
-
-    # Shape appearance
-    MappingRule("Shape Fill Color", "shape_fill_color", "Shape", "Fill Color",
-                "shape.fill.fore_color.rgb", "RGB tuple", "bg-*",
-                lambda shape, bg_key: convert_shape_fill_color(shape, bg_key)),
-
-    MappingRule("Shape Fill Type", "shape_fill_type", "Shape", "Fill Type",
-                "shape.fill.solid()", "solid/gradient/patterned", "#N/A",
-                lambda shape, *_: convert_shape_fill_type_solid(shape)),
-
-    MappingRule("Shape Line Color", "shape_line_color", "Shape", "Line Color",
-                "shape.line.color.rgb", "RGB tuple", "border",
-                lambda shape: convert_shape_line_color_default(shape)),
-
-    MappingRule("Shape Line Width", "shape_line_width", "Shape", "Line Width",
-                "shape.line.width", "Pt", "border-1..5",
-                lambda shape, n: convert_shape_line_width(shape, n)),
-
-    MappingRule("Shape Line Dash", "shape_line_dash", "Shape", "Line Dash Style",
-                "shape.line.dash_style", "dash/solid/etc", "#N/A",
-                lambda shape, style: convert_shape_line_dash(shape, style)),
-
-    MappingRule("Shape Shadow Enable", "shape_shadow_on", "Shape", "Shadow Enable",
-                "shape.shadow.inherit", "True/False", "#N/A",
-                lambda shape, on: convert_shape_shadow_enable(shape, on)),
-
-    MappingRule("Shape Shadow Blur", "shape_shadow_blur", "Shape", "Shadow Blur Radius",
-                "shape.shadow.blur_radius", "Pt", "#N/A",
-                lambda shape, pt: convert_shape_shadow_blur(shape, pt)),
-
-    MappingRule("Shape Shadow Distance", "shape_shadow_distance", "Shape", "Shadow Distance",
-                "shape.shadow.distance", "Pt", "#N/A",
-                lambda shape, pt: convert_shape_shadow_distance(shape, pt)),
-
-    MappingRule("Shape Shadow Direction", "shape_shadow_direction", "Shape", "Shadow Direction",
-                "shape.shadow.direction", "Degrees", "#N/A",
-                lambda shape, deg: convert_shape_shadow_direction(shape, deg)),
-
-    MappingRule("Shape Corner Radius", "shape_corner_radius", "Shape", "Corner Radius",
-                "shape.adjustments[0]", "Float 0-1", "rounded",
-                lambda shape, frac=0.2: convert_shape_corner_radius(shape, frac)),
-
-    # Text (shape level content)
-    MappingRule("Text Content", "text_content", "Text", "Text Content",
-                "shape.text", "String", "#N/A",
-                lambda shape, text: convert_text_content(shape, text)),
-
-    # Paragraph
-    MappingRule("Paragraph Align", "para_align", "Text", "Paragraph Alignment",
-                "paragraph.alignment", "LEFT/CENTER/RIGHT/JUSTIFY", "text-start",
-                lambda paragraph, align: convert_paragraph_alignment(paragraph, align)),
-
-    MappingRule("Paragraph Space Before", "para_space_before", "Text", "Paragraph Space Before",
-                "paragraph.space_before", "Pt", "#N/A",
-                lambda paragraph, pt: convert_paragraph_space_before(paragraph, pt)),
-
-    MappingRule("Paragraph Space After", "para_space_after", "Text", "Paragraph Space After",
-                "paragraph.space_after", "Pt", "#N/A",
-                lambda paragraph, pt: convert_paragraph_space_after(paragraph, pt)),
-
-    MappingRule("Paragraph Line Spacing", "para_line_spacing", "Text", "Paragraph Line Spacing",
-                "paragraph.line_spacing", "Float or Pt", "#N/A",
-                lambda paragraph, val: convert_paragraph_line_spacing(paragraph, val)),
-
-    # Runs
-    MappingRule("Run Text", "run_text", "Text", "Run Text",
-                "run.text", "String", "#N/A",
-                lambda run, text: convert_run_text(run, text)),
-
-    MappingRule("Font Bold", "font_bold", "Text", "Font Bold",
-                "run.font.bold", "True/False", "fw-bold",
-                lambda run, is_bold: convert_run_bold(run, is_bold)),
-
-    MappingRule("Font Italic", "font_italic", "Text", "Font Italic",
-                "run.font.italic", "True/False", "fst-italic",
-                lambda run, is_italic: convert_run_italic(run, is_italic)),
-
-    MappingRule("Font Size", "font_size", "Text", "Font Size",
-                "run.font.size", "Pt", "#N/A",
-                lambda run, pt: convert_run_size(run, pt)),
-
-    MappingRule("Font Name", "font_name", "Text", "Font Name",
-                "run.font.name", "String", "#N/A",
-                lambda run, name: convert_run_name(run, name)),
-
-    MappingRule("Font Color", "font_color", "Text", "Font Color",
-                "run.font.color.rgb", "RGB tuple", "text-primary",
-                lambda run, text_key: convert_run_color(run, text_key)),
-
-    MappingRule("Font Underline", "font_underline", "Text", "Font Underline",
-                "run.font.underline", "True/False", "#N/A",
-                lambda run, on: convert_run_underline(run, on)),
-
-    MappingRule("Font All Caps", "font_all_caps", "Text", "Font All Caps",
-                "run.font.all_caps", "True/False", "text-uppercase",
-                lambda run, on: convert_run_all_caps(run, on)),
-
-    # Table
-    MappingRule("Cell Text", "cell_text", "Table", "Cell Text",
-                "cell.text", "String", "#N/A",
-                lambda cell, text: convert_cell_text(cell, text)),
-
-    MappingRule("Cell Fill Color", "cell_fill_color", "Table", "Cell Fill Color",
-                "cell.fill.fore_color.rgb", "RGB tuple", "#N/A",
-                lambda cell, rgb: convert_cell_fill_color(cell, rgb)),
-
-    MappingRule("Cell Merge", "cell_merge", "Table", "Cell Merge",
-                "cell.merge()", "Cell object", "#N/A",
-                lambda cell, other: convert_cell_merge(cell, other)),
-
-    MappingRule("Cell Align", "cell_align", "Table", "Cell Text Alignment",
-                "cell.text_frame.paragraphs[0].alignment", "LEFT/CENTER/RIGHT", "#N/A",
-                lambda cell, align: convert_cell_text_alignment(cell, align)),
-
-    # Image
-    MappingRule("Add Picture", "add_picture", "Image", "Add Picture",
-                "shapes.add_picture()", "path + pos/size", "#N/A",
-                lambda shapes, path, left_in, top_in, width_in=None, height_in=None:
-                    convert_add_picture(shapes, path, left_in, top_in, width_in, height_in)),
-
-    # Chart
-    MappingRule("Chart Legend", "chart_has_legend", "Chart", "Has Legend",
-                "chart.has_legend", "True/False", "#N/A",
-                lambda chart, on: convert_chart_legend(chart, on)),
-
-    MappingRule("Legend Position", "chart_legend_position", "Chart", "Legend Position",
-                "chart.legend.position", "Position Enum", "#N/A",
-                lambda chart, pos: convert_chart_legend_position(chart, pos)),
-
-    MappingRule("Value Axis Max", "chart_value_axis_max", "Chart", "Value Axis Max",
-                "chart.value_axis.maximum_scale", "Float", "#N/A",
-                lambda chart, v: convert_chart_value_axis_max(chart, v)),
-
-    MappingRule("Value Axis Min", "chart_value_axis_min", "Chart", "Value Axis Min",
-                "chart.value_axis.minimum_scale", "Float", "#N/A",
-                lambda chart, v: convert_chart_value_axis_min(chart, v)),
-
-    MappingRule("Series Name", "series_name", "Chart", "Series Name",
-                "series.name", "String", "#N/A",
-                lambda series, name: convert_series_name(series, name)),
-
-    MappingRule("Series Values", "series_values", "Chart", "Series Values",
-                "series.values", "List", "#N/A",
-                lambda series, values: convert_series_values(series, values)),
-
-    MappingRule("Series X Values", "series_x_values", "Chart", "Series X Values",
-                "series.x_values", "List", "#N/A",
-                lambda series, x: convert_series_x_values(series, x)),
-
-    MappingRule("Series Fill Color", "series_fill_color", "Chart", "Series Fill Color",
-                "series.format.fill.fore_color.rgb", "RGB tuple", "#N/A",
-                lambda series, rgb: convert_series_fill_color(series, rgb)),
-
-    # Notes
-    MappingRule("Notes Text", "notes_text", "Notes", "Slide Notes Text",
-                "notes_slide.notes_text_frame.text", "String", "#N/A",
-                lambda slide, txt: convert_notes_text(slide, txt)),
-
-    # Other
-    MappingRule("Hyperlink", "shape_hyperlink", "Other", "Hyperlink",
-                "shape.click_action.hyperlink.address", "String", "#N/A",
-                lambda shape, url: convert_shape_hyperlink(shape, url)),
-
-    MappingRule("Rotation", "shape_rotation", "Other", "Rotation",
-                "shape.rotation", "Degrees", "#N/A",
-                lambda shape, deg: convert_shape_rotation(shape, deg)),
-]
+_REGISTRY: Optional[List[MappingRule]] = None
+
+def get_mapping_registry() -> List[MappingRule]:
+    global _REGISTRY
+    if _REGISTRY is None:
+        _REGISTRY = _build_registry()
+    return _REGISTRY
+
+def __getattr__(name: str):
+    if name == "MAPPING_REGISTRY":
+        return get_mapping_registry()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def _build_registry() -> List[MappingRule]:
+    return [
+        # Slide
+        MappingRule("Slide BG Color", "slide_bg_color", "Slide", "Background Fill Color",
+                    "slide.background.fill.fore_color.rgb", "RGB tuple",
+                    "#N/A", lambda slide, rgb: convert_slide_bg_color(slide, rgb)),
+
+        MappingRule("Slide BG Type", "slide_bg_type", "Slide", "Background Fill Type",
+                    "slide.background.fill.solid()", "solid, gradient, patterned",
+                    "#N/A", lambda slide, kind: convert_slide_bg_type(slide, kind)),
+
+        # Shape geometry
+        MappingRule("Shape Left", "shape_left", "Shape", "Left Position",
+                    "shape.left", "Length", "offset-1..offset-11",
+                    lambda shape, grid, offset_n: convert_shape_left_from_offset(shape, grid, offset_n)),
+
+        MappingRule("Shape Top", "shape_top", "Shape", "Top Position",
+                    "shape.top", "Length", "mt-0..mt-5",
+                    lambda shape, mt_n: convert_shape_top_from_mt(shape, mt_n)),
+
+        MappingRule("Shape Width", "shape_width", "Shape", "Width",
+                    "shape.width", "Length", "col-1..col-12",
+                    lambda shape, grid, col_n: convert_shape_width_from_col(shape, grid, col_n)),
+
+        MappingRule("Shape Height", "shape_height", "Shape", "Height",
+                    "shape.height", "Length", "h-25",
+                    lambda shape, band_h_in, frac: convert_shape_height_from_hfrac(shape, band_h_in, frac)),
+
+        # Shape appearance
+        MappingRule("Shape Fill Color", "shape_fill_color", "Shape", "Fill Color",
+                    "shape.fill.fore_color.rgb", "RGB tuple", "bg-*",
+                    lambda shape, bg_key: convert_shape_fill_color(shape, bg_key)),
+
+        MappingRule("Shape Fill Type", "shape_fill_type", "Shape", "Fill Type",
+                    "shape.fill.solid()", "solid/gradient/patterned", "#N/A",
+                    lambda shape, *_: convert_shape_fill_type_solid(shape)),
+
+        MappingRule("Shape Line Color", "shape_line_color", "Shape", "Line Color",
+                    "shape.line.color.rgb", "RGB tuple", "border",
+                    lambda shape: convert_shape_line_color_default(shape)),
+
+        MappingRule("Shape Line Width", "shape_line_width", "Shape", "Line Width",
+                    "shape.line.width", "Pt", "border-1..5",
+                    lambda shape, n: convert_shape_line_width(shape, n)),
+
+        MappingRule("Shape Line Dash", "shape_line_dash", "Shape", "Line Dash Style",
+                    "shape.line.dash_style", "dash/solid/etc", "#N/A",
+                    lambda shape, style: convert_shape_line_dash(shape, style)),
+
+        MappingRule("Shape Shadow Enable", "shape_shadow_on", "Shape", "Shadow Enable",
+                    "shape.shadow.inherit", "True/False", "#N/A",
+                    lambda shape, on: convert_shape_shadow_enable(shape, on)),
+
+        MappingRule("Shape Shadow Blur", "shape_shadow_blur", "Shape", "Shadow Blur Radius",
+                    "shape.shadow.blur_radius", "Pt", "#N/A",
+                    lambda shape, pt: convert_shape_shadow_blur(shape, pt)),
+
+        MappingRule("Shape Shadow Distance", "shape_shadow_distance", "Shape", "Shadow Distance",
+                    "shape.shadow.distance", "Pt", "#N/A",
+                    lambda shape, pt: convert_shape_shadow_distance(shape, pt)),
+
+        MappingRule("Shape Shadow Direction", "shape_shadow_direction", "Shape", "Shadow Direction",
+                    "shape.shadow.direction", "Degrees", "#N/A",
+                    lambda shape, deg: convert_shape_shadow_direction(shape, deg)),
+
+        MappingRule("Shape Corner Radius", "shape_corner_radius", "Shape", "Corner Radius",
+                    "shape.adjustments[0]", "Float 0-1", "rounded",
+                    lambda shape, frac=0.2: convert_shape_corner_radius(shape, frac)),
+
+        # Text (shape level content)
+        MappingRule("Text Content", "text_content", "Text", "Text Content",
+                    "shape.text", "String", "#N/A",
+                    lambda shape, text: convert_text_content(shape, text)),
+
+        # Paragraph
+        MappingRule("Paragraph Align", "para_align", "Text", "Paragraph Alignment",
+                    "paragraph.alignment", "LEFT/CENTER/RIGHT/JUSTIFY", "text-start",
+                    lambda paragraph, align: convert_paragraph_alignment(paragraph, align)),
+
+        MappingRule("Paragraph Space Before", "para_space_before", "Text", "Paragraph Space Before",
+                    "paragraph.space_before", "Pt", "#N/A",
+                    lambda paragraph, pt: convert_paragraph_space_before(paragraph, pt)),
+
+        MappingRule("Paragraph Space After", "para_space_after", "Text", "Paragraph Space After",
+                    "paragraph.space_after", "Pt", "#N/A",
+                    lambda paragraph, pt: convert_paragraph_space_after(paragraph, pt)),
+
+        MappingRule("Paragraph Line Spacing", "para_line_spacing", "Text", "Paragraph Line Spacing",
+                    "paragraph.line_spacing", "Float or Pt", "#N/A",
+                    lambda paragraph, val: convert_paragraph_line_spacing(paragraph, val)),
+
+        # Runs
+        MappingRule("Run Text", "run_text", "Text", "Run Text",
+                    "run.text", "String", "#N/A",
+                    lambda run, text: convert_run_text(run, text)),
+
+        MappingRule("Font Bold", "font_bold", "Text", "Font Bold",
+                    "run.font.bold", "True/False", "fw-bold",
+                    lambda run, is_bold: convert_run_bold(run, is_bold)),
+
+        MappingRule("Font Italic", "font_italic", "Text", "Font Italic",
+                    "run.font.italic", "True/False", "fst-italic",
+                    lambda run, is_italic: convert_run_italic(run, is_italic)),
+
+        MappingRule("Font Size", "font_size", "Text", "Font Size",
+                    "run.font.size", "Pt", "#N/A",
+                    lambda run, pt: convert_run_size(run, pt)),
+
+        MappingRule("Font Name", "font_name", "Text", "Font Name",
+                    "run.font.name", "String", "#N/A",
+                    lambda run, name: convert_run_name(run, name)),
+
+        MappingRule("Font Color", "font_color", "Text", "Font Color",
+                    "run.font.color.rgb", "RGB tuple", "text-primary",
+                    lambda run, text_key: convert_run_color(run, text_key)),
+
+        MappingRule("Font Underline", "font_underline", "Text", "Font Underline",
+                    "run.font.underline", "True/False", "#N/A",
+                    lambda run, on: convert_run_underline(run, on)),
+
+        MappingRule("Font All Caps", "font_all_caps", "Text", "Font All Caps",
+                    "run.font.all_caps", "True/False", "text-uppercase",
+                    lambda run, on: convert_run_all_caps(run, on)),
+
+        # Table
+        MappingRule("Cell Text", "cell_text", "Table", "Cell Text",
+                    "cell.text", "String", "#N/A",
+                    lambda cell, text: convert_cell_text(cell, text)),
+
+        MappingRule("Cell Fill Color", "cell_fill_color", "Table", "Cell Fill Color",
+                    "cell.fill.fore_color.rgb", "RGB tuple", "#N/A",
+                    lambda cell, rgb: convert_cell_fill_color(cell, rgb)),
+
+        MappingRule("Cell Merge", "cell_merge", "Table", "Cell Merge",
+                    "cell.merge()", "Cell object", "#N/A",
+                    lambda cell, other: convert_cell_merge(cell, other)),
+
+        MappingRule("Cell Align", "cell_align", "Table", "Cell Text Alignment",
+                    "cell.text_frame.paragraphs[0].alignment", "LEFT/CENTER/RIGHT", "#N/A",
+                    lambda cell, align: convert_cell_text_alignment(cell, align)),
+
+        # Image
+        MappingRule("Add Picture", "add_picture", "Image", "Add Picture",
+                    "shapes.add_picture()", "path + pos/size", "#N/A",
+                    lambda shapes, path, left_in, top_in, width_in=None, height_in=None:
+                        convert_add_picture(shapes, path, left_in, top_in, width_in, height_in)),
+
+        # Chart
+        MappingRule("Chart Legend", "chart_has_legend", "Chart", "Has Legend",
+                    "chart.has_legend", "True/False", "#N/A",
+                    lambda chart, on: convert_chart_legend(chart, on)),
+
+        MappingRule("Legend Position", "chart_legend_position", "Chart", "Legend Position",
+                    "chart.legend.position", "Position Enum", "#N/A",
+                    lambda chart, pos: convert_chart_legend_position(chart, pos)),
+
+        MappingRule("Value Axis Max", "chart_value_axis_max", "Chart", "Value Axis Max",
+                    "chart.value_axis.maximum_scale", "Float", "#N/A",
+                    lambda chart, v: convert_chart_value_axis_max(chart, v)),
+
+        MappingRule("Value Axis Min", "chart_value_axis_min", "Chart", "Value Axis Min",
+                    "chart.value_axis.minimum_scale", "Float", "#N/A",
+                    lambda chart, v: convert_chart_value_axis_min(chart, v)),
+
+        MappingRule("Series Name", "series_name", "Chart", "Series Name",
+                    "series.name", "String", "#N/A",
+                    lambda series, name: convert_series_name(series, name)),
+
+        MappingRule("Series Values", "series_values", "Chart", "Series Values",
+                    "series.values", "List", "#N/A",
+                    lambda series, values: convert_series_values(series, values)),
+
+        MappingRule("Series X Values", "series_x_values", "Chart", "Series X Values",
+                    "series.x_values", "List", "#N/A",
+                    lambda series, x: convert_series_x_values(series, x)),
+
+        MappingRule("Series Fill Color", "series_fill_color", "Chart", "Series Fill Color",
+                    "series.format.fill.fore_color.rgb", "RGB tuple", "#N/A",
+                    lambda series, rgb: convert_series_fill_color(series, rgb)),
+
+        # Notes
+        MappingRule("Notes Text", "notes_text", "Notes", "Slide Notes Text",
+                    "notes_slide.notes_text_frame.text", "String", "#N/A",
+                    lambda slide, txt: convert_notes_text(slide, txt)),
+
+        # Other
+        MappingRule("Hyperlink", "shape_hyperlink", "Other", "Hyperlink",
+                    "shape.click_action.hyperlink.address", "String", "#N/A",
+                    lambda shape, url: convert_shape_hyperlink(shape, url)),
+
+        MappingRule("Rotation", "shape_rotation", "Other", "Rotation",
+                    "shape.rotation", "Degrees", "#N/A",
+                    lambda shape, deg: convert_shape_rotation(shape, deg)),
+    ]
 
 # -----------------------------
 # High-level “apply” helpers
@@ -0,0 +1,47 @@
+"""
+Compiled CSS selectors for mapping.json-driven parsing.
+
+bs4's Tag.select()/select_one() hand the selector string to soupsieve on every
+call. Here each selector string is compiled once per process and the compiled
+pattern is reused across columns, files and batch runs.
+
+    SEL = SelectorRegistry(mapping)
+    body  = SEL.one("left_narrative_card_body", col)
+    boxes = SEL.all("left_kpi_boxes", col)
+    paras = compiled("p").select(body)
+
+Missing or empty mapping entries match nothing (instead of raising
+SelectorSyntaxError on "").
+"""
+from typing import Dict, List, Optional
+import soupsieve as sv
+
+# selector string -> compiled pattern, shared by every registry in this process
+_COMPILED: Dict[str, "sv.SoupSieve"] = {}
+
+def compiled(selector: str) -> Optional["sv.SoupSieve"]:
+    """Compile a selector once; None for an empty selector."""
+    if not selector:
+        return None
+    pat = _COMPILED.get(selector)
+    if pat is None:
+        pat = _COMPILED[selector] = sv.compile(selector)
+    return pat
+
+class SelectorRegistry:
+    """mapping.json entries (key -> selector string) compiled up front."""
+
+    def __init__(self, mapping: dict):
+        self._by_key = {k: compiled(v) for k, v in mapping.items() if isinstance(v, str)}
+
+    def one(self, key: str, el):
+        pat = self._by_key.get(key)
+        return pat.select_one(el) if pat is not None and el is not None else None
+
+    def all(self, key: str, el) -> List:
+        pat = self._by_key.get(key)
+        return pat.select(el) if pat is not None and el is not None else []
+
+def clear_cache() -> None:
+    """Drop compiled patterns (tests / long-running processes that reload configs)."""
+    _COMPILED.clear()
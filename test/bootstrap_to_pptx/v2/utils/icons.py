@@ -0,0 +1,238 @@
+"""
+Icons for Bootstrap Icons (bi-*) / Font Awesome (fa-*) class names, rasterized
+to PNG at the size and color they are drawn, with an on-disk cache.
+
+Sources, first match wins (icon_dir = styles["icons"]["dir"], relative to the
+version folder, default assets/icons; set = "bi" or "fa"):
+  1. SVG set    <icon_dir>/<set>/<name>.svg; currentColor takes the color.
+                Needs cairosvg (optional: only imported here, when an SVG is found).
+  2. icon font  <icon_dir>/<set>.ttf / .otf next to <set>.json, the name -> codepoint
+                map as the packages ship it (bootstrap-icons.json: {"cpu": 63046},
+                Font Awesome icons.json: {"house": {"unicode": "f015"}}), drawn with Pillow.
+  3. badge      a filled circle with the name's first letter; only with
+                styles["icons"]["badge"] true. Otherwise an icon without a source
+                draws nothing (as before icons were rasterized: the tree ships no
+                icon set, and icon_map.json images still come first).
+
+Cache: with styles["icons"]["cache_dir"] set, <cache_dir>/<key[:2]>/<key>.png,
+key = sha256 of (set, name, px, color, source file identity). Entries are
+written atomically (as in utils.render_cache), so batch workers share one
+directory and each (icon, size, color) is rasterized once across runs. Without
+it nothing is written: the PNG is kept in memory for the process and placed as
+a data: URI. Results are memoized in-process (LRU of ICON_ENTRIES); a memoized
+cache file that has since been pruned is rasterized again, and an icon without
+a source is looked up again next time (a set may be installed meanwhile).
+Pictures go through utils.images, so a repeated icon is one image part per deck.
+
+PNG only: Pillow cannot write EMF.
+"""
+import base64
+import hashlib
+import json
+import logging
+import os
+import re
+import tempfile
+from collections import OrderedDict
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from utils.images import DEFAULT_DPI, add_picture
+
+# Module logger; handlers and level are configured by the entry point (main.py).
+logger = logging.getLogger(__name__)
+
+CODE_ROOT = Path(__file__).resolve().parents[1]  # the version folder (v3/, v4/, ...)
+DEFAULT_ICON_DIR = CODE_ROOT / "assets" / "icons"
+DEFAULT_COLOR = "#0d6efd"
+SETS = ("bi", "fa")
+ICON_ENTRIES = 1024  # icon_png() results kept in-process (LRU)
+
+# Font Awesome style / size classes, not icon names
+_FA_MODIFIER = re.compile(r"^fa-(solid|regular|light|thin|duotone|brands|sharp|fw|xs|sm|lg|xl|\d+x|spin|pulse)$")
+
+def split_name(icon: str) -> Optional[Tuple[str, str]]:
+    """"bi-cpu" -> ("bi", "cpu"); None for anything that is not an icon name."""
+    prefix, _, name = (icon or "").partition("-")
+    if prefix not in SETS or not name or _FA_MODIFIER.match(icon):
+        return None
+    return prefix, name
+
+# ---- sources --------------------------------------------------------------------
+
+def _codepoint(v) -> Optional[int]:
+    if isinstance(v, dict):
+        v = v.get("unicode")
+    if isinstance(v, int):
+        return v
+    try:
+        return int(str(v), 16)
+    except ValueError:
+        return None
+
+@lru_cache(maxsize=16)
+def _font_source(icon_dir: str, icon_set: str) -> Optional[Tuple[str, Dict[str, int]]]:
+    """(font path, name -> codepoint) of a set, if icon_dir has both files."""
+    folder = Path(icon_dir)
+    fonts = [folder / f"{icon_set}{ext}" for ext in (".ttf", ".otf")]
+    font = next((p for p in fonts if p.is_file()), None)
+    mapping = folder / f"{icon_set}.json"
+    if font is None or not mapping.is_file():
+        return None
+    raw = json.loads(mapping.read_text(encoding="utf-8"))
+    codes = {name: cp for name, cp in ((n, _codepoint(v)) for n, v in raw.items()) if cp is not None}
+    return str(font), codes
+
+def _source(icon_dir: str, icon_set: str, name: str) -> Tuple[str, Optional[str], Optional[int]]:
+    """(kind, file, codepoint): ("svg", path, None), ("font", path, cp) or ("badge", None, None)."""
+    svg = Path(icon_dir) / icon_set / f"{name}.svg"
+    if svg.is_file():
+        return "svg", str(svg), None
+    font = _font_source(icon_dir, icon_set)
+    if font and name in font[1]:
+        return "font", font[0], font[1][name]
+    return "badge", None, None
+
+# ---- rasterizers ----------------------------------------------------------------
+
+def _rgba(color: str) -> Tuple[int, int, int, int]:
+    h = color.lstrip("#")
+    return int(h[0:2], 16), int(h[2:4], 16), int(h[4:6], 16), 255
+
+def _render_svg(path: str, px: int, color: str) -> bytes:
+    import cairosvg
+    svg = Path(path).read_text(encoding="utf-8").replace("currentColor", color)
+    return cairosvg.svg2png(bytestring=svg.encode(), output_width=px, output_height=px)
+
+@lru_cache(maxsize=64)
+def _font(path: Optional[str], px: int):
+    from PIL import ImageFont
+    return ImageFont.truetype(path, px) if path else ImageFont.load_default(size=px)
+
+def _render_glyph(path: str, cp: int, px: int, color: str) -> bytes:
+    from PIL import Image, ImageDraw
+    img = Image.new("RGBA", (px, px), (0, 0, 0, 0))
+    ImageDraw.Draw(img).text((px / 2, px / 2), chr(cp), font=_font(path, px), fill=_rgba(color), anchor="mm")
+    return _png(img)
+
+def _render_badge(name: str, px: int, color: str) -> bytes:
+    from PIL import Image, ImageDraw
+    img = Image.new("RGBA", (px, px), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(img)
+    draw.ellipse((0, 0, px - 1, px - 1), fill=_rgba(color))
+    draw.text((px / 2, px / 2), name[:1].upper(), font=_font(None, max(1, px // 2)), fill=(255, 255, 255, 255),
+              anchor="mm")
+    return _png(img)
+
+def _png(img) -> bytes:
+    import io
+    out = io.BytesIO()
+    img.save(out, "PNG")
+    return out.getvalue()
+
+# ---- cache ----------------------------------------------------------------------
+
+# in-process memo: (icon, px, color, dirs, badge) -> PNG path / data: URI / None (not an icon name)
+_paths: "OrderedDict[tuple, Optional[str]]" = OrderedDict()
+stats = {"memo": 0, "disk": 0, "rendered": 0}
+
+def _memo_get(memo: tuple) -> Tuple[bool, Optional[str]]:
+    """(hit, value); a cache file that is gone from disk counts as a miss."""
+    if memo not in _paths:
+        return False, None
+    value = _paths[memo]
+    if value is not None and not value.startswith("data:") and not Path(value).is_file():
+        del _paths[memo]
+        return False, None
+    _paths.move_to_end(memo)
+    return True, value
+
+def _remember(memo: tuple, value: Optional[str]) -> Optional[str]:
+    _paths[memo] = value
+    if len(_paths) > ICON_ENTRIES:
+        _paths.popitem(last=False)
+    return value
+
+def icon_png(icon: str, px: int, color: str = DEFAULT_COLOR, icon_dir: Optional[str] = None,
+             cache_dir: Optional[str] = None, badge: bool = False) -> Optional[str]:
+    """
+    A px x px PNG of icon ("bi-cpu", "fa-house") in color: its path under cache_dir, or
+    without cache_dir a data: URI. None if icon is not an icon name, or has no source
+    and badge is off.
+    """
+    memo = (icon, px, color, icon_dir, cache_dir, badge)
+    hit, value = _memo_get(memo)
+    if hit:
+        stats["memo"] += 1
+        return value
+    parsed = split_name(icon)
+    if parsed is None:
+        return _remember(memo, None)
+    icon_set, name = parsed
+    kind, src, cp = _source(str(CODE_ROOT / icon_dir if icon_dir else DEFAULT_ICON_DIR), icon_set, name)
+    if kind == "badge" and not badge:
+        return None  # not memoized: the set may appear later
+    ident = "badge-1"
+    if src:
+        st = os.stat(src)
+        ident = f"{src}|{st.st_mtime_ns}|{st.st_size}"
+    key = hashlib.sha256(f"{icon_set}/{name}|{px}|{color.lower()}|{kind}|{ident}|{cp}".encode()).hexdigest()
+    path = Path(cache_dir) / key[:2] / f"{key}.png" if cache_dir else None
+    if path is not None and path.is_file():
+        stats["disk"] += 1
+        return _remember(memo, str(path))
+    try:
+        if kind == "svg":
+            data = _render_svg(src, px, color)
+        elif kind == "font":
+            data = _render_glyph(src, cp, px, color)
+        else:
+            data = _render_badge(name, px, color)
+    except ImportError:  # an SVG without cairosvg installed
+        if not badge:
+            logger.warning("cairosvg is not installed; %s skipped", src)
+            return _remember(memo, None)
+        logger.warning("cairosvg is not installed; %s drawn as a badge", src)
+        data = _render_badge(name, px, color)
+    stats["rendered"] += 1
+    logger.debug("rasterized %s (%s, %dpx, %s)", icon, kind, px, color)
+    if path is None:
+        return _remember(memo, "data:image/png;base64," + base64.b64encode(data).decode("ascii"))
+    _write_atomic(path, data)
+    return _remember(memo, str(path))
+
+def _write_atomic(path: Path, data: bytes):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+def add_icon(shapes, icon: str, left: int, top: int, size: int, styles: Optional[dict] = None,
+             icon_map: Optional[dict] = None):
+    """
+    Square picture of icon at (left, top), size in EMU, colored and sized per
+    styles["icons"] (color, dpi, dir, cache_dir, badge). An icon_map.json entry (image
+    path relative to the version folder) takes precedence over the rasterized
+    glyph. Returns the Picture, or None.
+    """
+    from pptx.util import Emu
+
+    opts = (styles or {}).get("icons", {})
+    dpi = opts.get("dpi", DEFAULT_DPI)
+    mapped = (icon_map or {}).get(icon)
+    if mapped:
+        pic = add_picture(shapes, mapped, left, top, height=size, base_dir=str(CODE_ROOT), dpi=dpi)
+        if pic is not None:
+            return pic
+    px = max(1, round(Emu(size).inches * dpi))
+    path = icon_png(icon, px, opts.get("color", DEFAULT_COLOR), opts.get("dir"), opts.get("cache_dir"),
+                    bool(opts.get("badge")))
+    if path is None:
+        return None
+    return add_picture(shapes, path, left, top, size, size, dpi=dpi)
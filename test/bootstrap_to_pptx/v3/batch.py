@@ -0,0 +1,143 @@
+"""
+Batch conversion: many HTML files -> PPTX using a process pool.
+
+Each worker loads styles (+ overrides)/presets once in its initializer and then converts
+files one by one; the parent reports per-file timing/failures as they finish
+and writes a summary JSON.
+"""
+import argparse
+import glob
+import json
+import logging
+import os
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+log = logging.getLogger("v3.batch")
+
+# per-process state, filled by _init_worker
+_WORKER = {}
+
+def _init_worker(styles_path: str, presets_path: str, overrides_path: str | None, template_path: str | None,
+                 cache_dir: str | None = None, cache_max_bytes: int = 0):
+    from renderer.pipeline import load_configs
+    ST, PRE = load_configs(styles_path, presets_path, overrides_path)
+    cache = None
+    if cache_dir:
+        from utils.render_cache import RenderCache
+        cache = RenderCache(cache_dir, cache_max_bytes)
+    _WORKER.update(ST=ST, PRE=PRE, template=template_path, cache=cache)
+
+def _convert_one(html_path: str, out_path: str) -> dict:
+    from renderer.pipeline import build_deck_with_configs
+    t0 = time.perf_counter()
+    try:
+        render = lambda: build_deck_with_configs(html_path, _WORKER["ST"], _WORKER["PRE"],  # noqa: E731
+                                                 template_path=_WORKER["template"])
+        os.makedirs(os.path.dirname(out_path) or ".", exist_ok=True)
+        extra = {}
+        if _WORKER["cache"] is not None:
+            # ST already has the overrides merged in, so they are part of the key
+            from utils.render_cache import slide_xml
+            data, hit = _WORKER["cache"].render(render, html_path, (_WORKER["ST"], _WORKER["PRE"]),
+                                                _WORKER["template"])
+            with open(out_path, "wb") as f:
+                f.write(data)
+            slides, extra["cache"] = len(slide_xml(data)), "hit" if hit else "miss"
+        else:
+            prs = render()
+            prs.save(out_path)
+            slides = len(prs.slides)
+        return {"html": html_path, "out": out_path, "ok": True, "slides": slides,
+                "seconds": round(time.perf_counter() - t0, 4), **extra}
+    except Exception as e:
+        return {"html": html_path, "out": out_path, "ok": False, "error": f"{type(e).__name__}: {e}",
+                "traceback": traceback.format_exc(), "seconds": round(time.perf_counter() - t0, 4)}
+
+def expand_inputs(spec: str) -> list[Path]:
+    """A directory (all *.html below it) or a glob pattern (supports **)."""
+    p = Path(spec)
+    if p.is_dir():
+        files = sorted(p.rglob("*.html"))
+    else:
+        files = sorted(Path(f) for f in glob.glob(spec, recursive=True))
+    return [f.resolve() for f in files if f.is_file()]
+
+def _out_paths(files: list[Path], out_dir: Path) -> list[Path]:
+    """Mirror paths relative to the inputs' common folder, so equal stems in different folders don't collide."""
+    if not files:
+        return []
+    base = Path(os.path.commonpath([str(f.parent) for f in files]))
+    return [out_dir / f.relative_to(base).with_suffix(".pptx") for f in files]
+
+def run_batch(files: list[Path], out_dir: str, *, styles_path: str, presets_path: str,
+              overrides_path: str | None = None, template_path: str | None = None,
+              workers: int | None = None, cache_dir: str | None = None, cache_max_bytes: int = 512 << 20) -> dict:
+    out_dir = Path(out_dir).resolve()
+    jobs = list(zip(files, _out_paths(files, out_dir)))
+    results = []
+    t0 = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(styles_path, presets_path, overrides_path, template_path,
+                                       cache_dir, cache_max_bytes)) as pool:
+        futures = [pool.submit(_convert_one, str(h), str(o)) for h, o in jobs]
+        for fut in as_completed(futures):
+            r = fut.result()
+            results.append(r)
+            if r["ok"]:
+                log.info(f"OK   {r['seconds']:.3f}s  {r['html']}")
+            else:
+                log.error(f"FAIL {r['seconds']:.3f}s  {r['html']}: {r['error']}")
+
+    ok = [r for r in results if r["ok"]]
+    secs = [r["seconds"] for r in results]
+    return {
+        "total": len(results),
+        "ok": len(ok),
+        "failed": len(results) - len(ok),
+        "workers": workers or os.cpu_count(),
+        "wall_seconds": round(time.perf_counter() - t0, 4),
+        "cpu_seconds": round(sum(secs), 4),
+        "max_seconds": max(secs, default=0.0),
+        "cache_hits": sum(r.get("cache") == "hit" for r in results),
+        "files": sorted(results, key=lambda r: r["html"]),
+    }
+
+def batch_main(argv: list[str], resolve) -> int:
+    """`resolve` maps a config path to an absolute one (main._resolve)."""
+    ap = argparse.ArgumentParser(prog="main.py batch", description="Convert a directory / glob of HTML files (v3)")
+    ap.add_argument("inputs", help="Directory (recursive *.html) or glob pattern, e.g. 'reports/**/*.html'")
+    ap.add_argument("--out-dir", required=True)
+    ap.add_argument("--styles", default="config/styles.json")
+    ap.add_argument("--presets", default="config/element_presets.json")
+    ap.add_argument("--overrides", default="config/layout_overrides.json")
+    ap.add_argument("--template", default=None)
+    ap.add_argument("--workers", type=int, default=None, help="Process count (default: CPU count)")
+    ap.add_argument("--summary", default=None, help="Summary JSON path (default: <out-dir>/batch_summary.json)")
+    ap.add_argument("--cache-dir", default=None, help="Reuse PPTX rendered earlier from identical inputs (on-disk LRU)")
+    ap.add_argument("--cache-max-mb", type=int, default=512, help="Size cap of --cache-dir")
+    args = ap.parse_args(argv)
+
+    files = expand_inputs(args.inputs)
+    if not files:
+        raise SystemExit(f"No HTML files matched: {args.inputs}")
+    log.info(f"Converting {len(files)} file(s) with {args.workers or os.cpu_count()} worker(s)")
+
+    summary = run_batch(
+        files, args.out_dir,
+        styles_path=resolve(args.styles),
+        presets_path=resolve(args.presets),
+        overrides_path=resolve(args.overrides) if args.overrides else None,
+        template_path=str(Path(args.template).resolve()) if args.template else None,
+        workers=args.workers,
+        cache_dir=str(Path(args.cache_dir).resolve()) if args.cache_dir else None,
+        cache_max_bytes=args.cache_max_mb << 20,
+    )
+    summary_path = Path(args.summary) if args.summary else Path(args.out_dir) / "batch_summary.json"
+    summary_path.parent.mkdir(parents=True, exist_ok=True)
+    summary_path.write_text(json.dumps(summary, indent=2, ensure_ascii=False), encoding="utf-8")
+    log.info(f"Done: {summary['ok']}/{summary['total']} ok, {summary['failed']} failed, "
+             f"{summary['wall_seconds']:.2f}s wall. Summary: {summary_path.resolve()}")
+    return 1 if summary["failed"] else 0
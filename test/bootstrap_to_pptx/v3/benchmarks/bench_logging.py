@@ -0,0 +1,70 @@
+"""
+Benchmark: logging overhead per slide at DEBUG / INFO / WARNING.
+
+Two measurements:
+  - "slide":  build_deck_from_html on a real HTML file (parse + layout + python-pptx)
+  - "layout": layout_rows + Grid12.rect_for on a synthetic 12-row ILT, i.e. only the
+              layout math, where building debug strings used to dominate
+
+Log records go to os.devnull so the numbers show formatting cost, not terminal I/O.
+Run from v3/:
+    python benchmarks/bench_logging.py --runs 20
+For "before" numbers run the same command on an older checkout (modules there
+forced DEBUG at import, so the DEBUG row is what production paid).
+"""
+import argparse
+import logging
+import os
+import sys
+import time
+from pathlib import Path
+
+HERE = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(HERE))
+
+from renderer.pipeline import build_deck_from_html                    # noqa: E402
+from renderer.grid import Grid12                                      # noqa: E402
+from renderer.layout_solver import layout_rows                        # noqa: E402
+from parsers.generic_bootstrap_to_ilt import ILTItem, ILTRow          # noqa: E402
+
+
+def _time_per_call(fn, runs: int) -> float:
+    fn()  # warm-up (imports, first-touch caches)
+    t0 = time.perf_counter()
+    for _ in range(runs):
+        fn()
+    return (time.perf_counter() - t0) / runs
+
+
+def _synthetic_rows(n_rows: int = 12):
+    spans = (4, 4, 4)
+    return [ILTRow(items=[ILTItem(kind="card", col_span=s) for s in spans]) for _ in range(n_rows)]
+
+
+def main():
+    ap = argparse.ArgumentParser(description="v3 logging overhead benchmark")
+    ap.add_argument("--html", default=str(HERE / "test.html"))
+    ap.add_argument("--runs", type=int, default=20)
+    args = ap.parse_args()
+
+    cfg = HERE / "config"
+    render = lambda: build_deck_from_html(  # noqa: E731
+        args.html, str(cfg / "styles.json"), str(cfg / "element_presets.json"),
+        str(cfg / "layout_overrides.json"))
+
+    grid = Grid12(13.333, 7.5, (0.7, 0.7, 0.7, 0.7), 0.22)
+    rows = _synthetic_rows()
+    layout = lambda: layout_rows(grid, rows, 1.8, 0.4, row_gap_in=0.0)  # noqa: E731
+
+    sink = open(os.devnull, "w")
+    print(f"{'level':<8} {'slide ms':>9} {'layout us':>10}")
+    for level in ("DEBUG", "INFO", "WARNING"):
+        logging.basicConfig(level=getattr(logging, level), stream=sink,
+                            format="%(asctime)s [%(levelname)s] %(name)s: %(message)s", force=True)
+        slide_ms = _time_per_call(render, args.runs) * 1e3
+        layout_us = _time_per_call(layout, args.runs * 50) * 1e6
+        print(f"{level:<8} {slide_ms:>9.2f} {layout_us:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
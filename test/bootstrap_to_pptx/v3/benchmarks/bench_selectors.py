@@ -0,0 +1,76 @@
+"""
+Micro-benchmark: mapping.json selectors as strings (Tag.select per call) vs
+compiled once through utils.css_select.SelectorRegistry.
+
+For every column of the main row, each column-level mapping entry is looked up
+the way parse_bootstrap_html_to_ilt does it. Then the full parser is timed on
+an already-read file, with patterns warm (batch/server case).
+
+Run from v3/:
+    python benchmarks/bench_selectors.py --runs 2000
+"""
+import argparse
+import json
+import logging
+import sys
+import time
+from pathlib import Path
+
+HERE = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(HERE))
+
+from bs4 import BeautifulSoup                                    # noqa: E402
+from utils.css_select import SelectorRegistry                    # noqa: E402
+from parsers.bootstrap_html_to_ilt import parse_bootstrap_html_to_ilt, _classes  # noqa: E402
+
+COL_KEYS = ("left_narrative_card_body", "left_kpi_boxes", "right_steps_card", "right_icon_row",
+            "right_outlook_card_body")
+
+
+def _per_call(fn, runs: int) -> float:
+    fn()
+    t0 = time.perf_counter()
+    for _ in range(runs):
+        fn()
+    return (time.perf_counter() - t0) / runs
+
+
+def main():
+    ap = argparse.ArgumentParser(description="compiled selector registry micro-benchmark")
+    ap.add_argument("--html", default=str(HERE / "test.html"))
+    # v3's own mapping.json is the element-trigger format; the selector mapping lives in v2
+    ap.add_argument("--mapping", default=str(HERE.parent / "v2" / "config" / "mapping.json"))
+    ap.add_argument("--runs", type=int, default=2000)
+    args = ap.parse_args()
+    logging.disable(logging.INFO)
+
+    mapping = json.load(open(args.mapping, "r", encoding="utf-8"))
+    soup = BeautifulSoup(open(args.html, "r", encoding="utf-8").read(), "lxml")
+    main_row = soup.select_one(mapping["main_row"])
+    cols = [c for c in main_row.find_all(recursive=False) if any(x.startswith("col-") for x in _classes(c))]
+
+    def strings():
+        for col in cols:
+            for k in COL_KEYS:
+                col.select(mapping.get(k, ""))
+
+    SEL = SelectorRegistry(mapping)
+    def registry():
+        for col in cols:
+            for k in COL_KEYS:
+                SEL.all(k, col)
+
+    old_us = _per_call(strings, args.runs) * 1e6
+    new_us = _per_call(registry, args.runs) * 1e6
+    lookups = len(cols) * len(COL_KEYS)
+    print(f"column lookups per pass: {lookups}")
+    print(f"string selectors   {old_us:9.1f} us/pass")
+    print(f"compiled registry  {new_us:9.1f} us/pass   ({old_us / new_us:.2f}x)")
+
+    parse_runs = max(1, args.runs // 20)
+    full_ms = _per_call(lambda: parse_bootstrap_html_to_ilt(args.html, mapping), parse_runs) * 1e3
+    print(f"parse_bootstrap_html_to_ilt (incl. lxml parse) {full_ms:.2f} ms/file")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+Micro-benchmark: measuring table cells one string at a time (memoized per-char
+widths, utils.text_metrics) vs one batch call on the NumPy width table
+(utils.text_metrics_np).
+
+Cells are distinct random strings, the shape of a large data table. The Python
+path is timed cold (memo caches cleared, every string is new) and warm (the same
+strings again, all cache hits).
+
+Run from v3/:
+    python benchmarks/bench_text_metrics.py --cells 1000 10000 50000
+"""
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+HERE = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(HERE))
+
+from utils import text_metrics                                   # noqa: E402
+from utils.text_metrics import get_font, text_widths_pt          # noqa: E402
+
+WORDS = ("revenue", "EBITDA", "North", "America", "growth", "Q3", "12.4%", "–", "margin", "FY2024",
+         "operating", "cost", "Région", "€1,250", "total", "n/a", "forecast", "vs.", "plan")
+
+
+def _cells(n: int, seed: int = 0) -> list:
+    rnd = random.Random(seed)
+    return [" ".join(rnd.choice(WORDS) for _ in range(rnd.randint(1, 5))) + f" {i}" for i in range(n)]
+
+
+def _best(fn, runs: int, before=None) -> float:
+    best = float("inf")
+    for _ in range(runs):
+        if before:
+            before()
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def _clear():
+    text_metrics.text_width_pt.cache_clear()
+    text_metrics.glyph_widths.cache_clear()
+
+
+def main():
+    ap = argparse.ArgumentParser(description="text width measurement: per-string vs NumPy batch")
+    ap.add_argument("--cells", type=int, nargs="+", default=[1000, 10000, 50000])
+    ap.add_argument("--size-pt", type=float, default=11.0)
+    ap.add_argument("--runs", type=int, default=5)
+    args = ap.parse_args()
+
+    font = get_font()
+    text_widths_pt(["warm"], font, args.size_pt, backend="numpy")  # builds the width table once
+    print(f"{'cells':>7} {'python cold ms':>15} {'python warm ms':>15} {'numpy ms':>10} {'cold/numpy':>11}")
+    for n in args.cells:
+        cells = _cells(n)
+        py = lambda: text_widths_pt(cells, font, args.size_pt)  # noqa: E731
+        np_ = lambda: text_widths_pt(cells, font, args.size_pt, backend="numpy")  # noqa: E731
+        cold = _best(py, args.runs, before=_clear)
+        warm = _best(py, args.runs)
+        vec = _best(np_, args.runs)
+        print(f"{n:>7} {cold * 1e3:>15.2f} {warm * 1e3:>15.2f} {vec * 1e3:>10.2f} {cold / vec:>10.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,6 @@
 import logging
 from typing import Any, List, Dict
 
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s [%(levelname)s] %(name)s: %(message)s"
-)
 logger = logging.getLogger(__name__)
 
 def solve_grid_layout(layout_tree: List[Any], overrides: dict) -> List[List[Dict[str, Any]]]:
@@ -25,7 +21,7 @@ def solve_grid_layout(layout_tree: List[Any], overrides: dict) -> List[List[Dict
                 "position": calculate_position(col_span, overrides)
             })
         grid.append(grid_row)
-    logger.info(f"Grid layout solved for {len(grid)} rows.")
+    logger.info("Grid layout solved for %s rows.", len(grid))
     return grid
 
 def get_col_span(classes: list) -> int:
@@ -37,7 +33,7 @@ def get_col_span(classes: list) -> int:
             try:
                 return int(cls.split("-")[1])
             except Exception as e:
-                logger.warning(f"Could not parse col span from class '{cls}': {e}")
+                logger.warning("Could not parse col span from class '%s': %s", cls, e)
                 continue
     return 12
 
@@ -46,7 +42,7 @@ def calculate_position(col_span: int, overrides: dict) -> dict:
     Calculate left/top/width/height based on col_span and overrides.
     """
     # Placeholder logic; replace with your actual calculation
-    logger.debug(f"Calculating position for col_span={col_span}")
+    logger.debug("Calculating position for col_span=%s", col_span)
     return {
         "left": col_span * 0.5,
         "top": 1,
@@ -1,11 +1,8 @@
 import argparse
 import json
 import logging
+import sys
 from pathlib import Path
-from parsers.html_to_layout import parse_html_to_layout
-from layout.grid_solver import solve_grid_layout
-from renderer.render_engine import render_slide
-from renderer.render_engine import render_from_html    # new
 
 logging.basicConfig(
     level=logging.INFO,
@@ -13,6 +10,18 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+HERE = Path(__file__).parent.resolve()
+
+def _resolve(path_str: str) -> str:
+    """Resolve a path from CWD or relative to this file's directory."""
+    p = Path(path_str)
+    if p.exists():
+        return str(p.resolve())
+    p2 = HERE / path_str
+    if p2.exists():
+        return str(p2.resolve())
+    raise FileNotFoundError(f"File not found: {path_str}")
+
 def load_json(p: str) -> dict:
     """Load a JSON file and return its contents."""
     try:
@@ -26,6 +35,10 @@ def load_json(p: str) -> dict:
 
 def main() -> None:
     """Main entry point for Bootstrap HTML to PPTX conversion (v3)."""
+    if len(sys.argv) > 1 and sys.argv[1] == "batch":
+        from batch import batch_main
+        raise SystemExit(batch_main(sys.argv[2:], _resolve))
+
     parser = argparse.ArgumentParser(description="Bootstrap HTML → PPTX (v3, scalable)")
     parser.add_argument("--html", required=True)
     parser.add_argument("--out", required=True)
@@ -34,6 +47,11 @@ def main() -> None:
     parser.add_argument("--overrides", default="config/layout_overrides.json")
     args = parser.parse_args()
 
+    # imported here so --help / batch / bad arguments don't pay for python-pptx + bs4
+    from parsers.html_to_layout import parse_html_to_layout
+    from layout.grid_solver import solve_grid_layout
+    from renderer.render_engine import render_slide
+
     logger.info("Loading configs...")
     mapping = load_json(args.mapping)
     presets = load_json(args.presets)
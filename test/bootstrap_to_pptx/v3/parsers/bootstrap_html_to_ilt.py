@@ -3,27 +3,28 @@ from dataclasses import dataclass, field
 from typing import List, Optional, Dict, Any
 from bs4 import BeautifulSoup
 import re
+from utils.css_select import SelectorRegistry, compiled
 
-# Configure logging
-logging.basicConfig(level=logging.DEBUG, format="%(levelname)s: %(message)s")
+# Module logger; handlers and level are configured by the entry point (main.py).
+logger = logging.getLogger(__name__)
+
+# Fixed (non-mapping) selectors, compiled once
+_P, _UL_LI, _BOLD, _SMALL, _I = (compiled(x) for x in ("p", "ul li", ".fw-bold", "small", "i"))
 
 # Compile regex to match Bootstrap column classes like col-6, col-md-4, etc.
 _COL_PAT = re.compile(r"^col(?:-(?:sm|md|lg|xl|xxl))?-(\d{1,2})$")
 
 def _is_col_class_list(classes):
     """Return the first column width found in a class list, else None."""
-    logging.debug(f"Checking for column width in classes: {classes}")
     if not classes:
         return None
     for c in classes:
         m = _COL_PAT.match(c)
         if m:
             try:
-                width = max(1, min(12, int(m.group(1))))
-                logging.debug(f"Matched column width: {width}")
-                return width
+                return max(1, min(12, int(m.group(1))))
             except ValueError:
-                logging.warning(f"Invalid column width in class: {c}")
+                logger.warning("Invalid column width in class: %s", c)
                 pass
     return None
 
@@ -51,13 +52,10 @@ class ILT:
 
 def _classes(el):
     """Get the list of CSS classes for an element."""
-    cls = el.get("class", []) if el else []
-    logging.debug(f"Classes for element {el}: {cls}")
-    return cls
+    return el.get("class", []) if el else []
 
 def _get_col_span(cls: List[str]) -> int:
     """Get the column span (1–12) from a list of classes."""
-    logging.debug(f"Getting column span from classes: {cls}")
     w = _is_col_class_list(cls)
     if w is not None:
         return w
@@ -71,7 +69,6 @@ def _get_col_span(cls: List[str]) -> int:
 
 def _get_offset(cls: List[str]) -> int:
     """Get the column offset (0–11) from a list of classes."""
-    logging.debug(f"Getting offset from classes: {cls}")
     for c in cls:
         if c.startswith("offset-"):
             try:
@@ -82,7 +79,6 @@ def _get_offset(cls: List[str]) -> int:
 
 def _get_hfrac(cls: List[str]) -> Optional[float]:
     """Get height fraction from Bootstrap-like h-* classes."""
-    logging.debug(f"Getting height fraction from classes: {cls}")
     for c in cls:
         if c.startswith("h-"):
             m = {"25": 0.25, "50": 0.5, "75": 0.75, "100": 1.0}
@@ -92,37 +88,37 @@ def _get_hfrac(cls: List[str]) -> Optional[float]:
     return None
 
 def parse_bootstrap_html_to_ilt(html_path: str, mapping: Dict[str, str]) -> ILT:
-    logging.info(f"Parsing HTML file: {html_path}")
+    logger.info("Parsing HTML file: %s", html_path)
     soup = BeautifulSoup(open(html_path, "r", encoding="utf-8").read(), "lxml")
 
     ilt = ILT()
-    logging.debug("Created new ILT object.")
+    SEL = SelectorRegistry(mapping)
 
     # Decor shapes
-    if soup.select_one(mapping.get("decor_diagonal", "")):
-        logging.debug("Found diagonal decor.")
+    if SEL.one("decor_diagonal", soup):
+        logger.debug("Found diagonal decor.")
         ilt.decor.append("diagonal")
-    if soup.select_one(mapping.get("decor_circle", "")):
-        logging.debug("Found circle decor.")
+    if SEL.one("decor_circle", soup):
+        logger.debug("Found circle decor.")
         ilt.decor.append("circle")
 
     # Title & Subtitle
-    t = soup.select_one(mapping.get("title", ""))
-    s = soup.select_one(mapping.get("subtitle", ""))
+    t = SEL.one("title", soup)
+    s = SEL.one("subtitle", soup)
     ilt.title = t.get_text(" ", strip=True) if t else None
     ilt.subtitle = s.get_text(" ", strip=True) if s else None
-    logging.debug(f"Title: {ilt.title}, Subtitle: {ilt.subtitle}")
+    logger.debug("Title: %s, Subtitle: %s", ilt.title, ilt.subtitle)
 
     # MAIN GRID
-    main = soup.select_one(mapping.get("main_row", ""))
+    main = SEL.one("main_row", soup)
     if main:
-        logging.debug("Found main row container.")
+        logger.debug("Found main row container.")
         cols = []
         for child in main.find_all(recursive=False):
             cls = _classes(child)
             if _is_col_class_list(cls) is not None or any(c.startswith("col-") for c in cls):
                 cols.append(child)
-        logging.debug(f"Identified {len(cols)} column elements.")
+        logger.debug("Identified %s column elements.", len(cols))
 
         # Flow-pack columns into rows
         cur_row, cur_sum = ILTRow(), 0
@@ -130,48 +126,49 @@ def parse_bootstrap_html_to_ilt(html_path: str, mapping: Dict[str, str]) -> ILT:
             cls = _classes(col)
             span = _get_col_span(cls)
             off = _get_offset(cls)
-            logging.debug(f"Processing column: span={span}, offset={off}")
+            logger.debug("Processing column: span=%s, offset=%s", span, off)
 
             item_group = ILTItem(kind="column", classes=cls, col_span=span, offset=off)
 
             # Narrative
-            n_body = col.select_one(mapping.get("left_narrative_card_body", ""))
+            n_body = SEL.one("left_narrative_card_body", col)
             if n_body:
-                paras = [p.get_text(" ", strip=True) for p in n_body.select("p") if p.get_text(strip=True)]
-                bullets = [li.get_text(" ", strip=True) for li in n_body.select("ul li")]
-                logging.debug(f"Found narrative: {len(paras)} paragraphs, {len(bullets)} bullets.")
+                paras = [p.get_text(" ", strip=True) for p in _P.select(n_body) if p.get_text(strip=True)]
+                bullets = [li.get_text(" ", strip=True) for li in _UL_LI.select(n_body)]
+                logger.debug("Found narrative: %s paragraphs, %s bullets.", len(paras), len(bullets))
                 item_group.children.append(ILTItem(kind="card", classes=["card", "rounded"],
                                                    content={"paragraphs": paras, "bullets": bullets}))
 
             # KPIs
-            kpis = col.select(mapping.get("left_kpi_boxes", ""))
+            kpis = SEL.all("left_kpi_boxes", col)
             if kpis:
-                logging.debug(f"Found {len(kpis)} KPI boxes.")
+                logger.debug("Found %s KPI boxes.", len(kpis))
                 for sb in kpis[:3]:
                     c2 = _classes(sb)
-                    headline = (sb.select_one(".fw-bold") or sb).get_text(" ", strip=True)
-                    caption = (sb.select_one("small") or sb).get_text(" ", strip=True)
+                    headline = (_BOLD.select_one(sb) or sb).get_text(" ", strip=True)
+                    caption = (_SMALL.select_one(sb) or sb).get_text(" ", strip=True)
                     item_group.children.append(ILTItem(kind="kpi", classes=c2,
                                                        content={"headline": headline, "caption": caption}))
 
             # Steps
-            steps_card = col.select_one(mapping.get("right_steps_card", ""))
+            steps_card = SEL.one("right_steps_card", col)
             if steps_card:
-                header = steps_card.select_one(mapping.get("right_steps_header", ""))
-                items = [li.get_text(" ", strip=True) for li in steps_card.select(mapping.get("right_steps_list", ""))]
-                logging.debug(f"Found steps: header={header.get_text(strip=True) if header else None}, items={len(items)}")
+                header = SEL.one("right_steps_header", steps_card)
+                items = [li.get_text(" ", strip=True) for li in SEL.all("right_steps_list", steps_card)]
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Found steps: header=%s, items=%s", header.get_text(strip=True) if header else None, len(items))
                 item_group.children.append(ILTItem(kind="steps", classes=_classes(steps_card),
                                                    content={"header": header.get_text(" ", strip=True) if header else None,
                                                             "items": items}))
 
             # Icons
-            icon_row = col.select_one(mapping.get("right_icon_row", ""))
+            icon_row = SEL.one("right_icon_row", col)
             if icon_row:
-                cards = icon_row.select(mapping.get("right_icon_cards", ""))
-                logging.debug(f"Found {len(cards)} icon cards.")
+                cards = SEL.all("right_icon_cards", icon_row)
+                logger.debug("Found %s icon cards.", len(cards))
                 for c in cards[:3]:
-                    caption = c.select_one(mapping.get("right_icon_caption", ""))
-                    icon_i = c.select_one("i")
+                    caption = SEL.one("right_icon_caption", c)
+                    icon_i = _I.select_one(c)
                     icon_name = None
                     if icon_i:
                         for cc in _classes(icon_i):
@@ -183,10 +180,10 @@ def parse_bootstrap_html_to_ilt(html_path: str, mapping: Dict[str, str]) -> ILT:
                                                                 "icon": icon_name}))
 
             # Outlook
-            outlook = col.select(mapping.get("right_outlook_card_body", ""))
+            outlook = SEL.all("right_outlook_card_body", col)
             if outlook:
                 txt = " ".join(o.get_text(" ", strip=True) for o in outlook)
-                logging.debug(f"Found outlook text: {txt[:50]}...")
+                logger.debug("Found outlook text: %s...", txt[:50])
                 item_group.children.append(ILTItem(kind="outlook", classes=["card"], content={"text": txt}))
 
             item_group.height_frac = _get_hfrac(cls)
@@ -194,20 +191,20 @@ def parse_bootstrap_html_to_ilt(html_path: str, mapping: Dict[str, str]) -> ILT:
             # Add to current row or start a new one if overflow
             take = off + span
             if cur_sum + take > 12:
-                logging.debug("Row full — starting a new row.")
+                logger.debug("Row full — starting a new row.")
                 ilt.rows.append(cur_row)
                 cur_row, cur_sum = ILTRow(), 0
             cur_row.items.append(item_group)
             cur_sum += take
 
         if cur_row.items:
-            logging.debug("Adding final row to ILT.")
+            logger.debug("Adding final row to ILT.")
             ilt.rows.append(cur_row)
 
     # Footer
-    foot = soup.select_one(mapping.get("footer_left", ""))
+    foot = SEL.one("footer_left", soup)
     ilt.footer_left = foot.get_text(" ", strip=True) if foot else None
-    logging.debug(f"Footer text: {ilt.footer_left}")
+    logger.debug("Footer text: %s", ilt.footer_left)
 
-    logging.info("Finished parsing HTML into ILT object.")
+    logger.info("Finished parsing HTML into ILT object.")
     return ilt
@@ -2,6 +2,7 @@ from dataclasses import dataclass, field
 from typing import List, Optional, Dict, Any
 from bs4 import BeautifulSoup
 import re
+from utils.icons import split_name
 
 @dataclass
 class ILTItem:
@@ -110,7 +111,7 @@ def parse_generic_bootstrap_to_ilt(html_path: str) -> ILTSlide:
                     icon_name = None
                     if icon_el:
                         for cc in _classes(icon_el):
-                            if cc.startswith(("bi-","fa-")) and cc not in ("bi","fa","fas","far"):
+                            if split_name(cc):  # bi-* / fa-*, not fa-solid, fa-2x, ...
                                 icon_name = cc
                                 break
                     ilt_row.items.append(ILTItem(kind="icon", classes=_classes(icard),
@@ -2,17 +2,13 @@ import logging
 from typing import Any, List
 from bs4 import BeautifulSoup
 
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s [%(levelname)s] %(name)s: %(message)s"
-)
 logger = logging.getLogger(__name__)
 
 def parse_html_to_layout(html_path: str, mapping: dict) -> List[Any]:
     """
     Parse HTML file and return a layout tree of rows and columns.
     """
-    logger.info(f"Reading HTML file: {html_path}")
+    logger.info("Reading HTML file: %s", html_path)
     with open(html_path, "r", encoding="utf-8") as f:
         soup = BeautifulSoup(f, "html.parser")
 
@@ -28,7 +24,7 @@ def parse_html_to_layout(html_path: str, mapping: dict) -> List[Any]:
                 "bootstrap_classes": col.get("class", [])
             })
         rows.append(row_data)
-    logger.info(f"Detected {len(rows)} rows.")
+    logger.info("Detected %s rows.", len(rows))
     return rows
 
 def infer_element_type(col: Any, mapping: dict) -> str:
@@ -38,6 +34,6 @@ def infer_element_type(col: Any, mapping: dict) -> str:
     classes = col.get("class", [])
     for el_type, triggers in mapping.get("element_triggers", {}).items():
         if any(cls in classes for cls in triggers):
-            logger.debug(f"Element type '{el_type}' detected for classes: {classes}")
+            logger.debug("Element type '%s' detected for classes: %s", el_type, classes)
             return el_type
     return "text"
\ No newline at end of file
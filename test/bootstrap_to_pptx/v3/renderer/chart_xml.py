@@ -0,0 +1,189 @@
+"""
+Bulk chart builder for large series: the chart XML and its embedded workbook,
+each written in one pass.
+
+python-pptx's add_chart formats every point through a template, looks up each
+category's index by walking the whole category list (quadratic in the number of
+categories), and writes the workbook one cell at a time through XlsxWriter: a
+10k-point line chart takes seconds. Here python-pptx writes the chart XML for a
+one-point stub of the same chart (type, series names, number format), so every
+chart type keeps its own plot / axis XML; each series' point caches and sheet
+ranges are then swapped for the full ones, built as joined strings. The
+workbook is a minimal .xlsx (one sheet, inline strings) with python-pptx's
+layout, so "Edit Data" in PowerPoint opens the same table.
+
+The chart XML is the same as add_chart produces from CategoryChartData /
+XyChartData. Date categories are left to that path.
+"""
+import io
+import re
+import zipfile
+from numbers import Number
+from typing import List, Optional, Sequence, Tuple
+from xml.sax.saxutils import escape, quoteattr
+
+from lxml import etree
+from pptx.chart.data import CategoryChartData, XyChartData
+from pptx.chart.xlsx import CategoryWorkbookWriter
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import qn
+
+Values = Sequence[Optional[float]]
+
+class BulkChartData:
+    """Takes the place of a ChartData in shapes.add_chart, which only reads these two."""
+
+    def __init__(self, xml: bytes, xlsx_blob: bytes):
+        self._xml = xml
+        self.xlsx_blob = xlsx_blob
+
+    def xml_bytes(self, chart_type) -> bytes:
+        return self._xml
+
+def category_chart_data(chart_type, categories: Sequence, series: Sequence[Tuple[str, Values]],
+                        number_format: str = "General") -> BulkChartData:
+    """Chart data for (name, values) series over one level of string or numeric categories."""
+    stub = CategoryChartData(number_format)
+    stub.categories = categories[:1]
+    for name, values in series:
+        stub.add_series(name, values[:1])
+    root = parse_xml(stub.xml_bytes(chart_type))
+
+    n = len(categories)
+    numeric = isinstance(categories[0], Number)
+    cat_ref = f"Sheet1!$A$2:$A${n + 1}"
+    cat_pts = _pts(categories) if numeric else _pts(escape(str(c)) for c in categories)
+    fills = []
+    for i, (ser, (name, values)) in enumerate(zip(root.iter(qn("c:ser")), series)):
+        col = CategoryWorkbookWriter._column_reference(2 + i)
+        _splice(ser.find(qn("c:cat")), cat_ref, n, cat_pts, fills)
+        _splice(ser.find(qn("c:val")), f"Sheet1!${col}$2:${col}${len(values) + 1}", len(values), _pts(values), fills)
+    return BulkChartData(_serialize(root, fills), xlsx_blob(_column_rows(categories, series), number_format))
+
+def xy_chart_data(chart_type, series: Sequence[Tuple[str, Values, Values]],
+                  number_format: str = "General") -> BulkChartData:
+    """Chart data for (name, x values, y values) series; one two-column table per series."""
+    stub = XyChartData(number_format)
+    for name, xs, ys in series:
+        stub.add_series(name).add_data_point(xs[0], ys[0])
+    root = parse_xml(stub.xml_bytes(chart_type))
+
+    rows, offset, fills = [], 0, []
+    for ser, (name, xs, ys) in zip(root.iter(qn("c:ser")), series):
+        top, bottom = offset + 2, offset + len(xs) + 1
+        ser.find(qn("c:tx")).find(qn("c:strRef")).find(qn("c:f")).text = f"Sheet1!$B${offset + 1}"
+        _splice(ser.find(qn("c:xVal")), f"Sheet1!$A${top}:$A${bottom}", len(xs), _pts(xs), fills)
+        _splice(ser.find(qn("c:yVal")), f"Sheet1!$B${top}:$B${bottom}", len(ys), _pts(ys), fills)
+        rows.append([None, name])
+        rows.extend(zip(xs, ys))
+        rows.append([])  # spacer row between series tables
+        offset += len(xs) + 2
+    return BulkChartData(_serialize(root, fills), xlsx_blob(rows, number_format))
+
+def _pts(values) -> bytes:
+    return "".join(f'<c:pt idx="{i}"><c:v>{v}</c:v></c:pt>' for i, v in enumerate(values) if v is not None).encode()
+
+def _splice(parent, ref: str, count: int, pts: bytes, fills: List[bytes]):
+    """
+    Point the strRef / numRef under parent at ref and empty its cache, leaving a
+    marker where the count points go in when the XML is serialized (_serialize).
+    """
+    ref_el = parent[0]
+    ref_el.find(qn("c:f")).text = ref
+    cache = ref_el[1]
+    for pt in cache.findall(qn("c:pt")):
+        cache.remove(pt)
+    cache.find(qn("c:ptCount")).set("val", str(count))
+    cache.append(etree.Comment(f"pts {len(fills)}"))
+    fills.append(pts)
+
+_FILL = re.compile(rb"<!--pts (\d+)-->")
+
+def _serialize(root, fills: List[bytes]) -> bytes:
+    xml = etree.tostring(root, encoding="UTF-8", xml_declaration=True, standalone=True)
+    return _FILL.sub(lambda m: fills[int(m.group(1))], xml)
+
+def _column_rows(categories: Sequence, series: Sequence[Tuple[str, Values]]) -> List[list]:
+    """Category layout: series names in row 1, then one row per category (categories in column A)."""
+    columns = [categories] + [values for _, values in series]
+    rows = [[None] + [name for name, _ in series]]
+    rows.extend([col[r] if r < len(col) else None for col in columns] for r in range(max(map(len, columns))))
+    return rows
+
+# --- workbook ------------------------------------------------------------------
+
+_MAIN = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+_REL = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+_PKG_REL = "http://schemas.openxmlformats.org/package/2006/relationships"
+_CT = "application/vnd.openxmlformats-officedocument.spreadsheetml"
+
+_CONTENT_TYPES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    f'<Override PartName="/xl/workbook.xml" ContentType="{_CT}.sheet.main+xml"/>'
+    f'<Override PartName="/xl/worksheets/sheet1.xml" ContentType="{_CT}.worksheet+xml"/>'
+    f'<Override PartName="/xl/styles.xml" ContentType="{_CT}.styles+xml"/>'
+    "</Types>")
+_ROOT_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    f'<Relationships xmlns="{_PKG_REL}"><Relationship Id="rId1" '
+    f'Type="{_REL}/officeDocument" Target="xl/workbook.xml"/></Relationships>')
+_WORKBOOK = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    f'<workbook xmlns="{_MAIN}" xmlns:r="{_REL}"><sheets>'
+    '<sheet name="Sheet1" sheetId="1" r:id="rId1"/></sheets></workbook>')
+_WORKBOOK_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    f'<Relationships xmlns="{_PKG_REL}">'
+    f'<Relationship Id="rId1" Type="{_REL}/worksheet" Target="worksheets/sheet1.xml"/>'
+    f'<Relationship Id="rId2" Type="{_REL}/styles" Target="styles.xml"/></Relationships>')
+
+def _styles(number_format: str) -> str:
+    """Style 0 is Normal, style 1 carries the number format of the values."""
+    num_fmts, xf = "", '<xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/>'
+    if number_format != "General":
+        num_fmts = f'<numFmts count="1"><numFmt numFmtId="164" formatCode={quoteattr(number_format)}/></numFmts>'
+        xf = '<xf numFmtId="164" fontId="0" fillId="0" borderId="0" xfId="0" applyNumberFormat="1"/>'
+    return (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        f'<styleSheet xmlns="{_MAIN}">{num_fmts}'
+        '<fonts count="1"><font><sz val="11"/><name val="Calibri"/><family val="2"/></font></fonts>'
+        '<fills count="2"><fill><patternFill patternType="none"/></fill>'
+        '<fill><patternFill patternType="gray125"/></fill></fills>'
+        '<borders count="1"><border><left/><right/><top/><bottom/><diagonal/></border></borders>'
+        '<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>'
+        f'<cellXfs count="2"><xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/>{xf}</cellXfs>'
+        '<cellStyles count="1"><cellStyle name="Normal" xfId="0" builtinId="0"/></cellStyles>'
+        "</styleSheet>")
+
+def _column_letters(n: int) -> List[str]:
+    return [CategoryWorkbookWriter._column_reference(c + 1) for c in range(n)]
+
+def _cell(ref: str, value) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, str):
+        return f'<c r="{ref}" t="inlineStr"><is><t xml:space="preserve">{escape(value)}</t></is></c>'
+    return f'<c r="{ref}" s="1"><v>{value}</v></c>'
+
+def xlsx_blob(rows: Sequence[Sequence], number_format: str = "General") -> bytes:
+    """A one-sheet .xlsx holding rows from A1 (None / missing = empty cell); numbers get number_format."""
+    letters = _column_letters(max((len(r) for r in rows), default=0))
+    sheet = [f'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n<worksheet xmlns="{_MAIN}"><sheetData>']
+    for r, row in enumerate(rows, 1):
+        cells = "".join(_cell(f"{letters[c]}{r}", v) for c, v in enumerate(row))
+        if cells:
+            sheet.append(f'<row r="{r}">{cells}</row>')
+    sheet.append("</sheetData></worksheet>")
+
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w", zipfile.ZIP_DEFLATED, compresslevel=1) as z:
+        z.writestr("[Content_Types].xml", _CONTENT_TYPES)
+        z.writestr("_rels/.rels", _ROOT_RELS)
+        z.writestr("xl/workbook.xml", _WORKBOOK)
+        z.writestr("xl/_rels/workbook.xml.rels", _WORKBOOK_RELS)
+        z.writestr("xl/styles.xml", _styles(number_format))
+        z.writestr("xl/worksheets/sheet1.xml", "".join(sheet))
+    return buf.getvalue()
@@ -1,8 +1,20 @@
+import logging
 from pptx.util import Inches, Pt
 from pptx.enum.text import MSO_AUTO_SIZE, MSO_ANCHOR
-from .elements import add_card, add_card_header, add_text, add_bullets, add_kpi_tile
+from .charts import add_chart_from_spec, parse_chart_spec
+from .elements import (
+    GRAY_700, Para, add_card, add_card_header, add_text, add_bullets, add_kpi_tile, bullet_paras,
+    compact_frame, is_compact,
+)
+from .table_xml import add_table_bulk, bulk_ok
 from utils.bootstrap_mapping import apply_shape_appearance_from_bootstrap
+from utils.icons import add_icon
+from utils.images import DEFAULT_DPI, add_picture
 from utils.text_fit import wrap_text
+from utils.text_metrics import text_widths_pt
+
+# Module logger; handlers and level are configured by the entry point (main.py).
+logger = logging.getLogger(__name__)
 
 def _tf_setup(tf):
     tf.clear()
@@ -15,6 +27,12 @@ def render_card(slide, rect, item, presets, styles):
     x, y, w, h = rect.left, rect.top, rect.width, rect.height
     card = add_card(slide, x, y, w, h, radius=presets["card"]["rounded"], shadow=presets["card"]["shadow"])
     apply_shape_appearance_from_bootstrap(card, item.classes)
+    if is_compact(styles):
+        # the card's own frame; padding + a textbox's default inset as margins
+        compact_frame(slide, card, [Para(para, presets["card"]["text"]["body_pt"]) for para in item.content.get("paragraphs", [])]
+                      + [Para(f"• {b}", presets["card"]["text"]["bullet_pt"]) for b in item.content.get("bullets", [])],
+                      padding=(pad[0]+0.1, pad[1]+0.05, pad[2]+0.1, pad[3]+0.05))
+        return
 
     tx, ty = x+pad[0], y+pad[1]
     tw, th = w-(pad[0]+pad[2]), h-(pad[1]+pad[3])
@@ -40,13 +58,17 @@ def render_kpis(slide, rect, items, presets, styles):
                      headline=k.content.get("headline",""), caption=cap,
                      bg_hex=presets["kpi"]["bg_hex"],
                      headline_pt=presets["kpi"]["headline_pt"],
-                     caption_pt=presets["kpi"]["caption_pt"])
+                     caption_pt=presets["kpi"]["caption_pt"], compact=is_compact(styles))
 
 def render_steps(slide, rect, item, presets, styles):
     card = add_card(slide, rect.left, rect.top, rect.width, rect.height,
                     radius=presets["steps"]["rounded"], shadow=presets["steps"]["shadow"])
     header = item.content.get("header") or "Steps"
-    add_card_header(slide, card, header)
+    add_card_header(slide, card, header, compact=is_compact(styles))
+    if is_compact(styles):
+        compact_frame(slide, card, bullet_paras(item.content.get("items", []), size=presets["steps"]["item_pt"], numbered=True),
+                      padding=(0.36, 0.74, 0.36, 0.24))
+        return
     tb = add_bullets(slide, rect.left+0.3, rect.top+0.7, rect.width-0.6, rect.height-0.9,
                      item.content.get("items", []),
                      size=presets["steps"]["item_pt"], numbered=True)
@@ -58,30 +80,86 @@ def render_icon_row(slide, rect, items, presets, styles):
     for i, it in enumerate(items):
         card = add_card(slide, x + i*(tile_w+gutter), y, tile_w, tile_h,
                         radius=presets["icon"]["rounded"], shadow=presets["icon"]["shadow"])
-        add_text(slide, x + i*(tile_w+gutter) + 0.2, y + 0.8, tile_w-0.4, 0.6,
-                 it.content.get("caption",""), size=presets["icon"]["caption_pt"])
+        # Glyph above the caption (utils.icons: rasterized once, kept in styles["icons"]["cache_dir"] if set)
+        if it.content.get("icon"):
+            img_h = styles["icons"]["img_h_in"]
+            add_icon(slide.shapes, it.content["icon"], Inches(x + i*(tile_w+gutter) + (tile_w - img_h)/2),
+                     Inches(y + 0.12), Inches(img_h), styles)
+        if is_compact(styles):
+            compact_frame(slide, card, [Para(it.content.get("caption",""), presets["icon"]["caption_pt"], GRAY_700)],
+                          padding=(0.26, 0.84, 0.26, 0.04))
+        else:
+            add_text(slide, x + i*(tile_w+gutter) + 0.2, y + 0.8, tile_w-0.4, 0.6,
+                     it.content.get("caption",""), size=presets["icon"]["caption_pt"])
+
+CELL_MARGIN_IN = 0.1  # python-pptx / PowerPoint default left + right cell margin
+
+def _column_widths_in(rows, n_cols, total_in, header_pt, cell_pt, backend="python"):
+    """
+    Column widths proportional to the widest measured cell of each column (text on
+    one line + margins), no column below a third of an even share. Each row size is
+    measured in one batch call.
+    """
+    natural = [2 * CELL_MARGIN_IN] * n_cols
+    for size, part in ((header_pt, rows[:1]), (cell_pt, rows[1:])):
+        texts = [(row[c] if c < len(row) else "") or "" for row in part for c in range(n_cols)]
+        for i, w_pt in enumerate(text_widths_pt(texts, size_pt=size, backend=backend)):
+            c = i % n_cols
+            natural[c] = max(natural[c], w_pt / 72.0 + 2 * CELL_MARGIN_IN)
+    floor = total_in / n_cols / 3.0
+    natural = [max(floor, w) for w in natural]
+    scale = total_in / sum(natural)
+    return [w * scale for w in natural]
 
-def render_table(slide, rect, item, presets):
+def render_table(slide, rect, item, presets, styles=None):
     rows = item.content.get("rows", [])
     if not rows: return
-    # simple table: let pptx compute cell sizes; we set overall bounds
+    # overall bounds from the layout; columns sized by measured content
+    header_pt, cell_pt = presets["table"]["header_pt"], presets["table"]["cell_pt"]
+    backend = (styles or {}).get("text_metrics", {}).get("backend", "python")
+    widths = [Inches(w) for w in _column_widths_in(rows, len(rows[0]), rect.width, header_pt, cell_pt, backend)]
+    widths[-1] = Inches(rect.width) - sum(widths[:-1])  # no rounding gap at the right edge
+    if bulk_ok(rows):
+        add_table_bulk(slide.shapes, rows, Inches(rect.left), Inches(rect.top), Inches(rect.width),
+                       Inches(rect.height), col_widths=widths, header_fill=presets["table"]["header_fill"],
+                       header_pt=header_pt, cell_pt=cell_pt)
+    else:
+        render_table_cells(slide, rect, rows, widths, header_pt, cell_pt)
+
+def render_table_cells(slide, rect, rows, widths, header_pt, cell_pt):
+    """Per-cell path (python-pptx proxies): line breaks, control characters, ragged rows."""
     table = slide.shapes.add_table(rows=len(rows), cols=len(rows[0]),
                                    left=Inches(rect.left), top=Inches(rect.top),
                                    width=Inches(rect.width), height=Inches(rect.height)).table
+    for col, w in zip(table.columns, widths):
+        col.width = w
     for r, row in enumerate(rows):
         for c, txt in enumerate(row):
             cell = table.cell(r, c)
             cell.text = txt or ""
+            cell.text_frame.paragraphs[0].font.size = Pt(header_pt if r == 0 else cell_pt)
             if r == 0:  # header
                 cell.fill.solid(); 
                 from pptx.dml.color import RGBColor
                 cell.fill.fore_color.rgb = RGBColor(0xF1,0xF3,0xF5)
+    return table
 
-def render_image(slide, rect, item, presets):
+def render_image(slide, rect, item, presets, base_dir=None):
     src = item.content.get("src")
     if not src: return
-    slide.shapes.add_picture(src, Inches(rect.left), Inches(rect.top),
-                             width=Inches(rect.width))  # keep aspect
+    # resized to the rect, encoded once, one image part per deck (utils.images)
+    add_picture(slide.shapes, src, Inches(rect.left), Inches(rect.top), width=Inches(rect.width),  # keep aspect
+                base_dir=base_dir, dpi=presets["image"].get("dpi", DEFAULT_DPI))
+
+def render_chart(slide, rect, item, presets):
+    try:
+        spec = parse_chart_spec(item.content.get("spec") or "{}")
+    except ValueError as e:  # no chart in the spec: leave a placeholder
+        logger.warning("Chart not rendered: %s", e)
+        add_text(slide, rect.left, rect.top, rect.width, rect.height, "[Chart placeholder]", size=presets["text"]["pt"])
+        return None
+    return add_chart_from_spec(slide.shapes, spec, Inches(rect.left), Inches(rect.top), Inches(rect.width),
+                               Inches(rect.height), presets.get("chart"))
 
 def render_text(slide, rect, item, presets):
     add_text(slide, rect.left, rect.top, rect.width, rect.height,
@@ -1,18 +1,18 @@
 import logging
 from pptx.util import Inches
 
-# Set or adjust this in your app's entrypoint
-logging.basicConfig(level=logging.DEBUG, format="%(levelname)s: %(message)s")
+# Level/handlers are configured by the app entrypoint, not here.
+logger = logging.getLogger(__name__)
 
 class Grid12:
     """
     Simple 12-col grid helper for 16:9 slides.
 
-    Logs:
+    Logs (DEBUG only, so nothing is formatted unless enabled):
       - Slide/margin/gutter config on init
       - Computed content area & column width
       - Every rect request with inputs and outputs
-      - Warnings if col_start/col_span exceed the 12-col layout
+    Always warns if col_start/col_span exceed the 12-col layout.
     """
 
     def __init__(
@@ -22,11 +22,12 @@ class Grid12:
         margins_in: tuple[float, float, float, float] = (0.6, 0.6, 0.6, 0.7),
         gutter_in: float = 0.2,
     ):
-        logging.info("Initializing Grid12")
-        logging.debug(f"Slide size (in): width={slide_width_in}, height={slide_height_in}")
-        logging.debug(f"Margins (in): left={margins_in[0]}, top={margins_in[1]}, "
-                      f"right={margins_in[2]}, bottom={margins_in[3]}")
-        logging.debug(f"Gutter (in): {gutter_in}")
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug("Initializing Grid12")
+            logger.debug("Slide size (in): width=%s, height=%s", slide_width_in, slide_height_in)
+            logger.debug("Margins (in): left=%s, top=%s, right=%s, bottom=%s", *margins_in)
+            logger.debug("Gutter (in): %s", gutter_in)
 
         self.sw = slide_width_in
         self.sh = slide_height_in
@@ -36,13 +37,14 @@ class Grid12:
         # Compute content area inside margins
         self.content_w = self.sw - self.m_left - self.m_right
         self.content_h = self.sh - self.m_top - self.m_bottom
-        logging.debug(f"Content area (in): width={self.content_w}, height={self.content_h}")
 
         # There are 11 gutters between 12 columns
         total_gutters = 11 * self.gutter
         self.col_w = (self.content_w - total_gutters) / 12.0
-        logging.debug(f"Total gutters (in): {total_gutters}")
-        logging.debug(f"Computed column width (in): {self.col_w}")
+        if debug:
+            logger.debug("Content area (in): width=%s, height=%s", self.content_w, self.content_h)
+            logger.debug("Total gutters (in): %s", total_gutters)
+            logger.debug("Computed column width (in): %s", self.col_w)
 
     def rect_for(self, *, row_top_in: float, col_start: int, col_span: int, height_in: float):
         """
@@ -53,27 +55,25 @@ class Grid12:
         col_span:   number of columns to span (1..12)
         height_in:  desired height in inches
         """
-        logging.info("Grid12.rect_for called")
-        logging.debug(f"Inputs -> row_top_in={row_top_in}, col_start={col_start}, "
-                      f"col_span={col_span}, height_in={height_in}")
-
         # Light sanity checks with warnings (no hard fail to keep behavior unchanged)
         if col_start < 0 or col_start > 11:
-            logging.warning(f"col_start={col_start} is outside 0..11")
+            logger.warning("col_start=%s is outside 0..11", col_start)
         if col_span < 1 or col_span > 12:
-            logging.warning(f"col_span={col_span} is outside 1..12")
+            logger.warning("col_span=%s is outside 1..12", col_span)
         if (col_start + col_span) > 12:
-            logging.warning(f"col_start+col_span={col_start + col_span} exceeds 12 columns")
+            logger.warning("col_start+col_span=%s exceeds 12 columns", col_start + col_span)
 
         left = self.m_left + col_start * (self.col_w + self.gutter)
         width = col_span * self.col_w + (col_span - 1) * self.gutter
         top = self.m_top + row_top_in
 
-        logging.debug(f"Computed -> left={left}, top={top}, width={width}, height={height_in}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("rect_for(row_top_in=%s, col_start=%s, col_span=%s, height_in=%s) -> "
+                         "left=%s, top=%s, width=%s", row_top_in, col_start, col_span, height_in,
+                         left, top, width)
         return left, top, width, height_in
 
     @staticmethod
     def inches(x: float):
         """Convenience wrapper to convert inches to EMUs for python-pptx APIs."""
-        logging.debug(f"Converting inches to EMUs: {x}\"")
         return Inches(x)
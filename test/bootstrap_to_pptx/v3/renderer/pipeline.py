@@ -1,15 +1,15 @@
 import json, os
-from pptx import Presentation
 from pptx.util import Inches, Pt
 from .grid import Grid12
 from .layout_solver import Rect
 from parsers.generic_bootstrap_to_ilt import parse_generic_bootstrap_to_ilt, ILTItem
 from .element_registry import (
     render_card, render_kpis, render_steps, render_icon_row,
-    render_table, render_image, render_text
+    render_table, render_image, render_chart, render_text
 )
 from utils.merge import deep_update
 from utils.clean_up import cleanup_slide
+from utils.template_cache import open_template
 
 def layout_columns(grid: Grid12, ilt_rows, band_top_in: float, band_height_in: float, row_gap_in: float = 0.2):
     """Yield (row_index, [(Rect, [ILTItem or group])...]). Groups similar kinds."""
@@ -44,15 +44,24 @@ def layout_columns(grid: Grid12, ilt_rows, band_top_in: float, band_height_in: f
         cur_top += band_height_in + row_gap_in
     return out
 
-def build_deck_from_html(html_path: str, styles_path: str, presets_path: str, overrides_path: str = None, template_path: str = None):
+def load_configs(styles_path: str, presets_path: str, overrides_path: str = None):
+    """Load styles (merged with overrides) + presets once; both are read-only while rendering."""
     ST = json.load(open(styles_path,"r",encoding="utf-8"))
     PRE = json.load(open(presets_path,"r",encoding="utf-8"))
     if overrides_path and os.path.exists(overrides_path):
         deep_update(ST, json.load(open(overrides_path,"r",encoding="utf-8")))
+    return ST, PRE
+
+def build_deck_from_html(html_path: str, styles_path: str, presets_path: str, overrides_path: str = None, template_path: str = None):
+    ST, PRE = load_configs(styles_path, presets_path, overrides_path)
+    return build_deck_with_configs(html_path, ST, PRE, template_path)
 
+def build_deck_with_configs(html_path: str, ST: dict, PRE: dict, template_path: str = None):
+    """Same as build_deck_from_html, with already-loaded configs (batch workers reuse them)."""
     ilt = parse_generic_bootstrap_to_ilt(html_path)
+    base_dir = os.path.dirname(os.path.abspath(html_path))  # relative img[src] resolve against the HTML
 
-    prs = Presentation(template_path) if template_path else Presentation()
+    prs = open_template(template_path)
     prs.slide_width  = Inches(ST["page"]["width_in"])
     prs.slide_height = Inches(ST["page"]["height_in"])
     slide = prs.slides.add_slide(prs.slide_layouts[6])
@@ -65,7 +74,7 @@ def build_deck_from_html(html_path: str, styles_path: str, presets_path: str, ov
     )
 
     # title/subtitle (optional)
-    from .elements import add_title, add_subtitle, add_footer_bar
+    from .elements import add_title, add_subtitle, add_footer_bar, is_compact
     if ilt.title:    add_title(slide, 0.6, ST["title"]["top_in"], 12.0, 0.9, ilt.title)
     if ilt.subtitle: add_subtitle(slide, 0.6, ST["subtitle"]["top_in"], 12.0, 0.6, ilt.subtitle)
 
@@ -91,11 +100,9 @@ def build_deck_from_html(html_path: str, styles_path: str, presets_path: str, ov
                                   rect.height * (it.h_frac if it.h_frac else 1.0))
                 if it.kind == "card":   render_card(slide, inner_rect, it, PRE, ST)
                 elif it.kind == "steps":render_steps(slide, inner_rect, it, PRE, ST)
-                elif it.kind == "table":render_table(slide, inner_rect, it, PRE)
-                elif it.kind == "image":render_image(slide, inner_rect, it, PRE)
-                elif it.kind == "chart":
-                    # placeholder: you can implement your chart spec→pptx here
-                    render_text(slide, inner_rect, ILTItem(kind="text", content={"text":"[Chart placeholder]"}), PRE)
+                elif it.kind == "table":render_table(slide, inner_rect, it, PRE, ST)
+                elif it.kind == "image":render_image(slide, inner_rect, it, PRE, base_dir)
+                elif it.kind == "chart":render_chart(slide, inner_rect, it, PRE)
                 elif it.kind == "text": render_text(slide, inner_rect, it, PRE)
                 else:
                     # fallback: render as text
@@ -110,7 +117,8 @@ def build_deck_from_html(html_path: str, styles_path: str, presets_path: str, ov
                        left_text=ilt.footer_left,
                        right_text=f"{ST['footer'].get('prefix','Pg ')}1",
                        left_pt=ST["footer"]["left_pt"],
-                       right_pt=ST["footer"]["right_pt"])
+                       right_pt=ST["footer"]["right_pt"],
+                       compact=is_compact(ST))
 
     from utils.clean_up import cleanup_slide
     cleanup_slide(slide)
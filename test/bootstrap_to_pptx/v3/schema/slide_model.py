@@ -2,8 +2,8 @@ import logging
 from dataclasses import dataclass, field
 from typing import List, Optional
 
-# Configure logging (adjust level as needed in main app)
-logging.basicConfig(level=logging.DEBUG, format="%(levelname)s: %(message)s")
+# Module logger; handlers and level are configured by the entry point (main.py).
+logger = logging.getLogger(__name__)
 
 @dataclass
 class TitleBlock:
@@ -11,7 +11,7 @@ class TitleBlock:
     subtitle: Optional[str] = None
 
     def __post_init__(self):
-        logging.debug(f"TitleBlock created: title='{self.title}', subtitle='{self.subtitle}'")
+        logger.debug("TitleBlock created: title='%s', subtitle='%s'", self.title, self.subtitle)
 
 @dataclass
 class Narrative:
@@ -19,7 +19,7 @@ class Narrative:
     bullets: List[str] = field(default_factory=list)
 
     def __post_init__(self):
-        logging.debug(f"Narrative created: {len(self.paragraphs)} paragraphs, {len(self.bullets)} bullets")
+        logger.debug("Narrative created: %s paragraphs, %s bullets", len(self.paragraphs), len(self.bullets))
 
 @dataclass
 class KpiTile:
@@ -28,7 +28,7 @@ class KpiTile:
     color_hex: str = "#0d6efd"
 
     def __post_init__(self):
-        logging.debug(f"KpiTile created: headline='{self.headline}', caption='{self.caption}', color_hex='{self.color_hex}'")
+        logger.debug("KpiTile created: headline='%s', caption='%s', color_hex='%s'", self.headline, self.caption, self.color_hex)
 
 @dataclass
 class StepsList:
@@ -36,7 +36,7 @@ class StepsList:
     items: List[str] = field(default_factory=list)
 
     def __post_init__(self):
-        logging.debug(f"StepsList created: header='{self.header}', items={len(self.items)}")
+        logger.debug("StepsList created: header='%s', items=%s", self.header, len(self.items))
 
 @dataclass
 class IconHighlight:
@@ -44,14 +44,15 @@ class IconHighlight:
     caption: str = ""
 
     def __post_init__(self):
-        logging.debug(f"IconHighlight created: icon_name='{self.icon_name}', caption='{self.caption}'")
+        logger.debug("IconHighlight created: icon_name='%s', caption='%s'", self.icon_name, self.caption)
 
 @dataclass
 class Outlook:
     text: str = ""
 
     def __post_init__(self):
-        logging.debug(f"Outlook created: text='{self.text[:50]}{'...' if len(self.text) > 50 else ''}'")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Outlook created: text='%s%s'", self.text[:50], "..." if len(self.text) > 50 else "")
 
 @dataclass
 class FooterBar:
@@ -59,14 +60,14 @@ class FooterBar:
     right_text: str = ""
 
     def __post_init__(self):
-        logging.debug(f"FooterBar created: left_text='{self.left_text}', right_text='{self.right_text}'")
+        logger.debug("FooterBar created: left_text='%s', right_text='%s'", self.left_text, self.right_text)
 
 @dataclass
 class DecorShape:
     kind: str  # "diagonal" or "circle"
 
     def __post_init__(self):
-        logging.debug(f"DecorShape created: kind='{self.kind}'")
+        logger.debug("DecorShape created: kind='%s'", self.kind)
 
 @dataclass
 class SlideModel:
@@ -80,13 +81,12 @@ class SlideModel:
     footer: Optional[FooterBar] = None
 
     def __post_init__(self):
-        logging.debug(
-            f"SlideModel created: title_block={self.title_block}, "
-            f"decor_count={len(self.decor)}, "
-            f"narrative={'present' if self.narrative else 'none'}, "
-            f"kpis_count={len(self.kpis)}, "
-            f"steps={'present' if self.steps else 'none'}, "
-            f"icons_count={len(self.icon_highlights)}, "
-            f"outlook={'present' if self.outlook else 'none'}, "
-            f"footer={'present' if self.footer else 'none'}"
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
+        logger.debug(
+            "SlideModel created: title_block=%s, decor_count=%s, narrative=%s, kpis_count=%s, "
+            "steps=%s, icons_count=%s, outlook=%s, footer=%s",
+            self.title_block, len(self.decor), "present" if self.narrative else "none", len(self.kpis),
+            "present" if self.steps else "none", len(self.icon_highlights),
+            "present" if self.outlook else "none", "present" if self.footer else "none",
         )
@@ -0,0 +1,68 @@
+import pytest
+from utils.text_fit import fit_font_size, wrap_text
+from utils.text_metrics import (
+    PT_PER_IN, fit_size_to_box, get_font, text_height_in, text_width_pt, wrap_lines,
+)
+
+ARIAL = get_font()
+INSET = (0.1, 0.05)
+
+
+def test_widths_come_from_the_bundled_arial_table():
+    assert text_width_pt("a", ARIAL, 10) == pytest.approx(5.56)
+    assert text_width_pt("aaa bbb", ARIAL, 10) == pytest.approx(6 * 5.56 + 2.78)
+    assert text_width_pt("é", ARIAL, 10) == text_width_pt("e", ARIAL, 10)   # accented -> base letter
+    assert text_width_pt("漢", ARIAL, 10) == 10                             # CJK: one em
+
+
+def test_wrap_at_a_known_width():
+    # at 10 pt: "aaa bbb" is 36.14 pt, "bbb ccc" 34.46 pt, "aaa bbb ccc" 53.92 pt
+    assert wrap_lines("aaa bbb ccc", 40, ARIAL, 10) == ("aaa bbb", "ccc")
+    assert wrap_lines("aaa bbb ccc", 36, ARIAL, 10) == ("aaa", "bbb ccc")
+    assert wrap_lines("aaa bbb ccc", 34, ARIAL, 10) == ("aaa", "bbb", "ccc")
+    assert wrap_lines("aaa bbb ccc", 60, ARIAL, 10) == ("aaa bbb ccc",)
+    assert wrap_lines("aaa\n\nbbb", 60, ARIAL, 10) == ("aaa", "", "bbb")
+
+
+def test_an_over_long_word_is_split_at_characters():
+    # "m" is 8.33 pt at 10 pt: three fit in 30 pt, four do not
+    assert wrap_lines("mmmmmmmmmm", 30, ARIAL, 10) == ("mmm", "mmm", "mmm", "m")
+    assert wrap_lines("ab mmmmmmm cd", 30, ARIAL, 10) == ("ab", "mmm", "mmm", "m cd")
+    assert all(text_width_pt(line, ARIAL, 10) <= 30 for line in wrap_lines("m" * 50, 30, ARIAL, 10))
+
+
+def test_text_height_counts_lines_and_insets():
+    width_in = 40 / PT_PER_IN + 2 * INSET[0]   # 40 pt inside the margins: two lines
+    assert text_height_in("aaa bbb ccc", width_in, 10) == pytest.approx(2 * 10 * 1.15 / PT_PER_IN + 2 * INSET[1])
+    assert text_height_in("aaa bbb ccc", width_in, 10, space_after_pt=6) == pytest.approx(
+        (2 * 10 * 1.15 + 6) / PT_PER_IN + 2 * INSET[1])
+
+
+@pytest.mark.parametrize("text,box", [
+    ("Quarterly revenue grew in every region", (2.0, 0.6)),
+    ("word " * 60, (3.0, 1.5)),
+    ("Short", (1.0, 0.4)),
+])
+def test_fit_returns_the_largest_size_that_fits(text, box):
+    size = fit_size_to_box(text, box[0], box[1], 40, 6)
+    assert text_height_in(text, box[0], size) <= box[1]
+    assert size == 40 or text_height_in(text, box[0], size + 1) > box[1]
+
+
+def test_fit_returns_min_pt_when_nothing_fits():
+    assert fit_size_to_box("word " * 500, 1.0, 0.3, 24, 9) == 9
+    assert fit_size_to_box("x", 5.0, 5.0, 24, 9) == 24
+    assert fit_size_to_box("   ", 0.1, 0.1, 24, 9) == 24   # nothing to fit
+
+
+def test_fit_font_size_without_a_box_keeps_the_length_heuristic():
+    assert fit_font_size("x" * 40, 50, 16, 12) == 16                    # within budget
+    assert fit_font_size("x" * 60, 50, 20, 8) == int(20 * (0.6 + 0.4 * 50 / 60))
+    assert fit_font_size("x" * 500, 50, 16, 12) == 12                   # floored at min_pt
+    assert fit_font_size("", 50, 16, 12) == 16
+
+
+def test_fit_font_size_with_a_box_measures():
+    text = "Quarterly revenue grew in every region"
+    assert fit_font_size(text, 10, 28, 8, box_in=(2.0, 0.6)) == fit_size_to_box(text, 2.0, 0.6, 28, 8)
+    assert wrap_text(text, width_in=1.0, size_pt=12).split("\n") == list(wrap_lines(text, 72.0, ARIAL, 12))
@@ -0,0 +1,29 @@
+import numpy as np
+import pytest
+from utils.text_metrics import get_font, text_width_pt, text_widths_pt
+from utils.text_metrics_np import advance_units, codepoints, string_widths, width_table
+
+TEXTS = ["", "Hello, world!", "café naïve Ångström — “quotes”", "漢字かなカナ", "ｆｕｌｌ",
+         "emoji 😀👍🏽", "𝐛𝐨𝐥𝐝 math", "", "mixed 😀 é 漢 x"]
+
+
+@pytest.mark.parametrize("bold", [False, True])
+@pytest.mark.parametrize("size", [9, 11.5, 24])
+def test_numpy_widths_match_the_python_backend(bold, size):
+    font = get_font(bold=bold)
+    expected = [text_width_pt(t, font, size) for t in TEXTS]
+    assert np.allclose(string_widths(TEXTS, font, size), expected)
+    assert np.allclose(text_widths_pt(TEXTS, font, size, backend="numpy"), text_widths_pt(TEXTS, font, size))
+
+
+def test_codepoints_past_the_table_are_looked_up():
+    font = get_font()
+    cps, lengths = codepoints(["a😀", "😀b😀"])
+    assert list(lengths) == [2, 3] and cps.max() >= len(width_table(font))
+    assert list(advance_units(cps, font)) == [font.advance(chr(int(cp))) for cp in cps]
+
+
+def test_empty_batches():
+    font = get_font()
+    assert len(string_widths([], font, 12)) == 0
+    assert list(string_widths(["", ""], font, 12)) == [0, 0]
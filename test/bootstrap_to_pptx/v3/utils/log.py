@@ -1,7 +1,4 @@
 import logging
 
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s [%(levelname)s] %(name)s: %(message)s"
-)
-logger = logging.getLogger(__name__)
\ No newline at end of file
+# Library modules only ask for a logger; handlers/level belong to the entry point.
+logger = logging.getLogger(__name__)
@@ -0,0 +1,47 @@
+"""
+Per-process cache of parsed templates.
+
+Presentation(path) unzips and parses the whole package (masters, layouts, theme,
+media) on every call. open_template() loads each template once per
+(path, mtime, size) and hands out copy.deepcopy() of that pristine Presentation:
+lxml trees are copied in C, and binary parts (images, fonts) keep sharing their
+immutable bytes, so a copy costs a small fraction of a reload. Saving a new
+version of the file (new mtime/size) loads it again on the next call.
+"""
+import copy
+import os
+import threading
+from typing import Dict, Optional, Tuple
+
+from pptx import Presentation
+
+_PRISTINE: Dict[Tuple[str, int, int], object] = {}
+_LOCK = threading.Lock()
+STATS = {"loads": 0, "copies": 0}
+
+def _key(template_path: Optional[str]) -> Tuple[str, int, int]:
+    if not template_path:
+        return ("", 0, 0)  # python-pptx default template, never changes
+    path = os.path.abspath(template_path)
+    st = os.stat(path)
+    return (path, st.st_mtime_ns, st.st_size)
+
+def open_template(template_path: Optional[str] = None):
+    """A fresh Presentation of template_path (python-pptx default when None), from the cache."""
+    key = _key(template_path)
+    pristine = _PRISTINE.get(key)
+    if pristine is None:
+        with _LOCK:
+            pristine = _PRISTINE.get(key)
+            if pristine is None:
+                # drop older versions of the same file
+                for stale in [k for k in _PRISTINE if k[0] == key[0]]:
+                    del _PRISTINE[stale]
+                pristine = _PRISTINE[key] = Presentation(key[0] or None)
+                STATS["loads"] += 1
+    STATS["copies"] += 1
+    return copy.deepcopy(pristine)
+
+def clear_cache() -> None:
+    with _LOCK:
+        _PRISTINE.clear()
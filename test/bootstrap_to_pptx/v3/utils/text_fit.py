@@ -1,11 +1,19 @@
 from pptx.util import Pt
 
-def fit_font_size(text: str, max_chars: int, base_pt: int = 16, min_pt: int = 12) -> int:
+from utils.text_metrics import fit_size_to_box, get_font, wrap_lines
+
+def fit_font_size(text: str, max_chars: int = 0, base_pt: int = 16, min_pt: int = 12, *,
+                  box_in=None, font=None, **fit) -> int:
     """
-    Heuristic font fitter: gently reduces size as content length exceeds a rough budget.
+    With box_in=(width, height): largest size <= base_pt at which the text, wrapped
+    with real font metrics, fits the box (see utils.text_metrics.fit_size_to_box;
+    extra keywords such as inset_in / space_after_pt are passed through).
+    Otherwise the old heuristic: gently reduces size as content length exceeds max_chars.
     """
     if not text:
         return base_pt
+    if box_in is not None:
+        return fit_size_to_box(text, box_in[0], box_in[1], base_pt, min_pt, font or get_font(), **fit)
     n = len(text.strip())
     if n <= max_chars:
         return base_pt
@@ -13,12 +21,15 @@ def fit_font_size(text: str, max_chars: int, base_pt: int = 16, min_pt: int = 12
     size = int(base_pt * (0.6 + 0.4 * ratio))  # stay in [~60%, 100%]
     return max(min_pt, size)
 
-def wrap_text(s: str, limit: int = 35) -> str:
+def wrap_text(s: str, limit: int = 35, *, width_in: float = None, size_pt: float = None, font=None) -> str:
     """
     Simple greedy wrapper: breaks s into lines of ~limit chars without hyphenation.
+    With width_in and size_pt, lines are filled by measured width instead (inches, no insets).
     """
     if not s:
         return ""
+    if width_in is not None and size_pt is not None:
+        return "\n".join(wrap_lines(" ".join(s.split()), width_in * 72.0, font or get_font(), size_pt))
     words = s.split()
     lines, line = [], []
     count = 0
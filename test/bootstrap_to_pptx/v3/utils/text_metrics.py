@@ -0,0 +1,209 @@
+"""
+Text measurement from font advance widths: string widths, word-wrapped line
+counts, block heights, and the largest point size that fits a box.
+
+Metrics come from a TrueType/OpenType file via fontTools when a path is given
+(optional dependency, only imported then), otherwise from the bundled table:
+Arial/Helvetica advance widths (1000 units/em, ASCII + common punctuation).
+Arial is a little wider than Calibri (the default theme font), so for decks
+using Calibri the bundled table errs on the side of smaller text that fits.
+
+Everything is memoized: glyph widths per (font, size), and widths / wrapped
+lines / fitted sizes per (text, font, size, box), so repeated captions, bullets
+and retries of the size search cost a dict lookup.
+"""
+import logging
+import unicodedata
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence, Tuple
+
+# Module logger; handlers and level are configured by the entry point (main.py).
+logger = logging.getLogger(__name__)
+
+PT_PER_IN = 72.0
+DEFAULT_INSET_IN = (0.1, 0.05)  # PowerPoint text frame margins (left/right, top/bottom)
+
+# Arial / Helvetica advance widths, codepoints 32..126, 1000 units per em.
+_ASCII_REGULAR = (
+    278, 278, 355, 556, 556, 889, 667, 191, 333, 333, 389, 584, 278, 333, 278, 278,
+    556, 556, 556, 556, 556, 556, 556, 556, 556, 556, 278, 278, 584, 584, 584, 556,
+    1015, 667, 667, 722, 722, 667, 611, 778, 722, 278, 500, 667, 556, 833, 722, 778,
+    667, 778, 722, 667, 611, 722, 667, 944, 667, 667, 611, 278, 278, 278, 469, 556,
+    333, 556, 556, 500, 556, 556, 278, 556, 556, 222, 222, 500, 222, 833, 556, 556,
+    556, 556, 333, 500, 278, 556, 500, 722, 500, 500, 500, 334, 260, 334, 584,
+)
+_ASCII_BOLD = (
+    278, 333, 474, 556, 556, 889, 722, 238, 333, 333, 389, 584, 278, 333, 278, 278,
+    556, 556, 556, 556, 556, 556, 556, 556, 556, 556, 333, 333, 584, 584, 584, 611,
+    975, 722, 722, 722, 722, 667, 611, 778, 722, 278, 556, 722, 611, 833, 722, 778,
+    667, 778, 722, 667, 611, 722, 667, 944, 667, 667, 611, 333, 278, 333, 584, 556,
+    333, 556, 611, 556, 611, 556, 333, 611, 611, 278, 278, 556, 278, 889, 611, 611,
+    611, 611, 389, 556, 333, 611, 556, 778, 556, 556, 500, 389, 280, 389, 584,
+)
+# nbsp, (c), degree, middle dot, times, bullet, en/em dash, quotes, ellipsis, euro
+_EXTRA_REGULAR = {0xA0: 278, 0xA9: 737, 0xB0: 400, 0xB7: 278, 0xD7: 584, 0x2022: 350, 0x2013: 556,
+                  0x2014: 1000, 0x2018: 222, 0x2019: 222, 0x201C: 333, 0x201D: 333, 0x2026: 1000, 0x20AC: 556}
+_EXTRA_BOLD = {**_EXTRA_REGULAR, 0x2018: 278, 0x2019: 278, 0x201C: 500, 0x201D: 500}
+
+# Arial hhea: (ascender + descender + line gap) / units per em = (1854 + 434 + 67) / 2048
+_ARIAL_LINE_HEIGHT = 1.15
+_BUNDLED_ALIASES = {"arial", "helvetica", "liberation sans", "arimo"}
+
+@dataclass(eq=False)  # compared/hashed by identity: one instance per loaded font (see get_font)
+class FontMetrics:
+    name: str
+    upm: int                                 # font units per em
+    advances: Dict[int, int] = field(repr=False)  # codepoint -> advance width (font units)
+    default_advance: int                     # for codepoints the font has no width for
+    line_height: float                       # line pitch as a multiple of the font size
+
+    def advance(self, ch: str) -> int:
+        cp = ord(ch)
+        adv = self.advances.get(cp)
+        if adv is not None:
+            return adv
+        if unicodedata.east_asian_width(ch) in ("W", "F"):
+            return self.upm  # CJK / fullwidth: one em
+        base = unicodedata.normalize("NFD", ch)[0]  # accented letter -> its base letter
+        if base != ch:
+            return self.advances.get(ord(base), self.default_advance)
+        return self.default_advance
+
+def _bundled(bold: bool) -> FontMetrics:
+    table = _ASCII_BOLD if bold else _ASCII_REGULAR
+    advances = {32 + i: w for i, w in enumerate(table)}
+    advances.update(_EXTRA_BOLD if bold else _EXTRA_REGULAR)
+    return FontMetrics("Arial Bold" if bold else "Arial", 1000, advances,
+                       advances[ord("n")], _ARIAL_LINE_HEIGHT)
+
+def _from_font_file(path: str) -> FontMetrics:
+    from fontTools.ttLib import TTFont  # optional: only needed for fonts given by file
+    tt = TTFont(path, lazy=True)
+    upm = tt["head"].unitsPerEm
+    hmtx = tt["hmtx"].metrics
+    advances = {cp: hmtx[glyph][0] for cp, glyph in tt.getBestCmap().items()}
+    hhea = tt["hhea"]
+    name = tt["name"].getDebugName(4) or path
+    return FontMetrics(name, upm, advances, advances.get(ord("n"), upm // 2),
+                       (hhea.ascent - hhea.descent + hhea.lineGap) / upm)
+
+@lru_cache(maxsize=None)
+def get_font(name: str = "Arial", bold: bool = False, path: Optional[str] = None) -> FontMetrics:
+    """Metrics for a font: from `path` (needs fontTools) or the bundled Arial table."""
+    if path:
+        return _from_font_file(path)
+    if name.lower() not in _BUNDLED_ALIASES:
+        logger.debug("No metrics for font %r; measuring with the bundled Arial widths", name)
+    return _bundled(bold)
+
+class _Widths(dict):
+    """char -> advance in points at one size, filled on first use of each char."""
+    def __init__(self, font: FontMetrics, size_pt: float):
+        super().__init__()
+        self.font, self.scale = font, size_pt / font.upm
+
+    def __missing__(self, ch: str) -> float:
+        w = self[ch] = self.font.advance(ch) * self.scale
+        return w
+
+@lru_cache(maxsize=256)
+def glyph_widths(font: FontMetrics, size_pt: float) -> _Widths:
+    return _Widths(font, size_pt)
+
+@lru_cache(maxsize=65536)
+def text_width_pt(text: str, font: FontMetrics, size_pt: float) -> float:
+    """Advance width of a single line of text, in points."""
+    widths = glyph_widths(font, size_pt)
+    return sum(widths[ch] for ch in text)
+
+def text_widths_pt(texts: Sequence[str], font: Optional[FontMetrics] = None, size_pt: float = 12.0,
+                   backend: str = "python") -> List[float]:
+    """
+    Widths (points) of many single-line strings in one call. backend="numpy" measures
+    the whole batch with one table gather + sum (utils.text_metrics_np).
+    """
+    font = font or get_font()
+    if backend == "numpy":
+        from utils.text_metrics_np import string_widths
+        return string_widths(texts, font, size_pt).tolist()
+    if backend != "python":
+        raise ValueError(f"unknown text metrics backend: {backend!r}")
+    return [text_width_pt(t, font, size_pt) for t in texts]
+
+def _break_word(word: str, width_pt: float, widths: _Widths):
+    """Split a word wider than the line at character boundaries (as PowerPoint does)."""
+    piece, w = "", 0.0
+    for ch in word:
+        if piece and w + widths[ch] > width_pt:
+            yield piece, w
+            piece, w = "", 0.0
+        piece += ch
+        w += widths[ch]
+    yield piece, w
+
+@lru_cache(maxsize=16384)
+def wrap_lines(text: str, width_pt: float, font: FontMetrics, size_pt: float) -> Tuple[str, ...]:
+    """
+    Greedy word wrap into lines no wider than width_pt; "\\n" starts a new paragraph.
+    Words wider than the line are broken at character boundaries.
+    """
+    widths = glyph_widths(font, size_pt)
+    space = widths[" "]
+    lines = []
+    for para in text.split("\n"):
+        line, line_w = "", 0.0
+        for word in para.split():
+            word_w = text_width_pt(word, font, size_pt)
+            if line and line_w + space + word_w <= width_pt:
+                line, line_w = f"{line} {word}", line_w + space + word_w
+                continue
+            if line:
+                lines.append(line)
+            pieces = list(_break_word(word, width_pt, widths)) if word_w > width_pt else [(word, word_w)]
+            lines.extend(p for p, _ in pieces[:-1])
+            line, line_w = pieces[-1]
+        lines.append(line)
+    return tuple(lines)
+
+def text_height_pt(text: str, width_pt: float, font: FontMetrics, size_pt: float,
+                   line_spacing: float = 1.0, space_after_pt: float = 0.0) -> float:
+    """Height of the wrapped text block: lines * line pitch + space after each paragraph."""
+    n_lines = len(wrap_lines(text, width_pt, font, size_pt))
+    n_paras = text.count("\n") + 1
+    return n_lines * size_pt * font.line_height * line_spacing + n_paras * space_after_pt
+
+def text_height_in(text: str, width_in: float, size_pt: float, font: Optional[FontMetrics] = None,
+                   inset_in: Tuple[float, float] = DEFAULT_INSET_IN, line_spacing: float = 1.0,
+                   space_after_pt: float = 0.0) -> float:
+    """Height (inches, insets included) a text box of width_in needs for text at size_pt."""
+    font = font or get_font()
+    inner_w = max(0.0, width_in - 2 * inset_in[0]) * PT_PER_IN
+    h = text_height_pt(text, inner_w, font, size_pt, line_spacing, space_after_pt)
+    return h / PT_PER_IN + 2 * inset_in[1]
+
+@lru_cache(maxsize=8192)
+def fit_size_to_box(text: str, width_in: float, height_in: float, max_pt: int, min_pt: int = 8,
+                    font: Optional[FontMetrics] = None, inset_in: Tuple[float, float] = DEFAULT_INSET_IN,
+                    line_spacing: float = 1.0, space_after_pt: float = 0.0) -> int:
+    """
+    Largest whole point size in [min_pt, max_pt] at which text, wrapped to the
+    box width, fits the box height (binary search). min_pt if nothing fits.
+    """
+    if not text or not text.strip():
+        return max_pt
+    font = font or get_font()
+    inner_w = max(0.0, width_in - 2 * inset_in[0]) * PT_PER_IN
+    inner_h = max(0.0, height_in - 2 * inset_in[1]) * PT_PER_IN
+    lo, hi = min_pt, max_pt
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if text_height_pt(text, inner_w, font, mid, line_spacing, space_after_pt) <= inner_h:
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
+
+def cache_info() -> dict:
+    return {f.__name__: f.cache_info()._asdict()
+            for f in (glyph_widths, text_width_pt, wrap_lines, fit_size_to_box)}
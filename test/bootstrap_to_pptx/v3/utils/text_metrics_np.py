@@ -0,0 +1,53 @@
+"""
+NumPy glyph-width tables for utils.text_metrics (optional: numpy is only imported here).
+
+Each font gets one uint16 array of advance widths (font units) indexed by
+codepoint, built once from FontMetrics.advance, so the fallbacks for accented
+and East Asian characters are baked in. A batch of strings is measured as one
+array of codepoints (the strings joined and viewed as UTF-32): one gather into
+the table, one cumulative sum, and a difference at the string boundaries.
+Codepoints past the end of the table (astral planes) are looked up per unique
+codepoint.
+
+Widths are summed in integer font units and scaled once, so they equal
+text_metrics.text_width_pt up to float rounding.
+"""
+from functools import lru_cache
+from typing import Sequence, Tuple
+
+import numpy as np
+
+from utils.text_metrics import FontMetrics
+
+TABLE_LIMIT = 0x10000  # the table covers at most the Basic Multilingual Plane
+
+@lru_cache(maxsize=None)
+def width_table(font: FontMetrics) -> np.ndarray:
+    """Advance width per codepoint, 0 .. the font's highest mapped codepoint (BMP at most)."""
+    n = min(max(font.advances, default=0x7F) + 1, TABLE_LIMIT)
+    return np.fromiter((font.advance(chr(cp)) for cp in range(n)), dtype=np.uint16, count=n)
+
+def codepoints(texts: Sequence[str]) -> Tuple[np.ndarray, np.ndarray]:
+    """(codepoints of all strings back to back, length of each string)."""
+    joined = "".join(texts).encode("utf-32-le", "surrogatepass")
+    lengths = np.fromiter(map(len, texts), dtype=np.int64, count=len(texts))
+    return np.frombuffer(joined, dtype=np.uint32), lengths
+
+def advance_units(cps: np.ndarray, font: FontMetrics) -> np.ndarray:
+    table = width_table(font)
+    if not len(cps) or cps.max() < len(table):
+        return table[cps]  # the common case: one gather
+    inside = cps < len(table)
+    units = np.zeros(len(cps), dtype=np.uint16)
+    units[inside] = table[cps[inside]]
+    rest, inverse = np.unique(cps[~inside], return_inverse=True)
+    units[~inside] = np.array([font.advance(chr(cp)) for cp in rest], dtype=np.uint16)[inverse]
+    return units
+
+def string_widths(texts: Sequence[str], font: FontMetrics, size_pt: float) -> np.ndarray:
+    """Width in points of each string (single line), as one float64 array."""
+    cps, lengths = codepoints(texts)
+    total = np.zeros(len(cps) + 1, dtype=np.int64)
+    np.cumsum(advance_units(cps, font), dtype=np.int64, out=total[1:])
+    ends = np.cumsum(lengths)
+    return (total[ends] - total[ends - lengths]) * (size_pt / font.upm)
@@ -0,0 +1,93 @@
+"""
+Benchmark: line charts through python-pptx's CategoryChartData (per point) vs
+the bulk chart builder (renderer/chart_xml.py), on 2-series charts of N points.
+
+Each size is rendered both ways onto a fresh slide; the two charts' XML must be
+identical, and the time per chart is the best of --runs. --dashboard then
+renders one slide of four data-chart specs (line, column, area, scatter) of
+that many points each through the pipeline.
+
+Run from v4/:
+    python benchmarks/bench_chart.py --points 100 1000 10000 --dashboard 10000
+"""
+import argparse
+import json
+import math
+import sys
+import time
+from pathlib import Path
+
+HERE = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(HERE))
+
+from lxml import etree                                           # noqa: E402
+from pptx.chart.data import CategoryChartData                    # noqa: E402
+from pptx.enum.chart import XL_CHART_TYPE                        # noqa: E402
+from pptx.util import Inches                                     # noqa: E402
+from parsers.generic_bootstrap_to_ilt import ILT, ILTRow, ILTItem  # noqa: E402
+from renderer.chart_xml import category_chart_data               # noqa: E402
+from renderer.pipeline import build_deck_from_ilts, load_configs  # noqa: E402
+from utils.template_cache import open_template                   # noqa: E402
+
+
+def _series(n: int):
+    labels = [f"t{i}" for i in range(n)]
+    return labels, [("Signal", [round(50 + 40 * math.sin(i / 50), 3) for i in range(n)]),
+                    ("Trend", [round(i / max(1, n) * 100, 3) for i in range(n)])]
+
+
+def _time(fn, runs: int):
+    best, xml = float("inf"), None
+    for _ in range(runs):
+        slide = open_template().slides.add_slide(open_template().slide_layouts[6])
+        t0 = time.perf_counter()
+        frame = fn(slide)
+        best = min(best, time.perf_counter() - t0)
+        xml = etree.tostring(frame.chart._chartSpace)
+    return best, xml
+
+
+def _per_point(slide, labels, series):
+    data = CategoryChartData()
+    data.categories = labels
+    for name, values in series:
+        data.add_series(name, values)
+    return slide.shapes.add_chart(XL_CHART_TYPE.LINE, 0, 0, Inches(8), Inches(4.5), data)
+
+
+def _bulk(slide, labels, series):
+    data = category_chart_data(XL_CHART_TYPE.LINE, labels, series)
+    return slide.shapes.add_chart(XL_CHART_TYPE.LINE, 0, 0, Inches(8), Inches(4.5), data)
+
+
+def main():
+    ap = argparse.ArgumentParser(description="per-point vs bulk chart building")
+    ap.add_argument("--points", type=int, nargs="+", default=[100, 1000, 10000])
+    ap.add_argument("--runs", type=int, default=1)
+    ap.add_argument("--dashboard", type=int, default=10000, help="points per chart of the 4-chart slide (0 = skip)")
+    args = ap.parse_args()
+
+    print(f"{'points':>7} {'per-point ms':>13} {'bulk ms':>9} {'speedup':>8}  same XML")
+    for n in args.points:
+        labels, series = _series(n)
+        slow, slow_xml = _time(lambda s: _per_point(s, labels, series), args.runs)
+        fast, fast_xml = _time(lambda s: _bulk(s, labels, series), args.runs)
+        print(f"{n:>7} {slow * 1e3:>13.1f} {fast * 1e3:>9.1f} {slow / fast:>7.1f}x  {slow_xml == fast_xml}")
+
+    if args.dashboard:
+        n = args.dashboard
+        labels, series = _series(n)
+        spec = {"labels": labels, "series": [{"name": name, "values": values} for name, values in series]}
+        xy = {"type": "scatter", "series": [{"name": "Signal", "x": list(range(n)), "y": series[0][1]}]}
+        items = [ILTItem(kind="chart", col_span=6, content={"spec": json.dumps(s)})
+                 for s in ({**spec, "type": "line"}, {**spec, "type": "column"}, {**spec, "type": "area"}, xy)]
+        ilt = ILT(title="Dashboard", rows=[ILTRow(items=items[:2]), ILTRow(items=items[2:])])
+        ST, PRE = load_configs(str(HERE / "config/styles.json"), str(HERE / "config/element_presets.json"))
+        ST["bands"]["row_height_in"] = 2.5
+        t0 = time.perf_counter()
+        build_deck_from_ilts([ilt], ST, PRE)
+        print(f"dashboard: 4 charts x {n} points in {time.perf_counter() - t0:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
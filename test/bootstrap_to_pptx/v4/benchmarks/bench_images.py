@@ -0,0 +1,80 @@
+"""
+Benchmark: pictures added straight from their files (shapes.add_picture(path))
+vs through the image stage (utils/images.py: resize to the rect, LRU, dedup).
+
+Builds a deck of --slides slides, each with one of --photos large JPEG photos
+(--px wide, generated noise) in a half-width rect and the same PNG logo; prints
+build time, saved size and the number of image parts either way.
+
+Run from v4/:
+    python benchmarks/bench_images.py --slides 50 --photos 5 --px 4000
+"""
+import argparse
+import io
+import sys
+import tempfile
+import time
+import zipfile
+from pathlib import Path
+
+HERE = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(HERE))
+
+import numpy as np                                               # noqa: E402
+from PIL import Image                                            # noqa: E402
+from pptx.util import Inches                                     # noqa: E402
+from utils import images                                         # noqa: E402
+from utils.template_cache import open_template                   # noqa: E402
+
+
+def _assets(folder: Path, photos: int, px: int) -> list:
+    rng = np.random.default_rng(0)
+    paths = []
+    for i in range(photos):
+        noise = rng.integers(0, 255, (px * 3 // 4, px, 3), dtype=np.uint8)
+        paths.append(folder / f"photo{i}.jpg")
+        Image.fromarray(noise).save(paths[-1], quality=90)
+    logo = Image.new("RGBA", (1200, 600), (0, 0, 0, 0))
+    logo.paste((13, 110, 253, 255), (100, 100, 1100, 500))
+    logo.save(folder / "logo.png")
+    return paths
+
+
+def _deck(photos: list, logo: Path, slides: int, staged: bool):
+    prs = open_template()
+    for i in range(slides):
+        shapes = prs.slides.add_slide(prs.slide_layouts[6]).shapes
+        for src, left, width in ((photos[i % len(photos)], 0.6, 6.0), (logo, 7.0, 2.0)):
+            if staged:
+                images.add_picture(shapes, str(src), Inches(left), Inches(1.6), width=Inches(width))
+            else:
+                shapes.add_picture(str(src), Inches(left), Inches(1.6), width=Inches(width))
+    return prs
+
+
+def main():
+    ap = argparse.ArgumentParser(description="direct add_picture vs the image stage")
+    ap.add_argument("--slides", type=int, default=50)
+    ap.add_argument("--photos", type=int, default=5)
+    ap.add_argument("--px", type=int, default=4000, help="photo width in pixels")
+    args = ap.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        photos = _assets(Path(tmp), args.photos, args.px)
+        print(f"{'path':>8} {'build s':>8} {'save s':>7} {'MB':>7} {'images':>7}")
+        for staged in (False, True):
+            images.cache_clear()
+            t0 = time.perf_counter()
+            prs = _deck(photos, Path(tmp) / "logo.png", args.slides, staged)
+            t1 = time.perf_counter()
+            buf = io.BytesIO()
+            prs.save(buf)
+            t2 = time.perf_counter()
+            parts = sum("/media/" in n for n in zipfile.ZipFile(buf).namelist())
+            print(f"{'stage' if staged else 'direct':>8} {t1 - t0:>8.2f} {t2 - t1:>7.2f} "
+                  f"{len(buf.getvalue()) / 1e6:>7.1f} {parts:>7}")
+        print("image stage cache:", images.cache_info())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+Benchmark: ways to get a rendered deck out (utils/pptx_io.py).
+
+Parses --html once and renders it --slides times. Output step only, for one
+built deck:
+  file      prs.save(path) and read back (what a service did to send it)
+  buffer    to_buffer(prs, level) for zlib default, 1 and 0 (store only)
+Build + output, the deck rendered again for each:
+  build+save    build, then save to a file
+  stream        build with PptxStreamWriter writing each slide to the file
+Streaming is about memory, not time: the zip goes out slide by slide instead
+of the whole serialized deck being built at the end.
+
+Run from v4/:
+    python benchmarks/bench_output.py --slides 300
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+HERE = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(HERE))
+
+from parsers.generic_bootstrap_to_ilt import parse_generic_bootstrap_to_ilt  # noqa: E402
+from renderer.pipeline import build_deck_from_ilts, load_configs           # noqa: E402
+from utils.pptx_io import PptxStreamWriter, save, to_buffer                # noqa: E402
+
+
+def _timed(fn):
+    t0 = time.perf_counter()
+    out = fn()
+    return out, time.perf_counter() - t0
+
+
+def main():
+    ap = argparse.ArgumentParser(description="file round trip vs in-memory vs streamed output")
+    ap.add_argument("--html", default=str(HERE / "test.html"))
+    ap.add_argument("--slides", type=int, default=300)
+    args = ap.parse_args()
+
+    ST, PRE = load_configs(str(HERE / "config/styles.json"), str(HERE / "config/element_presets.json"))
+    ilts = [parse_generic_bootstrap_to_ilt(args.html)] * args.slides
+    prs = build_deck_from_ilts(ilts, ST, PRE)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "out.pptx")
+        print(f"{'output':>14} {'s':>6} {'MB':>6}")
+        data, secs = _timed(lambda: (prs.save(path), Path(path).read_bytes())[1])
+        print(f"{'file':>14} {secs:>6.2f} {len(data) / 1e6:>6.2f}")
+        for level in (None, 1, 0):
+            buf, secs = _timed(lambda: to_buffer(prs, level))
+            print(f"{'buffer z' + ('-' if level is None else str(level)):>14} {secs:>6.2f} "
+                  f"{len(buf.getbuffer()) / 1e6:>6.2f}")
+
+        def build_save():
+            save(build_deck_from_ilts(ilts, ST, PRE), path)
+
+        def stream():
+            with open(path, "wb") as f, PptxStreamWriter(f) as writer:
+                build_deck_from_ilts(ilts, ST, PRE, stream=writer)
+
+        print(f"{'build+output':>14} {'s':>6}")
+        for name, fn in (("build+save", build_save), ("stream", stream)):
+            _, secs = _timed(fn)
+            print(f"{name:>14} {secs:>6.2f}")
+
+
+if __name__ == "__main__":
+    main()
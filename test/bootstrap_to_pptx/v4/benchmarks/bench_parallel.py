@@ -0,0 +1,49 @@
+"""
+Benchmark: one deck of --slides slides rendered in one process vs split over
+worker processes and merged into one package (renderer/parallel.py).
+
+Parses --html once and renders it --slides times; for each worker count prints
+wall time (render + merge), speedup over one process and whether the slide
+XML matches the single-process deck.
+
+Run from v4/:
+    python benchmarks/bench_parallel.py --slides 500 --workers 1 2 4 8
+"""
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+HERE = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(HERE))
+
+from lxml import etree                                                     # noqa: E402
+from parsers.generic_bootstrap_to_ilt import parse_generic_bootstrap_to_ilt  # noqa: E402
+from renderer.pipeline import build_deck_from_ilts, load_configs           # noqa: E402
+
+
+def main():
+    ap = argparse.ArgumentParser(description="single process vs parallel slide rendering")
+    ap.add_argument("--html", default=str(HERE / "test.html"))
+    ap.add_argument("--slides", type=int, default=500)
+    ap.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, os.cpu_count() or 1])
+    args = ap.parse_args()
+
+    ST, PRE = load_configs(str(HERE / "config/styles.json"), str(HERE / "config/element_presets.json"))
+    ilts = [parse_generic_bootstrap_to_ilt(args.html)] * args.slides
+    print(f"{args.slides} slides, {os.cpu_count()} CPUs")
+    print(f"{'workers':>7} {'wall s':>7} {'speedup':>8} {'same XML':>9}")
+    base_s = base_xml = None
+    for workers in sorted(set(args.workers)):
+        t0 = time.perf_counter()
+        prs = build_deck_from_ilts(ilts, ST, PRE, workers=workers)
+        secs = time.perf_counter() - t0
+        xml = [etree.tostring(s._element) for s in prs.slides]
+        if base_s is None:
+            base_s, base_xml = secs, xml
+        print(f"{workers:>7} {secs:>7.2f} {base_s / secs:>7.2f}x {str(xml == base_xml):>9}")
+
+
+if __name__ == "__main__":
+    main()
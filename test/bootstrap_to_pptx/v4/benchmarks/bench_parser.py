@@ -0,0 +1,167 @@
+"""
+Benchmark: parse_ilt_from_root (single-pass classifier) vs the legacy
+per-kind select() parser on a synthetic Bootstrap export.
+
+The export has nested rows, cards with lists/icons, KPI tiles, steps, tables,
+images and charts; --blocks controls its size (~2k elements at the default).
+The legacy parser is kept here for comparison and as an equality check.
+
+Run from v4/:
+    python benchmarks/bench_parser.py --blocks 80
+"""
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+from typing import List
+
+HERE = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(HERE))
+
+from bs4 import BeautifulSoup                                   # noqa: E402
+from parsers.generic_bootstrap_to_ilt import (                   # noqa: E402
+    ILT, ILTRow, ILTItem, _classes, _col_span, _offset, _hfrac, parse_ilt_from_root,
+)
+
+
+# ---------- legacy (one select() pass per kind and column), for comparison ----------
+
+def legacy_parse(soup) -> ILT:
+    ilt = ILT()
+    t = soup.select_one("h1, h2.fw-bold, h2")
+    s = soup.select_one("p.lead, p.text-muted, h3, h4")
+    ilt.title = t.get_text(" ", strip=True) if t else None
+    ilt.subtitle = s.get_text(" ", strip=True) if s else None
+
+    for row in soup.select(".row"):
+        direct_cols = [c for c in row.find_all(recursive=False) if any(cc.startswith("col-") for cc in _classes(c))]
+        if not direct_cols:
+            continue
+        ilt_row = ILTRow()
+        for col in direct_cols:
+            cls = _classes(col)
+            col_span, off, hfrac = _col_span(cls), _offset(cls), _hfrac(cls)
+            inner_items: List[ILTItem] = []
+            for card in col.select(".card"):
+                body = card.select_one(".card-body")
+                if body:
+                    paras = [p.get_text(" ", strip=True) for p in body.select("p")]
+                    bullets = [li.get_text(" ", strip=True) for li in body.select("ul li, ol li")]
+                    if paras or bullets:
+                        inner_items.append(ILTItem(kind="card", classes=_classes(card),
+                                                   content={"paragraphs": paras, "bullets": bullets}))
+            for sb in col.select(".stat-box, .kpi, .tile"):
+                headline = (sb.select_one(".fw-bold, .fs-3") or sb).get_text(" ", strip=True)
+                small = sb.select_one("small")
+                caption = small.get_text(" ", strip=True) if small else ""
+                inner_items.append(ILTItem(kind="kpi", classes=_classes(sb),
+                                           content={"headline": headline, "caption": caption}))
+            ol = col.select_one("ol")
+            if ol and ol.select("li"):
+                items = [li.get_text(" ", strip=True) for li in ol.select("li")]
+                header_el = col.select_one(".card-header")
+                header = header_el.get_text(" ", strip=True) if header_el else None
+                inner_items.append(ILTItem(kind="steps", classes=_classes(ol), content={"header": header, "items": items}))
+            for icard in col.select(".card"):
+                if icard.select_one("i"):
+                    cap = icard.select_one("p, .small, .caption")
+                    if cap:
+                        icon_el = icard.select_one("i[class*='bi-'], i[class*='fa-']")
+                        icon_name = None
+                        if icon_el:
+                            for cc in _classes(icon_el):
+                                if cc.startswith(("bi-", "fa-")) and cc not in ("bi", "fa", "fas", "far"):
+                                    icon_name = cc; break
+                        inner_items.append(ILTItem(kind="icon", classes=_classes(icard),
+                                                   content={"caption": cap.get_text(' ', strip=True), "icon": icon_name}))
+            for tb in col.select("table"):
+                rows_data = []
+                for tr in tb.select("tr"):
+                    cells = [c.get_text(" ", strip=True) for c in tr.select("th, td")]
+                    if cells: rows_data.append(cells)
+                if rows_data:
+                    inner_items.append(ILTItem(kind="table", classes=_classes(tb), content={"rows": rows_data}))
+            for img in col.select("img[src]"):
+                inner_items.append(ILTItem(kind="image", classes=_classes(img), content={"src": img["src"]}))
+            chart = col.select_one("[data-chart], .chart")
+            if chart:
+                spec = chart.get("data-chart", "{}")
+                inner_items.append(ILTItem(kind="chart", classes=_classes(chart), content={"spec": spec}))
+            if not inner_items:
+                txt = col.get_text(" ", strip=True)
+                if txt:
+                    inner_items.append(ILTItem(kind="text", classes=cls, content={"text": txt}))
+            for it in inner_items:
+                it.col_span, it.offset, it.h_frac = col_span, off, hfrac
+                ilt_row.items.append(it)
+        if ilt_row.items:
+            ilt.rows.append(ilt_row)
+
+    foot = soup.select_one(".footer, .footer-bar, footer")
+    if foot:
+        ilt.footer_left = foot.get_text(" ", strip=True)
+    return ilt
+
+
+# ---------- synthetic export ----------
+
+_BLOCKS = [
+    '<div class="card"><div class="card-body"><p>Narrative {i}</p><ul><li>a{i}</li><li>b{i}</li></ul></div></div>',
+    '<div class="stat-box bg-primary"><div class="fw-bold">{i}%</div><small>metric {i}</small></div>',
+    '<div class="kpi tile"><span class="fs-3">{i}</span><small>kpi {i}</small></div>',
+    '<div class="card"><div class="card-header">Steps {i}</div><div class="card-body"><ol><li>s1</li><li>s2</li></ol></div></div>',
+    '<div class="card"><i class="bi bi-cpu"></i><p class="small">icon {i}</p></div>',
+    '<table class="table"><tr><th>k</th><th>v</th></tr><tr><td>x{i}</td><td>{i}</td></tr></table>',
+    '<img src="img{i}.png" class="img-fluid">',
+    '<div class="chart" data-chart=\'{{"type":"bar","i":{i}}}\'></div>',
+    '<p>plain text {i}</p>',
+]
+
+def synthetic_html(blocks: int, seed: int = 7, nest_every: int = 3) -> str:
+    rnd = random.Random(seed)
+    out = ['<html><body><h1>Synthetic</h1><p class="lead">export</p><div class="container">']
+    for i in range(blocks):
+        span = rnd.choice((3, 4, 6, 12))
+        cols = []
+        for j in range(12 // span):
+            inner = "".join(rnd.choice(_BLOCKS).format(i=f"{i}.{j}.{k}") for k in range(rnd.randint(1, 4)))
+            if i % nest_every == 0 and j == 0:
+                inner += ('<div class="row"><div class="col-6">' + _BLOCKS[0].format(i=f"n{i}")
+                          + '</div><div class="col-6 offset-0 h-50">' + _BLOCKS[1].format(i=f"n{i}") + "</div></div>")
+            cols.append(f'<div class="col-md-{span}">{inner}</div>')
+        out.append('<div class="row">' + "".join(cols) + "</div>")
+    out.append('</div><div class="footer">Footer</div></body></html>')
+    return "".join(out)
+
+
+def _best_of(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main():
+    ap = argparse.ArgumentParser(description="v4 HTML -> ILT parser benchmark")
+    ap.add_argument("--blocks", type=int, default=80, help="rows of synthetic content (~50 elements each)")
+    ap.add_argument("--repeat", type=int, default=5)
+    args = ap.parse_args()
+
+    soup = BeautifulSoup(synthetic_html(args.blocks), "lxml")
+    n_el = len(soup.find_all(True))
+    new_ilt, old_ilt = parse_ilt_from_root(soup), legacy_parse(soup)
+    assert new_ilt == old_ilt, "single-pass classifier output differs from legacy parser"
+
+    new_s = _best_of(lambda: parse_ilt_from_root(soup), args.repeat)
+    old_s = _best_of(lambda: legacy_parse(soup), args.repeat)
+    items = sum(len(r.items) for r in new_ilt.rows)
+    print(f"elements={n_el} rows={len(new_ilt.rows)} items={items}")
+    print(f"single-pass {new_s * 1e3:8.2f} ms")
+    print(f"legacy      {old_s * 1e3:8.2f} ms   ({old_s / new_s:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
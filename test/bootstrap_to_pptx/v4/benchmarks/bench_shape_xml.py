@@ -0,0 +1,73 @@
+"""
+Benchmark: --shapes shapes drawn through renderer.elements with the python-pptx
+backend vs the XML backend (renderer/shape_xml.py, styles["shapes"]["backend"]).
+
+Each slide gets a title, a card with text and bullets, a KPI tile and a footer
+bar, repeated until --shapes <p:sp> elements exist; prints build and save time
+per backend and checks that both wrote the same slide XML.
+
+Run from v4/:
+    python benchmarks/bench_shape_xml.py --shapes 10000
+"""
+import argparse
+import io
+import sys
+import time
+from pathlib import Path
+
+HERE = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(HERE))
+
+from lxml import etree                                                       # noqa: E402
+from renderer.elements import (add_bullets, add_card, add_footer_bar,        # noqa: E402
+                               add_kpi_tile, add_text, add_title)
+from renderer.shape_xml import SlideXml                                      # noqa: E402
+from utils.template_cache import open_template                               # noqa: E402
+
+PER_SLIDE = 11  # title, card, 2 texts, bullets, KPI tile + 2 texts, footer bar + 2 texts
+
+
+def _slide(target, i: int):
+    add_title(target, 0.6, 0.4, 12.0, 0.9, f"Slide {i}")
+    add_card(target, 0.6, 1.6, 5.8, 4.6, shadow=bool(i % 2))
+    add_text(target, 0.8, 1.8, 5.4, 0.5, f"Card {i}", size=18)
+    add_text(target, 0.8, 2.3, 5.4, 0.5, "Body text of the card")
+    add_bullets(target, 0.8, 2.9, 5.4, 3.0, ["First point", "Second point", "Third point"], numbered=bool(i % 3))
+    add_kpi_tile(target, 6.8, 1.6, 2.8, 1.2, f"{i}%", "of the target", bg_hex="#198754")
+    add_footer_bar(target, 0.6, 6.7, 12.1, 0.4, "Footer", f"Pg {i}")
+
+
+def _deck(slides: int, xml: bool):
+    prs = open_template()
+    for i in range(slides):
+        slide = prs.slides.add_slide(prs.slide_layouts[6])
+        target = SlideXml(slide) if xml else slide
+        _slide(target, i)
+        if xml:
+            target.flush()
+    return prs
+
+
+def main():
+    ap = argparse.ArgumentParser(description="python-pptx proxies vs XML templates")
+    ap.add_argument("--shapes", type=int, default=10000)
+    args = ap.parse_args()
+
+    slides = -(-args.shapes // PER_SLIDE)
+    print(f"{slides} slides x {PER_SLIDE} shapes")
+    print(f"{'backend':>8} {'build s':>8} {'shapes/s':>9} {'save s':>7}")
+    xml_of = {}
+    for xml in (False, True):
+        t0 = time.perf_counter()
+        prs = _deck(slides, xml)
+        t1 = time.perf_counter()
+        prs.save(io.BytesIO())
+        t2 = time.perf_counter()
+        name = "xml" if xml else "python"
+        print(f"{name:>8} {t1 - t0:>8.2f} {slides * PER_SLIDE / (t1 - t0):>9.0f} {t2 - t1:>7.2f}")
+        xml_of[name] = [etree.tostring(s._element) for s in prs.slides]
+    print("same XML:", xml_of["python"] == xml_of["xml"])
+
+
+if __name__ == "__main__":
+    main()
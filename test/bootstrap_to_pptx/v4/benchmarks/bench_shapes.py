@@ -0,0 +1,51 @@
+"""
+Benchmark: shapes per slide with styles["shapes"]["compact"] off vs on.
+
+Parses --html once and renders it --slides times into one deck both ways;
+prints <p:sp> elements per slide, build and save time and the saved size, all
+after cleanup_slide. Compact mode writes card / KPI / icon / steps / footer text
+into one text frame per container instead of a textbox per part
+(renderer.elements.compact_frame).
+
+Run from v4/:
+    python benchmarks/bench_shapes.py --slides 300
+"""
+import argparse
+import io
+import sys
+import time
+import zipfile
+from pathlib import Path
+
+HERE = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(HERE))
+
+from parsers.generic_bootstrap_to_ilt import parse_generic_bootstrap_to_ilt  # noqa: E402
+from renderer.pipeline import build_deck_from_ilts, load_configs           # noqa: E402
+
+
+def main():
+    ap = argparse.ArgumentParser(description="shape count: default vs compact text frames")
+    ap.add_argument("--html", default=str(HERE / "test.html"))
+    ap.add_argument("--slides", type=int, default=300)
+    args = ap.parse_args()
+
+    ilt = parse_generic_bootstrap_to_ilt(args.html)
+    print(f"{'mode':>8} {'sp/slide':>9} {'build s':>8} {'save s':>7} {'MB':>6}")
+    for compact in (False, True):
+        ST, PRE = load_configs(str(HERE / "config/styles.json"), str(HERE / "config/element_presets.json"))
+        ST["shapes"]["compact"] = compact
+        t0 = time.perf_counter()
+        prs = build_deck_from_ilts([ilt] * args.slides, ST, PRE)
+        t1 = time.perf_counter()
+        buf = io.BytesIO()
+        prs.save(buf)
+        t2 = time.perf_counter()
+        with zipfile.ZipFile(buf) as z:
+            sp = sum(z.read(n).count(b"<p:sp>") for n in z.namelist() if n.startswith("ppt/slides/slide"))
+        print(f"{'compact' if compact else 'default':>8} {sp / args.slides:>9.1f} {t1 - t0:>8.2f} {t2 - t1:>7.2f} "
+              f"{len(buf.getvalue()) / 1e6:>6.2f}")
+
+
+if __name__ == "__main__":
+    main()
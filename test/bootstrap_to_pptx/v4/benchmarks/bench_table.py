@@ -0,0 +1,83 @@
+"""
+Benchmark: tables per cell (python-pptx cell.text / cell.fill) vs the bulk
+<a:tbl> builder (renderer/table_xml.py), on N x 10 tables of short strings.
+
+Each size is rendered both ways onto a fresh slide; the two tables' XML must be
+identical, and the time per table is the best of --runs. --appendix-rows then
+renders one slide holding an N-row table through the pipeline, which continues
+it on as many slides as needed (header repeated on each).
+
+Run from v4/:
+    python benchmarks/bench_table.py --rows 10 100 1000 --cols 10 --appendix-rows 20000
+"""
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+HERE = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(HERE))
+
+from lxml import etree                                           # noqa: E402
+from pptx.util import Inches                                     # noqa: E402
+from parsers.generic_bootstrap_to_ilt import ILT, ILTRow, ILTItem  # noqa: E402
+from renderer.element_registry import render_table_cells         # noqa: E402
+from renderer.layout_solver import Rect                          # noqa: E402
+from renderer.pipeline import build_deck_from_ilts, load_configs  # noqa: E402
+from renderer.table_xml import add_table_bulk                    # noqa: E402
+from utils.template_cache import open_template                   # noqa: E402
+
+RECT = Rect(0.6, 1.6, 12.0, 5.0)
+
+
+def _rows(n_rows: int, n_cols: int, seed: int = 0) -> list:
+    rnd = random.Random(seed)
+    header = [f"Column {c + 1}" for c in range(n_cols)]
+    body = [[rnd.choice(["", f"{rnd.random() * 1e4:,.1f}", "n/a", f"R&D {r}", "<5%", "North America"])
+             for _ in range(n_cols)] for r in range(n_rows - 1)]
+    return [header] + body
+
+
+def _time(fn, runs: int):
+    best, xml = float("inf"), None
+    for _ in range(runs):
+        slide = open_template().slides.add_slide(open_template().slide_layouts[6])
+        t0 = time.perf_counter()
+        fn(slide)
+        best = min(best, time.perf_counter() - t0)
+        xml = etree.tostring(slide.shapes[-1].table._tbl)
+    return best, xml
+
+
+def main():
+    ap = argparse.ArgumentParser(description="per-cell vs bulk XML table rendering")
+    ap.add_argument("--rows", type=int, nargs="+", default=[10, 100, 1000])
+    ap.add_argument("--cols", type=int, default=10)
+    ap.add_argument("--runs", type=int, default=3)
+    ap.add_argument("--appendix-rows", type=int, default=20000, help="rows of the paginated table (0 = skip)")
+    args = ap.parse_args()
+
+    print(f"{'table':>10} {'per-cell ms':>12} {'bulk ms':>9} {'speedup':>8}  same XML")
+    for n in args.rows:
+        rows = _rows(n, args.cols)
+        slow, slow_xml = _time(lambda s: render_table_cells(s, RECT, rows, None, 12, 11), args.runs)
+        fast, fast_xml = _time(lambda s: add_table_bulk(
+            s.shapes, rows, Inches(RECT.left), Inches(RECT.top), Inches(RECT.width), Inches(RECT.height),
+            header_fill="#f1f3f5", header_pt=12, cell_pt=11), args.runs)
+        print(f"{f'{n}x{args.cols}':>10} {slow * 1e3:>12.1f} {fast * 1e3:>9.1f} {slow / fast:>7.1f}x  "
+              f"{slow_xml == fast_xml}")
+
+    if args.appendix_rows:
+        ST, PRE = load_configs(str(HERE / "config/styles.json"), str(HERE / "config/element_presets.json"))
+        table = ILTItem(kind="table", content={"rows": _rows(args.appendix_rows + 1, args.cols)})
+        ilt = ILT(title="Data appendix", rows=[ILTRow(items=[table])])
+        t0 = time.perf_counter()
+        prs = build_deck_from_ilts([ilt], ST, PRE)
+        dt = time.perf_counter() - t0
+        print(f"appendix {args.appendix_rows} rows x {args.cols}: {len(prs.slides)} slides in {dt:.2f}s "
+              f"({dt / len(prs.slides) * 1e3:.1f} ms/slide)")
+
+
+if __name__ == "__main__":
+    main()
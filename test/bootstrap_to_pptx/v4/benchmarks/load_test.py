@@ -0,0 +1,166 @@
+"""
+Load test for the render server (server.py): p50/p90/p99 request latency.
+
+Starts `python main.py serve` on a free port (or a Unix socket with --unix),
+waits until /health answers, then sends --requests POST /render calls from
+--concurrency client threads, each thread on its own keep-alive connection.
+For comparison it also times --cold-runs plain `python main.py --html ...`
+invocations (interpreter start + imports + configs + render + save).
+
+Run from v4/:
+    python benchmarks/load_test.py --requests 200 --concurrency 8 --workers 4
+Against a server that is already running:
+    python benchmarks/load_test.py --url http://127.0.0.1:8765
+"""
+import argparse
+import http.client
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from urllib.parse import urlparse
+
+HERE = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(HERE))
+
+from server import UnixHTTPConnection                            # noqa: E402
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _percentile(values, q: float) -> float:
+    values = sorted(values)
+    return values[min(len(values) - 1, int(round(q / 100 * (len(values) - 1))))]
+
+
+def _connect(target: str) -> http.client.HTTPConnection:
+    if target.startswith("unix:"):
+        return UnixHTTPConnection(target[len("unix:"):])
+    u = urlparse(target)
+    return http.client.HTTPConnection(u.hostname, u.port, timeout=120)
+
+
+def _wait_ready(target: str, proc: subprocess.Popen | None, timeout: float = 60.0) -> None:
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if proc is not None and proc.poll() is not None:
+            raise SystemExit(f"server exited with code {proc.returncode}")
+        try:
+            conn = _connect(target)
+            conn.request("GET", "/health")
+            if conn.getresponse().status == 200:
+                return
+        except OSError:
+            time.sleep(0.1)
+    raise SystemExit("server did not become ready")
+
+
+def run_load(target: str, body: bytes, requests: int, concurrency: int):
+    latencies, statuses = [], {}
+    lock = threading.Lock()
+    todo = iter(range(requests))
+
+    def client():
+        conn = _connect(target)
+        while True:
+            with lock:
+                if next(todo, None) is None:
+                    return
+            t0 = time.perf_counter()
+            conn.request("POST", "/render", body, {"Content-Type": "application/json"})
+            resp = conn.getresponse()
+            resp.read()
+            dt = time.perf_counter() - t0
+            with lock:
+                latencies.append(dt)
+                statuses[resp.status] = statuses.get(resp.status, 0) + 1
+
+    t0 = time.perf_counter()
+    threads = [threading.Thread(target=client) for _ in range(concurrency)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return latencies, statuses, time.perf_counter() - t0
+
+
+def cold_cli(html: str, runs: int) -> list[float]:
+    out = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for _ in range(runs):
+            t0 = time.perf_counter()
+            subprocess.run([sys.executable, "main.py", "--html", html, "--out", os.path.join(tmp, "o.pptx")],
+                           cwd=HERE, check=True, capture_output=True)
+            out.append(time.perf_counter() - t0)
+    return out
+
+
+def main():
+    ap = argparse.ArgumentParser(description="render server load test")
+    ap.add_argument("--html", default=str(HERE / "test.html"))
+    ap.add_argument("--deck", action="store_true")
+    ap.add_argument("--requests", type=int, default=200)
+    ap.add_argument("--concurrency", type=int, default=8)
+    ap.add_argument("--workers", type=int, default=4, help="server workers (when started here)")
+    ap.add_argument("--max-queue", type=int, default=64)
+    ap.add_argument("--url", default=None, help="use a running server instead of starting one")
+    ap.add_argument("--unix", action="store_true", help="start the server on a Unix socket")
+    ap.add_argument("--cold-runs", type=int, default=3, help="plain main.py runs for comparison (0 = skip)")
+    args = ap.parse_args()
+
+    proc = None
+    sock_dir = None
+    if args.url:
+        target = args.url
+    else:
+        cmd = [sys.executable, "main.py", "serve", "--workers", str(args.workers), "--max-queue", str(args.max_queue)]
+        if args.unix:
+            sock_dir = tempfile.TemporaryDirectory()
+            path = os.path.join(sock_dir.name, "render.sock")
+            cmd += ["--socket", path]
+            target = "unix:" + path
+        else:
+            port = _free_port()
+            cmd += ["--port", str(port)]
+            target = f"http://127.0.0.1:{port}"
+        proc = subprocess.Popen(cmd, cwd=HERE)
+    try:
+        t0 = time.perf_counter()
+        _wait_ready(target, proc)
+        print(f"server ready in {time.perf_counter() - t0:.2f}s at {target}")
+
+        body = json.dumps({"html": Path(args.html).read_text(encoding="utf-8"), "deck": args.deck}).encode()
+        run_load(target, body, min(args.requests, args.concurrency * 2), args.concurrency)  # warm-up
+        lat, statuses, wall = run_load(target, body, args.requests, args.concurrency)
+        ms = [x * 1e3 for x in lat]
+        print(f"requests={len(ms)} concurrency={args.concurrency} statuses={statuses}")
+        print(f"throughput {len(ms) / wall:.1f} req/s")
+        print(f"latency ms  p50 {_percentile(ms, 50):.1f}  p90 {_percentile(ms, 90):.1f}  "
+              f"p99 {_percentile(ms, 99):.1f}  max {max(ms):.1f}  mean {statistics.mean(ms):.1f}")
+        conn = _connect(target)
+        conn.request("GET", "/health")
+        print("server", conn.getresponse().read().decode())
+    finally:
+        if proc is not None:
+            proc.terminate()
+            proc.wait()
+        if sock_dir is not None:
+            sock_dir.cleanup()
+
+    if args.cold_runs:
+        cold = [x * 1e3 for x in cold_cli(args.html, args.cold_runs)]
+        print(f"cold main.py ms  median {statistics.median(cold):.1f}  (runs={len(cold)})")
+
+
+if __name__ == "__main__":
+    main()
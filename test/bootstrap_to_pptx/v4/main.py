@@ -1,9 +1,8 @@
 import argparse
 import logging
+import sys
 from pathlib import Path
 
-from renderer.render_engine import render_from_html
-
 logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
 log = logging.getLogger("v4")
 
@@ -17,21 +16,66 @@ def _resolve(p: str) -> str:
     raise FileNotFoundError(p)
 
 def main():
+    if len(sys.argv) > 1 and sys.argv[1] == "batch":
+        from batch import batch_main
+        raise SystemExit(batch_main(sys.argv[2:], _resolve))
+    if len(sys.argv) > 1 and sys.argv[1] == "serve":
+        from server import serve_main
+        raise SystemExit(serve_main(sys.argv[2:], _resolve))
+
     ap = argparse.ArgumentParser(description="Bootstrap HTML → PPTX (v4)")
     ap.add_argument("--html", required=True, help="Input HTML file")
     ap.add_argument("--out", required=True, help="Output PPTX file")
     ap.add_argument("--styles", default="config/styles.json")
     ap.add_argument("--presets", default="config/element_presets.json")
     ap.add_argument("--template", default=None, help="Optional POTX/PPTX template")
+    ap.add_argument("--deck", action="store_true", help="One slide per <section> / .page-break in the HTML")
+    ap.add_argument("--workers", type=int, default=None,
+                    help="Render the slides of a --deck in N processes, merged into one file")
+    ap.add_argument("--compress-level", type=int, default=None, choices=range(10), metavar="0-9",
+                    help="Zip deflate level of the output; 0 = store only (fastest, larger)")
+    ap.add_argument("--stream", action="store_true",
+                    help="Write each slide into the output as soon as it is rendered")
+    ap.add_argument("--cache-dir", default=None, help="Reuse PPTX rendered earlier from identical inputs (on-disk LRU)")
+    ap.add_argument("--cache-max-mb", type=int, default=512, help="Size cap of --cache-dir")
     args = ap.parse_args()
+    if args.stream and args.cache_dir:
+        ap.error("--stream cannot be combined with --cache-dir (a cached deck is written in one piece)")
 
     html = _resolve(args.html)
     styles = _resolve(args.styles)
     presets = _resolve(args.presets)
     template = str(Path(args.template).resolve()) if args.template else None
 
-    prs = render_from_html(html_path=html, styles_path=styles, presets_path=presets, template_path=template)
-    prs.save(args.out)
+    if args.cache_dir:
+        from renderer.pipeline import load_configs, build_deck_with_configs
+        from utils.render_cache import RenderCache
+        ST, PRE = load_configs(styles, presets)
+        cache = RenderCache(args.cache_dir, args.cache_max_mb << 20)
+        data, hit = cache.render(lambda: build_deck_with_configs(html, ST, PRE, template, deck=args.deck,
+                                                                 workers=args.workers),
+                                 html, (ST, PRE), template, variant="deck" if args.deck else "slide",
+                                 compresslevel=args.compress_level)
+        Path(args.out).write_bytes(data)
+        log.info(f"Cache {'hit' if hit else 'miss'}: {cache.info()}")
+    elif args.stream:
+        from renderer.pipeline import load_configs, build_deck_with_configs
+        from utils.pptx_io import PptxStreamWriter
+        ST, PRE = load_configs(styles, presets)
+        with open(args.out, "wb") as f, PptxStreamWriter(f, args.compress_level) as stream:
+            build_deck_with_configs(html, ST, PRE, template, deck=args.deck, workers=args.workers, stream=stream)
+    elif args.workers:
+        from renderer.pipeline import load_configs, build_deck_with_configs
+        from utils.pptx_io import save
+        ST, PRE = load_configs(styles, presets)
+        save(build_deck_with_configs(html, ST, PRE, template, deck=args.deck, workers=args.workers), args.out,
+             args.compress_level)
+    else:
+        from renderer.render_engine import render_from_html, render_deck_from_html
+        from utils.pptx_io import save
+        render = render_deck_from_html if args.deck else render_from_html
+        prs = render(html_path=html, styles_path=styles, presets_path=presets, template_path=template)
+        save(prs, args.out, args.compress_level)
     log.info(f"Saved: {Path(args.out).resolve()}")
 
 if __name__ == "__main__":
@@ -1,7 +1,10 @@
 from dataclasses import dataclass, field
 from typing import List, Optional, Dict, Any
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, Tag
+import os
 import re
+from .sections import split_sections
+from utils.icons import split_name
 
 @dataclass
 class ILTItem:
@@ -22,6 +25,7 @@ class ILT:
     subtitle: Optional[str] = None
     rows: List[ILTRow] = field(default_factory=list)
     footer_left: Optional[str] = None
+    base_dir: Optional[str] = None   # folder of the HTML file; relative img[src] resolve against it
 
 _COL_PAT = re.compile(r"^col(?:-(?:sm|md|lg|xl|xxl))?-(\d{1,2})$")
 
@@ -47,102 +51,220 @@ def _hfrac(cls: List[str]) -> Optional[float]:
             if v in m: return m[v]
     return None
 
+def _with_base(ilts: List[ILT], html_path: str) -> List[ILT]:
+    base = os.path.dirname(os.path.abspath(html_path))
+    for ilt in ilts:
+        ilt.base_dir = base
+    return ilts
+
+def load_soup(html_path: str) -> BeautifulSoup:
+    return BeautifulSoup(open(html_path,"r",encoding="utf-8").read(), "lxml")
+
 def parse_generic_bootstrap_to_ilt(html_path: str) -> ILT:
-    soup = BeautifulSoup(open(html_path,"r",encoding="utf-8").read(), "lxml")
+    return _with_base([parse_ilt_from_root(load_soup(html_path))], html_path)[0]
+
+def parse_generic_bootstrap_deck(html_path: str) -> List[ILT]:
+    """One ILT per <section> / .page-break group (see parsers.sections)."""
+    return _with_base([parse_ilt_from_root(root) for root in split_sections(load_soup(html_path))], html_path)
+
+def parse_generic_bootstrap_text(html: str, deck: bool = False, base_dir: Optional[str] = None) -> List[ILT]:
+    """
+    Same as the two parsers above for HTML already in memory (render server); base_dir =
+    the folder relative img[src] resolve against (that of the HTML file, if it came from one).
+    """
+    soup = BeautifulSoup(html, "lxml")
+    ilts = [parse_ilt_from_root(root) for root in split_sections(soup)] if deck else [parse_ilt_from_root(soup)]
+    for ilt in ilts:
+        ilt.base_dir = base_dir
+    return ilts
+
+# ---------- single-pass classifier ----------
+# One walk over the document puts every element into the buckets of each column
+# it sits in (a column = direct child with a col-* class of a .row element).
+# Buckets keep document order, so they equal the old per-column select() results.
+
+_CLASS_BUCKETS = {
+    "card": ("card",),
+    "stat-box": ("kpi",), "kpi": ("kpi",), "tile": ("kpi",),
+    "card-header": ("card_header",),
+    "chart": ("chart",),
+}
+_TAG_BUCKETS = {
+    "ol": ("ol",),
+    "table": ("table",),
+}
+
+def _buckets_for(el) -> set:
+    out = set(_TAG_BUCKETS.get(el.name, ()))
+    for c in _classes(el):
+        out.update(_CLASS_BUCKETS.get(c, ()))
+    if el.name == "img" and el.has_attr("src"):
+        out.add("img")
+    if el.has_attr("data-chart"):
+        out.add("chart")
+    return out
+
+def _first(el, names=(), classes=()):
+    """First descendant with a tag in names or a class in classes (select_one without CSS parsing)."""
+    return el.find(lambda t: t.name in names or any(c in classes for c in _classes(t)))
+
+def _icon_class_el(el):
+    """Same match as select_one("i[class*='bi-'], i[class*='fa-']")."""
+    def match(t):
+        if t.name != "i":
+            return False
+        attr = " ".join(_classes(t))
+        return "bi-" in attr or "fa-" in attr
+    return el.find(match)
+
+def _is_col(el) -> bool:
+    return any(cc.startswith("col-") for cc in _classes(el))
+
+def _tag_children(el) -> list:
+    return [c for c in el.children if isinstance(c, Tag)]
+
+def _slide_roles(el) -> list:
+    """title / subtitle / footer roles of el (same matches as the old select_one() lists)."""
+    name, cls = el.name, _classes(el)
+    roles = []
+    if name in ("h1", "h2"):
+        roles.append("title")
+    if name in ("h3", "h4") or (name == "p" and ("lead" in cls or "text-muted" in cls)):
+        roles.append("subtitle")
+    if name == "footer" or "footer" in cls or "footer-bar" in cls:
+        roles.append("footer")
+    return roles
+
+def _classify(root):
+    """
+    Walk root once. Returns (rows, buckets, firsts):
+    - rows = [[col, ...], ...] for every .row below root in document order
+      (only rows with direct col-* children)
+    - buckets[id(col)] = {bucket: [elements in document order]}
+    - firsts = first title / subtitle / footer element below root
+    """
+    rows, buckets, firsts = [], {}, {}
+    stack = [(child, ()) for child in reversed(_tag_children(root))]
+    while stack:
+        el, cols = stack.pop()
+        for role in _slide_roles(el):
+            firsts.setdefault(role, el)
+        if cols:
+            for b in _buckets_for(el):
+                for col in cols:
+                    buckets[id(col)].setdefault(b, []).append(el)
+
+        children = _tag_children(el)
+        child_cols = cols
+        if "row" in _classes(el):
+            direct = [c for c in children if _is_col(c)]
+            if direct:
+                rows.append(direct)
+                for c in direct:
+                    buckets[id(c)] = {}
+        if id(el) in buckets:
+            child_cols = cols + (el,)
+        stack.extend((c, child_cols) for c in reversed(children))
+    return rows, buckets, firsts
+
+def _col_items(col, found: dict) -> List[ILTItem]:
+    """Build one column's items from its buckets (same order/kinds as the per-kind selects)."""
+    inner_items: List[ILTItem] = []
+    cards = found.get("card", [])
+
+    # cards (narrative)
+    for card in cards:
+        body = _first(card, classes=("card-body",))
+        if body:
+            paras = [p.get_text(" ", strip=True) for p in body.find_all("p")]
+            bullets = [li.get_text(" ", strip=True) for li in body.find_all("li") if li.find_parent(("ul", "ol"))]
+            if paras or bullets:
+                inner_items.append(ILTItem(kind="card", classes=_classes(card),
+                                           content={"paragraphs": paras, "bullets": bullets}))
+
+    # KPI-ish tiles
+    for sb in found.get("kpi", []):
+        headline = (_first(sb, classes=("fw-bold", "fs-3")) or sb).get_text(" ", strip=True)
+        small = sb.find("small")
+        caption = small.get_text(" ", strip=True) if small else ""
+        inner_items.append(ILTItem(kind="kpi", classes=_classes(sb),
+                                   content={"headline": headline, "caption": caption}))
+
+    # steps (first ol)
+    ols = found.get("ol")
+    if ols:
+        ol = ols[0]
+        lis = ol.find_all("li")
+        if lis:
+            headers = found.get("card_header")
+            header = headers[0].get_text(" ", strip=True) if headers else None
+            inner_items.append(ILTItem(kind="steps", classes=_classes(ol),
+                                       content={"header": header, "items": [li.get_text(" ", strip=True) for li in lis]}))
+
+    # icons
+    for icard in cards:
+        if icard.find("i"):
+            cap = _first(icard, names=("p",), classes=("small", "caption"))
+            if cap:
+                icon_el = _icon_class_el(icard)
+                icon_name = None
+                if icon_el:
+                    for cc in _classes(icon_el):
+                        if split_name(cc):  # bi-* / fa-*, not fa-solid, fa-2x, ...
+                            icon_name = cc; break
+                inner_items.append(ILTItem(kind="icon", classes=_classes(icard),
+                                           content={"caption": cap.get_text(' ', strip=True), "icon": icon_name}))
+
+    # tables
+    for tb in found.get("table", []):
+        rows_data = []
+        for tr in tb.find_all("tr"):
+            cells = [c.get_text(" ", strip=True) for c in tr.find_all(["th", "td"])]
+            if cells: rows_data.append(cells)
+        if rows_data:
+            inner_items.append(ILTItem(kind="table", classes=_classes(tb), content={"rows": rows_data}))
+
+    # images
+    for img in found.get("img", []):
+        inner_items.append(ILTItem(kind="image", classes=_classes(img), content={"src": img["src"]}))
+
+    # chart placeholder (first)
+    charts = found.get("chart")
+    if charts:
+        chart = charts[0]
+        inner_items.append(ILTItem(kind="chart", classes=_classes(chart), content={"spec": chart.get("data-chart", "{}")}))
+
+    if not inner_items:
+        # fallback to plain text
+        txt = col.get_text(" ", strip=True)
+        if txt:
+            inner_items.append(ILTItem(kind="text", classes=_classes(col), content={"text": txt}))
+    return inner_items
+
+def parse_ilt_from_root(soup) -> ILT:
+    """Parse a whole document or a single section (any bs4 Tag) into an ILT."""
     ilt = ILT()
 
+    rows, buckets, firsts = _classify(soup)
+
     # title/subtitle (best-effort)
-    t = soup.select_one("h1, h2.fw-bold, h2")
-    s = soup.select_one("p.lead, p.text-muted, h3, h4")
+    t, s = firsts.get("title"), firsts.get("subtitle")
     ilt.title = t.get_text(" ", strip=True) if t else None
     ilt.subtitle = s.get_text(" ", strip=True) if s else None
-
-    for row in soup.select(".row"):
-        direct_cols = [c for c in row.find_all(recursive=False) if any(cc.startswith("col-") for cc in _classes(c))]
-        if not direct_cols: 
-            continue
+    for direct_cols in rows:
         ilt_row = ILTRow()
         for col in direct_cols:
             cls = _classes(col)
             col_span, off, hfrac = _col_span(cls), _offset(cls), _hfrac(cls)
-
-            # gather items
-            inner_items: List[ILTItem] = []
-
-            # cards (narrative)
-            for card in col.select(".card"):
-                body = card.select_one(".card-body")
-                if body:
-                    paras = [p.get_text(" ", strip=True) for p in body.select("p")]
-                    bullets = [li.get_text(" ", strip=True) for li in body.select("ul li, ol li")]
-                    if paras or bullets:
-                        inner_items.append(ILTItem(kind="card", classes=_classes(card),
-                                                   content={"paragraphs": paras, "bullets": bullets}))
-
-            # KPI-ish tiles
-            for sb in col.select(".stat-box, .kpi, .tile"):
-                headline = (sb.select_one(".fw-bold, .fs-3") or sb).get_text(" ", strip=True)
-                small = sb.select_one("small")
-                caption = small.get_text(" ", strip=True) if small else ""
-                inner_items.append(ILTItem(kind="kpi", classes=_classes(sb),
-                                           content={"headline": headline, "caption": caption}))
-
-            # steps (ol)
-            ol = col.select_one("ol")
-            if ol and ol.select("li"):
-                items = [li.get_text(" ", strip=True) for li in ol.select("li")]
-                header_el = col.select_one(".card-header")
-                header = header_el.get_text(" ", strip=True) if header_el else None
-                inner_items.append(ILTItem(kind="steps", classes=_classes(ol), content={"header": header, "items": items}))
-
-            # icons
-            for icard in col.select(".card"):
-                if icard.select_one("i"):
-                    cap = icard.select_one("p, .small, .caption")
-                    if cap:
-                        icon_el = icard.select_one("i[class*='bi-'], i[class*='fa-']")
-                        icon_name = None
-                        if icon_el:
-                            for cc in _classes(icon_el):
-                                if cc.startswith(("bi-","fa-")) and cc not in ("bi","fa","fas","far"):
-                                    icon_name = cc; break
-                        inner_items.append(ILTItem(kind="icon", classes=_classes(icard),
-                                                   content={"caption": cap.get_text(' ', strip=True), "icon": icon_name}))
-
-            # tables
-            for tb in col.select("table"):
-                rows_data = []
-                for tr in tb.select("tr"):
-                    cells = [c.get_text(" ", strip=True) for c in tr.select("th, td")]
-                    if cells: rows_data.append(cells)
-                if rows_data:
-                    inner_items.append(ILTItem(kind="table", classes=_classes(tb), content={"rows": rows_data}))
-
-            # images
-            for img in col.select("img[src]"):
-                inner_items.append(ILTItem(kind="image", classes=_classes(img), content={"src": img["src"]}))
-
-            # chart placeholder
-            chart = col.select_one("[data-chart], .chart")
-            if chart:
-                spec = chart.get("data-chart", "{}")
-                inner_items.append(ILTItem(kind="chart", classes=_classes(chart), content={"spec": spec}))
-
-            if not inner_items:
-                # fallback to plain text
-                txt = col.get_text(" ", strip=True)
-                if txt:
-                    inner_items.append(ILTItem(kind="text", classes=cls, content={"text": txt}))
-
             # Append all inner items as independent slots within this column (simple approach)
-            for it in inner_items:
+            for it in _col_items(col, buckets[id(col)]):
                 it.col_span, it.offset, it.h_frac = col_span, off, hfrac
                 ilt_row.items.append(it)
 
         if ilt_row.items:
             ilt.rows.append(ilt_row)
 
-    foot = soup.select_one(".footer, .footer-bar, footer")
+    foot = firsts.get("footer")
     if foot:
         ilt.footer_left = foot.get_text(" ", strip=True)
     return ilt
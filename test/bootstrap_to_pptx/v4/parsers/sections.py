@@ -0,0 +1,62 @@
+from typing import List
+from bs4 import BeautifulSoup
+
+def _classes(el): return el.get("class", []) if el else []
+
+def _top_level_sections(soup):
+    """<section> elements that are not nested inside another <section>."""
+    return [s for s in soup.find_all("section") if s.find_parent("section") is None]
+
+def _is_break(el) -> bool:
+    return getattr(el, "name", None) is not None and "page-break" in _classes(el)
+
+def _cut(node, soup) -> List[List]:
+    """
+    node's children in document order, cut at every .page-break below node:
+    one list of nodes per piece. A child holding a break is itself cut, each
+    piece kept in a shallow copy of it (same tag and attributes).
+    """
+    pieces = [[]]
+    for child in list(node.children):
+        if _is_break(child):
+            child.extract()
+            pieces.append([])
+        elif getattr(child, "name", None) and child.select_one(".page-break") is not None:
+            shells = []
+            for part in _cut(child, soup):
+                shell = soup.new_tag(child.name, attrs=dict(child.attrs))
+                for n in part:
+                    shell.append(n)
+                shells.append(shell)
+            child.extract()
+            pieces[-1].append(shells[0])
+            pieces.extend([shell] for shell in shells[1:])
+        else:
+            pieces[-1].append(child.extract())
+    return pieces
+
+def split_sections(soup: BeautifulSoup) -> List:
+    """
+    Split one HTML document into per-slide roots.
+    - Top-level <section> elements: one slide each.
+    - Otherwise .page-break elements act as separators, wherever they are: the
+      document is cut at every break in document order, elements that hold a
+      break are split with it, and each piece becomes one slide (wrapped in a
+      detached <div>, so the soup is consumed).
+    - Otherwise the whole document is a single slide.
+    """
+    sections = _top_level_sections(soup)
+    if sections:
+        return sections
+
+    if soup.select_one(".page-break") is None:
+        return [soup]
+
+    chunks = []
+    for piece in _cut(soup.body or soup, soup):
+        div = soup.new_tag("div")
+        for n in piece:
+            div.append(n)
+        chunks.append(div)
+    # drop empty groups (e.g. a break at the very start or end)
+    return [c for c in chunks if c.find(True) or c.get_text(strip=True)]
@@ -0,0 +1,237 @@
+"""
+Native charts from data-chart specs (the JSON the parser keeps in
+ILTItem.content["spec"]).
+
+    {"type": "line", "labels": ["Q1", "Q2", "Q3"],
+     "series": [{"name": "Revenue", "values": [1.2, 3.4, 2.8], "color": "#0d6efd"}],
+     "title": "Revenue", "legend": "bottom", "min": 0, "max": 5,
+     "number_format": "0.0", "stacked": false}
+
+Chart.js-style specs are read too: data.labels, data.datasets[].label / .data,
+borderColor / backgroundColor, options.plugins.legend, indexAxis "y". Types:
+bar / column, barh, line, area, pie, doughnut, scatter. Scatter points are
+{"x", "y"} objects or [x, y] pairs, or a series has "x" and "y" lists. Colors
+are hex or a Bootstrap name ("primary").
+
+The spec becomes CategoryChartData / XyChartData for shapes.add_chart. Series
+longer than BULK_POINTS go through renderer.chart_xml instead, which writes the
+same chart XML (and the embedded workbook) in one pass. Legend, axis range and
+series colors are set with the utils.bootstrap_mapping chart converters.
+"""
+import json
+import math
+from dataclasses import dataclass, field
+from numbers import Number
+from typing import Any, List, Optional, Tuple, Union
+
+from pptx.chart.data import CategoryChartData, XyChartData
+from pptx.enum.chart import XL_CHART_TYPE
+from pptx.util import Pt
+
+from utils.bootstrap_mapping import (
+    BOOTSTRAP_COLORS, convert_chart_legend, convert_chart_legend_position,
+    convert_chart_value_axis_max, convert_chart_value_axis_min,
+    convert_series_fill_color, convert_series_line_color,
+)
+from .chart_xml import category_chart_data, xy_chart_data
+
+BULK_POINTS = 1000  # points in the longest series from which the bulk builder is used
+
+# spec type -> (chart type, stacked chart type)
+CHART_TYPES = {
+    "bar":      (XL_CHART_TYPE.COLUMN_CLUSTERED, XL_CHART_TYPE.COLUMN_STACKED),
+    "column":   (XL_CHART_TYPE.COLUMN_CLUSTERED, XL_CHART_TYPE.COLUMN_STACKED),
+    "barh":     (XL_CHART_TYPE.BAR_CLUSTERED, XL_CHART_TYPE.BAR_STACKED),
+    "line":     (XL_CHART_TYPE.LINE, XL_CHART_TYPE.LINE_STACKED),
+    "area":     (XL_CHART_TYPE.AREA, XL_CHART_TYPE.AREA_STACKED),
+    "pie":      (XL_CHART_TYPE.PIE, XL_CHART_TYPE.PIE),
+    "doughnut": (XL_CHART_TYPE.DOUGHNUT, XL_CHART_TYPE.DOUGHNUT),
+    "scatter":  (XL_CHART_TYPE.XY_SCATTER, XL_CHART_TYPE.XY_SCATTER),
+}
+_ALIASES = {"horizontalBar": "barh", "hbar": "barh", "donut": "doughnut", "xy": "scatter"}
+_LINE_KINDS = ("line", "scatter")   # series color goes on the line, not the fill
+_ROUND_KINDS = ("pie", "doughnut")  # no value axis; slices take the theme colors
+
+@dataclass
+class ChartSpec:
+    kind: str                                   # key of CHART_TYPES
+    chart_type: Any                             # XL_CHART_TYPE member
+    categories: List[Any] = field(default_factory=list)
+    series: List[tuple] = field(default_factory=list)   # (name, values) or, for scatter, (name, xs, ys)
+    colors: List[Optional[str]] = field(default_factory=list)
+    title: str = ""
+    legend: Union[bool, str, None] = None       # None = preset default; str = position
+    y_min: Optional[float] = None
+    y_max: Optional[float] = None
+    number_format: str = "General"
+
+    @property
+    def points(self) -> int:
+        return max((len(s[-1]) for s in self.series), default=0)
+
+def parse_chart_spec(spec: Union[str, dict]) -> ChartSpec:
+    """Read a data-chart spec (JSON text or dict). Raises ValueError if it holds no chart."""
+    if isinstance(spec, str):
+        try:
+            spec = json.loads(spec or "{}")
+        except json.JSONDecodeError as e:
+            raise ValueError(f"data-chart is not JSON: {e}") from None
+    if not isinstance(spec, dict):
+        raise ValueError("data-chart must be a JSON object")
+    data = spec.get("data") if isinstance(spec.get("data"), dict) else spec
+    options = _dict(spec.get("options"))
+
+    kind = str(spec.get("type") or "bar")
+    kind = _ALIASES.get(kind, kind)
+    if kind == "bar" and options.get("indexAxis") == "y":
+        kind = "barh"
+    if kind not in CHART_TYPES:
+        raise ValueError(f"unknown chart type {kind!r}")
+    stacked = bool(spec.get("stacked") or _stacked(options))
+    out = ChartSpec(kind, CHART_TYPES[kind][stacked])
+
+    raw_series = _list(data.get("series") or data.get("datasets"))
+    for i, s in enumerate(raw_series):
+        if not isinstance(s, dict):
+            s = {"values": s}
+        name = str(s.get("name") or s.get("label") or f"Series {i + 1}")
+        if kind == "scatter":
+            xs, ys = _xy(s)
+            if not xs:
+                continue
+            out.series.append((name, xs, ys))
+        else:
+            values = [_number(v) for v in _list(s.get("values") or s.get("data"))]
+            if not values:
+                continue
+            out.series.append((name, values))
+        # colors pair with out.series, so only kept series get one
+        out.colors.append(_color(s.get("color") or s.get("borderColor") or s.get("backgroundColor")))
+    if not out.series:
+        raise ValueError("data-chart has no series")
+
+    if kind != "scatter":
+        n = max(len(s[1]) for s in out.series)
+        labels = list(_list(data.get("labels") or data.get("categories")))[:n]
+        labels += [len(labels) + i + 1 for i in range(n - len(labels))]   # unlabeled points: 1, 2, ...
+        numeric = bool(labels) and all(isinstance(c, Number) and not isinstance(c, bool) for c in labels)
+        out.categories = labels if numeric else ["" if c is None else str(c) for c in labels]
+
+    legend = _dict(options.get("plugins")).get("legend", spec.get("legend"))
+    if isinstance(legend, dict):
+        legend = legend.get("position", True) if legend.get("display", True) else False
+    out.legend = legend
+    out.title = str(spec.get("title") or "")
+    y_axis = _dict(_dict(options.get("scales")).get("y"))
+    out.y_min = _number(spec.get("min", y_axis.get("min")))
+    out.y_max = _number(spec.get("max", y_axis.get("max")))
+    out.number_format = str(spec.get("number_format") or "General")
+    return out
+
+def _dict(v) -> dict:
+    """v if it is a JSON object, else {} (a spec may hold null or another type anywhere)."""
+    return v if isinstance(v, dict) else {}
+
+def _list(v) -> list:
+    """v if it is a JSON array, else []."""
+    return v if isinstance(v, (list, tuple)) else []
+
+def _stacked(options: dict) -> bool:
+    return any(isinstance(a, dict) and a.get("stacked") for a in _dict(options.get("scales")).values())
+
+def _number(v) -> Optional[float]:
+    """Numeric value of a data point; None (a gap) for anything that is not a finite number."""
+    if isinstance(v, bool) or v is None:
+        return None
+    if isinstance(v, str):
+        try:
+            v = float(v.replace(",", ""))
+        except ValueError:
+            return None
+    if not isinstance(v, Number) or not math.isfinite(v):
+        return None
+    return v
+
+def _xy(s: dict) -> Tuple[list, list]:
+    if "x" in s and "y" in s:
+        pairs = zip(_list(s["x"]), _list(s["y"]))
+    else:
+        pairs = ((p.get("x"), p.get("y")) if isinstance(p, dict) else tuple(p)[:2]
+                 for p in _list(s.get("values") or s.get("data"))
+                 if isinstance(p, dict) or (isinstance(p, (list, tuple)) and len(p) >= 2))
+    xs, ys = [], []
+    for x, y in pairs:
+        x = _number(x)
+        if x is not None:   # a point needs an x; a missing y is a gap
+            xs.append(x)
+            ys.append(_number(y))
+    return xs, ys
+
+def _color(value) -> Optional[str]:
+    if not isinstance(value, str):
+        return None   # Chart.js per-point color lists keep the theme colors
+    value = value.strip()
+    if value in BOOTSTRAP_COLORS:
+        return str(BOOTSTRAP_COLORS[value])
+    h = value.lstrip("#")
+    if len(h) == 6 and all(c in "0123456789abcdefABCDEF" for c in h):
+        return h.upper()
+    return None
+
+def chart_data(spec: ChartSpec):
+    """CategoryChartData / XyChartData for the spec, or the bulk builder's data for long series."""
+    if spec.points > BULK_POINTS:
+        if spec.kind == "scatter":
+            return xy_chart_data(spec.chart_type, spec.series, spec.number_format)
+        return category_chart_data(spec.chart_type, spec.categories, spec.series, spec.number_format)
+    if spec.kind == "scatter":
+        data = XyChartData(spec.number_format)
+        for name, xs, ys in spec.series:
+            s = data.add_series(name)
+            for x, y in zip(xs, ys):
+                s.add_data_point(x, y)
+        return data
+    data = CategoryChartData(spec.number_format)
+    data.categories = spec.categories
+    for name, values in spec.series:
+        data.add_series(name, values)
+    return data
+
+def add_chart_from_spec(shapes, spec: ChartSpec, left: int, top: int, width: int, height: int,
+                        preset: Optional[dict] = None):
+    """Chart graphic frame for a parsed spec at (left, top, width, height) in EMU; preset = presets["chart"]."""
+    from pptx.dml.color import RGBColor
+
+    preset = preset or {}
+    frame = shapes.add_chart(spec.chart_type, left, top, width, height, chart_data(spec))
+    chart = frame.chart
+    if preset.get("font_pt"):
+        chart.font.size = Pt(preset["font_pt"])
+
+    legend = spec.legend
+    if legend is None:
+        legend = preset.get("legend") or len(spec.series) > 1 or spec.kind in _ROUND_KINDS
+    convert_chart_legend(chart, bool(legend))
+    if legend:
+        convert_chart_legend_position(chart, legend if isinstance(legend, str) else preset.get("legend_pos", "bottom"))
+        chart.legend.include_in_layout = False
+
+    if spec.title:
+        chart.has_title = True
+        chart.chart_title.text_frame.text = spec.title
+    elif len(spec.series) == 1 and spec.kind not in _ROUND_KINDS:
+        chart.has_title = False   # PowerPoint would show the series name as the title
+
+    if spec.kind not in _ROUND_KINDS:
+        if spec.y_min is not None:
+            convert_chart_value_axis_min(chart, spec.y_min)
+        if spec.y_max is not None:
+            convert_chart_value_axis_max(chart, spec.y_max)
+        for series, color in zip(chart.series, spec.colors):
+            if color:
+                rgb = RGBColor.from_string(color)
+                if spec.kind in _LINE_KINDS:
+                    convert_series_line_color(series, rgb)
+                else:
+                    convert_series_fill_color(series, rgb)
+    return frame
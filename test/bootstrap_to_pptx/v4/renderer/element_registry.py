@@ -1,12 +1,25 @@
 # v4/renderer/element_registry.py
+import logging
+from itertools import chain
 from typing import List
-from pptx.util import Inches, Pt
+from pptx.util import Emu, Inches, Pt
 from pptx.enum.text import MSO_AUTO_SIZE, MSO_ANCHOR
 
-from .elements import add_card, add_text, add_bullets, add_kpi_tile
+from .charts import add_chart_from_spec, parse_chart_spec
+from .elements import (
+    GRAY_700, Para, add_card, add_text, add_bullets, add_kpi_tile, bullet_paras, compact_frame, is_compact,
+)
+from .table_xml import add_table_bulk, bulk_ok, even_split
+from .table_pages import fill_height, paginate
+from .layout_solver import Rect
 from utils.bootstrap_mapping import apply_shape_appearance_from_bootstrap
+from utils.icons import add_icon
+from utils.images import DEFAULT_DPI, add_picture
 from utils.text_fit import wrap_text
 
+# Module logger; handlers and level are configured by the entry point (main.py).
+logger = logging.getLogger(__name__)
+
 
 def _init_textframe(tb):
     """Standard text frame setup: wrap + shrink-to-fit + top anchor."""
@@ -30,18 +43,27 @@ def render_card(slide, rect, item, presets: dict, styles: dict):
     )
     apply_shape_appearance_from_bootstrap(card, item.classes)
 
-    # One textbox for both paragraphs and bullets (more stable layout).
-    tx, ty = x + pad_l, y + pad_t
-    tw, th = w - (pad_l + pad_r), h - (pad_t + pad_b)
-    tb = slide.shapes.add_textbox(Inches(tx), Inches(ty), Inches(tw), Inches(th))
-    tf = _init_textframe(tb)
-
     body_pt = presets["card"]["text"]["body_pt"]
     bullet_pt = presets["card"]["text"]["bullet_pt"]
 
     paras = item.content.get("paragraphs", []) or []
     bullets = item.content.get("bullets", []) or []
 
+    if is_compact(styles):
+        # The card's own text frame; padding + a textbox's default inset as margins.
+        compact_frame(
+            slide, card,
+            [Para(para, body_pt) for para in paras] + [Para(f"• {b or ''}", bullet_pt, space_after_pt=3) for b in bullets],
+            padding=(pad_l + 0.1, pad_t + 0.05, pad_r + 0.1, pad_b + 0.05)
+        )
+        return
+
+    # One textbox for both paragraphs and bullets (more stable layout).
+    tx, ty = x + pad_l, y + pad_t
+    tw, th = w - (pad_l + pad_r), h - (pad_t + pad_b)
+    tb = slide.shapes.add_textbox(Inches(tx), Inches(ty), Inches(tw), Inches(th))
+    tf = _init_textframe(tb)
+
     # Paragraphs
     for i, para in enumerate(paras):
         p = tf.add_paragraph() if i else tf.paragraphs[0]
@@ -78,6 +100,7 @@ def render_kpis(slide, rect, items: List, presets: dict, styles: dict):
             bg_hex=presets["kpi"]["bg_hex"],
             headline_pt=presets["kpi"]["headline_pt"],
             caption_pt=presets["kpi"]["caption_pt"],
+            compact=is_compact(styles),
         )
 
 
@@ -95,6 +118,17 @@ def render_steps(slide, rect, item, presets: dict, styles: dict):
     header_top = rect.top + 0.18
     bullets_top = rect.top + (0.18 if not header else 0.52)
 
+    if is_compact(styles):
+        # Header and numbered list as paragraphs of the card's own text frame.
+        head = [Para(header, max(13, styles["steps"]["items_pt"]), GRAY_700, bold=True, space_after_pt=6)] if header else []
+        compact_frame(
+            slide, card,
+            head + bullet_paras(item.content.get("items", []) or [], size=styles["steps"]["items_pt"], numbered=True),
+            # margins put the first line where it was: the header's add_text, else add_bullets' textbox
+            padding=(0.36, 0.22, 0.36, 0.27) if header else (0.4, 0.23, 0.4, 0.27)
+        )
+        return
+
     if header:
         tb = add_text(slide, rect.left + 0.3, header_top, rect.width - 0.6, 0.30, header, size=max(13, styles["steps"]["items_pt"]))
         # make header bold
@@ -136,7 +170,16 @@ def render_icon_row(slide, rect, items: List, presets: dict, styles: dict):
             radius=presets["icon"]["rounded"],
             shadow=presets["icon"]["shadow"]
         )
-        # Caption
+        # Glyph above the caption (utils.icons: rasterized once, kept in styles["icons"]["cache_dir"] if set)
+        if it.content.get("icon"):
+            img_h = styles["icons"]["img_h_in"]
+            add_icon(slide.shapes, it.content["icon"], Inches(x + i * (tile_w + gutter) + (tile_w - img_h) / 2),
+                     Inches(y + 0.12), Inches(img_h), styles)
+        # Caption (compact: in the card's own text frame, below the glyph)
+        if is_compact(styles):
+            compact_frame(slide, card, [Para(it.content.get("caption", ""), presets["icon"]["caption_pt"], GRAY_700)],
+                          padding=(0.26, 0.82, 0.26, 0.04))
+            continue
         add_text(
             slide,
             x + i * (tile_w + gutter) + 0.2,
@@ -148,11 +191,42 @@ def render_icon_row(slide, rect, items: List, presets: dict, styles: dict):
         )
 
 
-def render_table(slide, rect, item, presets: dict):
-    """Render a simple table sized to rect."""
+def render_table(slide, rect, item, presets: dict, styles: dict | None = None, next_height_in: float | None = None):
+    """
+    Render a table sized to rect, rows measured. With next_height_in, rows that do not
+    fit stay off this slide: the remaining pages (header repeated) are returned as a
+    lazy iterator for continuation slides of that height (render_table_page), else None.
+    """
     rows = item.content.get("rows", []) or []
     if not rows:
-        return
+        return None
+    header_pt, cell_pt = presets["table"]["header_pt"], presets["table"]["cell_pt"]
+    backend = (styles or {}).get("text_metrics", {}).get("backend", "python")
+    col_widths = even_split(Inches(rect.width), len(rows[0]))
+    pages = paginate(rows, col_widths, Inches(rect.height), Inches(next_height_in) if next_height_in else None,
+                     header_pt, cell_pt, backend)
+    page_rows, heights = next(pages)
+    following = next(pages, None)
+    if following is None:
+        heights = fill_height(heights, Inches(rect.height))
+    render_table_page(slide, rect.left, rect.top, rect.width, page_rows, heights, presets)
+    return None if following is None else chain([following], pages)
+
+
+def render_table_page(slide, left, top, width, rows, row_heights, presets: dict):
+    """One page of a table: rows (header first) with their heights in EMU, from (left, top)."""
+    header_pt, cell_pt = presets["table"]["header_pt"], presets["table"]["cell_pt"]
+    if bulk_ok(rows):
+        add_table_bulk(slide.shapes, rows, Inches(left), Inches(top), Inches(width), sum(row_heights),
+                       header_fill=presets["table"]["header_fill"], header_pt=header_pt, cell_pt=cell_pt,
+                       row_heights=row_heights)
+    else:
+        rect = Rect(left, top, width, Emu(sum(row_heights)).inches)
+        render_table_cells(slide, rect, rows, row_heights, header_pt, cell_pt)
+
+
+def render_table_cells(slide, rect, rows, row_heights=None, header_pt=None, cell_pt=None):
+    """Per-cell path (python-pptx proxies): line breaks, control characters, ragged rows."""
     table = slide.shapes.add_table(
         rows=len(rows),
         cols=len(rows[0]),
@@ -164,21 +238,40 @@ def render_table(slide, rect, item, presets: dict):
 
     from pptx.dml.color import RGBColor
 
+    for tr, h in zip(table.rows, row_heights or []):
+        tr.height = h
     for r, row in enumerate(rows):
         for c, txt in enumerate(row):
             cell = table.cell(r, c)
             cell.text = (txt or "")
+            size = header_pt if r == 0 else cell_pt
+            if size:
+                cell.text_frame.paragraphs[0].font.size = Pt(size)
             if r == 0:
                 cell.fill.solid()
                 cell.fill.fore_color.rgb = RGBColor(0xF1, 0xF3, 0xF5)
+    return table
 
 
-def render_image(slide, rect, item, presets: dict):
-    """Render an image; maintain aspect by specifying width only."""
+def render_image(slide, rect, item, presets: dict, base_dir: str | None = None):
+    """Render an image; maintain aspect by specifying width only (utils.images: resized to the rect, deduped)."""
     src = item.content.get("src")
     if not src:
         return
-    slide.shapes.add_picture(src, Inches(rect.left), Inches(rect.top), width=Inches(rect.width))
+    add_picture(slide.shapes, src, Inches(rect.left), Inches(rect.top), width=Inches(rect.width),
+                base_dir=base_dir, dpi=presets["image"].get("dpi", DEFAULT_DPI))
+
+
+def render_chart(slide, rect, item, presets: dict):
+    """Render a native chart from the item's data-chart spec; a spec without a chart leaves a placeholder."""
+    try:
+        spec = parse_chart_spec(item.content.get("spec") or "{}")
+    except ValueError as e:
+        logger.warning("Chart not rendered: %s", e)
+        add_text(slide, rect.left, rect.top, rect.width, rect.height, "[Chart placeholder]", size=presets["text"]["pt"])
+        return None
+    return add_chart_from_spec(slide.shapes, spec, Inches(rect.left), Inches(rect.top), Inches(rect.width),
+                               Inches(rect.height), presets.get("chart"))
 
 
 def render_text(slide, rect, item, presets: dict):
@@ -1,14 +1,105 @@
+from typing import NamedTuple, Optional
 from pptx.util import Inches, Pt
-from pptx.enum.text import MSO_AUTO_SIZE, MSO_ANCHOR
-from pptx.enum.shapes import MSO_SHAPE
+from pptx.enum.dml import MSO_THEME_COLOR
+from pptx.enum.text import MSO_AUTO_SIZE, MSO_ANCHOR, PP_ALIGN
+from pptx.enum.shapes import MSO_SHAPE, MSO_SHAPE_TYPE
+from pptx.oxml.ns import qn
 
 from pptx.dml.color import RGBColor
 
+from utils.cleanup import KEEP_NAMES
+from .shape_xml import SlideXml
+
 GRAY_700 = RGBColor(0x51,0x51,0x51)
 BORDER = RGBColor(0xDE,0xE2,0xE6)
 VERY_LIGHT = RGBColor(0xF8,0xF9,0xFA)
 
+# ---- compact mode: one text frame per container -----------------------------------
+# styles["shapes"]["compact"]: the text of a card, header, KPI tile or footer bar goes
+# into one frame (see compact_frame) instead of a textbox per part, so a slide has
+# fewer <p:sp>. The slide looks the same as without compact.
+
+def is_compact(styles) -> bool:
+    return bool((styles or {}).get("shapes", {}).get("compact"))
+
+class Para(NamedTuple):
+    text: str
+    size_pt: float
+    color: Optional[RGBColor] = None   # None = theme text color, as in a plain textbox
+    bold: bool = False
+    space_after_pt: float = 0
+
+def bullet_paras(items, size=14, numbered=False):
+    """add_bullets' paragraphs, for fill_text_frame."""
+    return [Para((f"{i+1}. " if numbered else "• ") + (t or ""), size, GRAY_700, space_after_pt=4)
+            for i, t in enumerate(items or [])]
+
+# add_textbox's default insets (l, t, r, b), inches
+TEXTBOX_INSET = (0.1, 0.05, 0.1, 0.05)
+
+def fill_text_frame(shape, paras, padding=TEXTBOX_INSET, shrink=True):
+    """
+    Write paras into shape's own text frame. padding (l, t, r, b in inches) becomes the
+    frame's margins: the offset of the textbox it replaces plus that textbox's inset,
+    so the text lands where it did. shrink: shrink text on overflow. Returns the
+    text frame.
+    """
+    autoshape = shape.shape_type != MSO_SHAPE_TYPE.TEXT_BOX   # a textbox is left-aligned, dark already
+    tf = shape.text_frame
+    tf.clear()
+    tf.word_wrap = True
+    if shrink:
+        tf.auto_size = MSO_AUTO_SIZE.TEXT_TO_FIT_SHAPE
+    if autoshape:
+        tf.vertical_anchor = MSO_ANCHOR.TOP   # autoshape text is centered by default
+    if tuple(padding) != TEXTBOX_INSET:
+        tf.margin_left, tf.margin_top, tf.margin_right, tf.margin_bottom = (Inches(v) for v in padding)
+    for i, para in enumerate(paras):
+        p = tf.add_paragraph() if i else tf.paragraphs[0]
+        if autoshape:
+            p.alignment = PP_ALIGN.LEFT
+        p.text = para.text or ""
+        p.font.size = Pt(para.size_pt)
+        p.font.bold = para.bold or None
+        if para.color is not None:
+            p.font.color.rgb = para.color
+        elif autoshape:
+            p.font.color.theme_color = MSO_THEME_COLOR.TEXT_1   # autoshape text is light by default
+        if para.space_after_pt:
+            p.space_after = Pt(para.space_after_pt)
+    return tf
+
+def compact_frame(slide, shape, paras, padding=TEXTBOX_INSET, shrink=True):
+    """
+    fill_text_frame into shape if cleanup_slide keeps it (its name is in KEEP_NAMES), else
+    into one textbox laid over it. cleanup_slide deletes an empty container; text in its
+    frame would keep it, and the slide would no longer look as it does without compact.
+    The textbox is inset by padding less its own default insets.
+    """
+    if (shape.name or "") not in KEEP_NAMES:
+        box = _inset_box(shape, padding)
+        shape = slide.textbox(*box, [], body="plain") if isinstance(slide, SlideXml) else slide.shapes.add_textbox(*box)
+        padding = TEXTBOX_INSET
+    return fill_text_frame(shape, paras, padding, shrink)
+
+def _inset_box(shape, padding):
+    """(left, top, width, height) of a textbox whose default insets put its text padding inside shape."""
+    l, t, r, b = (Inches(p - d) for p, d in zip(padding, TEXTBOX_INSET))
+    return shape.left + l, shape.top + t, shape.width - l - r, shape.height - t - b
+
+def _right_tab(paragraph, pos):
+    """Right-aligned tab stop at pos (EMU from the frame's left margin)."""
+    pPr = paragraph._p.get_or_add_pPr()
+    tabs = pPr.makeelement(qn("a:tabLst"), {})
+    tabs.append(pPr.makeelement(qn("a:tab"), {"pos": str(int(pos)), "algn": "r"}))
+    pPr.insert_element_before(tabs, "a:defRPr", "a:extLst")
+
+# Each helper takes a python-pptx slide, or a shape_xml.SlideXml (XML backend: same shapes from templates).
+
 def add_card(slide, left, top, width, height, radius=True, shadow=False):
+    if isinstance(slide, SlideXml):
+        return slide.autoshape("roundRect" if radius else "rect", Inches(left), Inches(top), Inches(width), Inches(height),
+                               "FFFFFF", str(BORDER), adj=0.16 if radius else None, shadow=bool(shadow))
     shp = slide.shapes.add_shape(MSO_SHAPE.ROUNDED_RECTANGLE if radius else MSO_SHAPE.RECTANGLE,
                                  Inches(left), Inches(top), Inches(width), Inches(height))
     shp.fill.solid(); shp.fill.fore_color.rgb = RGBColor(0xFF,0xFF,0xFF)
@@ -20,6 +111,8 @@ def add_card(slide, left, top, width, height, radius=True, shadow=False):
     return shp
 
 def add_title(slide, left, top, width, height, text):
+    if isinstance(slide, SlideXml):
+        return slide.textbox(Inches(left), Inches(top), Inches(width), Inches(height), [Para(text, 36, bold=True)])
     tb = slide.shapes.add_textbox(Inches(left), Inches(top), Inches(width), Inches(height))
     tf = tb.text_frame; tf.clear(); tf.word_wrap = True
     tf.auto_size = MSO_AUTO_SIZE.TEXT_TO_FIT_SHAPE; tf.vertical_anchor = MSO_ANCHOR.TOP
@@ -28,6 +121,8 @@ def add_title(slide, left, top, width, height, text):
     return tb
 
 def add_subtitle(slide, left, top, width, height, text):
+    if isinstance(slide, SlideXml):
+        return slide.textbox(Inches(left), Inches(top), Inches(width), Inches(height), [Para(text, 17)])
     tb = slide.shapes.add_textbox(Inches(left), Inches(top), Inches(width), Inches(height))
     tf = tb.text_frame; tf.clear(); tf.word_wrap = True
     tf.auto_size = MSO_AUTO_SIZE.TEXT_TO_FIT_SHAPE; tf.vertical_anchor = MSO_ANCHOR.TOP
@@ -36,6 +131,9 @@ def add_subtitle(slide, left, top, width, height, text):
     return tb
 
 def add_text(slide, left, top, width, height, text, size=14, color=GRAY_700):
+    if isinstance(slide, SlideXml):
+        return slide.textbox(Inches(left), Inches(top), Inches(width), Inches(height), [Para(text, size, color)],
+                             inset=(Inches(0.06), Inches(0.06), Inches(0.04), Inches(0.04)))
     tb = slide.shapes.add_textbox(Inches(left), Inches(top), Inches(width), Inches(height))
     tf = tb.text_frame; tf.clear(); tf.word_wrap = True
     tf.auto_size = MSO_AUTO_SIZE.TEXT_TO_FIT_SHAPE; tf.vertical_anchor = MSO_ANCHOR.TOP
@@ -45,6 +143,8 @@ def add_text(slide, left, top, width, height, text, size=14, color=GRAY_700):
     return tb
 
 def add_bullets(slide, left, top, width, height, items, size=14, numbered=False):
+    if isinstance(slide, SlideXml):
+        return slide.textbox(Inches(left), Inches(top), Inches(width), Inches(height), bullet_paras(items, size, numbered))
     tb = slide.shapes.add_textbox(Inches(left), Inches(top), Inches(width), Inches(height))
     tf = tb.text_frame; tf.clear(); tf.word_wrap = True
     tf.auto_size = MSO_AUTO_SIZE.TEXT_TO_FIT_SHAPE; tf.vertical_anchor = MSO_ANCHOR.TOP
@@ -56,22 +156,50 @@ def add_bullets(slide, left, top, width, height, items, size=14, numbered=False)
         p.space_after = Pt(4)
     return tb
 
-def add_footer_bar(slide, left, top, width, height, left_text, right_text, left_pt=9, right_pt=9):
-    bar = slide.shapes.add_shape(MSO_SHAPE.RECTANGLE, Inches(left), Inches(top), Inches(width), Inches(height))
-    bar.fill.solid(); bar.fill.fore_color.rgb = VERY_LIGHT; bar.line.color.rgb = BORDER
+def add_footer_bar(slide, left, top, width, height, left_text, right_text, left_pt=9, right_pt=9, compact=False):
+    if isinstance(slide, SlideXml):
+        bar = slide.autoshape("rect", Inches(left), Inches(top), Inches(width), Inches(height), str(VERY_LIGHT), str(BORDER))
+    else:
+        bar = slide.shapes.add_shape(MSO_SHAPE.RECTANGLE, Inches(left), Inches(top), Inches(width), Inches(height))
+        bar.fill.solid(); bar.fill.fore_color.rgb = VERY_LIGHT; bar.line.color.rgb = BORDER
+    if compact:
+        # one paragraph "left<TAB>right" against a right tab stop at the inner right edge
+        inset = 0.38  # textbox offset 0.28 + its 0.1 inset
+        p = compact_frame(slide, bar, [], padding=(inset, 0.09, inset, 0.09), shrink=False).paragraphs[0]
+        p.alignment = PP_ALIGN.LEFT
+        _right_tab(p, Inches(width - 2 * inset))
+        for text, size in ((left_text or "", left_pt), ("\t" + (right_text or ""), right_pt)):
+            run = p.add_run(); run.text = text; run.font.size = Pt(size)
+            run.font.color.theme_color = MSO_THEME_COLOR.TEXT_1
+        return bar
+    if isinstance(slide, SlideXml):
+        for x, text, size, align in ((bar.left+Inches(0.28), left_text, left_pt, None),
+                                     (bar.left+bar.width-Inches(width/2)-Inches(0.28), right_text, right_pt, "ctr")):
+            slide.textbox(x, bar.top+Inches(0.04), Inches(width/2), Inches(height-0.08), [Para(text, size)], body="plain",
+                          align=align)
+        return bar
     tb_left = slide.shapes.add_textbox(bar.left+Inches(0.28), bar.top+Inches(0.04), Inches(width/2), Inches(height-0.08))
     p = tb_left.text_frame.paragraphs[0]; p.text = left_text or ""; p.font.size = Pt(left_pt)
     tb_right = slide.shapes.add_textbox(bar.left+bar.width-Inches(width/2)-Inches(0.28), bar.top+Inches(0.04), Inches(width/2), Inches(height-0.08))
     r = tb_right.text_frame.paragraphs[0]; r.text = right_text or ""; r.font.size = Pt(right_pt); r.alignment = 2
     return bar
 
-def add_kpi_tile(slide, left, top, width, height, headline, caption, bg_hex="#0d6efd", headline_pt=26, caption_pt=11):
-    shp = slide.shapes.add_shape(MSO_SHAPE.ROUNDED_RECTANGLE, Inches(left), Inches(top), Inches(width), Inches(height))
-    shp.fill.solid()
-    h = bg_hex.lstrip("#"); shp.fill.fore_color.rgb = RGBColor(int(h[0:2],16), int(h[2:4],16), int(h[4:6],16))
-    shp.line.fill.background()
-    try: shp.adjustments[0] = 0.16
-    except: pass
+def add_kpi_tile(slide, left, top, width, height, headline, caption, bg_hex="#0d6efd", headline_pt=26, caption_pt=11,
+                 compact=False):
+    h = bg_hex.lstrip("#")
+    if isinstance(slide, SlideXml):
+        shp = slide.autoshape("roundRect", Inches(left), Inches(top), Inches(width), Inches(height), h[:6].upper(), adj=0.16)
+    else:
+        shp = slide.shapes.add_shape(MSO_SHAPE.ROUNDED_RECTANGLE, Inches(left), Inches(top), Inches(width), Inches(height))
+        shp.fill.solid()
+        shp.fill.fore_color.rgb = RGBColor(int(h[0:2],16), int(h[2:4],16), int(h[4:6],16))
+        shp.line.fill.background()
+        try: shp.adjustments[0] = 0.16
+        except: pass
+    if compact:
+        compact_frame(slide, shp, [Para(headline, headline_pt, RGBColor(0xFF,0xFF,0xFF)),
+                                   Para(caption, caption_pt, RGBColor(0xF1,0xF3,0xF5))], padding=(0.26, 0.22, 0.26, 0.04))
+        return shp
     add_text(slide, left+0.2, top+0.18, width-0.4, 0.5, headline, size=headline_pt, color=RGBColor(0xFF,0xFF,0xFF))
     add_text(slide, left+0.2, top+0.70, width-0.4, 0.4, caption, size=caption_pt, color=RGBColor(0xF1,0xF3,0xF5))
     return shp
@@ -7,11 +7,29 @@ from parsers.generic_bootstrap_to_ilt import ILT, ILTRow, ILTItem
 class Rect:
     left: float; top: float; width: float; height: float
 
-def solve_layout(grid: Grid12, ilt: ILT, *, row_top_in: float, row_height_in: float, row_gap_in: float = 0.0) -> List[Tuple[Rect, ILTItem]]:
+def _solve_numpy(grid: Grid12, ilt: ILT, row_top_in: float, row_height_in: float, row_gap_in: float) -> List[Tuple[Rect, ILTItem]]:
+    from .layout_solver_np import solve_arrays  # optional dependency
+
+    items = [it for row in ilt.rows for it in row.items]
+    item_row = [i for i, row in enumerate(ilt.rows) for _ in row.items]
+    left, top, width, height = solve_arrays(
+        [it.col_span for it in items], [it.offset for it in items], [it.h_frac or 0.0 for it in items],
+        item_row, len(ilt.rows), grid, row_top_in=row_top_in, row_height_in=row_height_in, row_gap_in=row_gap_in)
+    return [(Rect(*r), it) for r, it in
+            zip(zip(left.tolist(), top.tolist(), width.tolist(), height.tolist()), items)]
+
+def solve_layout(grid: Grid12, ilt: ILT, *, row_top_in: float, row_height_in: float, row_gap_in: float = 0.0,
+                 backend: str = "python") -> List[Tuple[Rect, ILTItem]]:
     """
     Flattens ILT rows into (Rect, ILTItem) placements.
     Simple policy: each ILTItem reserves its col_span at its offset; if a row overflows, start a new band below.
+    backend="numpy" computes the same placements with whole-array operations
+    (see layout_solver_np; needs numpy).
     """
+    if backend == "numpy":
+        return _solve_numpy(grid, ilt, row_top_in, row_height_in, row_gap_in)
+    if backend != "python":
+        raise ValueError(f"Unknown solver backend: {backend!r}")
     placements: List[Tuple[Rect, ILTItem]] = []
     cur_top = row_top_in
     for row in ilt.rows:
@@ -0,0 +1,42 @@
+"""
+NumPy backend for layout_solver.solve_layout (optional: numpy is only imported here).
+
+All items of a slide are laid out as arrays:
+  - col_start = running sum of offset + col_span within the row (exclusive) + offset
+  - row tops are an accumulated `cur_top += row_height_in + row_gap_in`
+  - left / width / height come from whole-array expressions
+
+Same float operations in the same order as the pure-Python solver, so the
+rectangles are bit-identical.
+"""
+import numpy as np
+
+def solve_arrays(span, offset, h_frac, item_row, n_rows: int, grid, *,
+                 row_top_in: float, row_height_in: float, row_gap_in: float = 0.0):
+    """
+    Rect fields for items given as parallel arrays (item_row[i] = index of i's
+    row, non-decreasing; h_frac 0 = unset). Returns (left, top, width, height) arrays.
+    """
+    span = np.asarray(span, dtype=np.int64)
+    offset = np.asarray(offset, dtype=np.int64)
+    item_row = np.asarray(item_row, dtype=np.int64)
+    h_frac = np.asarray(h_frac, dtype=np.float64)
+    take = offset + span
+
+    before = np.cumsum(take) - take        # exclusive running sum over all items
+    row_first = np.ones(len(span), dtype=bool)
+    if len(span):
+        row_first[1:] = item_row[1:] != item_row[:-1]
+    seg = np.cumsum(row_first) - 1
+    col_start = before - before[row_first][seg] + offset
+
+    steps = np.full(n_rows, row_height_in + row_gap_in, dtype=np.float64)
+    if n_rows:
+        steps[0] = row_top_in
+    row_top = np.cumsum(steps)
+
+    left = grid.m_left + col_start * (grid.col_w + grid.gutter_in)
+    width = span * grid.col_w + (span - 1) * grid.gutter_in
+    top = row_top[item_row]
+    height = np.where(h_frac != 0, row_height_in * h_frac, row_height_in)
+    return left, top, width, height
@@ -0,0 +1,79 @@
+"""
+Parallel deck rendering: the ILTs of one deck are split into chunks, worker
+processes render each chunk into their own copy of the template and export
+the slides as data (utils/slide_parts.py), and the parent merges them in order
+into one Presentation, with one image part per distinct picture.
+
+Page numbers: a slide's footer number depends on how many continuation slides
+(long tables) come before it. Chunks are first rendered assuming one slide per
+ILT; each returns how many slides every ILT produced, and a chunk that then
+turns out to start at another number is rendered again with the right one (in
+parallel, at most once). The result is the deck build_deck_from_ilts renders.
+"""
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional
+
+from parsers.generic_bootstrap_to_ilt import ILT
+from utils.slide_parts import SlideMerger, export_slides, template_partnames
+from .pipeline import _grid_for, _new_presentation, render_ilt_slide
+
+# Module logger; handlers and level are configured by the entry point (main.py).
+logger = logging.getLogger(__name__)
+
+# per-process state, filled by _init_worker
+_WORKER = {}
+
+def _init_worker(ST: dict, PRE: dict, template_path: Optional[str]):
+    shared = template_partnames(_new_presentation(ST, template_path))
+    _WORKER.update(ST=ST, PRE=PRE, template=template_path, shared=shared)
+
+def _render_chunk(ilts: List[ILT], first_num: int):
+    """(slides per ILT, exported slides, media) of ilts rendered as slides first_num, first_num + 1, ..."""
+    ST, PRE = _WORKER["ST"], _WORKER["PRE"]
+    prs = _new_presentation(ST, _WORKER["template"])
+    grid = _grid_for(ST)
+    first = len(prs.slides)
+    counts = []
+    for ilt in ilts:
+        before = len(prs.slides)
+        render_ilt_slide(prs, grid, ilt, ST, PRE, slide_num=first_num + before - first)
+        counts.append(len(prs.slides) - before)
+    slides, media = export_slides(prs, first, _WORKER["shared"])
+    return counts, slides, media
+
+def build_deck_parallel(ilts: List[ILT], ST: dict, PRE: dict, template_path: Optional[str] = None,
+                        workers: Optional[int] = None, chunk_size: Optional[int] = None, stream=None):
+    """
+    build_deck_from_ilts across `workers` processes (default: CPU count); chunks of chunk_size
+    ILTs. stream (utils.pptx_io.PptxStreamWriter) gets the slides of each chunk once merged.
+    """
+    prs = _new_presentation(ST, template_path)
+    if stream is not None:
+        stream.write_slides(prs)  # the template's own slides, if any
+    if not ilts:
+        return prs
+    workers = workers or os.cpu_count() or 1
+    chunk_size = chunk_size or max(1, -(-len(ilts) // (workers * 4)))  # ~4 chunks per worker to balance
+    starts = list(range(0, len(ilts), chunk_size))
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(ST, PRE, template_path)) as pool:
+        futures = [pool.submit(_render_chunk, ilts[s:s + chunk_size], s + 1) for s in starts]
+        results = [f.result() for f in futures]
+        # slide counts do not depend on numbering: renumber the chunks after continuation slides
+        redo, num = {}, 1
+        for i, (s, (counts, _, _)) in enumerate(zip(starts, results)):
+            if num != s + 1:
+                redo[i] = pool.submit(_render_chunk, ilts[s:s + chunk_size], num)
+            num += sum(counts)
+        if redo:
+            logger.debug("re-rendering %d of %d chunks with shifted page numbers", len(redo), len(starts))
+        for i, fut in redo.items():
+            results[i] = fut.result()
+    merger = SlideMerger(prs)
+    for _, slides, media in results:
+        merger.add(slides, media)
+        if stream is not None:
+            stream.write_slides(prs)
+    return prs
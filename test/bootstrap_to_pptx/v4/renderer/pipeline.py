@@ -1,50 +1,81 @@
 import json
-from pptx import Presentation
 from pptx.util import Inches
 from .grid import Grid12
 from .layout_solver import solve_layout, Rect
-from .element_registry import render_card, render_kpis, render_steps, render_icon_row, render_table, render_image, render_text
+from .element_registry import render_card, render_kpis, render_steps, render_icon_row, render_table, render_table_page, render_image, render_chart, render_text
 from utils.cleanup import cleanup_slide
-from parsers.generic_bootstrap_to_ilt import parse_generic_bootstrap_to_ilt, ILTItem
-from .elements import add_title, add_subtitle, add_footer_bar
+from parsers.generic_bootstrap_to_ilt import parse_generic_bootstrap_to_ilt, parse_generic_bootstrap_deck, ILT
+from .elements import add_title, add_subtitle, add_footer_bar, is_compact
+from .shape_xml import SlideXml
+from utils.template_cache import open_template
 
-def build_deck_from_html(html_path: str, styles_path: str, presets_path: str, template_path: str | None = None):
-    ST = json.load(open(styles_path, "r", encoding="utf-8"))
-    PRE = json.load(open(presets_path, "r", encoding="utf-8"))
-
-    ilt = parse_generic_bootstrap_to_ilt(html_path)
-
-    prs = Presentation(template_path) if template_path else Presentation()
+def _new_presentation(ST: dict, template_path: str | None = None):
+    prs = open_template(template_path)
     prs.slide_width  = Inches(ST["page"]["width_in"])
     prs.slide_height = Inches(ST["page"]["height_in"])
-    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    return prs
 
-    grid = Grid12(
+def _grid_for(ST: dict) -> Grid12:
+    return Grid12(
         slide_width_in=ST["page"]["width_in"],
         slide_height_in=ST["page"]["height_in"],
         margins_in=tuple(ST["page"]["margins_in"]),
         gutter_in=ST["page"]["gutter_in"]
     )
 
+def render_ilt_slide(prs, grid: Grid12, ilt: ILT, ST: dict, PRE: dict, slide_num: int = 1):
+    """Add one blank slide to prs and render a parsed ILT onto it."""
+    slide = _target(prs.slides.add_slide(prs.slide_layouts[6]), ST)
+
     # titles
     if ilt.title:    add_title(slide, 0.6, ST["title"]["top_in"], 12.0, 0.9, ilt.title)
     if ilt.subtitle: add_subtitle(slide, 0.6, ST["subtitle"]["top_in"], 12.0, 0.6, ilt.subtitle)
 
-    placements = solve_layout(grid, ilt, row_top_in=ST["bands"]["row_top_in"], row_height_in=ST["bands"]["row_height_in"], row_gap_in=0.0)
+    placements = solve_layout(grid, ilt, row_top_in=ST["bands"]["row_top_in"], row_height_in=ST["bands"]["row_height_in"], row_gap_in=0.0,
+                              backend=ST.get("solver", {}).get("backend", "python"))
 
     # render
     # (simple grouping: if adjacent items in same rect-row share kind 'kpi' or 'icon', you can batch render. Here: per item; KPI/icon use available width)
+    overflow = []  # (rect, remaining pages) of tables continued on the next slides
     for rect, it in placements:
         if it.kind == "card":   render_card(slide, rect, it, PRE, ST)
         elif it.kind == "kpi":  render_kpis(slide, Rect(rect.left, rect.top, rect.width, ST["kpi"]["height_in"]), [it], PRE, ST)
         elif it.kind == "steps":render_steps(slide, rect, it, PRE, ST)
         elif it.kind == "icon": render_icon_row(slide, Rect(rect.left, rect.top, rect.width, ST["icons"]["height_in"]), [it], PRE, ST)
-        elif it.kind == "table":render_table(slide, rect, it, PRE)
-        elif it.kind == "image":render_image(slide, rect, it, PRE)
-        elif it.kind == "chart":render_text(slide, rect, ILTItem(kind="text", content={"text":"[Chart placeholder]"}), PRE)
+        elif it.kind == "table":
+            pages = render_table(slide, rect, it, PRE, ST, next_height_in=ST["bands"]["row_height_in"])
+            if pages: overflow.append((rect, pages))
+        elif it.kind == "image":render_image(slide, rect, it, PRE, base_dir=ilt.base_dir)
+        elif it.kind == "chart":render_chart(slide, rect, it, PRE)
         else:                   render_text(slide, rect, it, PRE)
 
-    # footer
+    _add_footer(slide, ilt, ST, slide_num)
+    slide = _finish(slide)
+    cleanup_slide(slide)
+
+    # tables that did not fit: one continuation slide per page, header row repeated
+    for rect, pages in overflow:
+        for page_rows, heights in pages:
+            slide_num += 1
+            cont = _target(prs.slides.add_slide(prs.slide_layouts[6]), ST)
+            if ilt.title: add_title(cont, 0.6, ST["title"]["top_in"], 12.0, 0.9, f"{ilt.title} (cont.)")
+            render_table_page(cont, rect.left, ST["bands"]["row_top_in"], rect.width, page_rows, heights, PRE)
+            _add_footer(cont, ilt, ST, slide_num)
+            cleanup_slide(_finish(cont))
+    return slide
+
+def _target(slide, ST: dict):
+    """What the renderers draw on: the slide, or with shapes.backend "xml" a SlideXml over it."""
+    return SlideXml(slide) if ST.get("shapes", {}).get("backend", "python") == "xml" else slide
+
+def _finish(target):
+    """Add shapes still queued by the XML backend; returns the slide."""
+    if isinstance(target, SlideXml):
+        target.flush()
+        return target.slide
+    return target
+
+def _add_footer(slide, ilt: ILT, ST: dict, slide_num: int):
     if ilt.footer_left:
         add_footer_bar(slide,
             left=0.6,
@@ -52,10 +83,57 @@ def build_deck_from_html(html_path: str, styles_path: str, presets_path: str, te
             width=ST["page"]["width_in"] - 1.2,
             height=ST["footer"]["height_in"],
             left_text=ilt.footer_left,
-            right_text=f"{ST['footer'].get('prefix','Pg ')}1",
+            right_text=f"{ST['footer'].get('prefix','Pg ')}{slide_num}",
             left_pt=ST["footer"]["left_pt"],
-            right_pt=ST["footer"]["right_pt"]
+            right_pt=ST["footer"]["right_pt"],
+            compact=is_compact(ST)
         )
 
-    cleanup_slide(slide)
+def load_configs(styles_path: str, presets_path: str):
+    """Load styles + presets once; the dicts are read-only during rendering."""
+    ST = json.load(open(styles_path, "r", encoding="utf-8"))
+    PRE = json.load(open(presets_path, "r", encoding="utf-8"))
+    return ST, PRE
+
+def build_deck_with_configs(html_path: str, ST: dict, PRE: dict, template_path: str | None = None, deck: bool = False,
+                            workers: int | None = None, stream=None):
+    """
+    Render with already-loaded configs (batch workers load them once and reuse).
+    deck=False: whole document -> one slide; deck=True: one slide per section.
+    """
+    ilts = parse_generic_bootstrap_deck(html_path) if deck else [parse_generic_bootstrap_to_ilt(html_path)]
+    return build_deck_from_ilts(ilts, ST, PRE, template_path, workers=workers, stream=stream)
+
+def build_deck_from_ilts(ilts: list[ILT], ST: dict, PRE: dict, template_path: str | None = None,
+                         workers: int | None = None, stream=None):
+    """
+    One slide per parsed ILT (plus continuation slides of long tables), numbered from 1.
+    workers > 1: slides rendered in that many processes and merged (renderer/parallel.py).
+    stream: a utils.pptx_io.PptxStreamWriter, handed each slide as soon as it is finished.
+    """
+    if workers and workers > 1 and len(ilts) > 1:
+        from .parallel import build_deck_parallel
+        return build_deck_parallel(ilts, ST, PRE, template_path, workers=workers, stream=stream)
+    prs = _new_presentation(ST, template_path)
+    grid = _grid_for(ST)
+    first = len(prs.slides)
+    if stream is not None:
+        stream.write_slides(prs)  # the template's own slides, if any
+    for ilt in ilts:
+        # continued tables add slides, so number by position in the deck
+        render_ilt_slide(prs, grid, ilt, ST, PRE, slide_num=len(prs.slides) - first + 1)
+        if stream is not None:
+            stream.write_slides(prs)
     return prs
+
+def build_deck_from_html(html_path: str, styles_path: str, presets_path: str, template_path: str | None = None):
+    ST, PRE = load_configs(styles_path, presets_path)
+    return build_deck_with_configs(html_path, ST, PRE, template_path)
+
+def build_deck_from_sections(html_path: str, styles_path: str, presets_path: str, template_path: str | None = None):
+    """
+    Deck mode: one slide per <section> / .page-break group of a single HTML file.
+    Configs, template and grid are loaded once and shared by every slide.
+    """
+    ST, PRE = load_configs(styles_path, presets_path)
+    return build_deck_with_configs(html_path, ST, PRE, template_path, deck=True)
@@ -0,0 +1,160 @@
+"""
+XML shape backend: <p:sp> elements cloned from pre-parsed templates instead of
+built through python-pptx proxies.
+
+shapes.add_shape / add_textbox plus the fill, line and text-frame setters cost
+a proxy object, an XPath over the whole slide for the next shape id and a few
+element lookups per call. Here each distinct shape style (geometry, fill,
+line, text-frame setup) and paragraph style is parsed once and cached; a shape
+is a deepcopy with its id, name, offset and extent filled in and its runs
+appended. New shapes are queued and added to the spTree in one go on flush().
+
+    out = SlideXml(slide)       # hand to the renderers in place of the slide
+    add_card(out, ...)          # renderer.elements helpers emit through it
+    out.shapes.add_picture(...) # anything else: queued shapes are flushed first
+    out.flush()
+
+The XML is the same as renderer.elements writes through python-pptx: same ids
+and names (max id + 1, "Rounded Rectangle 4", "TextBox 5"), same attribute
+order, runs split at line breaks into <a:br/>, control characters escaped as
+_xHHHH_. Each helper returns the usual shape proxy, so callers can keep
+adjusting the shape (fill_text_frame, apply_shape_appearance_from_bootstrap).
+"""
+import copy
+import re
+from functools import lru_cache
+from typing import List, Optional, Sequence
+
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import nsdecls, qn
+
+_BASENAMES = {"rect": "Rectangle", "roundRect": "Rounded Rectangle"}
+_STYLE = ('<p:style><a:lnRef idx="1"><a:schemeClr val="accent1"/></a:lnRef><a:fillRef idx="3"><a:schemeClr '
+          'val="accent1"/></a:fillRef><a:effectRef idx="2"><a:schemeClr val="accent1"/></a:effectRef><a:fontRef '
+          'idx="minor"><a:schemeClr val="lt1"/></a:fontRef></p:style>')
+_XFRM = '<a:xfrm><a:off x="0" y="0"/><a:ext cx="0" cy="0"/></a:xfrm>'
+# text frame setups of renderer.elements: add_text / add_title (wrapped, shrink on overflow), a bare add_textbox
+_BODIES = {
+    "fit": '<a:bodyPr wrap="square" anchor="t"{inset}><a:normAutofit/></a:bodyPr>',
+    "plain": '<a:bodyPr wrap="none"><a:spAutoFit/></a:bodyPr>',
+}
+_BREAK = re.compile("\n|\v")
+_CTRL = re.compile(r"[\x00-\x08\x0B-\x1F]")
+
+@lru_cache(maxsize=64)
+def _autoshape(prst: str, fill: str, line: Optional[str], adj: Optional[int], effects: bool):
+    """Template <p:sp> for a preset shape; line None = no line; adj in 1/100000."""
+    gd = f'<a:gd name="adj" fmla="val {adj}"/>' if adj is not None else ""
+    ln = f'<a:solidFill><a:srgbClr val="{line}"/></a:solidFill>' if line else "<a:noFill/>"
+    return parse_xml(
+        f'<p:sp {nsdecls("p", "a")}><p:nvSpPr><p:cNvPr id="0" name=""/><p:cNvSpPr/><p:nvPr/></p:nvSpPr>'
+        f'<p:spPr>{_XFRM}<a:prstGeom prst="{prst}"><a:avLst>{gd}</a:avLst></a:prstGeom>'
+        f'<a:solidFill><a:srgbClr val="{fill}"/></a:solidFill><a:ln>{ln}</a:ln>{"<a:effectLst/>" if effects else ""}'
+        f'</p:spPr>{_STYLE}<p:txBody><a:bodyPr rtlCol="0" anchor="ctr"/><a:lstStyle/><a:p><a:pPr algn="ctr"/></a:p>'
+        "</p:txBody></p:sp>")
+
+@lru_cache(maxsize=64)
+def _textbox(body: str, inset: Optional[tuple]):
+    """Template text box, paragraphs left out; inset = (l, r, t, b) margins in EMU."""
+    ins = "" if inset is None else ' lIns="{}" rIns="{}" tIns="{}" bIns="{}"'.format(*inset)
+    return parse_xml(
+        f'<p:sp {nsdecls("p", "a")}><p:nvSpPr><p:cNvPr id="0" name=""/><p:cNvSpPr txBox="1"/><p:nvPr/></p:nvSpPr>'
+        f'<p:spPr>{_XFRM}<a:prstGeom prst="rect"><a:avLst/></a:prstGeom><a:noFill/></p:spPr>'
+        f'<p:txBody>{_BODIES[body].format(inset=ins)}<a:lstStyle/></p:txBody></p:sp>')
+
+@lru_cache(maxsize=256)
+def _paragraph(size: Optional[int], color: Optional[str], bold: bool, space_after: Optional[int],
+               align: Optional[str]):
+    """Template <a:p> with its pPr; size in 1/100 pt, space_after in 1/100 pt."""
+    if not (size or color or bold or space_after or align):
+        return parse_xml(f"<a:p {nsdecls('a')}/>")
+    attrs = (f' sz="{size}"' if size else "") + (' b="1"' if bold else "")
+    fill = f'<a:solidFill><a:srgbClr val="{color}"/></a:solidFill>' if color else ""
+    rpr = f"<a:defRPr{attrs}>{fill}</a:defRPr>" if fill else (f"<a:defRPr{attrs}/>" if attrs else "")
+    spc = f'<a:spcAft><a:spcPts val="{space_after}"/></a:spcAft>' if space_after else ""
+    algn = f' algn="{align}"' if align else ""
+    return parse_xml(f"<a:p {nsdecls('a')}><a:pPr{algn}>{spc}{rpr}</a:pPr></a:p>")
+
+def _esc(s: str) -> str:
+    return _CTRL.sub(lambda m: "_x%04X_" % ord(m.group()), s)
+
+class SlideXml:
+    """A slide stand-in for renderer.elements: its helpers emit template shapes here (see module docstring)."""
+
+    def __init__(self, slide):
+        self.slide = slide
+        self._spTree = slide.shapes._spTree
+        self._pending: List = []
+        self._next_id: Optional[int] = None
+
+    @property
+    def shapes(self):
+        """The slide's shape tree, after adding the queued shapes (keeps z-order and ids)."""
+        self.flush()
+        self._next_id = None   # python-pptx may add shapes now
+        return self.slide.shapes
+
+    def flush(self):
+        """Add the queued shapes to the spTree."""
+        if not self._pending:
+            return
+        ext = self._spTree.find(qn("p:extLst"))
+        if ext is None:
+            self._spTree.extend(self._pending)
+        else:
+            for sp in self._pending:
+                ext.addprevious(sp)
+        self._pending = []
+
+    def _emit(self, template, basename: str, left: int, top: int, width: int, height: int):
+        if self._next_id is None:
+            self._next_id = self._spTree.max_shape_id + 1
+        sp = copy.deepcopy(template)
+        shape_id, self._next_id = self._next_id, self._next_id + 1
+        c_nv_pr = sp[0][0]
+        c_nv_pr.set("id", str(shape_id))
+        c_nv_pr.set("name", f"{basename} {shape_id - 1}")
+        off, ext = sp[1][0]
+        off.set("x", str(int(left))); off.set("y", str(int(top)))
+        ext.set("cx", str(int(width))); ext.set("cy", str(int(height)))
+        self._pending.append(sp)
+        return sp
+
+    def autoshape(self, prst: str, left: int, top: int, width: int, height: int, fill: str,
+                  line: Optional[str] = None, adj: Optional[float] = None, shadow: bool = True):
+        """
+        Preset shape ("rect", "roundRect") with a solid fill and a solid line (None = no line),
+        "RRGGBB" colors, EMU geometry; adj = adjustments[0]; shadow=False writes the empty
+        effect list of shape.shadow.inherit = False. Returns the Shape proxy.
+        """
+        template = _autoshape(prst, fill, line, None if adj is None else int(round(adj * 100000)), not shadow)
+        return self.slide.shapes._shape_factory(self._emit(template, _BASENAMES[prst], left, top, width, height))
+
+    def textbox(self, left: int, top: int, width: int, height: int, paras: Sequence, body: str = "fit",
+                inset: Optional[tuple] = None, align: Optional[str] = None):
+        """
+        Text box holding paras (renderer.elements.Para: text, size_pt, color, bold,
+        space_after_pt; color None = not set). body "fit" = wrapped, shrink on overflow,
+        "plain" = add_textbox's defaults; inset = (l, r, t, b) in EMU; align = algn of every
+        paragraph. No paras = the one empty paragraph of a cleared frame. Returns the Shape proxy.
+        """
+        sp = self._emit(_textbox(body, inset), "TextBox", left, top, width, height)
+        tx_body = sp[2]
+        for para in paras or [None]:
+            if para is None:
+                tx_body.append(copy.deepcopy(_paragraph(None, None, False, None, align)))
+                continue
+            p = copy.deepcopy(_paragraph(int(round(para.size_pt * 100)) if para.size_pt else None,
+                                         str(para.color) if para.color is not None else None, bool(para.bold),
+                                         int(round(para.space_after_pt * 100)) if para.space_after_pt else None,
+                                         align))
+            for i, part in enumerate(_BREAK.split(para.text or "")):
+                if i:
+                    p.append(p.makeelement(qn("a:br"), {}))
+                if part:
+                    r = p.makeelement(qn("a:r"), {})
+                    r.append(r.makeelement(qn("a:t"), {}))
+                    r[0].text = _esc(part)
+                    p.append(r)
+            tx_body.append(p)
+        return self.slide.shapes._shape_factory(sp)
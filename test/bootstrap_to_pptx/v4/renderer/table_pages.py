@@ -0,0 +1,85 @@
+"""
+Table pagination: rows are measured (wrapped cell text, utils.text_metrics) and
+cut into pages that fit the available height; every page starts with the header.
+
+Pages are produced lazily. Body rows are pulled from the row iterator one chunk
+at a time (one batch width measurement per chunk), and a page only holds its
+own rows and heights, so a table with tens of thousands of rows is never built
+as one python-pptx table. The caller renders the first page into the layout
+rect and each following page on a continuation slide.
+"""
+from itertools import islice
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from utils.text_metrics import get_font, text_widths_pt, wrap_lines
+
+EMU_PER_PT = 12700
+CELL_MARGIN_W_PT = 7.2   # 0.1in left/right (PowerPoint default cell margins)
+CELL_MARGIN_H_PT = 3.6   # 0.05in top/bottom
+CHUNK = 256              # body rows measured per batch
+
+Page = Tuple[List[Sequence[str]], List[int]]  # (header + body rows, row heights in EMU)
+
+def row_heights_pt(rows: Sequence[Sequence[str]], inner_w_pt: Sequence[float], size_pt: float,
+                   backend: str = "python") -> List[float]:
+    """Height of each row: its tallest cell (wrapped lines * line pitch) + cell margins."""
+    font = get_font()
+    n_cols = len(inner_w_pt)
+    texts = [(row[c] if c < len(row) else "") or "" for row in rows for c in range(n_cols)]
+    pitch = size_pt * font.line_height
+    heights = []
+    for r, widths in enumerate(_chunks(text_widths_pt(texts, font, size_pt, backend=backend), n_cols)):
+        lines = 1
+        for c, w in enumerate(widths):
+            if w > inner_w_pt[c]:
+                text = texts[r * n_cols + c]
+                lines = max(lines, len(wrap_lines(text, inner_w_pt[c], font, size_pt)))
+        heights.append(lines * pitch + 2 * CELL_MARGIN_H_PT)
+    return heights
+
+def _chunks(seq: Sequence, n: int) -> Iterator[Sequence]:
+    for i in range(0, len(seq), n):
+        yield seq[i:i + n]
+
+def paginate(rows: Iterable[Sequence[str]], col_widths: Sequence[int], first_h: int, next_h: Optional[int],
+             header_pt: float, cell_pt: float, backend: str = "python") -> Iterator[Page]:
+    """
+    Pages of a table (first row = header) whose measured rows fit first_h (EMU) on
+    the first page and next_h on the following ones; next_h=None keeps everything
+    on one page. A row taller than a whole page gets a page of its own.
+    """
+    rows = iter(rows)
+    header = next(rows, None)
+    if header is None:
+        return
+    inner = [max(1.0, w / EMU_PER_PT - 2 * CELL_MARGIN_W_PT) for w in col_widths]
+    header_h = round(row_heights_pt([header], inner, header_pt, backend)[0] * EMU_PER_PT)
+
+    avail = first_h
+    page, heights, used = [header], [header_h], header_h
+    while True:
+        chunk = list(islice(rows, CHUNK))
+        if not chunk:
+            break
+        for row, h_pt in zip(chunk, row_heights_pt(chunk, inner, cell_pt, backend)):
+            h = round(h_pt * EMU_PER_PT)
+            if next_h is not None and used + h > avail and len(page) > 1:
+                yield page, heights
+                avail = next_h
+                page, heights, used = [header], [header_h], header_h
+            page.append(row)
+            heights.append(h)
+            used += h
+    yield page, heights
+
+def fill_height(heights: List[int], height: int) -> List[int]:
+    """
+    Rows of a table that fits: python-pptx's even split when every row fits its
+    share (the table fills the rect as before), else measured heights + equal slack.
+    """
+    n = len(heights)
+    share = height // n
+    if share >= max(heights):
+        return [share] * (n - 1) + [height - (n - 1) * share]
+    slack = max(0, height - sum(heights)) // n
+    return [h + slack for h in heights]
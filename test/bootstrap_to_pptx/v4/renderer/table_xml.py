@@ -0,0 +1,86 @@
+"""
+Bulk table builder: the whole <a:tbl> for a list of rows as one XML string.
+
+Setting cell.text / cell.fill through python-pptx costs a proxy object and a few
+XPath lookups per cell. Here the preset styles are formatted once into one
+header-cell and one body-cell template, every row is a join of filled-in
+templates, and the result is parsed once and swapped into a graphic frame made
+by add_table. The XML is the same as the per-cell path produces: same grid and
+row heights (python-pptx's even split, last column/row absorbing the rounding),
+same run / defRPr / fill elements.
+
+Cells with line breaks, control characters or non-string content, and rows
+longer than the header, are left to the caller's per-cell path (bulk_ok).
+"""
+import re
+from typing import List, Optional, Sequence
+from xml.sax.saxutils import escape
+
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import nsdecls
+
+DEFAULT_STYLE_ID = "{5C22544A-7EE6-4342-B048-85BDC9FD1C3A}"  # python-pptx's default table style
+
+# anything python-pptx would turn into extra paragraphs, <a:br/> or _xHHHH_ escapes (tab is kept as is)
+_EXOTIC = re.compile(r"[\x00-\x08\x0a-\x1f]")
+
+def bulk_ok(rows: Sequence[Sequence]) -> bool:
+    """True when every cell can go through the templates unchanged."""
+    if not rows:
+        return False
+    n_cols = len(rows[0])
+    for row in rows:
+        if len(row) > n_cols or any(c is not None and not isinstance(c, str) for c in row):
+            return False
+    return not _EXOTIC.search("".join(c for row in rows for c in row if c))
+
+def even_split(total: int, n: int) -> List[int]:
+    """python-pptx's split of a width/height over n columns/rows."""
+    part = total // n
+    return [part] * (n - 1) + [total - (n - 1) * part]
+
+_UNTOUCHED = "<a:tc><a:txBody><a:bodyPr/><a:lstStyle/><a:p/></a:txBody><a:tcPr/></a:tc>"
+
+def _cell_template(size_pt: Optional[float], fill_hex: Optional[str]) -> tuple:
+    """(template for a cell with text, XML of an empty cell)."""
+    ppr = f'<a:pPr><a:defRPr sz="{int(round(size_pt * 100))}"/></a:pPr>' if size_pt else ""
+    tcpr = (f'<a:tcPr><a:solidFill><a:srgbClr val="{fill_hex.lstrip("#").upper()}"/></a:solidFill></a:tcPr>'
+            if fill_hex else "<a:tcPr/>")
+    body = "<a:tc><a:txBody><a:bodyPr/><a:lstStyle/>{p}</a:txBody>" + tcpr + "</a:tc>"
+    empty = body.format(p=f"<a:p>{ppr}</a:p>" if ppr else "<a:p/>")
+    return body.format(p=f"<a:p>{ppr}<a:r><a:t>{{}}</a:t></a:r></a:p>"), empty
+
+def table_xml(rows: Sequence[Sequence[Optional[str]]], col_widths: Sequence[int], row_heights: Sequence[int],
+              header_fill: Optional[str] = None, header_pt: Optional[float] = None,
+              cell_pt: Optional[float] = None, style_id: str = DEFAULT_STYLE_ID) -> str:
+    """<a:tbl> for rows (first row = header); widths/heights in EMU, one per column/row."""
+    n_cols = len(col_widths)
+    head = _cell_template(header_pt, header_fill)
+    body = _cell_template(cell_pt, None)
+    parts = [f'<a:tbl {nsdecls("a")}><a:tblPr firstRow="1" bandRow="1"><a:tableStyleId>{style_id}'
+             "</a:tableStyleId></a:tblPr><a:tblGrid>"]
+    parts.extend(f'<a:gridCol w="{w}"/>' for w in col_widths)
+    parts.append("</a:tblGrid>")
+    for r, (row, h) in enumerate(zip(rows, row_heights)):
+        full, empty = head if r == 0 else body
+        cells = [full.format(escape(t)) if t else empty for t in row]
+        cells.extend([_UNTOUCHED] * (n_cols - len(cells)))  # short row: cells nobody wrote to
+        parts.append(f'<a:tr h="{h}">{"".join(cells)}</a:tr>')
+    parts.append("</a:tbl>")
+    return "".join(parts)
+
+def add_table_bulk(shapes, rows: Sequence[Sequence[Optional[str]]], left: int, top: int, width: int, height: int,
+                   col_widths: Optional[Sequence[int]] = None, header_fill: Optional[str] = None,
+                   header_pt: Optional[float] = None, cell_pt: Optional[float] = None,
+                   row_heights: Optional[Sequence[int]] = None):
+    """
+    Table graphic frame at (left, top, width, height) holding rows, built in one
+    pass. col_widths / row_heights default to an even split. Returns the GraphicFrame.
+    """
+    n_cols = len(rows[0])
+    frame = shapes.add_table(1, 1, left, top, width, height)  # only the frame is kept; its <a:tbl> is replaced
+    tbl = frame.table._tbl
+    new = parse_xml(table_xml(rows, list(col_widths or even_split(width, n_cols)),
+                              list(row_heights or even_split(height, len(rows))), header_fill, header_pt, cell_pt))
+    tbl.getparent().replace(tbl, new)
+    return frame
@@ -0,0 +1,274 @@
+"""
+Local render server: keeps python-pptx / bs4 / lxml, the default template and
+the JSON configs warm in a pool of worker processes.
+
+    python main.py serve --port 8765 --workers 4 --max-queue 16
+    python main.py serve --socket /tmp/pptx.sock
+
+POST /render   JSON body:
+    {"html": "<html>...</html>"            (or "html_path": "report.html"),
+     "styles": "config/styles.json",       (optional, paths resolved like main.py)
+     "presets": "config/element_presets.json",
+     "template": null, "deck": false,
+     "compresslevel": null}                (0-9, 0 = store only; null = zlib default)
+    -> 200 application/vnd.openxmlformats-officedocument.presentationml.presentation
+       400 bad request, 500 render error, 503 queue full, 504 timeout
+GET /health    -> JSON counters (in flight, served, rejected, ...)
+
+At most workers + max_queue requests are admitted at once; the rest get 503
+right away instead of piling up. A request that times out keeps its slot until
+its worker is done with it (or it is dropped from the queue), so timed-out
+renders cannot pile up behind the limit either. Each worker imports everything and opens the
+default template once in its initializer, and loads a config file once per
+(path, mtime).
+"""
+import argparse
+import http.client
+import json
+import logging
+import os
+import signal
+import socket
+import socketserver
+import threading
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeout
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+log = logging.getLogger("v4.server")
+
+PPTX_MIME = "application/vnd.openxmlformats-officedocument.presentationml.presentation"
+CHUNK = 1 << 16
+
+# ---------- worker process ----------
+
+# per-process state, filled by _init_worker
+_WORKER = {}
+
+def _init_worker():
+    from utils.template_cache import open_template
+    from renderer.pipeline import build_deck_from_ilts                      # noqa: F401  (warm imports)
+    from parsers.generic_bootstrap_to_ilt import parse_generic_bootstrap_text
+    open_template()  # parses the default template once; renders get copies
+    parse_generic_bootstrap_text("<div class='row'><div class='col-12'><p>warm</p></div></div>")
+    _WORKER.update(configs={})
+
+def _configs(styles_path: str, presets_path: str):
+    from renderer.pipeline import load_configs
+    key = (styles_path, os.stat(styles_path).st_mtime_ns, presets_path, os.stat(presets_path).st_mtime_ns)
+    hit = _WORKER["configs"].get(key)
+    if hit is None:
+        hit = _WORKER["configs"][key] = load_configs(styles_path, presets_path)
+    return hit
+
+def _render(req: dict) -> tuple[bytes, int]:
+    from renderer.pipeline import build_deck_from_ilts
+    from parsers.generic_bootstrap_to_ilt import parse_generic_bootstrap_text
+    ST, PRE = _configs(req["styles"], req["presets"])
+    ilts = parse_generic_bootstrap_text(req["html"], deck=req["deck"], base_dir=req["base_dir"])
+    from utils.pptx_io import to_buffer
+    prs = build_deck_from_ilts(ilts, ST, PRE, req["template"])
+    return to_buffer(prs, req["compresslevel"]).getvalue(), len(prs.slides)
+
+# ---------- server process ----------
+
+class BadRequest(ValueError):
+    pass
+
+class RenderService:
+    """Bounded process pool + admission control shared by all handler threads."""
+    def __init__(self, resolve, workers: int | None = None, max_queue: int = 16, timeout: float = 120.0):
+        self.resolve = resolve
+        self.workers = workers or os.cpu_count()
+        self.timeout = timeout
+        self.pool = ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker)
+        self.slots = threading.BoundedSemaphore(self.workers + max_queue)
+        self.lock = threading.Lock()
+        self.stats = {"workers": self.workers, "max_queue": max_queue, "in_flight": 0,
+                      "served": 0, "failed": 0, "rejected": 0, "timeouts": 0}
+        # start the workers now so the first request does not pay for the imports
+        for f in [self.pool.submit(os.getpid) for _ in range(self.workers)]:
+            f.result()
+
+    def _count(self, key: str, delta: int = 1):
+        with self.lock:
+            self.stats[key] += delta
+
+    def request(self, body) -> dict:
+        """Validated render request from a decoded JSON body; raises BadRequest (400) if it is not one."""
+        if not isinstance(body, dict):
+            raise BadRequest("body must be a JSON object")
+        for key in ("html", "html_path", "styles", "presets", "template"):
+            if body.get(key) is not None and not isinstance(body[key], str):
+                raise BadRequest(f"'{key}' must be a string")
+        base_dir = None
+        if body.get("html") is not None:
+            html = body["html"]
+        elif body.get("html_path"):
+            html_path = self.resolve(body["html_path"])
+            with open(html_path, "r", encoding="utf-8") as f:
+                html = f.read()
+            base_dir = os.path.dirname(html_path)
+        else:
+            raise BadRequest("need 'html' or 'html_path'")
+        level = body.get("compresslevel")
+        if level is not None and (isinstance(level, bool) or not isinstance(level, int) or not 0 <= level <= 9):
+            raise BadRequest("compresslevel must be 0-9 or null")
+        try:
+            return {
+                "html": html,
+                "base_dir": base_dir,
+                "styles": self.resolve(body.get("styles") or "config/styles.json"),
+                "presets": self.resolve(body.get("presets") or "config/element_presets.json"),
+                "template": self.resolve(body["template"]) if body.get("template") else None,
+                "deck": bool(body.get("deck", False)),
+                "compresslevel": level,
+            }
+        except FileNotFoundError as e:
+            raise BadRequest(f"not found: {e}")
+
+    def _release(self, future=None):
+        """Frees the request's slot; a done callback, so a timed-out render holds it until it ends."""
+        self._count("in_flight", -1)
+        self.slots.release()
+
+    def _failed(self, e: Exception):
+        self._count("failed")
+        log.error("render failed: %s", traceback.format_exc())
+        return HTTPStatus.INTERNAL_SERVER_ERROR, f"{type(e).__name__}: {e}", 0
+
+    def render(self, req: dict):
+        """(status, bytes or error text, slide count)."""
+        if not self.slots.acquire(blocking=False):
+            self._count("rejected")
+            return HTTPStatus.SERVICE_UNAVAILABLE, "render queue full", 0
+        self._count("in_flight")
+        try:
+            future = self.pool.submit(_render, req)
+        except Exception as e:  # pool broken or shut down
+            self._release()
+            return self._failed(e)
+        future.add_done_callback(self._release)
+        try:
+            data, slides = future.result(timeout=self.timeout)
+            self._count("served")
+            return HTTPStatus.OK, data, slides
+        except FutureTimeout:
+            future.cancel()  # still queued: dropped now; running: its slot frees when it ends
+            self._count("timeouts")
+            return HTTPStatus.GATEWAY_TIMEOUT, "render timed out", 0
+        except Exception as e:
+            return self._failed(e)
+
+    def close(self):
+        self.pool.shutdown(cancel_futures=True)
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive for load tests / clients that reuse connections
+
+    def setup(self):
+        super().setup()
+        if self.connection.family != socket.AF_UNIX:
+            # headers and body go out in separate writes; don't let Nagle + delayed ACK stall them
+            self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    def address_string(self):
+        return self.client_address[0] if self.client_address else "unix"
+
+    def log_message(self, fmt, *args):
+        log.debug("%s %s", self.address_string(), fmt % args)
+
+    def _send(self, status, body: bytes, ctype: str, extra: dict | None = None):
+        self.send_response(status)
+        self.send_header("Content-Type", ctype)
+        self.send_header("Content-Length", str(len(body)))
+        for k, v in (extra or {}).items():
+            self.send_header(k, v)
+        self.end_headers()
+        view = memoryview(body)
+        for i in range(0, len(view), CHUNK):
+            self.wfile.write(view[i:i + CHUNK])
+
+    def _error(self, status, message: str):
+        self._send(status, json.dumps({"error": message}).encode(), "application/json")
+
+    def do_GET(self):
+        if self.path != "/health":
+            return self._error(HTTPStatus.NOT_FOUND, "unknown path")
+        service = self.server.service
+        with service.lock:
+            stats = dict(service.stats)
+        self._send(HTTPStatus.OK, json.dumps(stats).encode(), "application/json")
+
+    def do_POST(self):
+        if self.path != "/render":
+            return self._error(HTTPStatus.NOT_FOUND, "unknown path")
+        service = self.server.service
+        t0 = time.perf_counter()
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            req = service.request(json.loads(self.rfile.read(length) or b"{}"))
+        except (ValueError, OSError) as e:
+            return self._error(HTTPStatus.BAD_REQUEST, str(e))
+        status, payload, slides = service.render(req)
+        if status != HTTPStatus.OK:
+            return self._error(status, payload)
+        self._send(status, payload, PPTX_MIME,
+                   {"X-Slides": str(slides), "X-Render-Ms": f"{(time.perf_counter() - t0) * 1e3:.1f}"})
+
+class _UnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+def make_server(service: RenderService, host: str = "127.0.0.1", port: int = 8765, socket_path: str | None = None):
+    if socket_path:
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+        server = _UnixHTTPServer(socket_path, Handler)
+    else:
+        server = ThreadingHTTPServer((host, port), Handler)
+        server.daemon_threads = True
+    server.service = service
+    return server
+
+def serve_main(argv: list[str], resolve) -> int:
+    """`resolve` maps a config path to an absolute one (main._resolve)."""
+    ap = argparse.ArgumentParser(prog="main.py serve", description="Local PPTX render server (v4)")
+    ap.add_argument("--host", default="127.0.0.1")
+    ap.add_argument("--port", type=int, default=8765)
+    ap.add_argument("--socket", default=None, help="Listen on a Unix socket instead of TCP")
+    ap.add_argument("--workers", type=int, default=None, help="Render processes (default: CPU count)")
+    ap.add_argument("--max-queue", type=int, default=16, help="Requests waiting beyond the busy workers before 503")
+    ap.add_argument("--timeout", type=float, default=120.0, help="Seconds per render before 504")
+    args = ap.parse_args(argv)
+
+    def _stop(signum, frame):
+        raise KeyboardInterrupt  # SIGTERM: same clean shutdown as Ctrl+C, workers included
+    signal.signal(signal.SIGTERM, _stop)
+
+    service = RenderService(resolve, args.workers, args.max_queue, args.timeout)
+    server = make_server(service, args.host, args.port, args.socket)
+    where = args.socket or f"http://{args.host}:{args.port}"
+    log.info("Serving on %s with %d worker(s), queue %d", where, service.workers, args.max_queue)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.close()
+        if args.socket and os.path.exists(args.socket):
+            os.unlink(args.socket)
+    return 0
+
+class UnixHTTPConnection(http.client.HTTPConnection):
+    """http.client connection over a Unix socket (for clients of --socket)."""
+    def __init__(self, socket_path: str, timeout: float = 120.0):
+        super().__init__("localhost", timeout=timeout)
+        self.socket_path = socket_path
+
+    def connect(self):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.settimeout(self.timeout)
+        self.sock.connect(self.socket_path)
@@ -0,0 +1,98 @@
+import io
+import re
+import zipfile
+
+import pytest
+from lxml import etree
+from pptx import Presentation
+from pptx.chart.data import CategoryChartData, XyChartData
+from pptx.enum.chart import XL_CHART_TYPE
+from pptx.oxml import parse_xml
+from pptx.util import Inches
+from renderer import charts
+from renderer.chart_xml import category_chart_data, xy_chart_data
+
+LABELS = ["<a & b>", 'say "hi"', "it's", "d"]
+SERIES = [("S1 & co", [1.5, None, 3, 4]), ("S2", [None, 2, None, 5])]
+XY = [("A", [1, 2, 3, 4], [1.0, None, 9, 16]), ("B <x>", [0.5, 1.5], [2, 3])]
+
+
+def _canon(xml: bytes) -> bytes:
+    return etree.tostring(parse_xml(xml))
+
+
+def _category_reference(number_format="General"):
+    data = CategoryChartData(number_format)
+    data.categories = LABELS
+    for name, values in SERIES:
+        data.add_series(name, values)
+    return data
+
+
+def _xy_reference(number_format="General"):
+    data = XyChartData(number_format)
+    for name, xs, ys in XY:
+        s = data.add_series(name)
+        for x, y in zip(xs, ys):
+            s.add_data_point(x, y)
+    return data
+
+
+def _cells(xlsx: bytes) -> dict:
+    """cell ref -> text of the first sheet, shared strings resolved."""
+    ns = {"m": "http://schemas.openxmlformats.org/spreadsheetml/2006/main"}
+    with zipfile.ZipFile(io.BytesIO(xlsx)) as z:
+        shared = []
+        if "xl/sharedStrings.xml" in z.namelist():
+            shared = ["".join(si.itertext()) for si in etree.fromstring(z.read("xl/sharedStrings.xml"))]
+        sheet = etree.fromstring(z.read("xl/worksheets/sheet1.xml"))
+    cells = {}
+    for c in sheet.iterfind(".//m:c", ns):
+        v = c.find("m:v", ns)
+        if c.get("t") == "s":
+            cells[c.get("r")] = shared[int(v.text)]
+        elif c.get("t") == "inlineStr":
+            cells[c.get("r")] = "".join(c.find("m:is", ns).itertext())
+        elif v is not None:
+            cells[c.get("r")] = str(float(v.text))
+    return cells
+
+
+@pytest.mark.parametrize("chart_type", [XL_CHART_TYPE.LINE, XL_CHART_TYPE.LINE_MARKERS, XL_CHART_TYPE.COLUMN_CLUSTERED,
+                                        XL_CHART_TYPE.BAR_STACKED, XL_CHART_TYPE.AREA])
+def test_category_xml_matches_add_chart(chart_type):
+    bulk = category_chart_data(chart_type, LABELS, SERIES)
+    assert _canon(bulk.xml_bytes(chart_type)) == _canon(_category_reference().xml_bytes(chart_type))
+
+
+@pytest.mark.parametrize("chart_type", [XL_CHART_TYPE.XY_SCATTER, XL_CHART_TYPE.XY_SCATTER_LINES])
+def test_scatter_with_gaps_matches_add_chart(chart_type):
+    bulk = xy_chart_data(chart_type, XY)
+    assert _canon(bulk.xml_bytes(chart_type)) == _canon(_xy_reference().xml_bytes(chart_type))
+
+
+def test_labels_are_escaped_once():
+    xml = category_chart_data(XL_CHART_TYPE.LINE, LABELS, SERIES).xml_bytes(XL_CHART_TYPE.LINE)
+    assert b"<c:v>&lt;a &amp; b&gt;</c:v>" in xml
+    cats = parse_xml(xml).find(".//{*}cat")
+    assert [v.text for v in cats.iter("{*}v")] == LABELS
+
+
+def test_workbook_holds_the_same_table():
+    bulk = category_chart_data(XL_CHART_TYPE.LINE, LABELS, SERIES, "0.0")
+    assert _cells(bulk.xlsx_blob) == _cells(_category_reference("0.0").xlsx_blob)
+    bulk = xy_chart_data(XL_CHART_TYPE.XY_SCATTER, XY)
+    assert _cells(bulk.xlsx_blob) == _cells(_xy_reference().xlsx_blob)
+
+
+def test_spec_renders_the_same_through_either_builder(monkeypatch):
+    spec = charts.parse_chart_spec({"type": "line", "labels": LABELS,
+                                    "series": [{"name": n, "values": v} for n, v in SERIES]})
+    prs = Presentation()
+    xml = []
+    for threshold in (10 ** 9, 0):  # per point, then bulk
+        monkeypatch.setattr(charts, "BULK_POINTS", threshold)
+        slide = prs.slides.add_slide(prs.slide_layouts[6])
+        frame = charts.add_chart_from_spec(slide.shapes, spec, 0, 0, Inches(6), Inches(4))
+        xml.append(re.sub(rb'r:id="rId\d+"', b"", etree.tostring(frame.chart._chartSpace)))
+    assert xml[0] == xml[1]
@@ -0,0 +1,54 @@
+import pytest
+from pptx import Presentation
+from pptx.util import Inches
+from parsers.generic_bootstrap_to_ilt import ILTItem
+from renderer.charts import add_chart_from_spec, parse_chart_spec
+from renderer.element_registry import render_chart
+from renderer.layout_solver import Rect
+
+
+def _fills(spec):
+    prs = Presentation()
+    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    chart = add_chart_from_spec(slide.shapes, spec, 0, 0, Inches(6), Inches(4)).chart
+    return {s.name: str(s.format.fill.fore_color.rgb) for s in chart.series}
+
+
+def test_colors_stay_with_their_series_when_an_empty_one_is_dropped():
+    spec = parse_chart_spec({"type": "bar", "labels": ["a", "b"],
+                             "series": [{"name": "empty", "values": [], "color": "#FF0000"},
+                                        {"name": "real", "values": [1, 2], "color": "#0000FF"}]})
+    assert [s[0] for s in spec.series] == ["real"]
+    assert spec.colors == ["0000FF"]
+    assert _fills(spec) == {"real": "0000FF"}
+
+
+def test_scatter_series_without_points_drop_their_color():
+    spec = parse_chart_spec({"type": "scatter", "series": [{"name": "none", "values": [[None, 1]], "color": "red"},
+                                                          {"name": "xy", "values": [[1, 2]], "color": "#00FF00"}]})
+    assert [s[0] for s in spec.series] == ["xy"] and spec.colors == ["00FF00"]
+
+
+@pytest.mark.parametrize("extra", [
+    {"options": None},
+    {"options": {"plugins": None, "scales": None}},
+    {"options": {"plugins": {"legend": None}, "scales": {"y": None}}},
+    {"options": {"scales": {"y": 3, "x": [1]}}},
+    {"options": [1, 2]},
+    {"labels": None},
+    {"labels": 5},
+])
+def test_null_or_odd_options_are_ignored(extra):
+    spec = parse_chart_spec({"type": "line", "labels": ["a", "b"], "series": [{"values": [1, 2]}], **extra})
+    assert spec.series == [("Series 1", [1, 2])]
+    assert spec.y_min is None and spec.y_max is None
+
+
+@pytest.mark.parametrize("bad", ['{"series": 5}', '{"series": [{"values": 3}]}',
+                                 '{"type": "scatter", "series": [{"x": 1, "y": 2}, {"values": [[1]]}]}'])
+def test_unusable_series_leave_a_placeholder(bad):
+    prs = Presentation()
+    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    presets = {"text": {"pt": 12}}
+    assert render_chart(slide, Rect(0, 0, 4, 3), ILTItem(kind="chart", content={"spec": bad}), presets) is None
+    assert [sh.text_frame.text for sh in slide.shapes] == ["[Chart placeholder]"]
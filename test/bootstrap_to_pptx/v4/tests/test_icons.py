@@ -0,0 +1,80 @@
+import base64
+import io
+from pathlib import Path
+
+import pytest
+from PIL import Image
+from pptx import Presentation
+from pptx.util import Inches
+from utils import icons
+
+
+@pytest.fixture(autouse=True)
+def _fresh_memo():
+    icons._paths.clear()
+    yield
+    icons._paths.clear()
+
+
+@pytest.mark.parametrize("name,parsed", [
+    ("bi-cpu", ("bi", "cpu")),
+    ("fa-house", ("fa", "house")),
+    ("bi-arrow-up-right", ("bi", "arrow-up-right")),
+    ("fa-solid", None), ("fa-2x", None), ("fa-fw", None),   # Font Awesome modifiers
+    ("bi-", None), ("bi", None), ("col-6", None), ("", None), (None, None),
+])
+def test_split_name(name, parsed):
+    assert icons.split_name(name) == parsed
+
+
+def test_an_icon_without_a_source_draws_nothing_unless_badge_is_on(tmp_path):
+    assert icons.icon_png("bi-cpu", 32, icon_dir=str(tmp_path)) is None
+    uri = icons.icon_png("bi-cpu", 32, "#ff0000", icon_dir=str(tmp_path), badge=True)
+    assert uri.startswith("data:image/png;base64,")
+    img = Image.open(io.BytesIO(base64.b64decode(uri.split(",", 1)[1])))
+    assert img.size == (32, 32) and img.getpixel((4, 16))[:3] == (255, 0, 0)
+    assert icons.icon_png("not-an-icon", 32, badge=True) is None
+
+
+def test_nothing_is_written_without_cache_dir(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    icons.icon_png("bi-cpu", 32, icon_dir=str(tmp_path / "none"), badge=True)
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_cache_dir_is_reused_across_processes(tmp_path):
+    cache = tmp_path / "cache"
+    path = icons.icon_png("bi-cpu", 32, icon_dir=str(tmp_path), cache_dir=str(cache), badge=True)
+    assert Path(path).is_file() and Path(path).parent.parent == cache
+    icons._paths.clear()   # as in a new process
+    before = dict(icons.stats)
+    assert icons.icon_png("bi-cpu", 32, icon_dir=str(tmp_path), cache_dir=str(cache), badge=True) == path
+    assert icons.stats["disk"] == before["disk"] + 1 and icons.stats["rendered"] == before["rendered"]
+
+
+def test_a_pruned_cache_file_is_drawn_again(tmp_path):
+    cache = str(tmp_path / "cache")
+    path = icons.icon_png("bi-cpu", 32, icon_dir=str(tmp_path), cache_dir=cache, badge=True)
+    Path(path).unlink()
+    assert icons.icon_png("bi-cpu", 32, icon_dir=str(tmp_path), cache_dir=cache, badge=True) == path
+    assert Path(path).is_file()
+    prs = Presentation()
+    shapes = prs.slides.add_slide(prs.slide_layouts[6]).shapes
+    Path(path).unlink()
+    styles = {"icons": {"dir": str(tmp_path), "cache_dir": cache, "badge": True}}
+    assert icons.add_icon(shapes, "bi-cpu", 0, 0, Inches(0.5), styles) is not None
+
+
+def test_a_missing_source_is_looked_up_again(tmp_path, monkeypatch):
+    assert icons.icon_png("bi-cpu", 32, icon_dir=str(tmp_path)) is None
+    (tmp_path / "bi").mkdir()
+    (tmp_path / "bi" / "cpu.svg").write_text("<svg/>", encoding="utf-8")
+    monkeypatch.setattr(icons, "_render_svg", lambda path, px, color: icons._render_badge("svg", px, color))
+    assert icons.icon_png("bi-cpu", 32, icon_dir=str(tmp_path)).startswith("data:image/png")
+
+
+def test_the_memo_is_bounded(tmp_path, monkeypatch):
+    monkeypatch.setattr(icons, "ICON_ENTRIES", 3)
+    for px in range(10, 20):
+        icons.icon_png("bi-cpu", px, icon_dir=str(tmp_path), badge=True)
+    assert [key[1] for key in icons._paths] == [17, 18, 19]
@@ -0,0 +1,32 @@
+from PIL import Image
+from pptx import Presentation
+from pptx.util import Inches
+from utils import images
+
+
+def test_a_missing_image_is_found_once_it_appears(tmp_path):
+    images.cache_clear()
+    assert images.resolve("late.png", str(tmp_path)) is None
+    Image.new("RGB", (10, 10)).save(tmp_path / "late.png")
+    assert images.resolve("late.png", str(tmp_path)) == str(tmp_path / "late.png")
+
+
+def test_a_removed_image_is_forgotten(tmp_path):
+    images.cache_clear()
+    Image.new("RGB", (10, 10)).save(tmp_path / "logo.png")
+    prs = Presentation()
+    shapes = prs.slides.add_slide(prs.slide_layouts[6]).shapes
+    assert images.add_picture(shapes, "logo.png", 0, 0, Inches(1), base_dir=str(tmp_path)) is not None
+    (tmp_path / "logo.png").unlink()
+    assert images.add_picture(shapes, "logo.png", 0, 0, Inches(1), base_dir=str(tmp_path)) is None
+    assert images.resolve("logo.png", str(tmp_path)) is None
+
+
+def test_digests_are_bounded(tmp_path, monkeypatch):
+    images.cache_clear()
+    monkeypatch.setattr(images, "DIGEST_ENTRIES", 3)
+    for i in range(5):
+        path = tmp_path / f"{i}.png"
+        Image.new("RGB", (10, 10), (i, 0, 0)).save(path)
+        images.prepare(str(path))
+    assert len(images._digests) == 3
@@ -0,0 +1,55 @@
+import json
+import logging
+from pathlib import Path
+
+from lxml import etree
+from PIL import Image
+from pptx.parts.image import ImagePart
+from parsers.generic_bootstrap_to_ilt import ILT, ILTItem, ILTRow
+from renderer.parallel import build_deck_parallel
+from renderer.pipeline import build_deck_from_ilts, load_configs
+
+V4 = Path(__file__).resolve().parents[1]
+SPEC = {"type": "column", "labels": ["a", "b", "c"], "series": [{"name": "s", "values": [1, 2, 3]}]}
+
+
+def _ilts(tmp_path):
+    logo = tmp_path / "logo.png"
+    Image.new("RGB", (40, 30), (200, 30, 30)).save(logo)
+    rows = [["Name", "Value", "Note"]] + [[f"r{i}", str(i), "x" * (i % 40)] for i in range(120)]
+    table = ILT(title="Table", rows=[ILTRow([ILTItem(kind="table", content={"rows": rows})])], footer_left="F")
+    image = ILT(title="Image", rows=[ILTRow([ILTItem(kind="image", col_span=6, content={"src": str(logo)})])],
+                footer_left="F")
+    chart = ILT(title="Chart", rows=[ILTRow([ILTItem(kind="chart", col_span=6, content={"spec": json.dumps(SPEC)}),
+                                             ILTItem(kind="chart", col_span=6,
+                                                     content={"spec": json.dumps({**SPEC, "type": "line"})})])],
+                footer_left="F")
+    # the table spills onto continuation slides, so every later chunk starts at another page number
+    return [table, image, chart, image, chart, image]
+
+
+def _rels(prs):
+    return [sorted((rId, rel.reltype, rel.target_ref if rel.is_external else str(rel.target_part.partname))
+                   for rId, rel in slide.part.rels.items()) for slide in prs.slides]
+
+
+def _media(prs):
+    return [p for p in prs.part.package.iter_parts() if isinstance(p, ImagePart)]
+
+
+def test_merged_deck_equals_the_serial_one(tmp_path, caplog):
+    ST, PRE = load_configs(str(V4 / "config/styles.json"), str(V4 / "config/element_presets.json"))
+    ilts = _ilts(tmp_path)
+    serial = build_deck_from_ilts(ilts, ST, PRE)
+    with caplog.at_level(logging.DEBUG, logger="renderer.parallel"):
+        merged = build_deck_parallel(ilts, ST, PRE, workers=2, chunk_size=2)
+
+    assert len(serial.slides) > len(ilts)
+    assert "re-rendering 2 of 3 chunks" in caplog.text
+    assert [etree.tostring(s._element) for s in merged.slides] == [etree.tostring(s._element) for s in serial.slides]
+    assert _rels(merged) == _rels(serial)
+    # one part for the picture on three slides, next to the template's own
+    assert len(_media(merged)) == len(_media(serial)) == len(_media(build_deck_from_ilts([], ST, PRE))) + 1
+    footers = [sh.text_frame.text for s in merged.slides for sh in s.shapes
+               if sh.has_text_frame and sh.text_frame.text.startswith("Pg ")]
+    assert footers == [f"Pg {n}" for n in range(1, len(serial.slides) + 1)]
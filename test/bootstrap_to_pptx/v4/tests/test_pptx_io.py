@@ -0,0 +1,75 @@
+import io
+import zipfile
+from pathlib import Path
+
+from lxml import etree
+from pptx import Presentation
+from parsers.generic_bootstrap_to_ilt import parse_generic_bootstrap_to_ilt
+from renderer.pipeline import build_deck_from_ilts, load_configs
+from utils.pptx_io import PptxStreamWriter, to_buffer
+
+V4 = Path(__file__).resolve().parents[1]
+
+
+class _Sink(io.RawIOBase):
+    """A write-only stream that cannot seek or tell (socket, pipe, HTTP response)."""
+
+    def __init__(self):
+        self.data = bytearray()
+
+    def writable(self):
+        return True
+
+    def write(self, b):
+        self.data += b
+        return len(b)
+
+
+def _configs():
+    return load_configs(str(V4 / "config/styles.json"), str(V4 / "config/element_presets.json"))
+
+
+def _ilts(n=3):
+    return [parse_generic_bootstrap_to_ilt(str(V4 / "test.html"))] * n
+
+
+def _members(data) -> dict:
+    with zipfile.ZipFile(io.BytesIO(data)) as zf:
+        return {name: zf.read(name) for name in zf.namelist()}
+
+
+def _slide_xml(data):
+    return [etree.tostring(s._element) for s in Presentation(io.BytesIO(data)).slides]
+
+
+def test_to_buffer_holds_what_save_writes():
+    ST, PRE = _configs()
+    prs = build_deck_from_ilts(_ilts(), ST, PRE)
+    saved = io.BytesIO()
+    prs.save(saved)
+    buf = to_buffer(prs)
+    assert buf.tell() == 0
+    assert _members(bytes(buf.getbuffer())) == _members(saved.getvalue())
+
+
+def test_level_0_stores_members_uncompressed():
+    ST, PRE = _configs()
+    prs = build_deck_from_ilts(_ilts(), ST, PRE)
+    stored, deflated = to_buffer(prs, 0).getvalue(), to_buffer(prs, 9).getvalue()
+    with zipfile.ZipFile(io.BytesIO(stored)) as zf:
+        assert {i.compress_type for i in zf.infolist()} == {zipfile.ZIP_STORED}
+    assert len(stored) > len(deflated)
+    assert _slide_xml(stored) == _slide_xml(deflated) == [etree.tostring(s._element) for s in prs.slides]
+
+
+def test_stream_to_an_unseekable_sink_reopens():
+    ST, PRE = _configs()
+    sink = _Sink()
+    with PptxStreamWriter(sink, compresslevel=1) as stream:
+        prs = build_deck_from_ilts(_ilts(), ST, PRE, stream=stream)
+    assert stream.stats["slides"] == 3
+    data = bytes(sink.data)
+    with zipfile.ZipFile(io.BytesIO(data)) as zf:  # sizes went after each member: no seeking back
+        assert all(i.flag_bits & 0x08 for i in zf.infolist())
+    assert _slide_xml(data) == [etree.tostring(s._element) for s in prs.slides]
+    assert _members(data) == _members(to_buffer(prs).getvalue())
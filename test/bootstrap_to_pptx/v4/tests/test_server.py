@@ -0,0 +1,74 @@
+import http.client
+import io
+import json
+import threading
+from pathlib import Path
+
+import pytest
+from pptx import Presentation
+from main import _resolve
+from server import RenderService, make_server
+
+V4 = Path(__file__).resolve().parents[1]
+HTML = ("<section><div class='row'><div class='col-12'><p>One</p></div></div></section>"
+        "<section><div class='row'><div class='col-12'><p>Two</p></div></div></section>")
+
+
+@pytest.fixture(scope="module")
+def server():
+    service = RenderService(_resolve, workers=1, max_queue=0)
+    httpd = make_server(service, port=0)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+    service.close()
+
+
+def _slides(data: bytes) -> int:
+    return len(Presentation(io.BytesIO(data)).slides)
+
+
+def _post(httpd, body: bytes):
+    conn = http.client.HTTPConnection(*httpd.server_address, timeout=60)
+    try:
+        conn.request("POST", "/render", body, {"Content-Type": "application/json"})
+        resp = conn.getresponse()
+        return resp.status, dict(resp.getheaders()), resp.read()
+    finally:
+        conn.close()
+
+
+def test_render_returns_the_deck_and_its_slide_count(server):
+    status, headers, data = _post(server, json.dumps({"html": HTML, "deck": True}).encode())
+    assert status == 200
+    assert headers["Content-Type"].endswith("presentationml.presentation")
+    assert headers["X-Slides"] == str(_slides(data)) and _slides(data) >= 2
+
+
+def test_render_from_a_path(server):
+    status, headers, data = _post(server, json.dumps({"html_path": str(V4 / "test.html")}).encode())
+    assert status == 200 and headers["X-Slides"] == str(_slides(data))
+
+
+@pytest.mark.parametrize("body", [b"5", b'["html"]', b'"html"', b"null", b"{not json", b"{}",
+                                  b'{"html": "<p>x</p>", "styles": 123}',
+                                  b'{"html": 5}', b'{"html_path": ["a"]}', b'{"html": "<p>x</p>", "template": {}}',
+                                  b'{"html": "<p>x</p>", "compresslevel": 10}',
+                                  b'{"html_path": "no/such/file.html"}'])
+def test_bad_requests_get_400(server, body):
+    status, headers, data = _post(server, body)
+    assert status == 400
+    assert headers["Content-Type"] == "application/json" and json.loads(data)["error"]
+
+
+def test_full_queue_gets_503(server):
+    service = server.service
+    assert service.slots.acquire(blocking=False)  # the only slot: 1 worker, max_queue 0
+    try:
+        status, _, data = _post(server, json.dumps({"html": HTML}).encode())
+    finally:
+        service.slots.release()
+    assert status == 503 and json.loads(data)["error"] == "render queue full"
+    assert _post(server, json.dumps({"html": HTML}).encode())[0] == 200
@@ -0,0 +1,61 @@
+from pptx import Presentation
+from pptx.util import Inches
+from parsers.generic_bootstrap_to_ilt import ILTItem
+from renderer.element_registry import render_table
+from renderer.layout_solver import Rect
+from renderer.table_pages import fill_height, paginate
+
+WIDTHS = [Inches(2)] * 2
+HEADER = ["Name", "Value"]
+TALL = ["word " * 400, "t"]  # wraps to far more than a page
+
+
+def _pages(rows, first_in, next_in):
+    return list(paginate(rows, WIDTHS, Inches(first_in), Inches(next_in) if next_in else None, 12, 11))
+
+
+def test_a_row_taller_than_a_page_gets_a_page_of_its_own():
+    rows = [HEADER, ["a", "1"], TALL, ["b", "2"]]
+    pages = _pages(rows, 1, 1)
+    assert [[r[0] for r in page] for page, _ in pages] == [["Name", "a"], ["Name", TALL[0]], ["Name", "b"]]
+    assert pages[1][1][1] > Inches(1)  # measured, not squeezed into the page
+
+
+def test_the_first_page_holds_a_body_row_even_when_only_the_header_fits():
+    rows = [HEADER] + [[f"r{i}", str(i)] for i in range(5)]
+    pages = _pages(rows, 0.2, 1)
+    assert [len(page) for page, _ in pages] == [2, 3, 3]
+    assert all(page[0] == HEADER for page, _ in pages)
+    assert [r for page, _ in pages for r in page[1:]] == rows[1:]
+
+
+def test_a_header_only_table_is_one_page():
+    pages = _pages([HEADER], 0.2, 1)
+    assert [page for page, _ in pages] == [[HEADER]]
+    assert fill_height(pages[0][1], Inches(1)) == [Inches(1)]
+    assert _pages([], 1, 1) == []
+
+
+def test_without_next_height_everything_stays_on_one_page():
+    rows = [HEADER, ["a", "1"], TALL, ["b", "2"]]
+    assert [len(page) for page, _ in _pages(rows, 1, None)] == [4]
+
+
+def test_fill_height():
+    assert fill_height([10, 10, 10], 100) == [33, 33, 34]          # even split, as python-pptx
+    assert fill_height([10, 60, 10], 100) == [16, 66, 16]          # measured + equal slack
+    assert fill_height([10, 200, 10], 100) == [10, 200, 10]        # overflow: measured heights kept
+
+
+def test_render_table_leaves_the_rest_for_continuation_slides():
+    prs = Presentation()
+    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    rows = [HEADER] + [[f"r{i}", str(i)] for i in range(30)]
+    presets = {"table": {"header_pt": 12, "cell_pt": 11, "header_fill": "#F1F3F5"}}
+    rest = render_table(slide, Rect(0.5, 0.5, 4, 0.2), ILTItem(kind="table", content={"rows": rows}), presets,
+                        next_height_in=2)
+    table = next(sh for sh in slide.shapes if sh.has_table).table
+    assert [c.text for c in table.rows[1].cells] == ["r0", "0"] and len(table.rows) == 2
+    following = list(rest)
+    assert following and all(page[0] == HEADER for page, _ in following)
+    assert [r for page, _ in following for r in page[1:]] == rows[2:]
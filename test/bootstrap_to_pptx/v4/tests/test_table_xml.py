@@ -0,0 +1,30 @@
+from lxml import etree
+from pptx import Presentation
+from pptx.util import Inches
+from renderer.element_registry import render_table_cells
+from renderer.layout_solver import Rect
+from renderer.table_xml import add_table_bulk, bulk_ok
+
+HEADER = ["Name", "Value"]
+
+
+def test_bulk_ok():
+    assert bulk_ok([HEADER, ["a", None], ["b"]])                   # empty and short rows are fine
+    assert bulk_ok([HEADER, ["tab\tseparated", "x"]])
+    assert not bulk_ok([])
+    assert not bulk_ok([HEADER, ["a", "b", "c"]])                  # wider than the header
+    assert not bulk_ok([HEADER, ["a", 1]])                         # not text
+    assert not bulk_ok([HEADER, ["line\nbreak", "x"]])             # needs the per-cell path
+    assert not bulk_ok([HEADER, ["bell\x07", "x"]])
+
+
+def test_bulk_table_matches_the_per_cell_one():
+    rows = [HEADER, ["a & <b>", None], ["", "tab\tseparated"], ["short"], ["x" * 200, "2"]]
+    heights = [Inches(0.3), Inches(0.25), Inches(0.25), Inches(0.25), Inches(0.6)]
+    prs = Presentation()
+    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    cells = render_table_cells(slide, Rect(0.5, 0.5, 6, 1.65), rows, heights, 12, 11)
+    bulk = add_table_bulk(slide.shapes, rows, Inches(0.5), Inches(0.5), Inches(6), sum(heights),
+                          header_fill="#F1F3F5", header_pt=12, cell_pt=11, row_heights=heights).table
+    assert bulk_ok(rows)
+    assert etree.tostring(bulk._tbl) == etree.tostring(cells._tbl)
@@ -60,3 +60,32 @@ def apply_shape_appearance_from_bootstrap(shape, classes: List[str]):
     if p.rounded:
         try: shape.adjustments[0] = 0.16
         except: pass
+
+# Chart
+
+def convert_chart_legend(chart, has_legend: bool):
+    chart.has_legend = bool(has_legend)
+
+def convert_chart_legend_position(chart, pos: str):
+    from pptx.enum.chart import XL_LEGEND_POSITION
+    m = {
+        "top": XL_LEGEND_POSITION.TOP,
+        "bottom": XL_LEGEND_POSITION.BOTTOM,
+        "left": XL_LEGEND_POSITION.LEFT,
+        "right": XL_LEGEND_POSITION.RIGHT,
+        "corner": XL_LEGEND_POSITION.CORNER,
+    }
+    if pos in m: chart.legend.position = m[pos]
+
+def convert_chart_value_axis_max(chart, value: float):
+    chart.value_axis.maximum_scale = float(value)
+
+def convert_chart_value_axis_min(chart, value: float):
+    chart.value_axis.minimum_scale = float(value)
+
+def convert_series_fill_color(series, rgb: RGBColor):
+    series.format.fill.solid()
+    series.format.fill.fore_color.rgb = rgb
+
+def convert_series_line_color(series, rgb: RGBColor):
+    series.format.line.color.rgb = rgb
@@ -1,3 +1,6 @@
+# shapes kept even when their text frame is empty
+KEEP_NAMES = {"FOOTER_BAR"}
+
 def _is_textbox_empty(shape) -> bool:
     try:
         if not hasattr(shape, "text_frame"): return False
@@ -7,10 +10,9 @@ def _is_textbox_empty(shape) -> bool:
         return False
 
 def cleanup_slide(slide):
-    keep = {"FOOTER_BAR"}
     to_delete = []
     for shp in slide.shapes:
-        if getattr(shp, "name", "") in keep: 
+        if getattr(shp, "name", "") in KEEP_NAMES:
             continue
         if _is_textbox_empty(shp): to_delete.append(shp); continue
         if shp.width == 0 or shp.height == 0: to_delete.append(shp)
@@ -0,0 +1,222 @@
+"""
+Image stage: every picture is resolved, decoded, downscaled and encoded once,
+and embedded once per deck.
+
+  resolve(src, base_dir)   img[src] / icon_map.json entry -> absolute path (relative
+                           paths against the HTML file's folder, then the cwd);
+                           found paths memoized (LRU of RESOLVED_ENTRIES), None when
+                           missing and looked up again next time (the file may appear).
+                           data: URIs are kept as is.
+  prepare(src, box_px)     bytes to embed, fitted to a box in pixels
+  add_picture(shapes, ...) shapes.add_picture with the prepared bytes
+
+Sizing: the box is the target rect at `dpi` (presets["image"]["dpi"], default 150),
+rounded up to a 64 px step so that slightly different rects share one result. A
+larger picture is downscaled (JPEG decodes straight at a reduced scale); a
+picture that already fits and is PNG / JPEG / GIF is embedded byte for byte.
+
+Encoding: a downscaled or converted picture (WebP, TIFF, BMP, EXIF-rotated, ...)
+becomes JPEG when it was a JPEG or is an opaque picture of more than 256 colors
+(photos), else PNG (transparency, logos, icons, line art).
+
+Dedup: python-pptx stores one image part per distinct SHA1 of the bytes it gets,
+so equal pictures must come out as equal bytes. prepare() is keyed on the
+source's content hash (not its path) and the box, and keeps its results in an
+LRU cache of CACHE_BYTES: the same logo on every slide, or under two file
+names, is read and encoded once and becomes one part.
+"""
+import base64
+import hashlib
+import io
+import logging
+import os
+from collections import OrderedDict
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Optional, Tuple
+from urllib.parse import unquote, urlparse
+
+# Module logger; handlers and level are configured by the entry point (main.py).
+logger = logging.getLogger(__name__)
+
+DEFAULT_DPI = 150
+STEP_PX = 64
+CACHE_BYTES = 64 << 20   # prepared pictures kept in memory (LRU)
+RESOLVED_ENTRIES = 4096  # resolve() results kept (LRU)
+DIGEST_ENTRIES = 4096    # source file hashes kept (LRU)
+JPEG_QUALITY = 85
+PASSTHROUGH = ("PNG", "JPEG", "GIF")
+
+Box = Tuple[Optional[int], Optional[int]]  # (max width, max height) in px; None = unbounded
+
+_resolved: "OrderedDict[tuple, str]" = OrderedDict()  # (src, base_dir) -> absolute path; hits only
+
+def resolve(src: str, base_dir: Optional[str] = None) -> Optional[str]:
+    """Absolute path of an image reference (data: URIs returned unchanged), or None."""
+    src = (src or "").strip()
+    if not src:
+        return None
+    if src.startswith("data:"):
+        return src
+    key = (src, base_dir)
+    path = _resolved.get(key)
+    if path is not None:
+        _resolved.move_to_end(key)
+        return path
+    path = _find(src, base_dir)
+    if path is not None:
+        _resolved[key] = path
+        if len(_resolved) > RESOLVED_ENTRIES:
+            _resolved.popitem(last=False)
+    return path
+
+def _find(src: str, base_dir: Optional[str]) -> Optional[str]:
+    url = urlparse(src)
+    if url.scheme in ("http", "https"):
+        logger.warning("Remote image not fetched: %s", src)
+        return None
+    path = unquote(url.path) if url.scheme == "file" else src
+    path = os.path.expanduser(path)
+    for base in ((base_dir, "") if base_dir and not os.path.isabs(path) else ("",)):
+        candidate = os.path.abspath(os.path.join(base, path))
+        if os.path.isfile(candidate):
+            return candidate
+    logger.warning("Image not found: %s", src)
+    return None
+
+@lru_cache(maxsize=64)
+def load_icon_map(path: str) -> dict:
+    """icon class -> image path, read once per process ({} if the file is missing)."""
+    import json
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        logger.warning("Icon map not found: %s", path)
+        return {}
+
+# ---- source bytes, keyed by content ---------------------------------------------
+
+_digests: "OrderedDict[tuple, str]" = OrderedDict()  # (path, mtime_ns, size) -> sha1 of the file
+
+def _source(src: str) -> Tuple[str, Callable[[], bytes]]:
+    """(content hash, loader of the raw bytes) for a resolved src."""
+    if src.startswith("data:"):
+        head, _, data = src.partition(",")
+        raw = base64.b64decode(data) if head.endswith(";base64") else unquote(data).encode("latin-1")
+        return hashlib.sha1(raw).hexdigest(), lambda: raw
+    st = os.stat(src)
+    k = (src, st.st_mtime_ns, st.st_size)
+    digest = _digests.get(k)
+    if digest is None:
+        digest = _digests[k] = hashlib.sha1(Path(src).read_bytes()).hexdigest()
+        if len(_digests) > DIGEST_ENTRIES:
+            _digests.popitem(last=False)
+    else:
+        _digests.move_to_end(k)
+    return digest, lambda: Path(src).read_bytes()
+
+# ---- LRU of prepared pictures ---------------------------------------------------
+
+_cache: "OrderedDict[tuple, bytes]" = OrderedDict()
+_cache_bytes = 0
+_stats = {"hits": 0, "misses": 0}
+
+def _cache_get(key):
+    blob = _cache.get(key)
+    if blob is not None:
+        _cache.move_to_end(key)
+        _stats["hits"] += 1
+    return blob
+
+def _cache_put(key, blob: bytes):
+    global _cache_bytes
+    _stats["misses"] += 1
+    _cache[key] = blob
+    _cache_bytes += len(blob)
+    while _cache_bytes > CACHE_BYTES and len(_cache) > 1:
+        _, old = _cache.popitem(last=False)
+        _cache_bytes -= len(old)
+
+def cache_info() -> dict:
+    return dict(_stats, entries=len(_cache), bytes=_cache_bytes)
+
+def cache_clear():
+    global _cache_bytes
+    _cache.clear(); _digests.clear(); _resolved.clear()
+    _cache_bytes = 0
+    _stats.update(hits=0, misses=0)
+
+# ---- decode / downscale / encode ------------------------------------------------
+
+def _step(px: Optional[float]) -> Optional[int]:
+    return None if px is None else max(STEP_PX, -(-int(px) // STEP_PX) * STEP_PX)
+
+def box_px(width_in: Optional[float], height_in: Optional[float], dpi: float = DEFAULT_DPI) -> Box:
+    """Pixel box of a rect at dpi, each side rounded up to STEP_PX."""
+    return (_step(width_in * dpi) if width_in else None, _step(height_in * dpi) if height_in else None)
+
+def _fit(size: Tuple[int, int], box: Box) -> Tuple[int, int]:
+    w, h = size
+    scale = min([1.0] + [b / s for b, s in zip(box, (w, h)) if b])
+    return max(1, round(w * scale)), max(1, round(h * scale))
+
+def prepare(src: str, box: Box = (None, None)) -> bytes:
+    """Bytes to embed for a resolved src, fitted to box (see module docstring)."""
+    digest, load = _source(src)
+    key = (digest, box)
+    blob = _cache_get(key)
+    if blob is None:
+        blob = _encode(load(), box)
+        _cache_put(key, blob)
+    return blob
+
+def _encode(raw: bytes, box: Box) -> bytes:
+    from PIL import Image, ImageOps
+
+    img = Image.open(io.BytesIO(raw))
+    fmt = img.format
+    orientation = img.getexif().get(0x0112, 1)
+    turned = orientation in (5, 6, 7, 8)  # EXIF orientations with a quarter turn
+    size = img.size[::-1] if turned else img.size
+    target = _fit(size, box)
+    if target == size and fmt in PASSTHROUGH and orientation == 1:
+        return raw
+    if fmt == "JPEG":
+        img.draft(None, target[::-1] if turned else target)  # decode at 1/2 .. 1/8 scale
+    img = ImageOps.exif_transpose(img)
+    if img.mode == "P":
+        img = img.convert("RGBA" if "transparency" in img.info else "RGB")
+    elif img.mode not in ("RGB", "RGBA", "L", "LA"):
+        img = img.convert("RGBA" if "A" in img.getbands() else "RGB")
+    if img.size != target:
+        img = img.resize(target, Image.LANCZOS, reducing_gap=3.0)
+
+    out = io.BytesIO()
+    if img.mode in ("RGBA", "LA") or (fmt != "JPEG" and img.getcolors(256) is not None):
+        img.save(out, "PNG")
+    else:
+        img.save(out, "JPEG", quality=JPEG_QUALITY, optimize=True)
+    return out.getvalue()
+
+def add_picture(shapes, src: str, left: int, top: int, width: Optional[int] = None, height: Optional[int] = None,
+                *, base_dir: Optional[str] = None, dpi: float = DEFAULT_DPI):
+    """
+    shapes.add_picture for an img[src] / icon path (EMU position and size, as there),
+    through the image stage. Returns the Picture, or None when src cannot be resolved.
+    """
+    from pptx.util import Emu
+
+    box = box_px(width and Emu(width).inches, height and Emu(height).inches, dpi)
+    for _ in range(2):
+        path = resolve(src, base_dir)
+        if path is None:
+            return None
+        try:
+            blob = prepare(path, box)
+            break
+        except FileNotFoundError:  # removed since it was resolved: forget it and look again
+            _resolved.pop(((src or "").strip(), base_dir), None)
+    else:
+        return None
+    return shapes.add_picture(io.BytesIO(blob), left, top, width, height)
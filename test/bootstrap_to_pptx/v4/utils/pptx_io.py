@@ -0,0 +1,125 @@
+"""
+PPTX output without a round trip through a file: to any writable stream (file,
+socket, HTTP response, BytesIO) or to memory, with a choice of zip compression.
+
+    save(prs, out, compresslevel=None)   out = path or writable stream (seekable or not)
+    to_buffer(prs, compresslevel=None)   BytesIO at position 0; .getbuffer() is a
+                                         memoryview of the same bytes (no copy)
+
+compresslevel: None = zlib's default (what prs.save writes, byte for byte),
+1..9 = deflate level, 0 = store only (fastest; larger file, pictures are
+already compressed anyway).
+
+Streaming: PptxStreamWriter writes the zip while the deck is being built. The
+pipeline calls write_slides(prs) after each slide is rendered; every slide not
+yet written goes out with its relationships and the parts it reaches that are
+not in the zip yet (pictures, charts, its layout and master). close() writes
+the rest (presentation, properties, content types). The serialized package
+never exists in memory as a whole, only the slide being written. Slides must
+not change once written; the member order differs from prs.save (slides
+first), which the format allows.
+"""
+import io
+import zipfile
+from typing import IO, Optional, Set, Union
+
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.opc.oxml import serialize_part_xml
+from pptx.opc.packuri import CONTENT_TYPES_URI, PACKAGE_URI
+from pptx.opc.serialized import _ContentTypesItem
+
+Out = Union[str, IO[bytes]]
+
+def _zip(out: Out, compresslevel: Optional[int]) -> zipfile.ZipFile:
+    if compresslevel == 0:
+        return zipfile.ZipFile(out, "w", compression=zipfile.ZIP_STORED, strict_timestamps=False)
+    return zipfile.ZipFile(out, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=compresslevel,
+                           strict_timestamps=False)
+
+def _write_part(zf: zipfile.ZipFile, part):
+    zf.writestr(part.partname.membername, part.blob)
+    if part._rels:
+        zf.writestr(part.partname.rels_uri.membername, part.rels.xml)
+
+def save(prs, out: Out, compresslevel: Optional[int] = None) -> None:
+    """prs.save(out) with a choice of compression (see module docstring)."""
+    package = prs.part.package
+    parts = tuple(package.iter_parts())
+    with _zip(out, compresslevel) as zf:
+        zf.writestr(CONTENT_TYPES_URI.membername, serialize_part_xml(_ContentTypesItem.xml_for(parts)))
+        zf.writestr(PACKAGE_URI.rels_uri.membername, package._rels.xml)
+        for part in parts:
+            _write_part(zf, part)
+
+def to_buffer(prs, compresslevel: Optional[int] = None) -> io.BytesIO:
+    """The saved PPTX in memory, rewound; buf.getbuffer() gives it as a memoryview without copying."""
+    buf = io.BytesIO()
+    save(prs, buf, compresslevel)
+    buf.seek(0)
+    return buf
+
+class PptxStreamWriter:
+    """
+    Zip writer fed slide by slide (see module docstring):
+
+        with open(path, "wb") as f, PptxStreamWriter(f, compresslevel=1) as stream:
+            build_deck_from_ilts(ilts, ST, PRE, stream=stream)
+
+    On a clean exit the remaining parts are written; after an error the zip is
+    only closed (incomplete).
+    """
+
+    def __init__(self, out: Out, compresslevel: Optional[int] = None):
+        self._zf = _zip(out, compresslevel)
+        self._prs = None
+        self._written: Set[str] = set()
+        self._slides = 0
+        self.stats = {"slides": 0, "parts": 0}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self._zf.close()
+
+    def _write_tree(self, part):
+        """part and the parts it reaches that are not written yet (the presentation part excluded)."""
+        stack = [part]
+        while stack:
+            p = stack.pop()
+            name = str(p.partname)
+            if name in self._written:
+                continue
+            _write_part(self._zf, p)
+            self._written.add(name)
+            self.stats["parts"] += 1
+            stack.extend(reversed([rel.target_part for rel in p.rels.values()
+                                   if not rel.is_external and rel.reltype not in (RT.SLIDE, RT.OFFICE_DOCUMENT)]))
+
+    def write_slides(self, prs):
+        """Write the slides of prs added since the last call."""
+        self._prs = prs
+        slides = list(prs.slides)
+        for slide in slides[self._slides:]:
+            self._write_tree(slide.part)
+            self.stats["slides"] += 1
+        self._slides = len(slides)
+
+    def close(self, prs=None):
+        """Write the remaining parts, the package relationships and the content types, and close the zip."""
+        prs = prs or self._prs
+        if prs is not None:
+            self.write_slides(prs)
+            package = prs.part.package
+            parts = tuple(package.iter_parts())
+            for part in parts:
+                if str(part.partname) not in self._written:
+                    _write_part(self._zf, part)
+                    self._written.add(str(part.partname))
+                    self.stats["parts"] += 1
+            self._zf.writestr(PACKAGE_URI.rels_uri.membername, package._rels.xml)
+            self._zf.writestr(CONTENT_TYPES_URI.membername, serialize_part_xml(_ContentTypesItem.xml_for(parts)))
+        self._zf.close()
@@ -0,0 +1,125 @@
+"""
+Slides moved between packages as plain data: a worker process renders slides
+into its own Presentation and exports them, the parent imports them into one.
+
+    slides, media = export_slides(prs, start)   # in the worker; picklable
+    SlideMerger(prs).add(slides, media)         # in the parent, in slide order
+
+A slide travels as its part: (partname, content type, blob, rels), each rel
+(rId, reltype, kind, ref):
+  "external"  ref = URL (hyperlinks)
+  "shared"    ref = partname of a part the template already has (the slide layout);
+              both packages come from the same template, so it exists on both sides
+  "media"     ref = SHA1 of an image; the bytes are sent once per export in
+              `media`, and the merger keeps one image part per SHA1 for the whole
+              deck (as python-pptx does for pictures added to one Presentation)
+  "part"      ref = the target part in the same form (charts and their embedded
+              workbooks), copied under the next free partname of its kind
+
+Imported parts get the next free partname and rIds; r:id / r:embed attributes
+are rewritten when an rId changes. Relationships are added in rId order and
+new parts in the order python-pptx creates them, so a deck merged from chunks
+in order is the same package as the deck rendered in one process.
+"""
+import io
+import re
+from typing import Dict, List, Optional, Set, Tuple
+
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.opc.package import PartFactory, XmlPart
+from pptx.opc.packuri import PackURI
+from pptx.parts.image import ImagePart
+
+_R_NS = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+_INDEX = re.compile(r"\d+(\.\w+)$")
+
+PartData = Tuple[str, str, bytes, List[tuple]]  # (partname, content type, blob, rels)
+
+def _rid_order(rId: str) -> tuple:
+    return (0, int(rId[3:])) if rId[3:].isdigit() else (1, rId)
+
+def template_partnames(prs) -> Set[str]:
+    """Partnames of every part in prs (call on a fresh copy of the template)."""
+    return {str(p.partname) for p in prs.part.package.iter_parts()}
+
+def _export_part(part, shared: Set[str], media: Dict[str, bytes]) -> PartData:
+    rels = []
+    for rId, rel in sorted(part.rels.items(), key=lambda kv: _rid_order(kv[0])):
+        if rel.is_external:
+            rels.append((rId, rel.reltype, "external", rel.target_ref))
+            continue
+        target = rel.target_part
+        if isinstance(target, ImagePart):
+            media.setdefault(target.sha1, target.blob)
+            rels.append((rId, rel.reltype, "media", target.sha1))
+        elif str(target.partname) in shared:
+            rels.append((rId, rel.reltype, "shared", str(target.partname)))
+        else:
+            rels.append((rId, rel.reltype, "part", _export_part(target, shared, media)))
+    return str(part.partname), part.content_type, part.blob, rels
+
+def export_slides(prs, start: int = 0, shared: Optional[Set[str]] = None) -> Tuple[List[PartData], Dict[str, bytes]]:
+    """
+    (slides, media) of prs.slides[start:]: slide parts as data and image bytes by
+    SHA1. shared = template_partnames() of the template prs was opened from
+    (default: the slide layouts and masters).
+    """
+    if shared is None:
+        shared = {str(p.partname) for p in prs.part.package.iter_parts()
+                  if p.content_type.endswith(("slideLayout+xml", "slideMaster+xml", "theme+xml"))}
+    media: Dict[str, bytes] = {}
+    slides = [_export_part(slide.part, shared, media) for slide in list(prs.slides)[start:]]
+    return slides, media
+
+class SlideMerger:
+    """Appends exported slides to prs; one merger per deck keeps media deduplicated across chunks."""
+
+    def __init__(self, prs):
+        self.prs = prs
+        self.package = prs.part.package
+        self._parts = {str(p.partname): p for p in self.package.iter_parts()}
+        self._images: Dict[str, ImagePart] = {}
+
+    def add(self, slides: List[PartData], media: Dict[str, bytes]):
+        """Append slides (from export_slides) after the last slide of prs."""
+        sldIdLst = self.prs.slides._sldIdLst
+        for data in slides:
+            part = self._new_part(data, PackURI("/ppt/slides/slide%d.xml" % (len(sldIdLst) + 1)))
+            sldIdLst.add_sldId(self.prs.part.relate_to(part, RT.SLIDE))
+            self._link(part, data[3], media)
+
+    def _image(self, sha1: str, media: Dict[str, bytes]) -> ImagePart:
+        part = self._images.get(sha1)
+        if part is None:
+            part = self._images[sha1] = self.package.get_or_add_image_part(io.BytesIO(media[sha1]))
+        return part
+
+    def _new_part(self, data: PartData, partname: Optional[PackURI] = None):
+        name, content_type, blob, _ = data
+        if partname is None:
+            partname = self.package.next_partname(_INDEX.sub(r"%d\1", name))
+        return PartFactory(partname, content_type, self.package, blob)
+
+    def _link(self, part, rels: List[tuple], media: Dict[str, bytes]):
+        """
+        Add part's relationships. Each new part is related before its own targets are
+        added: next free partnames are found among the parts reachable from the package.
+        """
+        renamed = {}
+        for rId, reltype, kind, ref in rels:
+            if kind == "external":
+                new = part.rels.get_or_add_ext_rel(reltype, ref)
+            elif kind == "part":
+                target = self._new_part(ref)
+                new = part.rels._add_relationship(reltype, target)
+                self._link(target, ref[3], media)
+            else:
+                target = self._image(ref, media) if kind == "media" else self._parts[ref]
+                new = part.rels._add_relationship(reltype, target)
+            if new != rId:
+                renamed[rId] = new
+        if renamed and isinstance(part, XmlPart):
+            for el in part._element.iter():
+                for attr, value in el.attrib.items():
+                    if attr.startswith(_R_NS) and value in renamed:
+                        el.set(attr, renamed[value])
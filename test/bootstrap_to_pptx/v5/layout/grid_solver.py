@@ -26,17 +26,35 @@ class Grid12:
         top = self.mT + row_top
         return Rect(left, top, width, row_h)
 
-def solve_layout(slide_layout: LayoutSlide, page: dict, bands: dict, gutter_in: float) -> List[Tuple[Rect, LayoutGroup]]:
+def _solve_numpy(slide_layout: LayoutSlide, grid: Grid12, row_top: float, row_h: float) -> List[Tuple[Rect, LayoutGroup]]:
+    from v5.layout.grid_solver_np import solve_arrays  # optional dependency
+
+    groups = [g for row in slide_layout.rows for g in row.groups]
+    group_row = [i for i, row in enumerate(slide_layout.rows) for _ in row.groups]
+    left, top, width, height = solve_arrays(
+        [g.span for g in groups], [g.offset for g in groups], group_row,
+        len(slide_layout.rows), grid, row_top, row_h)
+    return [(Rect(*r), g) for r, g in
+            zip(zip(left.tolist(), top.tolist(), width.tolist(), height.tolist()), groups)]
+
+def solve_layout(slide_layout: LayoutSlide, page: dict, bands: dict, gutter_in: float,
+                 backend: str = "python") -> List[Tuple[Rect, LayoutGroup]]:
     """
     Convert proportional layout to absolute placements.
     Packing policy:
       - Accumulate within a visual band (row_height_in)
       - If used_cols + (offset + span) > 12 -> wrap to a new band
       - After finishing a .row, move to next band as well
+    backend="numpy" computes the same placements with whole-array operations
+    (see grid_solver_np; needs numpy).
     """
     grid = Grid12(page["width_in"], page["height_in"], tuple(page["margins_in"]), gutter_in)
     row_top = bands["row_top_in"]
     row_h   = bands["row_height_in"]
+    if backend == "numpy":
+        return _solve_numpy(slide_layout, grid, row_top, row_h)
+    if backend != "python":
+        raise ValueError(f"Unknown solver backend: {backend!r}")
     placements: List[Tuple[Rect, LayoutGroup]] = []
 
     for row in slide_layout.rows:
@@ -0,0 +1,76 @@
+"""
+NumPy backend for grid_solver.solve_layout (optional: numpy is only imported here).
+
+All groups of a slide are laid out as arrays:
+  - take = offset + span; the running sum of take per row gives col_start
+  - wrap detection: each group's next break is found with searchsorted, and the
+    breaks reachable from the row starts are marked by pointer doubling
+  - band tops, left and width come from whole-array expressions
+
+The float operations are the same, in the same order, as the pure-Python solver
+(band tops are an accumulated `row_top += row_h`), so results are bit-identical.
+"""
+from typing import Tuple
+
+import numpy as np
+
+def _run_starts(key: np.ndarray) -> np.ndarray:
+    """True where a run of equal consecutive keys begins."""
+    first = np.ones(len(key), dtype=bool)
+    if len(key):
+        first[1:] = key[1:] != key[:-1]
+    return first
+
+def wrap_lines(row_first: np.ndarray, take: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    row_first marks the first group of each row. Returns (line_first, used):
+    line_first marks groups that start a band after a wrap or a new row,
+    used[g] = columns already taken on g's band (so col_start = used + offset).
+    """
+    n = len(take)
+    upto = np.cumsum(take)                 # running sum over all groups, inclusive
+    before = upto - take
+    # a line starting at i breaks before the first j > i with upto[j] - before[i] > 12
+    # (or at the end of i's row); n is a sentinel "no further line"
+    row_end = np.append(np.flatnonzero(row_first[1:]) + 1, n)[np.cumsum(row_first) - 1] if n else row_first
+    nxt = np.maximum(np.searchsorted(upto, before + 12, side="right"), np.arange(1, n + 1))
+    nxt = np.append(np.where(nxt < row_end, nxt, n), n)
+    # mark every line start reachable from a row start, doubling the jump each round
+    line_first = np.append(row_first, False)
+    while True:
+        reached = line_first.copy()
+        reached[nxt[line_first]] = True
+        if np.array_equal(reached, line_first):
+            break
+        line_first = reached
+        nxt = nxt[nxt]
+    line_first = line_first[:n]
+    return line_first, before - before[line_first][np.cumsum(line_first) - 1]
+
+def solve_arrays(span, offset, group_row, n_rows: int, grid, row_top: float, row_h: float):
+    """
+    Rect fields for groups given as parallel arrays (group_row[g] = index of g's
+    .row, non-decreasing). Returns (left, top, width, height) arrays.
+    """
+    span = np.asarray(span, dtype=np.int64)
+    offset = np.asarray(offset, dtype=np.int64)
+    group_row = np.asarray(group_row, dtype=np.int64)
+    take = offset + span
+
+    row_first = _run_starts(group_row)
+    line_first, used = wrap_lines(row_first, take)
+    col_start = used + offset
+    # the Python loop also wraps a row's first group when it alone is wider than 12
+    wrapped = (line_first & ~row_first) | (row_first & (take > 12))
+    band = np.cumsum(wrapped) + group_row
+
+    # one band per wrap plus one per .row, each `row_top += row_h`
+    steps = np.full(int(wrapped.sum()) + n_rows + 1, row_h, dtype=np.float64)
+    steps[0] = row_top
+    band_top = np.cumsum(steps)
+
+    left = grid.mL + col_start * (grid.col_w + grid.gutter)
+    width = span * grid.col_w + (span - 1) * grid.gutter
+    top = grid.mT + (band_top[band] - grid.mT)
+    height = np.full(len(span), row_h, dtype=np.float64)
+    return left, top, width, height
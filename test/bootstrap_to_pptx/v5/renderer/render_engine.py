@@ -1,16 +1,16 @@
 import json
-from pptx import Presentation
 from pptx.util import Inches
 from v5.parsers.layout_parser import parse_layout_only
 from v5.layout.grid_solver import solve_layout
 from v5.layout.placement_debug import draw_grid, draw_bbox
 from v5.renderer.primitives import add_placeholder
+from v5.utils.template_cache import open_template
 
 def render_layout_only(html_path: str, styles_path: str, template_path: str | None = None):
     ST = json.load(open(styles_path, "r", encoding="utf-8"))
     page, bands = ST["page"], ST["bands"]
 
-    prs = Presentation(template_path) if template_path else Presentation()
+    prs = open_template(template_path)
     prs.slide_width  = Inches(page["width_in"])
     prs.slide_height = Inches(page["height_in"])
     slide = prs.slides.add_slide(prs.slide_layouts[6])
@@ -19,7 +19,8 @@ def render_layout_only(html_path: str, styles_path: str, template_path: str | No
     layout = parse_layout_only(html_path)
 
     # Solve absolute placements
-    placements = solve_layout(layout, page, bands, page["gutter_in"])
+    placements = solve_layout(layout, page, bands, page["gutter_in"],
+                              backend=ST.get("solver", {}).get("backend", "python"))
 
     # Optional debug overlays
     if ST.get("debug", {}).get("grid", False):
@@ -0,0 +1,124 @@
+"""
+Benchmark: solve_layout_tree on synthetic deeply nested trees.
+
+Each level is a row of `width` columns where `fanout` of them hold the next level,
+so the node count grows linearly with depth (fanout=1) and the measurement pass
+should scale linearly too. The legacy solver (re-measuring every subtree at every
+level) is kept here for comparison only.
+
+Run from the folder that contains v6/:
+    python -m v6.benchmarks.bench_grid_solver
+"""
+import argparse
+import time
+from typing import List
+
+from v6.parsers.model import LayoutTree, LayoutRow, LayoutCol
+from v6.layout.grid_solver import Rect, solve_layout_tree, _row_to_lines, _place_line_in_container
+
+PAGE = {"width_in": 13.333, "height_in": 7.5, "margins_in": [0.7, 0.7, 0.7, 0.7], "gutter_in": 0.22}
+BANDS = {"row_top_in": 1.60, "row_height_in": 1.80}
+
+
+def build_tree(depth: int, width: int = 4, fanout: int = 1) -> LayoutTree:
+    span = max(1, 12 // width)
+
+    def level(d: int) -> LayoutRow:
+        row = LayoutRow()
+        for i in range(width):
+            col = LayoutCol(span=span)
+            if d < depth and i < fanout:
+                col.rows.append(level(d + 1))
+            row.cols.append(col)
+        return row
+
+    return LayoutTree(root_rows=[level(1)])
+
+
+def count_nodes(rows: List[LayoutRow]) -> int:
+    n = 0
+    for row in rows:
+        n += 1
+        for col in row.cols:
+            n += 1 + count_nodes(col.rows)
+    return n
+
+
+# ---------- legacy (pre-measurement-pass) solver, for comparison ----------
+
+def _legacy_col_units(col: LayoutCol) -> int:
+    if not col.rows:
+        return 1
+    return max(1, sum(_legacy_row_units(r) for r in col.rows))
+
+def _legacy_row_units(row: LayoutRow) -> int:
+    units = 0
+    for line in _row_to_lines(row):
+        if line:
+            units += max([1] + [_legacy_col_units(lc.col) for lc in line])
+    return max(1, units)
+
+def legacy_solve(tree: LayoutTree, page: dict, bands: dict):
+    placements = []
+    L, T, R, B = page["margins_in"]
+    content_w = page["width_in"] - L - R
+    unit_h = bands["row_height_in"]
+    base_gutter_pct = page["gutter_in"] / max(1e-6, content_w)
+
+    def place_rows(rows, left, top, width):
+        cur_top = top
+        for row in rows:
+            row_h = _legacy_row_units(row) * unit_h
+            row_placements = []
+            line_top = cur_top
+            for line in _row_to_lines(row):
+                if not line:
+                    continue
+                line_h = max([1] + [_legacy_col_units(lc.col) for lc in line]) * unit_h
+                row_placements.extend(_place_line_in_container(
+                    line, Rect(left, line_top, width, line_h), unit_h, base_gutter_pct))
+                line_top += line_h
+            placements.extend(row_placements)
+            for rect, col in row_placements:
+                if col.rows:
+                    place_rows(col.rows, rect.left, rect.top, rect.width)
+            cur_top += row_h
+
+    place_rows(tree.root_rows, L, T + bands["row_top_in"], content_w)
+    return placements
+
+
+def _best_of(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main():
+    ap = argparse.ArgumentParser(description="grid_solver depth-scaling benchmark")
+    ap.add_argument("--min-depth", type=int, default=10)
+    ap.add_argument("--max-depth", type=int, default=20)
+    ap.add_argument("--width", type=int, default=4)
+    ap.add_argument("--fanout", type=int, default=1)
+    ap.add_argument("--repeat", type=int, default=5)
+    ap.add_argument("--no-legacy", action="store_true", help="skip the legacy solver timings")
+    args = ap.parse_args()
+
+    print(f"{'depth':>5} {'nodes':>7} {'new ms':>9} {'new us/node':>12} {'legacy ms':>10} {'legacy us/node':>15}")
+    for depth in range(args.min_depth, args.max_depth + 1):
+        tree = build_tree(depth, args.width, args.fanout)
+        nodes = count_nodes(tree.root_rows)
+        new_s = _best_of(lambda: solve_layout_tree(tree, PAGE, BANDS), args.repeat)
+        if args.no_legacy:
+            legacy = ""
+        else:
+            old_s = _best_of(lambda: legacy_solve(tree, PAGE, BANDS), args.repeat)
+            legacy = f"{old_s * 1e3:>10.2f} {old_s * 1e6 / nodes:>15.2f}"
+        print(f"{depth:>5} {nodes:>7} {new_s * 1e3:>9.2f} {new_s * 1e6 / nodes:>12.2f} {legacy}")
+
+
+if __name__ == "__main__":
+    main()
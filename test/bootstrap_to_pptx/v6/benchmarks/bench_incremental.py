@@ -0,0 +1,57 @@
+"""
+Benchmark: full deck render vs incremental re-render after editing one section.
+
+Builds a deck of `sections` sections (each a row of columns with a nested row),
+renders it once with render_deck_incremental, edits one section and times the
+re-render (1 slide rendered, the rest spliced from the previous output) against
+a full render_layout_deck + save.
+
+Run from the folder that contains v6/:
+    python -m v6.benchmarks.bench_incremental --sections 200
+"""
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from v6.renderer.incremental import render_deck_incremental
+from v6.renderer.render_engine import load_styles, render_with_styles
+
+STYLES = Path(__file__).resolve().parents[1] / "config" / "styles.json"
+
+
+def deck_html(sections: int, edited: int = -1) -> str:
+    parts = []
+    for i in range(sections):
+        inner = "<div class='col-6'></div>" * (3 if i == edited else 2)
+        parts.append(f"<section><div class='row'><div class='col-4'></div><div class='col-4'></div>"
+                     f"<div class='col-4'><div class='row'>{inner}</div></div></div></section>")
+    return "<html><body>" + "\n".join(parts) + "</body></html>"
+
+
+def main():
+    ap = argparse.ArgumentParser(description="incremental deck re-render benchmark")
+    ap.add_argument("--sections", type=int, default=200)
+    args = ap.parse_args()
+
+    ST = load_styles(str(STYLES))
+    with tempfile.TemporaryDirectory() as tmp:
+        html, out, full = Path(tmp, "deck.html"), Path(tmp, "deck.pptx"), Path(tmp, "full.pptx")
+        html.write_text(deck_html(args.sections))
+        render_deck_incremental(str(html), ST, str(out))
+        html.write_text(deck_html(args.sections, edited=args.sections // 2))
+
+        t0 = time.perf_counter()
+        stats = render_deck_incremental(str(html), ST, str(out))
+        inc_s = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        render_with_styles(str(html), ST, deck=True).save(str(full))
+        full_s = time.perf_counter() - t0
+
+    print(f"sections={args.sections} reused={stats['reused']} rendered={stats['rendered']}")
+    print(f"full render  {full_s * 1e3:9.1f} ms")
+    print(f"incremental  {inc_s * 1e3:9.1f} ms  ({full_s / inc_s:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+Benchmark: memory held by many parsed layouts (preview-service scenario).
+
+Compares, for N copies of one parsed document:
+  - legacy: plain dataclasses (per-instance __dict__) with a class list per column
+  - slotted: current LayoutTree/LayoutRow/LayoutCol with interned class tuples
+  - flat:    FlatLayout parallel arrays (flatten_tree)
+
+Run from the folder that contains v6/:
+    python -m v6.benchmarks.bench_model_memory --copies 2000
+"""
+import argparse
+import gc
+import tracemalloc
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import List, Optional
+
+from v6.parsers.layout_parser import parse_layout_tree
+from v6.parsers.model import LayoutTree, LayoutRow, LayoutCol, intern_classes, flatten_tree
+
+DEFAULT_HTML = Path(__file__).resolve().parents[1] / "tests" / "full" / "test.html"
+
+
+# ---------- legacy (pre-slots) model, for comparison ----------
+
+@dataclass
+class _LegacyRow:
+    cols: List["_LegacyCol"] = field(default_factory=list)
+    units: int = 0
+
+@dataclass
+class _LegacyCol:
+    span: int
+    offset: int = 0
+    classes: List[str] = field(default_factory=list)
+    rows: List[_LegacyRow] = field(default_factory=list)
+    units: int = 0
+
+@dataclass
+class _LegacyTree:
+    root_rows: List[_LegacyRow] = field(default_factory=list)
+    title: Optional[str] = None
+    subtitle: Optional[str] = None
+
+
+def _copy_rows(rows, row_cls, col_cls, classes):
+    return [row_cls(cols=[col_cls(span=c.span, offset=c.offset, classes=classes(c.classes),
+                                  rows=_copy_rows(c.rows, row_cls, col_cls, classes)) for c in r.cols])
+            for r in rows]
+
+def legacy_copy(tree: LayoutTree) -> _LegacyTree:
+    # a fresh list per column, as the parser used to store what bs4 returned
+    return _LegacyTree(root_rows=_copy_rows(tree.root_rows, _LegacyRow, _LegacyCol, list))
+
+def slotted_copy(tree: LayoutTree) -> LayoutTree:
+    return LayoutTree(root_rows=_copy_rows(tree.root_rows, LayoutRow, LayoutCol, lambda c: intern_classes(list(c))))
+
+
+def _measure(make, copies: int) -> int:
+    gc.collect()
+    tracemalloc.start()
+    kept = [make() for _ in range(copies)]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del kept
+    return size
+
+
+def _count(rows) -> int:
+    return sum(1 + sum(1 + _count(c.rows) for c in r.cols) for r in rows)
+
+
+def main():
+    ap = argparse.ArgumentParser(description="layout model memory benchmark")
+    ap.add_argument("--html", default=str(DEFAULT_HTML))
+    ap.add_argument("--copies", type=int, default=2000)
+    args = ap.parse_args()
+
+    tree = parse_layout_tree(args.html)
+    nodes = _count(tree.root_rows)
+    print(f"{Path(args.html).name}: {nodes} rows+cols per layout, {args.copies} layouts")
+    results = {
+        "legacy": _measure(lambda: legacy_copy(tree), args.copies),
+        "slotted": _measure(lambda: slotted_copy(tree), args.copies),
+        "flat": _measure(lambda: flatten_tree(tree), args.copies),
+    }
+    base = results["legacy"]
+    for name, size in results.items():
+        print(f"{name:<8} {size / 2**20:8.2f} MiB  {size / (args.copies * nodes):7.1f} B/node  ({base / size:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Benchmark: pure-Python vs NumPy backend of solve_layout_tree on wide grids.
+
+Each slide has `rows` root rows of `cols` columns with random spans/offsets (so
+rows wrap into several lines); every `nest_every`-th column holds a small nested
+row. The NumPy backend must return the same rectangles; this is asserted before
+timing. "core" is grid_solver_np.solve_flat alone on a FlatLayout (arrays in,
+arrays out), i.e. without building Rect objects.
+
+Run from the folder that contains v6/:
+    python -m v6.benchmarks.bench_numpy_solver --rows 20 --cols 50 100 200 400
+"""
+import argparse
+import random
+import time
+
+from v6.parsers.model import LayoutTree, LayoutRow, LayoutCol, flatten_tree
+from v6.layout.grid_solver import solve_layout_tree
+from v6.layout.grid_solver_np import solve_flat
+
+PAGE = {"width_in": 13.333, "height_in": 7.5, "margins_in": [0.7, 0.7, 0.7, 0.7], "gutter_in": 0.22}
+BANDS = {"row_top_in": 1.60, "row_height_in": 1.80}
+
+
+def build_tree(rows: int, cols: int, nest_every: int = 10, seed: int = 0) -> LayoutTree:
+    rng = random.Random(seed)
+
+    def col(i: int) -> LayoutCol:
+        c = LayoutCol(span=rng.choice((2, 3, 4, 6)), offset=rng.choice((0, 0, 0, 1)))
+        if nest_every and i % nest_every == nest_every - 1:
+            c.rows.append(LayoutRow(cols=[LayoutCol(span=6), LayoutCol(span=6)]))
+        return c
+
+    return LayoutTree(root_rows=[LayoutRow(cols=[col(i) for i in range(cols)]) for _ in range(rows)])
+
+
+def _best_of(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main():
+    ap = argparse.ArgumentParser(description="NumPy vs Python grid solver")
+    ap.add_argument("--rows", type=int, default=20)
+    ap.add_argument("--cols", type=int, nargs="+", default=[50, 100, 200, 400])
+    ap.add_argument("--nest-every", type=int, default=10)
+    ap.add_argument("--repeat", type=int, default=5)
+    args = ap.parse_args()
+
+    print(f"{'cols/row':>8} {'columns':>8} {'python ms':>10} {'numpy ms':>9} {'core ms':>8} {'speedup':>8}")
+    for cols in args.cols:
+        tree = build_tree(args.rows, cols, args.nest_every)
+        flat = flatten_tree(tree)
+        py = solve_layout_tree(tree, PAGE, BANDS)
+        assert [r for r, _ in solve_layout_tree(tree, PAGE, BANDS, backend="numpy")] == [r for r, _ in py]
+
+        py_s = _best_of(lambda: solve_layout_tree(tree, PAGE, BANDS), args.repeat)
+        np_s = _best_of(lambda: solve_layout_tree(tree, PAGE, BANDS, backend="numpy"), args.repeat)
+        core_s = _best_of(lambda: solve_flat(flat, PAGE, BANDS), args.repeat)
+        print(f"{cols:>8} {len(py):>8} {py_s * 1e3:>10.2f} {np_s * 1e3:>9.2f} {core_s * 1e3:>8.2f} {py_s / core_s:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
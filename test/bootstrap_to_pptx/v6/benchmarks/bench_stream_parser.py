@@ -0,0 +1,68 @@
+"""
+Benchmark: peak memory / time of the streaming parser vs BeautifulSoup on a
+large synthetic export (many <section>s with inline tables).
+
+Each parser runs in its own process so ru_maxrss is a clean peak.
+
+Run from the folder that contains v6/:
+    python -m v6.benchmarks.bench_stream_parser --sections 400 --table-rows 200
+"""
+import argparse
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+
+def write_export(path: str, sections: int, table_rows: int) -> int:
+    cells = "".join(f"<td>cell {c}</td>" for c in range(8))
+    table = "<table class='table'>" + "".join(f"<tr>{cells}</tr>" for _ in range(table_rows)) + "</table>"
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("<html><body>")
+        for s in range(sections):
+            f.write(f"<section><div class='row'><div class='col-12'><h2>Section {s}</h2></div></div>"
+                    f"<div class='row'><div class='col-8'>{table}</div>"
+                    f"<div class='col-4'><div class='row'><div class='col-6'>A</div><div class='col-6'>B</div></div></div>"
+                    f"</div></section>")
+        f.write("</body></html>")
+    return os.path.getsize(path)
+
+
+def _child(kind: str, path: str) -> None:
+    t0 = time.perf_counter()
+    if kind == "stream":
+        from v6.parsers.stream_parser import iter_layout_sections
+        n = sum(1 for _ in iter_layout_sections(path))
+    else:
+        from v6.parsers.layout_parser import parse_layout_deck
+        n = len(parse_layout_deck(path))
+    secs = time.perf_counter() - t0
+    rss_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024  # KiB on Linux
+    print(f"{kind:<6} slides={n:<6} {secs:7.2f}s  peak RSS {rss_mb:8.1f} MiB")
+
+
+def main():
+    ap = argparse.ArgumentParser(description="streaming vs in-memory HTML parsing")
+    ap.add_argument("--sections", type=int, default=400)
+    ap.add_argument("--table-rows", type=int, default=200)
+    ap.add_argument("--child", nargs=2, metavar=("KIND", "PATH"), help=argparse.SUPPRESS)
+    args = ap.parse_args()
+    if args.child:
+        return _child(*args.child)
+
+    fd, path = tempfile.mkstemp(suffix=".html")
+    os.close(fd)
+    try:
+        size = write_export(path, args.sections, args.table_rows)
+        print(f"export: {size / 2**20:.1f} MiB, {args.sections} sections")
+        for kind in ("stream", "bs4"):
+            subprocess.run([sys.executable, "-m", "v6.benchmarks.bench_stream_parser", "--child", kind, path],
+                           check=True)
+    finally:
+        os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
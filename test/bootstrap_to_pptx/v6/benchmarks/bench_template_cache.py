@@ -0,0 +1,71 @@
+"""
+Benchmark: Presentation(template) per render vs template_cache.open_template.
+
+Builds a template of --images random (incompressible) PNGs, about 6.5 MB each
+at the default size, standing in for a corporate template full of masters and
+media, then times opening it repeatedly both ways, and a full
+render_layout_only with that template.
+
+Run from the folder that contains v6/:
+    python -m v6.benchmarks.bench_template_cache --images 2
+"""
+import argparse
+import io
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from pptx import Presentation
+from pptx.util import Inches
+
+from v6.renderer.render_engine import render_layout_only
+from v6.utils.template_cache import open_template
+
+HERE = Path(__file__).resolve().parents[1]
+
+
+def build_template(path: str, images: int, px: int) -> None:
+    import numpy as np
+    from PIL import Image
+    prs = Presentation()
+    rng = np.random.default_rng(0)
+    for _ in range(images):
+        buf = io.BytesIO()
+        Image.fromarray(rng.integers(0, 255, (px, px, 3), dtype=np.uint8)).save(buf, "PNG")
+        buf.seek(0)
+        prs.slides.add_slide(prs.slide_layouts[6]).shapes.add_picture(buf, 0, 0, Inches(2))
+    prs.save(path)
+
+
+def _mean(fn, runs: int) -> float:
+    fn()
+    t0 = time.perf_counter()
+    for _ in range(runs):
+        fn()
+    return (time.perf_counter() - t0) / runs
+
+
+def main():
+    ap = argparse.ArgumentParser(description="template cache benchmark")
+    ap.add_argument("--images", type=int, default=2)
+    ap.add_argument("--px", type=int, default=1500)
+    ap.add_argument("--runs", type=int, default=20)
+    args = ap.parse_args()
+
+    html = str(HERE / "tests" / "fixtures" / "nested_rows.html")
+    styles = str(HERE / "config" / "styles.json")
+    with tempfile.TemporaryDirectory() as tmp:
+        tpl = os.path.join(tmp, "template.pptx")
+        build_template(tpl, args.images, args.px)
+        print(f"template {os.path.getsize(tpl) / 1e6:.1f} MB")
+        load = _mean(lambda: Presentation(tpl), args.runs)
+        cached = _mean(lambda: open_template(tpl), args.runs)
+        render = _mean(lambda: render_layout_only(html, styles, tpl).save(io.BytesIO()), args.runs)
+    print(f"Presentation(template)  {load * 1e3:8.2f} ms")
+    print(f"open_template (copy)    {cached * 1e3:8.2f} ms  ({load / cached:.0f}x)")
+    print(f"render + save, cached   {render * 1e3:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
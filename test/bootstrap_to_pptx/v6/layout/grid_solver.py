@@ -1,6 +1,6 @@
 from dataclasses import dataclass
 from typing import List, Tuple
-from v6.parsers.model import LayoutTree, LayoutRow, LayoutCol
+from v6.parsers.model import LayoutTree, LayoutRow, LayoutCol, FlatLayout, flatten_tree
 
 @dataclass
 class Rect:
@@ -35,7 +35,7 @@ def _row_to_lines(row: LayoutRow) -> List[List[LineCol]]:
 
 def _measure_col_units(col: LayoutCol) -> int:
     """
-    Height units required by a column.
+    Height units required by a column (nested rows must already be measured).
     - If no nested rows: 1 unit.
     - If nested rows: sum of the units of each nested row (rows stack vertically inside the column).
     """
@@ -43,27 +43,53 @@ def _measure_col_units(col: LayoutCol) -> int:
         return 1
     total = 0
     for nrow in col.rows:
-        total += _measure_row_units(nrow)
+        total += nrow.units
     return max(1, total)
 
+def _line_units(line: List[LineCol]) -> int:
+    """Units of one wrapped line = max(units of its columns)."""
+    line_units = 1
+    for lc in line:
+        line_units = max(line_units, lc.col.units)
+    return line_units
+
 def _measure_row_units(row: LayoutRow) -> int:
     """
-    Height units required by a row.
+    Height units required by a row (its columns must already be measured).
     - Split row into wrapped lines.
     - Each line's units = max(units of its columns in that line).
     - Row units = sum(line units).
     """
-    lines = _row_to_lines(row)
     units = 0
-    for line in lines:
-        if not line:
-            continue
-        line_units = 1
-        for lc in line:
-            line_units = max(line_units, _measure_col_units(lc.col))
-        units += line_units
+    for line in _row_to_lines(row):
+        if line:
+            units += _line_units(line)
     return max(1, units)
 
+def measure_rows(rows: List[LayoutRow]) -> None:
+    """
+    Annotate every row/column below `rows` with its `.units`, bottom-up.
+    Each node is measured exactly once, so the pass is linear in tree size.
+    Uses an explicit stack so very deep nesting does not hit the recursion limit.
+    """
+    stack = [(row, False) for row in reversed(rows)]
+    while stack:
+        row, children_done = stack.pop()
+        if children_done:
+            for col in row.cols:
+                col.units = _measure_col_units(col)
+            row.units = _measure_row_units(row)
+            continue
+        stack.append((row, True))
+        for col in row.cols:
+            for nrow in reversed(col.rows):
+                stack.append((nrow, False))
+
+def measure_layout_tree(tree: LayoutTree) -> LayoutTree:
+    """Single measurement pass over the whole tree; returns the (annotated) tree."""
+    measure_rows(tree.root_rows)
+    return tree
+
 # ---------- placement inside a container ----------
 
 def _place_line_in_container(
@@ -106,11 +132,8 @@ def _place_row_in_container(
     for line in lines:
         if not line:
             continue
-        # measure this line's height in units
-        line_units = 1
-        for lc in line:
-            line_units = max(line_units, _measure_col_units(lc.col))
-        line_h = line_units * unit_h
+        # line height comes from the units annotated by measure_layout_tree
+        line_h = _line_units(line) * unit_h
 
         line_container = Rect(container.left, cur_top, container.width, line_h)
         placements.extend(_place_line_in_container(line, line_container, unit_h, base_gutter_pct))
@@ -120,14 +143,43 @@ def _place_row_in_container(
 
 # ---------- public: solve the whole tree ----------
 
-def solve_layout_tree(tree: LayoutTree, page: dict, bands: dict) -> List[Tuple[Rect, LayoutCol]]:
+def _solve_numpy(tree: LayoutTree | FlatLayout, page: dict, bands: dict) -> List[Tuple[Rect, LayoutCol]]:
+    """solve_layout_tree on the NumPy backend; annotates units like the Python path."""
+    from v6.layout.grid_solver_np import solve_flat  # optional dependency
+
+    if isinstance(tree, FlatLayout):
+        tree = tree.to_tree()
+    rows: List[LayoutRow] = []
+    cols: List[LayoutCol] = []
+    flat = flatten_tree(tree, nodes=(rows, cols))
+    left, top, width, height, col_units, row_units = solve_flat(flat, page, bands)
+    for row, units in zip(rows, row_units.tolist()):
+        row.units = units
+    for col, units in zip(cols, col_units.tolist()):
+        col.units = units
+    return [(Rect(*r), col) for r, col in
+            zip(zip(left.tolist(), top.tolist(), width.tolist(), height.tolist()), cols)]
+
+def solve_layout_tree(tree: LayoutTree | FlatLayout, page: dict, bands: dict,
+                      backend: str = "python") -> List[Tuple[Rect, LayoutCol]]:
     """
     Compute placements for all columns (including nested), avoiding overlaps:
+    - Measure the whole tree once (bottom-up), annotating row/col units.
     - Split each row into wrapped lines.
     - Give each line enough height to fit its nested rows.
     - Stack lines to get row height; stack rows to build page vertically.
+    A FlatLayout (compact stored form) is expanded to a tree first.
+    backend="numpy" computes the same placements with whole-array operations
+    (see grid_solver_np; needs numpy), which pays off on layouts with many columns.
     """
+    if backend == "numpy":
+        return _solve_numpy(tree, page, bands)
+    if backend != "python":
+        raise ValueError(f"Unknown solver backend: {backend!r}")
+    if isinstance(tree, FlatLayout):
+        tree = tree.to_tree()
     placements: List[Tuple[Rect, LayoutCol]] = []
+    measure_layout_tree(tree)
 
     L, T, R, B = page["margins_in"]
     content_w = page["width_in"] - L - R
@@ -144,9 +196,8 @@ def solve_layout_tree(tree: LayoutTree, page: dict, bands: dict) -> List[Tuple[R
         """
         cur_top = top
         for row in rows:
-            # measure row height (sum of line heights)
-            row_units = _measure_row_units(row)
-            row_h = row_units * unit_h
+            # row height (sum of line heights), measured up front
+            row_h = row.units * unit_h
 
             row_container = Rect(left, cur_top, width, row_h)
             # place this row's lines & columns
@@ -154,7 +205,7 @@ def solve_layout_tree(tree: LayoutTree, page: dict, bands: dict) -> List[Tuple[R
             placements.extend(row_placements)
 
             # recurse: for each placed column that has nested rows, place them within that column rect
-            # NOTE: we rely on the same unit_h for inner levels; line measurement already accounted for nested needs
+            # NOTE: we rely on the same unit_h for inner levels; the measurement pass already accounted for nested needs
             for rect, col in row_placements:
                 if col.rows:
                     place_rows(col.rows, rect.left, rect.top, rect.width)
@@ -0,0 +1,162 @@
+"""
+NumPy backend for solve_layout_tree (optional: numpy is only imported here).
+
+Works on the FlatLayout arrays instead of walking LayoutRow/LayoutCol objects:
+  - line breaks: running sum of offset+span; each column's next break is found
+    with searchsorted, and the breaks reachable from the row starts are marked
+    by pointer doubling (log2(lines per row) array passes)
+  - units: bottom-up, one vectorized step per nesting depth
+  - placement: top-down, one vectorized step per nesting depth; left/width/top/
+    height of every column at that depth come from whole-array expressions
+
+The float operations are the same, in the same order, as in grid_solver (the
+stacked tops are accumulated position by position, never as cumsum differences),
+so the rectangles are bit-identical to the pure-Python path.
+"""
+from typing import Tuple
+
+import numpy as np
+
+from v6.parsers.model import FlatLayout
+
+def _as_int(a) -> np.ndarray:
+    return np.asarray(a, dtype=np.int64)
+
+def _run_starts(key: np.ndarray) -> np.ndarray:
+    """True where a run of equal consecutive keys begins."""
+    first = np.ones(len(key), dtype=bool)
+    if len(key):
+        first[1:] = key[1:] != key[:-1]
+    return first
+
+def wrap_lines(row_first: np.ndarray, take: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Vectorized grid_solver._row_to_lines over all columns at once.
+    row_first marks the first column of each row, take = offset + span.
+    Returns (line_first, used): line_first marks the first column of each line,
+    used[c] = columns already taken on c's line (so col_start = used + offset).
+    """
+    n = len(take)
+    upto = np.cumsum(take)                 # running sum over all columns, inclusive
+    before = upto - take
+    # a line starting at i breaks before the first j > i with upto[j] - before[i] > 12
+    # (or at the end of i's row); n is a sentinel "no further line"
+    row_end = np.append(np.flatnonzero(row_first[1:]) + 1, n)[np.cumsum(row_first) - 1] if n else row_first
+    nxt = np.maximum(np.searchsorted(upto, before + 12, side="right"), np.arange(1, n + 1))
+    nxt = np.append(np.where(nxt < row_end, nxt, n), n)
+    # mark every line start reachable from a row start, doubling the jump each round
+    line_first = np.append(row_first, False)
+    while True:
+        reached = line_first.copy()
+        reached[nxt[line_first]] = True
+        if np.array_equal(reached, line_first):
+            break
+        line_first = reached
+        nxt = nxt[nxt]
+    line_first = line_first[:n]
+    return line_first, before - before[line_first][np.cumsum(line_first) - 1]
+
+def _stack(first: np.ndarray, start: np.ndarray, step: np.ndarray) -> np.ndarray:
+    """
+    Tops of items stacked in runs: the first item of a run is at start[i], the
+    next ones at previous top + previous step. Added one position at a time so
+    the sums round exactly like `cur_top += h`.
+    """
+    top = start.astype(np.float64, copy=True)
+    pos = np.arange(len(first)) - np.maximum.accumulate(np.where(first, np.arange(len(first)), 0))
+    for p in range(1, int(pos.max(initial=0)) + 1):
+        i = np.flatnonzero(pos == p)
+        top[i] = top[i - 1] + step[i - 1]
+    return top
+
+def solve_flat(flat: FlatLayout, page: dict, bands: dict):
+    """
+    Placements of every column of a FlatLayout, in FlatLayout (= solve_layout_tree) order.
+    Returns (left, top, width, height, col_units, row_units) as arrays.
+    """
+    n_rows, n_cols = flat.n_rows, flat.n_cols
+    row_parent = _as_int(flat.row_parent)
+    span, offset, col_row = _as_int(flat.span), _as_int(flat.offset), _as_int(flat.col_row)
+
+    L, T, R, B = page["margins_in"]
+    content_w = page["width_in"] - L - R
+    unit_h = bands["row_height_in"]
+    row_top_start = T + bands["row_top_in"]
+    base_gutter_pct = page["gutter_in"] / max(1e-6, content_w)
+
+    # ---- lines ----
+    line_first, used = wrap_lines(_run_starts(col_row), offset + span)
+    col_start = used + offset
+    col_line = np.cumsum(line_first) - 1
+    line_row = col_row[line_first]
+    n_lines = len(line_row)
+
+    # ---- nesting depth (parents come first, so depth settles in max-depth steps) ----
+    parent_row = np.where(row_parent >= 0, col_row[np.maximum(row_parent, 0)] if n_cols else -1, -1)
+    row_depth = np.zeros(n_rows, dtype=np.int64)
+    nested = np.flatnonzero(row_parent >= 0)
+    while True:
+        d = row_depth[parent_row[nested]] + 1
+        if np.array_equal(d, row_depth[nested]):
+            break
+        row_depth[nested] = d
+    col_depth = row_depth[col_row]
+    line_depth = row_depth[line_row]
+    max_depth = int(row_depth.max(initial=-1))
+
+    # ---- measure, bottom-up ----
+    row_units = np.ones(n_rows, dtype=np.int64)
+    col_units = np.ones(n_cols, dtype=np.int64)
+    line_units = np.ones(n_lines, dtype=np.int64)
+    for depth in range(max_depth, -1, -1):
+        below = nested[row_depth[nested] == depth + 1]
+        nested_sum = np.zeros(n_cols, dtype=np.int64)
+        np.add.at(nested_sum, row_parent[below], row_units[below])
+        c = np.flatnonzero(col_depth == depth)
+        col_units[c] = np.maximum(1, nested_sum[c])
+        np.maximum.at(line_units, col_line[c], col_units[c])
+        ln = np.flatnonzero(line_depth == depth)
+        line_sum = np.zeros(n_rows, dtype=np.int64)
+        np.add.at(line_sum, line_row[ln], line_units[ln])
+        r = np.flatnonzero(row_depth == depth)
+        row_units[r] = np.maximum(1, line_sum[r])
+
+    # ---- place, top-down ----
+    row_h = row_units * unit_h
+    line_h = line_units * unit_h
+    row_left = np.empty(n_rows)
+    row_top = np.empty(n_rows)
+    row_width = np.empty(n_rows)
+    left = np.empty(n_cols)
+    top = np.empty(n_cols)
+    width = np.empty(n_cols)
+    height = np.empty(n_cols)
+    for depth in range(max_depth + 1):
+        r = np.flatnonzero(row_depth == depth)
+        parent = row_parent[r]
+        has_parent = parent >= 0
+        p = np.maximum(parent, 0)
+        row_left[r] = np.where(has_parent, left[p] if n_cols else L, L)
+        row_width[r] = np.where(has_parent, width[p] if n_cols else content_w, content_w)
+        # sibling rows share a parent and are consecutive among the rows of one depth
+        row_top[r] = _stack(_run_starts(parent),
+                            np.where(has_parent, top[p] if n_cols else row_top_start, row_top_start),
+                            row_h[r])
+
+        ln = np.flatnonzero(line_depth == depth)
+        lrow = line_row[ln]
+        line_top = _stack(_run_starts(lrow), row_top[lrow], line_h[ln])
+
+        c = np.flatnonzero(col_depth == depth)
+        cw = row_width[col_row[c]]
+        gutter = base_gutter_pct * np.maximum(1e-6, cw)
+        colw = (cw - 11 * gutter) / 12.0
+        s = span[c]
+        left[c] = row_left[col_row[c]] + col_start[c] * (colw + gutter)
+        width[c] = s * colw + (s - 1) * gutter
+        # line index -> position among this depth's lines
+        at = np.searchsorted(ln, col_line[c])
+        top[c] = line_top[at]
+        height[c] = line_h[ln][at]
+
+    return left, top, width, height, col_units, row_units
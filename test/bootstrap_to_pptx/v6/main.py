@@ -1,6 +1,6 @@
 import argparse
+import sys
 from pathlib import Path
-from v6.renderer.render_engine import render_layout_only
 
 HERE = Path(__file__).resolve().parent
 
@@ -14,19 +14,48 @@ def _resolve(p: str) -> str:
     raise FileNotFoundError(p)
 
 def main():
+    if len(sys.argv) > 1 and sys.argv[1] == "batch":
+        from v6.batch import batch_main
+        raise SystemExit(batch_main(sys.argv[2:], _resolve))
+
     ap = argparse.ArgumentParser(description="v6 Layout-first (hierarchical) Bootstrap HTML → PPTX")
     ap.add_argument("--html", required=True)
     ap.add_argument("--out", required=True)
     ap.add_argument("--styles", default="config/styles.json")
     ap.add_argument("--template", default=None)
+    ap.add_argument("--deck", action="store_true", help="One slide per <section> / .page-break in the HTML")
+    ap.add_argument("--stream", action="store_true", help="Stream-parse the HTML (bounded memory for very large exports)")
+    ap.add_argument("--incremental", action="store_true",
+                    help="Deck mode that re-renders only sections changed since the last run into --out")
+    ap.add_argument("--cache-dir", default=None, help="Reuse PPTX rendered earlier from identical inputs (on-disk LRU)")
+    ap.add_argument("--cache-max-mb", type=int, default=512, help="Size cap of --cache-dir")
     args = ap.parse_args()
 
     html = _resolve(args.html)
     styles = _resolve(args.styles)
     template = _resolve(args.template) if args.template else None
 
-    prs = render_layout_only(html_path=html, styles_path=styles, template_path=template)
-    prs.save(args.out)
+    if args.incremental:
+        from v6.renderer.incremental import render_deck_incremental
+        from v6.renderer.render_engine import load_styles
+        stats = render_deck_incremental(html, load_styles(styles), args.out, template, stream=args.stream)
+        print(f"Slides: {stats['slides']} ({stats['reused']} reused, {stats['rendered']} rendered)")
+    elif args.cache_dir:
+        from v6.renderer.render_engine import load_styles, render_with_styles
+        from v6.utils.render_cache import RenderCache
+        ST = load_styles(styles)
+        cache = RenderCache(args.cache_dir, args.cache_max_mb << 20)
+        # --stream gives the same trees as the in-memory parser (see tests/test_stream_parser.py),
+        # so it renders the same slides and is not part of the key
+        data, hit = cache.render(lambda: render_with_styles(html, ST, template, deck=args.deck, stream=args.stream),
+                                 html, (ST,), template, variant="deck" if args.deck else "slide")
+        Path(args.out).write_bytes(data)
+        print(f"Cache {'hit' if hit else 'miss'}: {cache.info()}")
+    else:
+        from v6.renderer.render_engine import render_layout_only, render_layout_deck
+        render = render_layout_deck if args.deck else render_layout_only
+        prs = render(html_path=html, styles_path=styles, template_path=template, stream=args.stream)
+        prs.save(args.out)
     print(f"Saved: {Path(args.out).resolve()}")
 
 if __name__ == "__main__":
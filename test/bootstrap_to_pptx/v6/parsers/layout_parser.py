@@ -1,6 +1,7 @@
 from bs4 import BeautifulSoup
-from .model import LayoutTree, LayoutRow, LayoutCol
+from .model import LayoutTree, LayoutRow, LayoutCol, intern_classes
 from .bootstrap_norm import resolve_span, resolve_offset, is_unbounded_col
+from .sections import split_sections
 
 def _classes(el):
     return el.get("class", []) if el else []
@@ -8,11 +9,11 @@ def _classes(el):
 def _direct_children(el):
     return el.find_all(recursive=False)
 
-def _direct_rows(parent):
-    return [c for c in _direct_children(parent) if "row" in _classes(c)]
+def _direct_rows(parent, classes=_classes, children=_direct_children):
+    return [c for c in children(parent) if "row" in classes(c)]
 
-def _direct_cols(row):
-    return [c for c in _direct_children(row) if any(cc.startswith("col") for cc in _classes(c))]
+def _direct_cols(row, classes=_classes, children=_direct_children):
+    return [c for c in children(row) if any(cc.startswith("col") for cc in classes(c))]
 
 def _distribute_unspecified(spans, unspecified_idx):
     total_spec = sum(s for s in spans if s > 0)
@@ -27,16 +28,20 @@ def _distribute_unspecified(spans, unspecified_idx):
     for j in range(min(leftover, n)):
         spans[unspecified_idx[j]] += 1
 
-def _parse_row(row_el) -> LayoutRow:
+def _parse_row(row_el, classes=_classes, children=_direct_children) -> LayoutRow:
+    """
+    Parse one .row element. classes/children read an element's class list and
+    element children; the defaults are for bs4 Tags (stream_parser passes lxml ones).
+    """
     row = LayoutRow()
-    cols = _direct_cols(row_el)
+    cols = _direct_cols(row_el, classes, children)
     if not cols:
         return row
 
     spans = []
     unspecified = []
     for idx, col in enumerate(cols):
-        cls = _classes(col)
+        cls = classes(col)
         s = resolve_span(cls)
         spans.append(s)
         if s == 0 and is_unbounded_col(cls):
@@ -45,26 +50,37 @@ def _parse_row(row_el) -> LayoutRow:
     spans = [max(1, min(12, s or 1)) for s in spans]
 
     for col_el, span in zip(cols, spans):
-        cls = _classes(col_el)
-        col = LayoutCol(span=span, offset=resolve_offset(cls), classes=cls)
+        cls = classes(col_el)
+        col = LayoutCol(span=span, offset=resolve_offset(cls), classes=intern_classes(cls))
         # nested rows directly under this column
-        for nrow in _direct_rows(col_el):
-            col.rows.append(_parse_row(nrow))
+        for nrow in _direct_rows(col_el, classes, children):
+            col.rows.append(_parse_row(nrow, classes, children))
         row.cols.append(col)
     return row
 
-def parse_layout_tree(html_path: str) -> LayoutTree:
-    soup = BeautifulSoup(open(html_path, "r", encoding="utf-8").read(), "lxml")
+def _load_soup(html_path: str) -> BeautifulSoup:
+    return BeautifulSoup(open(html_path, "r", encoding="utf-8").read(), "lxml")
+
+def parse_layout_root(root) -> LayoutTree:
+    """Parse a whole document or a single section (any bs4 Tag) into a LayoutTree."""
     tree = LayoutTree()
 
-    root = soup.body if soup.body else soup
+    if getattr(root, "body", None):
+        root = root.body
     # top-level rows: direct rows under body (or root)
     for r in _direct_rows(root):
         tree.root_rows.append(_parse_row(r))
 
     # fallback: if none found, allow any .row (avoids empty slides on minimal HTML)
     if not tree.root_rows:
-        for r in soup.select(".row"):
+        for r in root.select(".row"):
             tree.root_rows.append(_parse_row(r))
             break
     return tree
+
+def parse_layout_tree(html_path: str) -> LayoutTree:
+    return parse_layout_root(_load_soup(html_path))
+
+def parse_layout_deck(html_path: str) -> list[LayoutTree]:
+    """One LayoutTree per <section> / .page-break group (see parsers.sections)."""
+    return [parse_layout_root(root) for root in split_sections(_load_soup(html_path))]
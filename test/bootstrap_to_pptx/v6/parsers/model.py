@@ -1,19 +1,108 @@
+import sys
+from array import array
 from dataclasses import dataclass, field
-from typing import List, Optional
+from functools import lru_cache
+from typing import List, Optional, Sequence, Tuple
 
-@dataclass
+# ---------- class-list interning ----------
+# Thousands of columns share a handful of class lists ("col-6", "col-md-4 p-2", ...);
+# keep one tuple per distinct list instead of a fresh list per column. Bounded, so a
+# long-running process fed documents with ever new class lists does not grow with them.
+CLASS_TUPLES = 4096
+
+@lru_cache(maxsize=CLASS_TUPLES)
+def _interned(key: Tuple[str, ...]) -> Tuple[str, ...]:
+    return tuple(sys.intern(c) for c in key)
+
+def intern_classes(classes: Sequence[str]) -> Tuple[str, ...]:
+    return _interned(tuple(classes))
+
+# ---------- tree form (parser output) ----------
+
+@dataclass(slots=True)
 class LayoutRow:
     cols: List["LayoutCol"] = field(default_factory=list)
+    units: int = 0  # height units, filled by grid_solver.measure_layout_tree
 
-@dataclass
+@dataclass(slots=True)
 class LayoutCol:
     span: int
     offset: int = 0
-    classes: List[str] = field(default_factory=list)
+    classes: Tuple[str, ...] = ()  # interned, see intern_classes
     rows: List[LayoutRow] = field(default_factory=list)  # nested rows
+    units: int = 0  # height units, filled by grid_solver.measure_layout_tree
 
-@dataclass
+@dataclass(slots=True)
 class LayoutTree:
     root_rows: List[LayoutRow] = field(default_factory=list)
     title: Optional[str] = None
     subtitle: Optional[str] = None
+
+# ---------- flat form (storage / solver) ----------
+
+@dataclass(slots=True)
+class FlatLayout:
+    """
+    A LayoutTree as parallel arrays, rows and columns numbered in pre-order.
+      rows:  row_parent[r] = index of the column holding row r (-1 = root row)
+      cols:  span[c], offset[c], col_row[c] = index of the row holding column c,
+             classes[c] = interned class tuple
+    Children always come after their parent, so one forward pass sees parents first.
+    """
+    row_parent: array = field(default_factory=lambda: array("i"))
+    span: array = field(default_factory=lambda: array("b"))
+    offset: array = field(default_factory=lambda: array("b"))
+    col_row: array = field(default_factory=lambda: array("i"))
+    classes: List[Tuple[str, ...]] = field(default_factory=list)
+    title: Optional[str] = None
+    subtitle: Optional[str] = None
+
+    @property
+    def n_rows(self) -> int:
+        return len(self.row_parent)
+
+    @property
+    def n_cols(self) -> int:
+        return len(self.span)
+
+    def to_tree(self) -> LayoutTree:
+        tree = LayoutTree(title=self.title, subtitle=self.subtitle)
+        rows = [LayoutRow() for _ in range(self.n_rows)]
+        cols: List[LayoutCol] = []
+        for c in range(self.n_cols):
+            col = LayoutCol(span=self.span[c], offset=self.offset[c], classes=self.classes[c])
+            rows[self.col_row[c]].cols.append(col)
+            cols.append(col)
+        for r, parent in enumerate(self.row_parent):
+            if parent < 0:
+                tree.root_rows.append(rows[r])
+            else:
+                cols[parent].rows.append(rows[r])
+        return tree
+
+def flatten_tree(tree: LayoutTree, nodes: Optional[Tuple[list, list]] = None) -> FlatLayout:
+    """
+    Pre-order flatten (rows before their columns, columns before their nested rows).
+    If nodes=(rows, cols) is given, the LayoutRow/LayoutCol objects are appended to
+    those lists in flat index order.
+    """
+    flat = FlatLayout(title=tree.title, subtitle=tree.subtitle)
+    stack = [(row, -1) for row in reversed(tree.root_rows)]
+    while stack:
+        row, parent = stack.pop()
+        r = len(flat.row_parent)
+        flat.row_parent.append(parent)
+        if nodes is not None:
+            nodes[0].append(row)
+        nested = []
+        for col in row.cols:
+            c = len(flat.span)
+            flat.span.append(col.span)
+            flat.offset.append(col.offset)
+            flat.col_row.append(r)
+            flat.classes.append(intern_classes(col.classes))
+            if nodes is not None:
+                nodes[1].append(col)
+            nested.extend((nrow, c) for nrow in col.rows)
+        stack.extend(reversed(nested))
+    return flat
@@ -0,0 +1,201 @@
+"""
+Streaming front-end for very large HTML exports (lxml HTMLPullParser).
+
+parse_layout_tree() reads the whole file and builds a full BeautifulSoup tree.
+Here the file is fed to lxml in chunks. Each top-level .row becomes a
+LayoutRow when its end tag is seen. Finished subtrees that the row/col
+skeleton does not need (cards, tables, text, ...) are cleared and detached.
+Peak memory is therefore bounded by the open path plus the rows/cols of one
+top-level block (one section in deck mode), not by the file size.
+
+Same results as the in-memory parser:
+- iter_layout_rows / parse_layout_tree_streaming  ~ parse_layout_tree
+  (direct .row children of <body>; else the first .row anywhere)
+- iter_layout_sections                            ~ parse_layout_deck
+  (one tree per top-level <section>; else split on .page-break; else one tree)
+
+Limitation: .page-break separators are honoured only as direct children of
+<body> (parse_layout_deck also handles breaks inside a wrapper element).
+"""
+from typing import Iterator, List, Optional
+from lxml import etree
+
+from .model import LayoutTree, LayoutRow
+from .layout_parser import _parse_row
+
+CHUNK_SIZE = 1 << 16  # bytes fed to the parser per read
+
+def _classes(el) -> List[str]:
+    return (el.get("class") or "").split()
+
+def _children(el) -> list:
+    # skip comments / processing instructions (their .tag is not a str)
+    return [c for c in el if isinstance(c.tag, str)]
+
+def _parse(row_el) -> LayoutRow:
+    return _parse_row(row_el, _classes, _children)
+
+def _free(el) -> None:
+    """Drop a finished subtree from the partial document."""
+    el.clear()
+    parent = el.getparent()
+    if parent is not None:
+        parent.remove(el)
+
+def _release(el, parent) -> None:
+    """
+    Free el unless the row/col skeleton may still need it: rows (nested rows of
+    a column) and direct children of rows (the columns) are kept until their
+    top-level row is parsed.
+    """
+    if "row" not in _classes(el) and (parent is None or "row" not in _classes(parent)):
+        _free(el)
+
+def _loose_text(parent, upto=None) -> bool:
+    """
+    True if parent has non-blank text of its own before child upto (anywhere if
+    None). That text is dropped: it only decides whether a group is empty.
+    """
+    found = bool((parent.text or "").strip())
+    parent.text = None
+    for c in parent:
+        if c is upto:
+            break
+        found = found or bool((c.tail or "").strip())
+        c.tail = None
+    return found
+
+def _iter_events(html_path: str, chunk_size: int = CHUNK_SIZE):
+    """(event, element) pairs for start/end of every element, reading chunk by chunk."""
+    parser = etree.HTMLPullParser(events=("start", "end"))
+    with open(html_path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            parser.feed(chunk)
+            for event, el in parser.read_events():
+                if isinstance(el.tag, str):
+                    yield event, el
+    parser.close()
+    for event, el in parser.read_events():
+        if isinstance(el.tag, str):
+            yield event, el
+
+class _Scope:
+    """Rows of one slide being collected: <body>, a <section> or a page-break group."""
+    def __init__(self, el=None):
+        self.el = el                                   # scope element (None = <body>)
+        self.rows: List[LayoutRow] = []                # direct .row children, parsed
+        self.first = None                              # first .row element (document order)
+        self.fallback: Optional[LayoutRow] = None      # its LayoutRow, used if rows stay empty
+        self.has_content = False
+
+    def is_direct(self, parent) -> bool:
+        return parent is self.el if self.el is not None else (parent is not None and parent.tag == "body")
+
+    def tree(self) -> LayoutTree:
+        rows = self.rows or ([self.fallback] if self.fallback is not None else [])
+        return LayoutTree(root_rows=list(rows))
+
+def _on_start(scope: _Scope, el) -> None:
+    if scope.first is None and el is not scope.el and "row" in _classes(el):
+        scope.first = el
+
+def _on_end(scope: _Scope, el, parent) -> Optional[LayoutRow]:
+    """Parse el if it is a direct row (returned) or the scope's fallback row."""
+    if scope.is_direct(parent):
+        scope.has_content = True
+        if "row" in _classes(el):
+            row = _parse(el)
+            scope.rows.append(row)
+            return row
+    if el is scope.first:
+        scope.fallback = _parse(el)
+    return None
+
+def iter_layout_rows(html_path: str, chunk_size: int = CHUNK_SIZE) -> Iterator[LayoutRow]:
+    """Yield the top-level LayoutRows of a document as their end tags are parsed."""
+    body, stack = _Scope(), []
+    for event, el in _iter_events(html_path, chunk_size):
+        if event == "start":
+            _on_start(body, el)
+            stack.append(el)
+            continue
+        stack.pop()
+        parent = stack[-1] if stack else None
+        row = _on_end(body, el, parent)
+        if row is not None:
+            yield row
+            _free(el)
+        else:
+            _release(el, parent)
+    if not body.rows and body.fallback is not None:
+        yield body.fallback
+
+def parse_layout_tree_streaming(html_path: str, chunk_size: int = CHUNK_SIZE) -> LayoutTree:
+    """Streaming equivalent of layout_parser.parse_layout_tree."""
+    return LayoutTree(root_rows=list(iter_layout_rows(html_path, chunk_size)))
+
+def iter_layout_sections(html_path: str, chunk_size: int = CHUNK_SIZE) -> Iterator[LayoutTree]:
+    """
+    Streaming equivalent of layout_parser.parse_layout_deck. Section trees are
+    yielded as each top-level <section> closes. Page-break groups are only
+    known to be slides once the document has no <section>, so they are yielded
+    at the end. By then their DOM has already been freed; only rows are kept.
+    """
+    stack = []
+    section: Optional[_Scope] = None
+    saw_section = False
+    groups, group, saw_break = [], _Scope(), False
+
+    for event, el in _iter_events(html_path, chunk_size):
+        if event == "start":
+            parent = stack[-1] if stack else None
+            if section is None and el.tag == "section":
+                section, saw_section = _Scope(el), True
+            elif section is not None:
+                _on_start(section, el)
+            if not saw_section:
+                _on_start(group, el)
+                # bare text before a direct child (what split_sections keeps as a group)
+                if group.is_direct(parent) and _loose_text(parent, el):
+                    group.has_content = True
+            stack.append(el)
+            continue
+
+        stack.pop()
+        parent = stack[-1] if stack else None
+
+        if section is not None and el is section.el:
+            yield section.tree()
+            section = None
+            _free(el)
+            continue
+
+        direct = False
+        if section is not None:
+            direct = _on_end(section, el, parent) is not None
+        if not saw_section:
+            if group.is_direct(parent) and "page-break" in _classes(el):
+                groups.append(group)
+                group, saw_break = _Scope(), True
+                direct = True
+            else:
+                direct = _on_end(group, el, parent) is not None or direct
+            # bare text after a direct child belongs to the group it ends up in (as in split_sections)
+            if group.is_direct(parent) and (el.tail or "").strip():
+                group.has_content = True
+            elif el.tag == "body" and _loose_text(el):
+                group.has_content = True
+        if direct:
+            _free(el)
+        else:
+            _release(el, parent)
+
+    if saw_section:
+        return
+    groups.append(group)
+    if not saw_break:
+        yield group.tree()
+        return
+    for g in groups:
+        if g.has_content:
+            yield g.tree()
@@ -0,0 +1,105 @@
+"""
+Incremental deck rendering: only sections whose parsed tree changed are rebuilt.
+
+Next to the output, <out>.slides.json records one fingerprint per slide (sha256
+of the section's FlatLayout arrays + styles + template + code version) and the
+slide's part name in the saved package. On the next run every section is parsed
+and fingerprinted. A section whose fingerprint is in the manifest gets a blank
+slide, the others are rendered as usual, and while the new package is written
+the blank slides' XML is replaced by the stored XML from the previous output.
+
+Slides here only reference their slide layout (no media), so a slide part can
+be moved between packages as-is. The manifest is ignored when the output file
+was modified since it was written.
+"""
+import hashlib
+import io
+import json
+import os
+import zipfile
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from v6.parsers.layout_parser import parse_layout_deck
+from v6.parsers.stream_parser import iter_layout_sections
+from v6.parsers.model import LayoutTree, flatten_tree
+from v6.renderer.render_engine import _new_presentation, render_tree_slide
+from v6.utils.render_cache import code_version, template_digest
+
+MANIFEST_VERSION = 1
+
+def manifest_path(out_path: str) -> Path:
+    return Path(str(out_path) + ".slides.json")
+
+def _context_digest(ST: dict, template_path: Optional[str]) -> bytes:
+    """Everything besides the tree that changes how a slide is drawn."""
+    h = hashlib.sha256(code_version().encode())
+    h.update(template_digest(template_path).encode())
+    h.update(json.dumps(ST, sort_keys=True, separators=(",", ":")).encode())
+    return h.digest()
+
+def tree_fingerprint(tree: LayoutTree, context: bytes) -> str:
+    flat = flatten_tree(tree)
+    h = hashlib.sha256(context)
+    for arr in (flat.row_parent, flat.span, flat.offset, flat.col_row):
+        h.update(len(arr).to_bytes(8, "little"))
+        h.update(arr.tobytes())
+    h.update(json.dumps([flat.classes, flat.title, flat.subtitle]).encode())
+    return h.hexdigest()
+
+def _stat(path: str) -> dict:
+    st = os.stat(path)
+    return {"size": st.st_size, "mtime_ns": st.st_mtime_ns}
+
+def _load_previous(out_path: str) -> Dict[str, bytes]:
+    """fingerprint -> slide XML of the previous output (empty if missing or stale)."""
+    mpath = manifest_path(out_path)
+    if not (mpath.exists() and os.path.exists(out_path)):
+        return {}
+    try:
+        manifest = json.loads(mpath.read_text(encoding="utf-8"))
+    except ValueError:
+        return {}
+    if manifest.get("version") != MANIFEST_VERSION or manifest.get("pptx") != _stat(out_path):
+        return {}
+    with zipfile.ZipFile(out_path) as z:
+        return {s["fingerprint"]: z.read(s["part"]) for s in manifest["slides"]}
+
+def _splice(pptx_bytes: bytes, parts: Dict[str, bytes]) -> bytes:
+    """Copy a package, replacing the XML of the given parts."""
+    out = io.BytesIO()
+    with zipfile.ZipFile(io.BytesIO(pptx_bytes)) as src, \
+            zipfile.ZipFile(out, "w", zipfile.ZIP_DEFLATED) as dst:
+        for info in src.infolist():
+            dst.writestr(info, parts.get(info.filename) or src.read(info))
+    return out.getvalue()
+
+def render_deck_incremental(html_path: str, ST: dict, out_path: str, template_path: Optional[str] = None,
+                            stream: bool = False) -> dict:
+    """
+    Deck mode (one slide per section) into out_path, reusing the slides of
+    unchanged sections from the previous out_path. Returns slide counts.
+    """
+    trees = iter_layout_sections(html_path) if stream else parse_layout_deck(html_path)
+    previous = _load_previous(out_path)
+    context = _context_digest(ST, template_path)
+
+    prs = _new_presentation(ST["page"], template_path)
+    slides: List[dict] = []
+    reused: Dict[str, bytes] = {}
+    for tree in trees:
+        fp = tree_fingerprint(tree, context)
+        if fp in previous:
+            slide = prs.slides.add_slide(prs.slide_layouts[6])
+            reused[slide.part.partname.lstrip("/")] = previous[fp]
+        else:
+            slide = render_tree_slide(prs, tree, ST)
+        slides.append({"fingerprint": fp, "part": slide.part.partname.lstrip("/")})
+
+    buf = io.BytesIO()
+    prs.save(buf)
+    data = _splice(buf.getvalue(), reused) if reused else buf.getvalue()
+    Path(out_path).write_bytes(data)
+    manifest = {"version": MANIFEST_VERSION, "pptx": _stat(out_path), "slides": slides}
+    manifest_path(out_path).write_text(json.dumps(manifest, indent=1), encoding="utf-8")
+    return {"slides": len(slides), "reused": len(reused), "rendered": len(slides) - len(reused)}
@@ -1,22 +1,24 @@
 import json
-from pptx import Presentation
 from pptx.util import Inches
-from v6.parsers.layout_parser import parse_layout_tree
+from v6.parsers.layout_parser import parse_layout_tree, parse_layout_deck
+from v6.parsers.stream_parser import parse_layout_tree_streaming, iter_layout_sections
+from v6.parsers.model import LayoutTree
 from v6.layout.grid_solver import solve_layout_tree
 from v6.layout.placement_debug import draw_grid, draw_bbox
 from v6.renderer.primitives import add_placeholder
+from v6.utils.template_cache import open_template
 
-def render_layout_only(html_path: str, styles_path: str, template_path: str | None = None):
-    ST = json.load(open(styles_path, "r", encoding="utf-8"))
-    page, bands = ST["page"], ST["bands"]
-
-    prs = Presentation(template_path) if template_path else Presentation()
+def _new_presentation(page: dict, template_path: str | None = None):
+    prs = open_template(template_path)
     prs.slide_width  = Inches(page["width_in"])
     prs.slide_height = Inches(page["height_in"])
-    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    return prs
 
-    tree = parse_layout_tree(html_path)
-    placements = solve_layout_tree(tree, page, bands)
+def render_tree_slide(prs, tree: LayoutTree, ST: dict):
+    """Add one blank slide to prs and draw the placeholders of a parsed LayoutTree."""
+    page, bands = ST["page"], ST["bands"]
+    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    placements = solve_layout_tree(tree, page, bands, backend=ST.get("solver", {}).get("backend", "python"))
 
     if ST.get("debug", {}).get("grid", False):
         draw_grid(slide, page, page["gutter_in"])
@@ -28,4 +30,35 @@ def render_layout_only(html_path: str, styles_path: str, template_path: str | No
         if ST.get("debug", {}).get("bbox", False):
             draw_bbox(slide, rect)
 
+    return slide
+
+def load_styles(styles_path: str) -> dict:
+    return json.load(open(styles_path, "r", encoding="utf-8"))
+
+def render_with_styles(html_path: str, ST: dict, template_path: str | None = None, deck: bool = False,
+                       stream: bool = False):
+    """
+    Render with an already-loaded styles dict (batch workers load it once and reuse).
+    deck=False: whole document -> one slide; deck=True: one slide per section.
+    stream=True: parse with the lxml streaming front-end (large exports); in deck
+    mode each section is rendered as soon as it has been parsed.
+    """
+    if stream:
+        trees = iter_layout_sections(html_path) if deck else [parse_layout_tree_streaming(html_path)]
+    else:
+        trees = parse_layout_deck(html_path) if deck else [parse_layout_tree(html_path)]
+
+    prs = _new_presentation(ST["page"], template_path)
+    for tree in trees:
+        render_tree_slide(prs, tree, ST)
     return prs
+
+def render_layout_only(html_path: str, styles_path: str, template_path: str | None = None, stream: bool = False):
+    return render_with_styles(html_path, load_styles(styles_path), template_path, stream=stream)
+
+def render_layout_deck(html_path: str, styles_path: str, template_path: str | None = None, stream: bool = False):
+    """
+    Deck mode: one slide per <section> / .page-break group of a single HTML file,
+    all rendered into one Presentation with configs and template loaded once.
+    """
+    return render_with_styles(html_path, load_styles(styles_path), template_path, deck=True, stream=stream)
@@ -0,0 +1,62 @@
+from v6.parsers.model import LayoutTree, LayoutRow, LayoutCol, flatten_tree, intern_classes
+from v6.layout.grid_solver import measure_layout_tree, solve_layout_tree
+
+PAGE = {"width_in": 13.333, "height_in": 7.5, "margins_in": [0.7, 0.7, 0.7, 0.7], "gutter_in": 0.22}
+BANDS = {"row_top_in": 1.60, "row_height_in": 1.80}
+
+
+def _nested(depth: int) -> LayoutRow:
+    row = LayoutRow(cols=[LayoutCol(span=6), LayoutCol(span=6)])
+    if depth > 1:
+        row.cols[0].rows.append(_nested(depth - 1))
+        row.cols[0].rows.append(_nested(depth - 1))
+    return row
+
+
+def test_measure_annotates_units_bottom_up():
+    tree = LayoutTree(root_rows=[_nested(3)])
+    measure_layout_tree(tree)
+    root = tree.root_rows[0]
+    assert root.cols[1].units == 1
+    assert root.cols[0].rows[0].units == 2
+    assert root.cols[0].units == 4
+    assert root.units == 4
+
+
+def test_wrapped_lines_add_up():
+    row = LayoutRow(cols=[LayoutCol(span=8), LayoutCol(span=8, rows=[_nested(2)])])
+    tree = LayoutTree(root_rows=[row])
+    measure_layout_tree(tree)
+    assert row.units == 1 + 2
+
+
+def test_nested_columns_fill_parent_rect():
+    tree = LayoutTree(root_rows=[_nested(2)])
+    placements = solve_layout_tree(tree, PAGE, BANDS)
+    (outer, _), (side, _), (inner_a, _), (inner_b, _) = placements[:4]
+    assert outer.height == 2 * BANDS["row_height_in"]
+    assert side.height == outer.height
+    assert inner_a.left == outer.left
+    assert abs((inner_b.left + inner_b.width) - (outer.left + outer.width)) < 1e-9
+
+
+def test_flat_form_round_trips_and_solves_the_same():
+    tree = LayoutTree(root_rows=[_nested(3), LayoutRow(cols=[LayoutCol(span=4, offset=2, classes=("col-4",))])])
+    flat = flatten_tree(tree)
+    assert flat.n_rows == 8 and flat.n_cols == 15
+    assert list(flat.row_parent[:3]) == [-1, 0, 2]
+    assert flat.to_tree() == tree
+    assert [r for r, _ in solve_layout_tree(flat, PAGE, BANDS)] == [r for r, _ in solve_layout_tree(tree, PAGE, BANDS)]
+
+
+def test_class_tuples_are_shared():
+    a = intern_classes(["col-6", "p-2"])
+    assert a == ("col-6", "p-2") and intern_classes(["col-6", "p-2"]) is a
+
+
+def test_numpy_backend_matches_python():
+    wide = LayoutRow(cols=[LayoutCol(span=s, offset=o) for s, o in [(5, 0), (5, 1), (8, 0), (12, 3), (3, 0), (2, 0)]])
+    tree = LayoutTree(root_rows=[_nested(3), LayoutRow(), wide, _nested(2)])
+    expected = [(r, c.units) for r, c in solve_layout_tree(tree, PAGE, BANDS)]
+    assert [(r, c.units) for r, c in solve_layout_tree(tree, PAGE, BANDS, backend="numpy")] == expected
+    assert [(r, c.units) for r, c in solve_layout_tree(flatten_tree(tree), PAGE, BANDS, backend="numpy")] == expected
@@ -0,0 +1,35 @@
+from pathlib import Path
+from v6.renderer.incremental import render_deck_incremental
+from v6.renderer.render_engine import load_styles, render_layout_deck
+from v6.utils.render_cache import slide_xml
+
+STYLES = Path(__file__).resolve().parents[1] / "config" / "styles.json"
+SECTION = "<section><div class='row'>{cols}</div></section>\n"
+
+
+def _write_deck(path: Path, spans):
+    cols = lambda s: "".join(f"<div class='col-{n}'></div>" for n in s)  # noqa: E731
+    path.write_text("<html><body>" + "".join(SECTION.format(cols=cols(s)) for s in spans) + "</body></html>")
+
+
+def test_only_changed_sections_are_rendered(tmp_path):
+    html, out = tmp_path / "deck.html", tmp_path / "deck.pptx"
+    ST = load_styles(str(STYLES))
+    _write_deck(html, [(6, 6), (4, 8), (12,)])
+    assert render_deck_incremental(str(html), ST, str(out)) == {"slides": 3, "reused": 0, "rendered": 3}
+
+    _write_deck(html, [(6, 6), (3, 9), (12,), (4, 4, 4)])
+    assert render_deck_incremental(str(html), ST, str(out)) == {"slides": 4, "reused": 2, "rendered": 2}
+
+    full = tmp_path / "full.pptx"
+    render_layout_deck(str(html), str(STYLES)).save(str(full))
+    assert slide_xml(out.read_bytes()) == slide_xml(full.read_bytes())
+
+
+def test_stale_manifest_is_ignored(tmp_path):
+    html, out = tmp_path / "deck.html", tmp_path / "deck.pptx"
+    ST = load_styles(str(STYLES))
+    _write_deck(html, [(6, 6), (4, 8)])
+    render_deck_incremental(str(html), ST, str(out))
+    out.write_bytes(out.read_bytes() + b"\0")  # output replaced behind our back
+    assert render_deck_incremental(str(html), ST, str(out))["reused"] == 0
@@ -0,0 +1,69 @@
+import os
+from pathlib import Path
+from v6.renderer.render_engine import load_styles, render_with_styles
+from v6.utils.render_cache import RenderCache, render_key, slide_xml
+
+FIXTURES = Path(__file__).resolve().parent / "fixtures"
+STYLES = Path(__file__).resolve().parents[1] / "config" / "styles.json"
+
+
+def test_second_render_is_a_hit_with_the_same_bytes(tmp_path):
+    html, ST = str(FIXTURES / "page_breaks.html"), load_styles(str(STYLES))
+    cache = RenderCache(str(tmp_path))
+    calls = []
+
+    def render():
+        calls.append(1)
+        return render_with_styles(html, ST, deck=True)
+
+    first, hit1 = cache.render(render, html, (ST,), variant="deck")
+    second, hit2 = cache.render(render, html, (ST,), variant="deck")
+    assert (hit1, hit2, len(calls)) == (False, True, 1)
+    assert first == second and len(slide_xml(second)) == 3
+
+
+def test_key_follows_html_and_styles_but_not_line_endings(tmp_path):
+    a, b = tmp_path / "a.html", tmp_path / "b.html"
+    a.write_bytes(b"<div class='row'><div class='col-6'></div></div>\n")
+    b.write_bytes(b"<div class='row'><div class='col-6'></div></div>  \r\n")
+    ST = load_styles(str(STYLES))
+    assert render_key(str(a), (ST,)) == render_key(str(b), (ST,))
+    assert render_key(str(a), (ST,)) != render_key(str(a), (dict(ST, bands={"row_top_in": 0}),))
+    assert render_key(str(a), (ST,)) != render_key(str(a), (ST,), variant="deck")
+
+
+def test_least_recently_used_entry_is_evicted(tmp_path):
+    cache = RenderCache(str(tmp_path), max_bytes=2500)
+    keys = ["%064x" % i for i in range(3)]
+    for i, key in enumerate(keys[:2]):
+        cache.put(key, b"x" * 1000)
+        os.utime(cache._path(key), (i, i))  # deterministic LRU order
+    assert cache.get(keys[0]) is not None   # keys[0] is now the most recent
+    cache.put(keys[2], b"x" * 1000)
+    assert cache.get(keys[1]) is None
+    assert cache.info()["entries"] == 2 and cache.stats["evictions"] == 1
+
+
+def test_key_follows_the_html_folder_and_its_images(tmp_path):
+    ST = load_styles(str(STYLES))
+    keys = []
+    for folder, logo in (("a", b"logo a"), ("b", b"logo b")):
+        (tmp_path / folder).mkdir()
+        (tmp_path / folder / "logo.png").write_bytes(logo)
+        (tmp_path / folder / "index.html").write_text("<div class='row'><img src='logo.png'></div>")
+        keys.append(render_key(str(tmp_path / folder / "index.html"), (ST,)))
+    assert keys[0] != keys[1]
+    (tmp_path / "a" / "logo.png").write_bytes(b"logo a, edited")
+    assert render_key(str(tmp_path / "a" / "index.html"), (ST,)) != keys[0]
+
+
+def test_entry_evicted_after_the_read_is_still_a_hit(tmp_path, monkeypatch):
+    cache = RenderCache(str(tmp_path))
+    key = "%064x" % 7
+    cache.put(key, b"pptx")
+
+    def gone(path, times=None):
+        raise FileNotFoundError(path)
+
+    monkeypatch.setattr(os, "utime", gone)
+    assert cache.get(key) == b"pptx" and cache.stats["hits"] == 1 and cache.stats["misses"] == 0
@@ -0,0 +1,37 @@
+from pathlib import Path
+from v6.parsers.layout_parser import parse_layout_deck, parse_layout_tree
+from v6.renderer.render_engine import render_layout_deck
+
+FIXTURES = Path(__file__).resolve().parent / "fixtures"
+STYLES = Path(__file__).resolve().parents[1] / "config" / "styles.json"
+
+
+def test_sections_split_into_trees():
+    trees = parse_layout_deck(str(FIXTURES / "sections.html"))
+    assert [len(t.root_rows) for t in trees] == [1, 1]
+    assert [c.span for c in trees[1].root_rows[0].cols] == [4, 8]
+    assert len(trees[1].root_rows[0].cols[1].rows) == 1
+
+
+def test_page_breaks_split_into_trees():
+    trees = parse_layout_deck(str(FIXTURES / "page_breaks.html"))
+    assert [[c.span for c in t.root_rows[0].cols] for t in trees] == [[12], [6, 6], [3]]
+
+
+def test_single_page_document_is_one_slide():
+    trees = parse_layout_deck(str(FIXTURES / "nested_rows.html"))
+    assert len(trees) == 1
+    assert trees[0] == parse_layout_tree(str(FIXTURES / "nested_rows.html"))
+
+
+def test_deck_renders_one_slide_per_section():
+    prs = render_layout_deck(str(FIXTURES / "page_breaks.html"), str(STYLES))
+    assert len(prs.slides) == 3
+
+
+def test_page_breaks_under_different_parents_keep_everything_in_order():
+    from bs4 import BeautifulSoup
+    from v6.parsers.sections import split_sections
+    soup = BeautifulSoup("<h1>Intro</h1><div><p>A</p><hr class='page-break'><p>B</p></div>"
+                         "<div><p>C</p><div class='page-break'></div><p>D</p></div>", "html.parser")
+    assert [c.get_text("|", strip=True) for c in split_sections(soup)] == ["Intro|A", "B|C", "D"]
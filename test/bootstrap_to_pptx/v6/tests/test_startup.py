@@ -0,0 +1,32 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[2]  # test/bootstrap_to_pptx
+BUDGET_US = 250_000  # importing main must stay well under a cold render
+HEAVY = ("pptx", "bs4", "lxml", "numpy", "PIL", "pandas")
+
+# (cwd, module) as each entry point is run: v3/v4 from their folder, v6 as a package
+ENTRY_POINTS = [("v3", "main"), ("v4", "main"), (".", "v6.main")]
+
+
+def _import_times(cwd: Path, module: str) -> dict:
+    """Cumulative microseconds per module from `python -X importtime -c "import <module>"`."""
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                          cwd=cwd, capture_output=True, text=True, check=True)
+    times = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+@pytest.mark.parametrize("cwd,module", ENTRY_POINTS)
+def test_main_imports_within_budget(cwd, module):
+    times = _import_times(ROOT / cwd, module)
+    assert times[module] < BUDGET_US, f"import {module}: {times[module] / 1e3:.0f} ms"
+    assert not [m for m in times if m.split(".")[0] in HEAVY]
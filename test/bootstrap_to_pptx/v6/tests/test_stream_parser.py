@@ -0,0 +1,45 @@
+from pathlib import Path
+from v6.parsers.layout_parser import parse_layout_tree, parse_layout_deck
+from v6.parsers.stream_parser import parse_layout_tree_streaming, iter_layout_sections, iter_layout_rows
+
+FIXTURES = Path(__file__).resolve().parent / "fixtures"
+
+
+def test_streaming_matches_in_memory_parser():
+    for html in sorted(FIXTURES.glob("*.html")):
+        assert parse_layout_tree_streaming(str(html), chunk_size=37) == parse_layout_tree(str(html)), html.name
+        assert list(iter_layout_sections(str(html), chunk_size=37)) == parse_layout_deck(str(html)), html.name
+
+
+def test_rows_are_emitted_before_the_document_ends(tmp_path):
+    html = tmp_path / "big.html"
+    html.write_text("<body>" + "<div class='row'><div class='col-6'>x</div></div>" * 50
+                    + "<p>" + "tail " * 20000 + "</p></body>", encoding="utf-8")
+    rows = iter_layout_rows(str(html), chunk_size=256)
+    first = next(rows)
+    assert [c.span for c in first.cols] == [6]
+    assert len(list(rows)) == 49
+
+
+def test_fallback_to_first_nested_row(tmp_path):
+    html = tmp_path / "wrapped.html"
+    html.write_text("<div class='container'><div class='row'><div class='col-4'></div></div>"
+                    "<div class='row'><div class='col-8'></div></div></div>", encoding="utf-8")
+    tree = parse_layout_tree_streaming(str(html))
+    assert tree == parse_layout_tree(str(html))
+    assert [c.span for r in tree.root_rows for c in r.cols] == [4]
+
+
+def test_deck_has_the_same_slides_streamed_or_not(tmp_path):
+    from v6.renderer.render_engine import render_layout_deck
+    styles = str(Path(__file__).resolve().parents[1] / "config" / "styles.json")
+    text_only = tmp_path / "text_only.html"
+    text_only.write_text("<div class='row'><div class='col-12'>One</div></div><div class='page-break'></div>"
+                         "bare text<div class='page-break'></div>"
+                         "<div class='row'><div class='col-3'>Three</div></div>", encoding="utf-8")
+    for html in (FIXTURES / "page_breaks.html", FIXTURES / "sections.html", text_only):
+        trees = parse_layout_deck(str(html))
+        assert list(iter_layout_sections(str(html), chunk_size=37)) == trees, html.name
+        slides = [len(render_layout_deck(str(html), styles, stream=stream).slides) for stream in (False, True)]
+        assert slides == [len(trees)] * 2, html.name
+    assert [len(t.root_rows) for t in parse_layout_deck(str(text_only))] == [1, 0, 1]
@@ -0,0 +1,30 @@
+import os
+from pptx import Presentation
+from v6.utils import template_cache
+from v6.utils.template_cache import open_template
+
+
+def test_copies_are_independent(tmp_path):
+    path = tmp_path / "tpl.pptx"
+    Presentation().save(str(path))
+    template_cache.clear_cache()
+    a, b = open_template(str(path)), open_template(str(path))
+    a.slides.add_slide(a.slide_layouts[6])
+    assert (len(a.slides), len(b.slides), len(open_template(str(path)).slides)) == (1, 0, 0)
+
+
+def test_new_file_version_is_reloaded(tmp_path):
+    path = tmp_path / "tpl.pptx"
+    Presentation().save(str(path))
+    template_cache.clear_cache()
+    open_template(str(path))
+    loads = template_cache.STATS["loads"]
+    open_template(str(path))
+    assert template_cache.STATS["loads"] == loads
+
+    prs = Presentation(str(path))
+    prs.slides.add_slide(prs.slide_layouts[0])
+    prs.save(str(path))
+    os.utime(path, ns=(0, 1))  # distinct mtime even on coarse clocks
+    assert len(open_template(str(path)).slides) == 1
+    assert template_cache.STATS["loads"] == loads + 1
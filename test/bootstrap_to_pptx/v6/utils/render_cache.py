@@ -0,0 +1,232 @@
+"""
+Content-addressed on-disk cache of rendered PPTX files.
+
+key = sha256 over
+  - the HTML, normalized (BOM, line endings, trailing whitespace per line)
+  - the assets it references: the HTML's folder (relative img[src] resolve
+    against it), and path + mtime + size of every img[src] it resolves to, of
+    the icon sources of its bi-* / fa-* classes and of config/icon_map.json and
+    its images, so a different or edited picture is a different key
+  - the configs exactly as the renderer sees them (styles/presets after
+    overrides are merged), as canonical JSON
+  - the template bytes (hashed once per path/mtime/size)
+  - the code version: every *.py of this version folder + python-pptx version
+  - a variant string for render options that change the output (e.g. deck mode)
+
+Entries are <cache_dir>/<key[:2]>/<key>.pptx, written atomically, so several
+processes (batch workers) can share one directory. LRU order is the file mtime:
+a hit touches the entry, and put() evicts the oldest entries once the total
+size passes max_bytes. Per-process counters are in RenderCache.stats.
+"""
+import hashlib
+import io
+import json
+import logging
+import os
+import re
+import tempfile
+import zipfile
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import unquote, urlparse
+
+# Module logger; handlers and level are configured by the entry point (main.py).
+logger = logging.getLogger(__name__)
+
+CODE_ROOT = Path(__file__).resolve().parents[1]  # the version folder (v3/, v4/, ...)
+SUFFIX = ".pptx"
+
+_code_version: Optional[str] = None
+_template_digests: Dict[Tuple[str, int, int], str] = {}
+
+def code_version() -> str:
+    """Digest of this version's sources + python-pptx version (computed once per process)."""
+    global _code_version
+    if _code_version is None:
+        import pptx
+        h = hashlib.sha256(f"python-pptx {pptx.__version__}\n".encode())
+        for p in sorted(CODE_ROOT.rglob("*.py")):
+            h.update(p.relative_to(CODE_ROOT).as_posix().encode() + b"\0")
+            h.update(p.read_bytes())
+        _code_version = h.hexdigest()
+    return _code_version
+
+def normalize_html(raw: bytes) -> bytes:
+    """Drop differences the parsers ignore: BOM, CRLF/CR, trailing whitespace on lines."""
+    if raw.startswith(b"\xef\xbb\xbf"):
+        raw = raw[3:]
+    raw = raw.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+    return b"\n".join(line.rstrip() for line in raw.split(b"\n")).strip()
+
+def template_digest(template_path: Optional[str]) -> str:
+    if not template_path:
+        return "-"
+    st = os.stat(template_path)
+    k = (str(Path(template_path).resolve()), st.st_mtime_ns, st.st_size)
+    digest = _template_digests.get(k)
+    if digest is None:
+        digest = _template_digests[k] = hashlib.sha256(Path(template_path).read_bytes()).hexdigest()
+    return digest
+
+_IMG_SRC = re.compile(r"""<img\b[^>]*?\bsrc\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s>]+))""", re.I)
+_ICON = re.compile(r"\b(bi|fa)-([a-z0-9][a-z0-9-]*)")
+
+def _identity(path: str) -> str:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return f"{path}|-"
+    return f"{path}|{st.st_mtime_ns}|{st.st_size}"
+
+def _resolved(src: str, base_dir: str) -> Iterable[str]:
+    """Where img[src] can resolve to (as utils.images.resolve: the HTML's folder, then the cwd)."""
+    src = src.strip()
+    url = urlparse(src)
+    if not src or src.startswith("data:") or url.scheme in ("http", "https"):
+        return []
+    path = os.path.expanduser(unquote(url.path) if url.scheme == "file" else src)
+    if os.path.isabs(path):
+        return [path]
+    return [os.path.abspath(os.path.join(base_dir, path)), os.path.abspath(path)]
+
+def _icon_dirs(configs: tuple) -> List[str]:
+    dirs = [str(CODE_ROOT / "assets" / "icons")]
+    for c in configs:
+        d = c.get("icons", {}).get("dir") if isinstance(c, dict) and isinstance(c.get("icons"), dict) else None
+        if d:
+            dirs.append(str(CODE_ROOT / d))
+    return dirs
+
+def asset_identity(html_path: str, html: str, configs: tuple = ()) -> bytes:
+    """The assets part of the key (see module docstring); files are stat-ed, not read."""
+    base_dir = str(Path(html_path).resolve().parent)
+    ids = [base_dir]
+    for m in _IMG_SRC.finditer(html):
+        src = next(g for g in m.groups() if g is not None)
+        ids.extend(_identity(p) for p in _resolved(src, base_dir))
+    icons = sorted(set(_ICON.findall(html)))
+    for icon_dir in _icon_dirs(configs):
+        for icon_set in sorted({s for s, _ in icons}):
+            ids.extend(_identity(os.path.join(icon_dir, icon_set + ext)) for ext in (".ttf", ".otf", ".json"))
+        ids.extend(_identity(os.path.join(icon_dir, s, n + ".svg")) for s, n in icons)
+    icon_map = CODE_ROOT / "config" / "icon_map.json"
+    if icons and icon_map.is_file():
+        ids.append(_identity(str(icon_map)))
+        try:
+            mapped = json.loads(icon_map.read_text(encoding="utf-8"))
+        except ValueError:
+            mapped = {}
+        ids.extend(_identity(str(CODE_ROOT / mapped[f"{s}-{n}"])) for s, n in icons
+                   if isinstance(mapped.get(f"{s}-{n}"), str))
+    return "\n".join(ids).encode()
+
+def render_key(html_path: str, configs: tuple, template_path: Optional[str] = None, variant: str = "") -> str:
+    h = hashlib.sha256()
+    html = normalize_html(Path(html_path).read_bytes())
+    for part in (
+        code_version().encode(),
+        variant.encode(),
+        template_digest(template_path).encode(),
+        json.dumps(configs, sort_keys=True, ensure_ascii=False, separators=(",", ":")).encode(),
+        html,
+        asset_identity(html_path, html.decode("utf-8", "replace"), configs),
+    ):
+        h.update(len(part).to_bytes(8, "little"))
+        h.update(part)
+    return h.hexdigest()
+
+def slide_xml(pptx_bytes: bytes) -> List[bytes]:
+    """The ppt/slides/slideN.xml parts of a PPTX, in slide order."""
+    with zipfile.ZipFile(io.BytesIO(pptx_bytes)) as z:
+        names = [n for n in z.namelist() if n.startswith("ppt/slides/slide") and n.endswith(".xml")]
+        names.sort(key=lambda n: int(n[len("ppt/slides/slide"):-len(".xml")]))
+        return [z.read(n) for n in names]
+
+class RenderCache:
+    def __init__(self, cache_dir: str, max_bytes: int = 512 << 20):
+        self.dir = Path(cache_dir)
+        self.dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.stats = {"hits": 0, "misses": 0, "puts": 0, "evictions": 0, "evicted_bytes": 0}
+        self._bytes = None  # total entry size, scanned lazily
+
+    def _path(self, key: str) -> Path:
+        return self.dir / key[:2] / (key + SUFFIX)
+
+    def _entries(self) -> List[Tuple[float, int, Path]]:
+        out = []
+        for p in self.dir.glob("*/*" + SUFFIX):
+            try:
+                st = p.stat()
+            except FileNotFoundError:  # evicted by another process
+                continue
+            out.append((st.st_mtime, st.st_size, p))
+        return out
+
+    def get(self, key: str) -> Optional[bytes]:
+        p = self._path(key)
+        try:
+            data = p.read_bytes()
+        except FileNotFoundError:
+            self.stats["misses"] += 1
+            return None
+        try:
+            os.utime(p)  # mark as recently used
+        except FileNotFoundError:  # evicted by another process after the read: still a hit
+            pass
+        self.stats["hits"] += 1
+        return data
+
+    def put(self, key: str, data: bytes) -> None:
+        p = self._path(key)
+        p.parent.mkdir(exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=p.parent, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, p)
+        self.stats["puts"] += 1
+        if self._bytes is None:
+            self._bytes = sum(size for _, size, _ in self._entries())
+        else:
+            self._bytes += len(data)
+        if self._bytes > self.max_bytes:
+            self.evict()
+
+    def evict(self) -> None:
+        """Delete least-recently-used entries until the cache fits in max_bytes."""
+        entries = sorted(self._entries())
+        total = sum(size for _, size, _ in entries)
+        for _, size, p in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                p.unlink()
+            except FileNotFoundError:
+                continue
+            total -= size
+            self.stats["evictions"] += 1
+            self.stats["evicted_bytes"] += size
+            logger.debug("evicted %s (%d bytes)", p.name, size)
+        self._bytes = total
+
+    def info(self) -> dict:
+        """Counters of this process + what is on disk now."""
+        entries = self._entries()
+        return dict(self.stats, entries=len(entries), bytes=sum(size for _, size, _ in entries),
+                    max_bytes=self.max_bytes)
+
+    def render(self, render: Callable, html_path: str, configs: tuple,
+               template_path: Optional[str] = None, variant: str = "") -> Tuple[bytes, bool]:
+        """
+        PPTX bytes for these inputs: stored ones on a hit, else render() (returning a
+        Presentation) is called and its saved bytes are stored. Returns (bytes, hit).
+        """
+        key = render_key(html_path, configs, template_path, variant)
+        data = self.get(key)
+        if data is not None:
+            return data, True
+        buf = io.BytesIO()
+        render().save(buf)
+        data = buf.getvalue()
+        self.put(key, data)
+        return data, False